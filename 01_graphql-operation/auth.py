@@ -0,0 +1,364 @@
+#╔═════════════════════════════════════════════════════════════════════════════╗
+#║══════════════════❯ 💫 AxieAPI | GraphQL | Access Tokens 💫
+#╚═════════════════════════════════════════════════════════════════════════════╝
+# 🔐 operations need an access token, obtained with a signed random message:
+#   'CreateRandomMessage' → signer.sign(message) → 'CreateAccessTokenWithSignature'.
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📦 Dependencies 📦
+# ╚════════❯ 📦 Built-in Dependencies:
+import base64
+import hashlib
+import heapq
+import hmac
+import json
+import logging
+import threading
+import time
+from concurrent.futures import Future
+# ╚════════❯ 📦 External Dependencies:
+try:
+    from eth_account import Account
+    from eth_account.messages import encode_defunct
+except ImportError:
+    Account = None
+# ╚════════❯ 📦 Internal Dependencies:
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ ✍️ Signers ✍️
+class Signer:
+    """
+    A base class for signers: they sign the random message of an account ('address').
+    """
+
+    address = None
+
+    def sign(self, message: str) -> str:
+        """
+        Signs a message.
+
+        Returns:
+            ➤ str: The '0x'-prefixed hex signature.
+        """
+
+        raise NotImplementedError
+
+class LocalSigner(Signer):
+    """
+    A signer that needs no wallet: an HMAC-SHA256 of the message with a secret.
+    The gateway doesn't accept it, but the mock gateway does (offline tests, cf. 'mock_gateway.MockGateway(auth=True)').
+    """
+
+    def __init__(self, address: str, secret: bytes = b"") -> None:
+        self.address = address.lower()
+        self._secret = secret or self.address.encode()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__module__}.{self.__class__.__name__} '{self.address}' object at {hex(id(self))}>"
+
+    def sign(self, message: str) -> str:
+        return "0x" + hmac.new(self._secret, message.encode("utf-8"), hashlib.sha256).hexdigest()
+
+class EthAccountSigner(Signer):
+    """
+    A signer of Ethereum 'personal_sign' messages with a private key (requires the optional 'eth_account' package).
+    """
+
+    def __init__(self, private_key: str) -> None:
+        """
+        Initializes an 'EthAccountSigner' instance.
+
+        Raises:
+            ➤ ImportError: If the 'eth_account' package is not installed.
+        """
+
+        if Account is None:
+            raise ImportError("'EthAccountSigner' requires the 'eth_account' package ('pip install eth-account').")
+        self._account = Account.from_key(private_key)
+        self.address = self._account.address.lower()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__module__}.{self.__class__.__name__} '{self.address}' object at {hex(id(self))}>"
+
+    def sign(self, message: str) -> str:
+        signature = self._account.sign_message(encode_defunct(text=message)).signature.hex()
+        return signature if signature.startswith("0x") else "0x" + signature
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🔐 Token Manager 🔐
+logger = logging.getLogger("axie.graphql.auth")
+
+class AuthenticationError(Exception):
+    """
+    An exception raised when an access token can't be obtained; 'result' holds the failed 'GraphQLResult'.
+    """
+
+    def __init__(self, message: str, result=None) -> None:
+        super().__init__(message)
+        self.result = result
+
+def expiry(access_token: str) -> float:
+    """
+    Reads the expiry of an access token (the 'exp' claim of a JWT), as a Unix time.
+
+    Returns:
+        ➤ float: The expiry, or None if the token is not a JWT with an 'exp' claim.
+    """
+
+    parts = access_token.split(".")
+    if len(parts) != 3:
+        return None
+    try:
+        claims = json.loads(base64.urlsafe_b64decode(parts[1] + "=" * (-len(parts[1]) % 4)))
+        return float(claims["exp"])
+    except (ValueError, KeyError, TypeError):
+        return None
+
+class Token:
+    """
+    A class that holds an access token of an account.
+    """
+
+    __slots__ = ("access_token", "account", "issued_at", "expires_at")
+
+    def __init__(self, access_token: str, account: str, issued_at: float, expires_at: float) -> None:
+        self.access_token = access_token
+        self.account = account
+        self.issued_at = issued_at
+        self.expires_at = expires_at
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__module__}.{self.__class__.__name__} '{self.account}' (expires at {self.expires_at:.0f}) object at {hex(id(self))}>"
+
+class TokenManager:
+    """
+    A class that obtains, caches and refreshes the access tokens of accounts (one 'Signer' each):
+        - a token is reused until it gets close to its expiry ('refresh_margin' of its lifetime before),
+          then refreshed in the background while the current one keeps being served.
+        - concurrent callers needing a new token of the same account share one login.
+    'GraphQLClient(tokens=...)' attaches 'Authorization: Bearer <token>' to 🔐 operations.
+    """
+
+    def __init__(self, signers, client=None, refresh_margin: float = 0.2, default_ttl: float = 3600.0, skew: float = 30.0, retry_delay: float = 5.0, background: bool = True, clock=time.time) -> None:
+        """
+        Initializes a 'TokenManager' instance.
+
+        Args:
+            ➤ signers (Signer | list): The signer of each account (the first one is the default account).
+            ➤ client (GraphQLClient): The client performing the logins (set by 'GraphQLClient(tokens=...)' if omitted).
+            ➤ refresh_margin (float): The fraction of a token lifetime, before its expiry, when it is refreshed.
+            ➤ default_ttl (float): The lifetime of tokens without an 'exp' claim, in seconds.
+            ➤ skew (float): A token is never served in its last 'skew' seconds (clock skew, request time).
+            ➤ retry_delay (float): The delay before retrying a failed background refresh, in seconds.
+            ➤ background (bool): Whether tokens are refreshed by a background thread (else on the next use).
+            ➤ clock (callable): The Unix time clock (e.g. a fake one in tests).
+
+        Raises:
+            ➤ ValueError: If there is no signer, or if 'refresh_margin' is out of range.
+        """
+
+        # ┗━━━━━➤ 🚦 Perform checks:
+        signers = [signers] if isinstance(signers, Signer) else list(signers)
+        if not signers:
+            raise ValueError("At least one signer is required.")
+        if not 0 <= refresh_margin < 1:
+            raise ValueError(f"'refresh_margin' ({refresh_margin}) must be in [0, 1[.")
+
+        # ┗━━━━━➤ 📌 Define attributes:
+        self._signers = {signer.address.lower(): signer for signer in signers}
+        self._default = signers[0].address.lower()
+        self.client = client
+        self._refresh_margin = refresh_margin
+        self._default_ttl = default_ttl
+        self._skew = skew
+        self._retry_delay = retry_delay
+        self._clock = clock
+        self._tokens = {}
+        self._inflight = {}
+        self._schedule = []
+        self._lock = threading.Condition()
+        self._closed = False
+        self._background = background
+        self._thread = None
+        self.stats = {"logins": 0, "hits": 0, "waits": 0, "background_refreshes": 0, "failures": 0}
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__module__}.{self.__class__.__name__} {list(self._signers)} object at {hex(id(self))}>"
+
+    def __enter__(self) -> "TokenManager":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def accounts(self) -> list:
+        """
+        """
+
+        return list(self._signers)
+
+    def _account(self, account: str) -> str:
+        account = (account or self._default).lower()
+        if account not in self._signers:
+            raise KeyError(f"Account '{account}' has no signer. It must be one of {self.accounts}.")
+        return account
+
+    def token(self, account: str = None) -> str:
+        """
+        Returns a valid access token of an account, logging in only if no cached token can be served.
+
+        Args:
+            ➤ account (str): The account address (the default account if omitted).
+
+        Raises:
+            ➤ KeyError: If the account has no signer.
+            ➤ AuthenticationError: If the login fails.
+        """
+
+        account = self._account(account)
+        now = self._clock()
+        with self._lock:
+            token = self._tokens.get(account)
+            if token is not None and now < token.expires_at - self._skew:
+                self.stats["hits"] += 1
+                if not self._background and now >= self._refresh_at(token) and account not in self._inflight:
+                    # No background thread: refresh from a worker, the current token is still served.
+                    threading.Thread(target=self._refresh_quietly, args=(account,), daemon=True).start()
+                return token.access_token
+        return self.refresh(account).access_token
+
+    def headers(self, account: str = None) -> dict:
+        """
+        Returns the authorization header of an account (cf. 'token').
+        """
+
+        return {"Authorization": f"Bearer {self.token(account)}"}
+
+    def invalidate(self, account: str = None, access_token: str = None) -> None:
+        """
+        Forgets the cached token of an account (e.g. after the gateway rejected it), unless it was already replaced.
+        """
+
+        account = self._account(account)
+        with self._lock:
+            token = self._tokens.get(account)
+            if token is not None and (access_token is None or token.access_token == access_token):
+                del self._tokens[account]
+
+    def refresh(self, account: str = None) -> Token:
+        """
+        Logs an account in, sharing the login with concurrent callers of the same account.
+
+        Raises:
+            ➤ AuthenticationError: If the login fails.
+        """
+
+        account = self._account(account)
+        with self._lock:
+            future = self._inflight.get(account)
+            owner = future is None
+            if owner:
+                future = self._inflight[account] = Future()
+            else:
+                self.stats["waits"] += 1
+        if not owner:
+            return future.result()
+
+        try:
+            token = self._login(account)
+        except BaseException as exception:
+            with self._lock:
+                self.stats["failures"] += 1
+                del self._inflight[account]
+            future.set_exception(exception)
+            raise
+        with self._lock:
+            self._tokens[account] = token
+            del self._inflight[account]
+            if self._background and not self._closed:
+                heapq.heappush(self._schedule, (self._refresh_at(token), account, token.access_token))
+                self._start()
+                self._lock.notify_all()
+        future.set_result(token)
+        return token
+
+    def _refresh_at(self, token: Token) -> float:
+        return token.expires_at - max(self._skew, self._refresh_margin * (token.expires_at - token.issued_at))
+
+    def _login(self, account: str) -> Token:
+        """
+        Runs the 'CreateRandomMessage' → sign → 'CreateAccessTokenWithSignature' flow.
+        """
+
+        if self.client is None:
+            raise AuthenticationError("No client to log in with: pass 'client', or the manager to 'GraphQLClient(tokens=...)'.")
+        signer = self._signers[account]
+        with self._lock:
+            self.stats["logins"] += 1
+
+        result = self.client.execute("CreateRandomMessage")
+        message = (result.data or {}).get("createRandomMessage")
+        if not result.ok or not message:
+            raise AuthenticationError(f"'CreateRandomMessage' failed: {result.errors or result.status}.", result)
+        issued_at = self._clock()
+        result = self.client.execute("CreateAccessTokenWithSignature", {
+            "input": {"mainnet": "ronin", "owner": account, "message": message, "signature": signer.sign(message)}
+        })
+        created = (result.data or {}).get("createAccessTokenWithSignature") or {}
+        if not result.ok or not created.get("accessToken"):
+            raise AuthenticationError(f"'CreateAccessTokenWithSignature' failed for '{account}': {result.errors or result.status}.", result)
+
+        access_token = created["accessToken"]
+        expires_at = expiry(access_token) or issued_at + self._default_ttl
+        logger.info("Logged '%s' in (token valid for %.0fs).", account, expires_at - issued_at)
+        return Token(access_token, account, issued_at, expires_at)
+
+    def _refresh_quietly(self, account: str) -> bool:
+        try:
+            self.refresh(account)
+            return True
+        except Exception as exception:
+            logger.warning("Refreshing the token of '%s' failed: %r.", account, exception)
+            return False
+
+    def _start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="TokenManager", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        """
+        Refreshes tokens as they reach their refresh time, retrying failures until they expire.
+        """
+
+        while True:
+            with self._lock:
+                while not self._closed and (not self._schedule or self._schedule[0][0] > self._clock()):
+                    self._lock.wait(self._schedule[0][0] - self._clock() if self._schedule else None)
+                if self._closed:
+                    return
+                _, account, access_token = heapq.heappop(self._schedule)
+                token = self._tokens.get(account)
+                if token is None or token.access_token != access_token:
+                    # Replaced or invalidated since it was scheduled:
+                    continue
+                self.stats["background_refreshes"] += 1
+            if not self._refresh_quietly(account):
+                with self._lock:
+                    if self._clock() + self._retry_delay < token.expires_at:
+                        heapq.heappush(self._schedule, (self._clock() + self._retry_delay, account, access_token))
+
+    def close(self) -> None:
+        """
+        Stops the background refreshes.
+        """
+
+        with self._lock:
+            self._closed = True
+            self._lock.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+# ═════════════════════════════════════════════════════════════════════════════╝
@@ -0,0 +1,100 @@
+#╔═════════════════════════════════════════════════════════════════════════════╗
+#║══════════════════❯ 💫 Benchmark | Module Import 💫
+#╚═════════════════════════════════════════════════════════════════════════════╝
+# Usage:
+#   python benchmarks/bench_import.py [--output results.json] [--repeat N]
+#   python benchmarks/compare.py baseline.json results.json [--threshold 0.10]
+# Each measure runs in a fresh interpreter: 'import_ns' with a warm bytecode cache, 'import_uncached_ns'
+# compiling the source, and 'assemble_ns' for the first access to every operation (cf. 'codegen.py').
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📦 Dependencies 📦
+# ╚════════❯ 📦 Built-in Dependencies:
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+# ╚════════❯ 📦 External Dependencies:
+# ╚════════❯ 📦 Internal Dependencies:
+from bench_operation import metadata
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ ⏱ Measures ⏱
+SOURCE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULES = ("operation", "document", "client")
+
+# Run in the child interpreter: prints '<import ns> <assemble ns>'.
+_CHILD = """
+import sys, time
+sys.path.insert(0, {source!r})
+start = time.perf_counter_ns()
+import {module}
+imported = time.perf_counter_ns()
+if {module!r} == "operation":
+    operations = operation.GraphQLOperation.ValidOperations
+    for name, value in list(vars(operations).items()):
+        if not name.startswith("__") and not isinstance(value, type):
+            getattr(operations, name)
+print(imported - start, time.perf_counter_ns() - imported)
+"""
+
+def _run(module: str, cache: str, write_bytecode: bool) -> tuple:
+    """
+    Imports 'module' in a fresh interpreter, with its bytecode cache in 'cache'.
+
+    Returns:
+        ➤ tuple: '(import ns, assemble ns)'.
+    """
+
+    env = {**os.environ, "PYTHONPYCACHEPREFIX": cache}
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    if not write_bytecode:
+        env["PYTHONDONTWRITEBYTECODE"] = "1"
+    output = subprocess.run(
+        [sys.executable, "-c", _CHILD.format(source=SOURCE, module=module)],
+        capture_output=True, text=True, check=True, env=env
+    ).stdout.split()
+    return int(output[0]), int(output[1])
+
+def bench(module: str, repeat: int) -> dict:
+    """
+    Measures the import of a module (best of 'repeat' fresh interpreters).
+    """
+
+    with tempfile.TemporaryDirectory() as cached, tempfile.TemporaryDirectory() as empty:
+        _run(module, cached, True)
+        warm = [_run(module, cached, True) for _ in range(repeat)]
+        cold = [_run(module, empty, False) for _ in range(repeat)]
+    return {
+        "import_ns": min(imported for imported, _ in warm),
+        "import_uncached_ns": min(imported for imported, _ in cold),
+        "assemble_ns": min(assembled for _, assembled in warm) if module == "operation" else None,
+    }
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🚀 Main 🚀
+def main(argv: list = None) -> dict:
+    parser = argparse.ArgumentParser(description="Benchmarks the import time of the modules.")
+    parser.add_argument("--output", help="The JSON results path (printed to stdout if omitted).")
+    parser.add_argument("--repeat", type=int, default=10, help="The number of fresh interpreters per measure.")
+    parser.add_argument("--module", action="append", help="Only benchmark these modules.")
+    args = parser.parse_args(argv)
+
+    results = {
+        "meta": metadata(),
+        "results": {f"import {module}": bench(module, args.repeat) for module in (args.module or MODULES)},
+    }
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+    return results
+
+if __name__ == "__main__":
+    main()
+# ═════════════════════════════════════════════════════════════════════════════╝
@@ -0,0 +1,144 @@
+#╔═════════════════════════════════════════════════════════════════════════════╗
+#║══════════════════❯ 💫 Benchmark | GraphQL Operation 💫
+#╚═════════════════════════════════════════════════════════════════════════════╝
+# Usage:
+#   python benchmarks/bench_operation.py [--output results.json] [--responses DIR] [--loops N]
+#   python benchmarks/compare.py baseline.json results.json [--threshold 0.10]
+# Recorded responses ('benchmarks/responses/<operation>.json') are optional: without one, a response
+# is generated from the operation's selections (cf. 'mock_gateway.ResponseGenerator', pages of 'GENERATED_SIZE').
+# Each response is also measured compressed with every available content coding ('<coding>_bytes', and
+# '<coding>_decode_ns' for a streaming decompression in 'transport.CHUNK_SIZE' chunks followed by 'json.loads').
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📦 Dependencies 📦
+# ╚════════❯ 📦 Built-in Dependencies:
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+# ╚════════❯ 📦 External Dependencies:
+# ╚════════❯ 📦 Internal Dependencies:
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import operation
+import transport as transports
+from mock_gateway import ResponseGenerator
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ ⏱ Measures ⏱
+RESPONSES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "responses")
+GENERATED_SIZE = 100
+
+def operation_names() -> list:
+    """
+    Lists every operation name of 'GraphQLOperation.ValidOperations'.
+    """
+
+    return [
+        name for name, value in vars(operation.GraphQLOperation.ValidOperations).items()
+        if not name.startswith("__") and not isinstance(value, type)
+    ]
+
+def measure(function, loops: int, repeat: int = 5) -> int:
+    """
+    Times 'function' over 'repeat' rounds of 'loops' calls.
+
+    Returns:
+        ➤ int: The best round's time per call, in nanoseconds (the least noisy estimate).
+    """
+
+    rounds = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for _ in range(loops):
+            function()
+        rounds.append((time.perf_counter_ns() - start) / loops)
+    return round(min(rounds))
+
+def load_response(name: str, directory: str) -> tuple:
+    """
+    Loads the recorded response of an operation ('<directory>/<name>.json') as raw bytes,
+    or generates one if none was recorded.
+
+    Returns:
+        ➤ tuple: '(response bytes, source)', where source is 'recorded' or 'generated'.
+    """
+
+    path = os.path.join(directory, f"{name}.json")
+    if os.path.exists(path):
+        with open(path, "rb") as file:
+            return file.read(), "recorded"
+    query = getattr(operation.GraphQLOperation.ValidOperations, name)
+    data = ResponseGenerator().generate(query, {"from": 0, "size": GENERATED_SIZE})
+    return json.dumps({"data": data}).encode(), "generated"
+
+def bench(name: str, loops: int, directory: str) -> dict:
+    """
+    Measures one operation: construction, payload size, payload encoding and response decoding.
+    """
+
+    graphql_operation = operation.GraphQLOperation(name)
+    encoded = json.dumps(graphql_operation.payload).encode()
+    result = {
+        "construct_ns": measure(lambda: operation.GraphQLOperation(name), loops),
+        "payload_bytes": len(encoded),
+        "encode_ns": measure(lambda: json.dumps(graphql_operation.payload).encode(), loops),
+    }
+    response, source = load_response(name, directory)
+    result["decode_ns"] = measure(lambda: json.loads(response), loops)
+    result["response_bytes"] = len(response)
+    result["response_source"] = source
+    for encoding in transports.ENCODINGS:
+        compressed = transports.compress(response, encoding)
+        chunks = [compressed[start:start + transports.CHUNK_SIZE] for start in range(0, len(compressed), transports.CHUNK_SIZE)]
+        result[f"{encoding}_bytes"] = len(compressed)
+        result[f"{encoding}_decode_ns"] = measure(lambda: json.loads(transports.decode(encoding, chunks)[0]), loops)
+    return result
+
+def metadata() -> dict:
+    """
+    Describes the environment and the commit the results were measured on.
+    """
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": int(time.time()),
+    }
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🚀 Main 🚀
+def main(argv: list = None) -> dict:
+    parser = argparse.ArgumentParser(description="Benchmarks every 'ValidOperations' operation.")
+    parser.add_argument("--output", help="The JSON results path (printed to stdout if omitted).")
+    parser.add_argument("--responses", default=RESPONSES, help="The directory of recorded responses ('<operation>.json').")
+    parser.add_argument("--loops", type=int, default=200, help="The number of calls per timing round.")
+    parser.add_argument("--operation", action="append", help="Only benchmark these operations.")
+    args = parser.parse_args(argv)
+
+    results = {
+        "meta": metadata(),
+        "results": {name: bench(name, args.loops, args.responses) for name in (args.operation or operation_names())},
+    }
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+    return results
+
+if __name__ == "__main__":
+    main()
+# ═════════════════════════════════════════════════════════════════════════════╝
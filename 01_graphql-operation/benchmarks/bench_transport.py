@@ -0,0 +1,114 @@
+#╔═════════════════════════════════════════════════════════════════════════════╗
+#║══════════════════❯ 💫 Benchmark | Transports 💫
+#╚═════════════════════════════════════════════════════════════════════════════╝
+# Usage:
+#   python benchmarks/bench_transport.py [--output results.json] [--requests N] [--concurrency N] [--latency SPEC]
+#   python benchmarks/compare.py baseline.json results.json [--threshold 0.10]
+# Fans 'GetAxieDetail' requests out against a local mock gateway (in its own process, so it doesn't share the
+# client's GIL), over the pooled HTTP/1.1 transport and the HTTP/2 transport (against the gateway's 'h2c'
+# stand-in, skipped without the optional 'h2' package).
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📦 Dependencies 📦
+# ╚════════❯ 📦 Built-in Dependencies:
+import argparse
+import json
+import multiprocessing
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+# ╚════════❯ 📦 External Dependencies:
+# ╚════════❯ 📦 Internal Dependencies:
+from bench_operation import metadata
+import transport
+from client import GraphQLClient
+from metrics import Histogram
+from mock_gateway import MockGateway
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ ⏱ Measures ⏱
+OPERATION = "GetAxieDetail"
+
+def _serve(http2: bool, latency: str, max_streams: int, channel) -> None:
+    """
+    Runs a mock gateway until told to stop: sends its URL, then its stats, through 'channel'.
+    """
+
+    with MockGateway(latency=latency, http2=http2, max_streams=max_streams) as gateway:
+        channel.send(gateway.url)
+        channel.recv()
+        channel.send(dict(gateway.stats))
+
+def bench(http2: bool, requests: int, concurrency: int, latency: str, connections: int, max_streams: int) -> dict:
+    """
+    Sends 'requests' operations from 'concurrency' threads through one client.
+
+    Returns:
+        ➤ dict: The wall time per request, latency percentiles and the sockets the gateway accepted.
+    """
+
+    channel, remote = multiprocessing.Pipe()
+    server = multiprocessing.Process(target=_serve, args=(http2, latency, max_streams, remote), daemon=True)
+    server.start()
+    try:
+        url = channel.recv()
+        if http2:
+            client_transport = transport.HTTP2Transport(url, connections=connections, max_streams=max_streams)
+        else:
+            client_transport = transport.HTTPTransport(url, pool_size=concurrency)
+        histogram = Histogram()
+
+        def execute(index: int) -> bool:
+            start = time.perf_counter()
+            result = client.execute(OPERATION, {"axieId": str(index)})
+            histogram.record(time.perf_counter() - start)
+            return result.ok
+
+        with GraphQLClient(transport=client_transport) as client, ThreadPoolExecutor(max_workers=concurrency) as executor:
+            start = time.perf_counter_ns()
+            failed = list(executor.map(execute, range(requests))).count(False)
+            elapsed = time.perf_counter_ns() - start
+        channel.send("stop")
+        stats = channel.recv()
+    finally:
+        server.join(timeout=5)
+        if server.is_alive():
+            server.terminate()
+    return {
+        "ns_per_request": round(elapsed / requests),
+        "p50_ns": round(histogram.percentile(50) * 1e9),
+        "p99_ns": round(histogram.percentile(99) * 1e9),
+        "sockets": stats["connections"],
+        "failed": failed,
+    }
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🚀 Main 🚀
+def main(argv: list = None) -> dict:
+    parser = argparse.ArgumentParser(description="Benchmarks the HTTP/1.1 and HTTP/2 transports under concurrency.")
+    parser.add_argument("--output", help="The JSON results path (printed to stdout if omitted).")
+    parser.add_argument("--requests", type=int, default=2000, help="The number of requests per transport.")
+    parser.add_argument("--concurrency", type=int, default=200, help="The number of concurrent requests.")
+    parser.add_argument("--latency", default="constant:0.02", help="The gateway latency spec (cf. 'mock_gateway.latency_sampler').")
+    parser.add_argument("--connections", type=int, default=2, help="The HTTP/2 connections.")
+    parser.add_argument("--max-streams", type=int, default=100, help="The HTTP/2 concurrent streams per connection.")
+    args = parser.parse_args(argv)
+
+    results = {"meta": metadata(), "results": {}}
+    for label, http2 in (("http/1.1", False), ("http/2", True)):
+        if http2 and transport.h2 is None:
+            print("'h2' is not installed: skipping HTTP/2.", file=sys.stderr)
+            continue
+        results["results"][f"{OPERATION} {label}"] = bench(http2, args.requests, args.concurrency, args.latency, args.connections, args.max_streams)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+    return results
+
+if __name__ == "__main__":
+    main()
+# ═════════════════════════════════════════════════════════════════════════════╝
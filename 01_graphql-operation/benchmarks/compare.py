@@ -0,0 +1,70 @@
+#╔═════════════════════════════════════════════════════════════════════════════╗
+#║══════════════════❯ 💫 Benchmark | Compare 💫
+#╚═════════════════════════════════════════════════════════════════════════════╝
+# Usage:
+#   python benchmarks/compare.py baseline.json results.json [--threshold 0.10]
+# Exits with status 1 if any metric regressed by more than the threshold.
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📦 Dependencies 📦
+# ╚════════❯ 📦 Built-in Dependencies:
+import argparse
+import json
+import sys
+# ╚════════❯ 📦 External Dependencies:
+# ╚════════❯ 📦 Internal Dependencies:
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ ⚖️ Compare ⚖️
+def compare(baseline: dict, current: dict, threshold: float) -> list:
+    """
+    Compares two results files, metric by metric (lower is better for every metric).
+
+    Args:
+        ➤ baseline (dict): The reference results.
+        ➤ current (dict): The new results.
+        ➤ threshold (float): The tolerated relative increase (e.g. 0.10 for +10%).
+
+    Returns:
+        ➤ list: The rows '(name, metric, baseline, current, ratio, regressed)'.
+    """
+
+    rows = []
+    for name, metrics in sorted(current["results"].items()):
+        reference = baseline["results"].get(name)
+        if reference is None:
+            continue
+        for metric, value in sorted(metrics.items()):
+            old = reference.get(metric)
+            if not isinstance(value, (int, float)) or not isinstance(old, (int, float)) or old <= 0:
+                continue
+            ratio = value / old
+            rows.append((name, metric, old, value, ratio, ratio > 1 + threshold))
+    return rows
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description="Reports regressions between two benchmark results files.")
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--threshold", type=float, default=0.10, help="The tolerated relative increase (default: 0.10).")
+    parser.add_argument("--all", action="store_true", help="Also print metrics within the threshold.")
+    args = parser.parse_args(argv)
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    with open(args.current) as file:
+        current = json.load(file)
+
+    rows = compare(baseline, current, args.threshold)
+    regressions = [row for row in rows if row[-1]]
+    print(f"{baseline['meta'].get('commit')} → {current['meta'].get('commit')} (threshold: +{args.threshold:.0%})")
+    for name, metric, old, new, ratio, regressed in rows:
+        if regressed or args.all:
+            print(f"{'❌' if regressed else '✅'} {name:<40} {metric:<16} {old:>12} → {new:>12} ({ratio - 1:+.1%})")
+    print(f"{len(regressions)} regression(s) out of {len(rows)} metric(s).")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
+# ═════════════════════════════════════════════════════════════════════════════╝
@@ -0,0 +1,217 @@
+#╔═════════════════════════════════════════════════════════════════════════════╗
+#║══════════════════❯ 💫 AxieAPI | GraphQL | Circuit Breaker 💫
+#╚═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📦 Dependencies 📦
+# ╚════════❯ 📦 Built-in Dependencies:
+import collections
+import logging
+import threading
+import time
+# ╚════════❯ 📦 External Dependencies:
+# ╚════════❯ 📦 Internal Dependencies:
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🔌 Circuit Breaker 🔌
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+STATES = (CLOSED, HALF_OPEN, OPEN)
+
+logger = logging.getLogger("axie.graphql.breaker")
+
+class CircuitOpenError(Exception):
+    """
+    An exception raised instead of sending a request while the circuit of its operation is open.
+    """
+
+    def __init__(self, name: str, retry_after: float) -> None:
+        super().__init__(f"Circuit of '{name}' is open: failing fast for {retry_after:.1f}s.")
+        self.name = name
+        self.retry_after = retry_after
+
+class _Circuit:
+    __slots__ = ("state", "outcomes", "consecutive", "opened_at", "probes", "successes")
+
+    def __init__(self, window: int) -> None:
+        self.state = CLOSED
+        self.outcomes = collections.deque(maxlen=window)
+        self.consecutive = 0
+        self.opened_at = 0.0
+        self.probes = 0
+        self.successes = 0
+
+class CircuitBreaker:
+    """
+    A class that tracks failures per operation name, and fails fast while an operation keeps failing:
+        - closed: requests flow, and outcomes are recorded over a sliding window.
+        - open: requests are rejected ('CircuitOpenError') for 'recovery_timeout' seconds.
+        - half-open: up to 'half_open_calls' probe requests are let through; their success closes
+          the circuit, a failure opens it again.
+    """
+
+    def __init__(self, failure_threshold: int = 5, failure_rate: float = 0.5, window: int = 20, min_calls: int = 10, recovery_timeout: float = 30.0, half_open_calls: int = 1, clock=time.monotonic) -> None:
+        """
+        Initializes a 'CircuitBreaker' instance.
+
+        Args:
+            ➤ failure_threshold (int): The consecutive failures that open a circuit.
+            ➤ failure_rate (float): The failure rate over the window that opens a circuit.
+            ➤ window (int): The number of recent outcomes the failure rate is computed on.
+            ➤ min_calls (int): The minimum number of outcomes before the failure rate applies.
+            ➤ recovery_timeout (float): How long a circuit stays open before probing, in seconds.
+            ➤ half_open_calls (int): The number of successful probes that close a circuit.
+            ➤ clock (callable): The monotonic clock (e.g. a fake one in tests).
+
+        Raises:
+            ➤ ValueError: If a threshold is out of range.
+        """
+
+        # ┗━━━━━➤ 🚦 Perform checks:
+        if failure_threshold < 1 or half_open_calls < 1 or window < 1:
+            raise ValueError("'failure_threshold', 'half_open_calls' and 'window' must be positive integers.")
+        if not 0 < failure_rate <= 1:
+            raise ValueError(f"'failure_rate' ({failure_rate}) must be in ]0, 1].")
+
+        # ┗━━━━━➤ 📌 Define attributes:
+        self._failure_threshold = failure_threshold
+        self._failure_rate = failure_rate
+        self._window = window
+        self._min_calls = min(min_calls, window)
+        self._recovery_timeout = recovery_timeout
+        self._half_open_calls = half_open_calls
+        self._clock = clock
+        self._circuits = {}
+        self._listeners = []
+        self._lock = threading.Lock()
+
+    def add_listener(self, listener) -> None:
+        """
+        Registers a callback called as 'listener(name, old_state, new_state)' on every transition.
+        """
+
+        self._listeners.append(listener)
+
+    def allow(self, name: str) -> None:
+        """
+        Checks whether a request of an operation can be sent (admitting it as a probe while half-open).
+
+        Raises:
+            ➤ CircuitOpenError: If the circuit is open, or if half-open with every probe already in flight.
+        """
+
+        transition = None
+        with self._lock:
+            circuit = self._circuits.get(name)
+            if circuit is None or circuit.state == CLOSED:
+                return
+            if circuit.state == OPEN:
+                remaining = circuit.opened_at + self._recovery_timeout - self._clock()
+                if remaining > 0:
+                    raise CircuitOpenError(name, remaining)
+                transition = self._set_state(name, circuit, HALF_OPEN)
+            if circuit.probes >= self._half_open_calls - circuit.successes:
+                raise CircuitOpenError(name, 0.0)
+            circuit.probes += 1
+        self._notify(transition)
+
+    def release(self, name: str) -> None:
+        """
+        Gives back a probe admitted by 'allow' for a request that was not sent.
+        """
+
+        with self._lock:
+            circuit = self._circuits.get(name)
+            if circuit is not None and circuit.state == HALF_OPEN and circuit.probes:
+                circuit.probes -= 1
+
+    def record(self, name: str, success: bool) -> None:
+        """
+        Records the outcome of a sent request.
+        """
+
+        transition = None
+        with self._lock:
+            circuit = self._circuits.get(name)
+            if circuit is None:
+                if success:
+                    return
+                circuit = self._circuits[name] = _Circuit(self._window)
+            if circuit.state == HALF_OPEN:
+                circuit.probes = max(0, circuit.probes - 1)
+                if not success:
+                    transition = self._set_state(name, circuit, OPEN)
+                else:
+                    circuit.successes += 1
+                    if circuit.successes >= self._half_open_calls:
+                        transition = self._set_state(name, circuit, CLOSED)
+            elif circuit.state == CLOSED:
+                circuit.outcomes.append(success)
+                circuit.consecutive = 0 if success else circuit.consecutive + 1
+                failures = circuit.outcomes.count(False)
+                if circuit.consecutive >= self._failure_threshold or (
+                    len(circuit.outcomes) >= self._min_calls and failures / len(circuit.outcomes) >= self._failure_rate
+                ):
+                    transition = self._set_state(name, circuit, OPEN)
+        self._notify(transition)
+
+    def state(self, name: str) -> str:
+        """
+        The state of an operation circuit ('closed', 'open' or 'half_open').
+        An open circuit whose recovery timeout elapsed reports 'half_open' (the next request probes it).
+        """
+
+        with self._lock:
+            circuit = self._circuits.get(name)
+            if circuit is None:
+                return CLOSED
+            if circuit.state == OPEN and self._clock() >= circuit.opened_at + self._recovery_timeout:
+                return HALF_OPEN
+            return circuit.state
+
+    def states(self) -> dict:
+        """
+        The state of every tracked operation circuit.
+        """
+
+        return {name: self.state(name) for name in list(self._circuits)}
+
+    def reset(self, name: str = None) -> None:
+        """
+        Closes one circuit (or all of them), forgetting their history.
+        """
+
+        with self._lock:
+            names = [name] if name is not None else list(self._circuits)
+            transitions = [
+                self._set_state(reset_name, self._circuits[reset_name], CLOSED)
+                for reset_name in names if reset_name in self._circuits
+            ]
+        for transition in transitions:
+            self._notify(transition)
+
+    def _set_state(self, name: str, circuit: _Circuit, state: str) -> tuple:
+        """
+        Moves a circuit to a new state (under the lock).
+
+        Returns:
+            ➤ tuple: The '(name, old state, new state)' transition, notified once the lock is released.
+        """
+
+        old = circuit.state
+        circuit.state = state
+        circuit.probes = circuit.successes = 0
+        if state == OPEN:
+            circuit.opened_at = self._clock()
+        elif state == CLOSED:
+            circuit.outcomes.clear()
+            circuit.consecutive = 0
+        return (name, old, state) if old != state else None
+
+    def _notify(self, transition: tuple) -> None:
+        if transition is None:
+            return
+        logger.info("Circuit of '%s': %s -> %s.", *transition)
+        for listener in self._listeners:
+            listener(*transition)
+# ═════════════════════════════════════════════════════════════════════════════╝
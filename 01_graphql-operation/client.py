@@ -0,0 +1,553 @@
+#╔═════════════════════════════════════════════════════════════════════════════╗
+#║══════════════════❯ 💫 AxieAPI | GraphQL | Client 💫
+#╚═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📦 Dependencies 📦
+# ╚════════❯ 📦 Built-in Dependencies:
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+# ╚════════❯ 📦 External Dependencies:
+# ╚════════❯ 📦 Internal Dependencies:
+import operation
+import tracing
+import transport as transports
+from auth import TokenManager
+from breaker import CircuitBreaker, CircuitOpenError
+from hedging import HedgePolicy
+from metrics import Metrics, SlowRequestLog, count_items
+from paginator import find_page
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📨 GraphQL Result 📨
+URL = "https://graphql-gateway.axieinfinity.com/graphql"
+
+class GraphQLResult:
+    """
+    A class that represents the decoded result of one GraphQL operation.
+    """
+
+    def __init__(self, name: str, variables: dict, status: int, data, errors, response: transports.Response, timings: dict = None) -> None:
+        """
+        Initializes a 'GraphQLResult' instance.
+
+        Args:
+            ➤ name (str): The operation name.
+            ➤ variables (dict): The operation variables.
+            ➤ status (int): The HTTP status code.
+            ➤ data: The response 'data' (or None).
+            ➤ errors: The response 'errors' (or None).
+            ➤ response (Response): The raw response (shared by the results of a batch).
+            ➤ timings (dict): The time spent per phase, in seconds ('transport.PHASES' and 'decode').
+        """
+
+        self.name = name
+        self.variables = variables
+        self.status = status
+        self.data = data
+        self.errors = errors
+        self.response = response
+        self.timings = timings or {}
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__module__}.{self.__class__.__name__} '{self.name}' {self.status} object at {hex(id(self))}>"
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether the operation succeeded (HTTP 2xx, and no GraphQL 'errors').
+        """
+
+        return 200 <= self.status < 300 and not self.errors
+
+def _decode(body: bytes):
+    """
+    Decodes a response body, or returns an error object if it is not JSON.
+    """
+
+    try:
+        return json.loads(body)
+    except ValueError:
+        return {"errors": [{"message": body[:200].decode("utf-8", "replace")}]}
+
+def _unauthenticated(result: GraphQLResult) -> bool:
+    """
+    Whether a result was rejected for a missing, invalid or expired access token.
+    """
+
+    return result.status == 401 or any(
+        isinstance(error, dict) and (error.get("extensions") or {}).get("code") == "UNAUTHENTICATED" for error in result.errors or ()
+    )
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ ✂️ Range Splitting ✂️
+class SplitPlanner:
+    """
+    A class that picks how many concurrent sub-ranges a '$from'/'$size' request is split into,
+    from the wall-clock latency measured for each candidate (per operation and page size).
+    """
+
+    def __init__(self, candidates: tuple = (1, 2, 4, 8), min_size: int = 10, explore_every: int = 50, alpha: float = 0.2) -> None:
+        """
+        Initializes a 'SplitPlanner' instance.
+
+        Args:
+            ➤ candidates (tuple): The numbers of sub-ranges to choose from.
+            ➤ min_size (int): The smallest sub-range size.
+            ➤ explore_every (int): Every how many calls a candidate other than the best one is retried.
+            ➤ alpha (float): The weight of a new latency in the moving averages.
+        """
+
+        self._candidates = tuple(sorted(candidates))
+        self._min_size = min_size
+        self._explore_every = explore_every
+        self._alpha = alpha
+        self._latencies = {}
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def choose(self, name: str, size: int) -> int:
+        """
+        The number of sub-ranges to split a page of 'size' items into: untried candidates first,
+        then the fastest one, retrying the others in turn every 'explore_every' calls.
+        """
+
+        candidates = [k for k in self._candidates if k == 1 or size // k >= self._min_size]
+        with self._lock:
+            latencies = self._latencies.setdefault((name, size), {})
+            calls = self._calls[(name, size)] = self._calls.get((name, size), 0) + 1
+            for k in candidates:
+                if k not in latencies:
+                    return k
+            if calls % self._explore_every == 0:
+                return candidates[(calls // self._explore_every) % len(candidates)]
+            return min(candidates, key=latencies.__getitem__)
+
+    def observe(self, name: str, size: int, k: int, latency: float) -> None:
+        """
+        Records the wall-clock latency of a page of 'size' items split into 'k' sub-ranges.
+        """
+
+        with self._lock:
+            latencies = self._latencies.setdefault((name, size), {})
+            previous = latencies.get(k)
+            latencies[k] = latency if previous is None else previous + self._alpha * (latency - previous)
+
+def _ranges(start: int, size: int, k: int) -> list:
+    """
+    Splits '[start, start + size)' into 'k' contiguous '(from, size)' sub-ranges of near-equal sizes.
+    """
+
+    step, extra = divmod(size, k)
+    ranges = []
+    for index in range(k):
+        length = step + (index < extra)
+        ranges.append((start, length))
+        start += length
+    return ranges
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🛰 GraphQL Client 🛰
+class GraphQLClient:
+    """
+    A class that executes 'ValidOperations' operations against the gateway, through a transport.
+    """
+
+    def __init__(self, url: str = URL, transport: transports.Transport = None, headers: dict = None, metrics: Metrics = None, slow_requests: SlowRequestLog = None, split=None, split_planner: SplitPlanner = None, breaker: CircuitBreaker = None, hedging: HedgePolicy = None, tokens: TokenManager = None) -> None:
+        """
+        Initializes a 'GraphQLClient' instance.
+
+        Args:
+            ➤ url (str): The GraphQL endpoint (ignored if 'transport' is given).
+            ➤ transport (Transport): The transport (a pooled 'HTTPTransport' by default).
+            ➤ headers (dict): Extra headers sent with every request.
+            ➤ metrics (Metrics): The per-operation metrics collector (a new one by default, cf. 'metrics').
+            ➤ slow_requests (SlowRequestLog): The log of the slowest requests (a new one by default, cf. 'slow_requests').
+            ➤ split (int | str): The default range splitting of 'execute' (cf. 'execute').
+            ➤ split_planner (SplitPlanner): The planner of 'split="auto"' (a new one by default).
+            ➤ breaker (CircuitBreaker): The per-operation circuit breaker (a new one by default, cf. 'breaker').
+            ➤ hedging (HedgePolicy): Hedges slow requests of latency-critical queries (disabled by default).
+            ➤ tokens (TokenManager): Authorizes 🔐 operations (logging in through this client if it has none, cf. 'auth').
+        """
+
+        self._transport = transport or transports.HTTPTransport(url)
+        self._headers = headers or {}
+        self._metrics = metrics if metrics is not None else Metrics()
+        self._slow_requests = slow_requests if slow_requests is not None else SlowRequestLog()
+        self._breaker = breaker if breaker is not None else CircuitBreaker()
+        self._breaker.add_listener(self._metrics.transition)
+        self._split = split
+        self._split_planner = split_planner or SplitPlanner()
+        self._hedging = hedging
+        self._tokens = tokens
+        if tokens is not None and tokens.client is None:
+            tokens.client = self
+        self._executor = None
+        self._hedge_executor = None
+        self._operations = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__module__}.{self.__class__.__name__} {self._transport!r} object at {hex(id(self))}>"
+
+    def __enter__(self) -> "GraphQLClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def transport(self) -> transports.Transport:
+        """
+        """
+
+        return self._transport
+
+    @property
+    def metrics(self) -> Metrics:
+        """
+        """
+
+        return self._metrics
+
+    @property
+    def slow_requests(self) -> SlowRequestLog:
+        """
+        """
+
+        return self._slow_requests
+
+    @property
+    def breaker(self) -> CircuitBreaker:
+        """
+        """
+
+        return self._breaker
+
+    @property
+    def tokens(self) -> TokenManager:
+        """
+        """
+
+        return self._tokens
+
+    def operation(self, name: str) -> operation.GraphQLOperation:
+        """
+        Returns the 'GraphQLOperation' of an operation name (built once per client).
+
+        Raises:
+            ➤ TypeError: If 'name' is not a string.
+            ➤ ValueError: If 'name' is not a valid operation name.
+        """
+
+        graphql_operation = self._operations.get(name)
+        if graphql_operation is None:
+            with self._lock:
+                graphql_operation = self._operations.setdefault(name, operation.GraphQLOperation(name))
+        return graphql_operation
+
+    def payload(self, name: str, variables: dict = None) -> dict:
+        """
+        Builds the payload of an operation, with the given variable values.
+        """
+
+        return {"operationName": name, "query": self.operation(name).query, "variables": variables or {}}
+
+    def execute(self, name: str, variables: dict = None, headers: dict = None, split=None, account: str = None) -> GraphQLResult:
+        """
+        Executes one operation.
+
+        Args:
+            ➤ name (str): The operation name.
+            ➤ variables (dict): The operation variables.
+            ➤ headers (dict): Extra headers for this request.
+            ➤ split (int | str): Splits a '$from'/'$size' request into that many concurrent sub-ranges,
+            stitched back into one result ('auto' picks it from measured latency, cf. 'SplitPlanner').
+            Defaults to the client 'split' option; None or 1 sends a single request.
+            ➤ account (str): The account whose access token authorizes a 🔐 operation (the default one of 'tokens' if omitted).
+
+        Returns:
+            ➤ GraphQLResult: The decoded result.
+
+        Raises:
+            ➤ ValueError: If 'name' is not a valid operation name.
+            ➤ CircuitOpenError: If the operation keeps failing (cf. 'breaker').
+            ➤ AuthenticationError: If an access token can't be obtained (cf. 'tokens').
+            ➤ OSError: If the request fails at the network level.
+        """
+
+        split = split if split is not None else self._split
+        if split not in (None, 1) and variables and isinstance(variables.get("size"), int) and isinstance(variables.get("from"), int):
+            return self._execute_split(name, variables, headers, split, account)
+        return self._authorize([name], headers, account, lambda headers: self._execute_one(name, variables, headers))
+
+    def _execute_one(self, name: str, variables: dict, headers: dict) -> GraphQLResult:
+        """
+        Sends one operation in one request, and decodes its result.
+        """
+
+        with tracing.span("graphql.operation", operation=name):
+            operations = [(name, variables)]
+            payload, body = self._compile(operations)
+            payload = payload[0]
+            response, start = self._send(operations, payload, body, headers)
+            with tracing.span("graphql.decode", bytes_in=len(response.body), bytes_wire=response.wire_bytes):
+                decoding = time.perf_counter()
+                decoded = _decode(response.body)
+                if not isinstance(decoded, dict):
+                    decoded = {"errors": [{"message": "Unexpected response."}]}
+                timings = {**response.timings, "decode": time.perf_counter() - decoding}
+            result = GraphQLResult(name, variables or {}, response.status, decoded.get("data"), decoded.get("errors"), response, timings)
+            self._observe(result, time.perf_counter() - start, len(body), len(response.body), response.wire_bytes)
+            return result
+
+    def execute_batch(self, operations: list, headers: dict = None, account: str = None) -> list:
+        """
+        Executes several operations in one request (a JSON list payload).
+
+        Args:
+            ➤ operations (list): The '(name, variables)' pairs.
+            ➤ headers (dict): Extra headers for this request.
+            ➤ account (str): The account whose access token authorizes 🔐 operations (cf. 'execute').
+
+        Returns:
+            ➤ list: The 'GraphQLResult' of each operation, in order.
+        """
+
+        return self._authorize([name for name, _ in operations], headers, account, lambda headers: self._execute_batch(operations, headers))
+
+    def _execute_batch(self, operations: list, headers: dict) -> list:
+        """
+        Sends several operations in one request, and decodes their results.
+        """
+
+        with tracing.span("graphql.batch", operations=[name for name, _ in operations]):
+            payload, body = self._compile(operations)
+            response, start = self._send(operations, payload, body, headers)
+            with tracing.span("graphql.decode", bytes_in=len(response.body), bytes_wire=response.wire_bytes):
+                decoding = time.perf_counter()
+                decoded = _decode(response.body)
+                if not isinstance(decoded, list):
+                    decoded = [decoded] * len(payload)
+                timings = {**response.timings, "decode": time.perf_counter() - decoding}
+            results = [
+                GraphQLResult(name, variables or {}, response.status, item.get("data"), item.get("errors"), response, timings)
+                for (name, variables), item in zip(operations, decoded)
+            ]
+            elapsed = time.perf_counter() - start
+            for result in results:
+                # The batch bytes are shared evenly between its operations:
+                self._observe(result, elapsed, len(body) // len(results), len(response.body) // len(results), response.wire_bytes // len(results))
+            return results
+
+    async def execute_async(self, name: str, variables: dict = None, headers: dict = None, split=None, account: str = None) -> GraphQLResult:
+        """
+        Executes one operation from a worker thread (cf. 'execute'), keeping the caller's tracing context.
+        """
+
+        return await asyncio.to_thread(self.execute, name, variables, headers, split, account)
+
+    async def execute_batch_async(self, operations: list, headers: dict = None, account: str = None) -> list:
+        """
+        Executes several operations in one request from a worker thread (cf. 'execute_batch').
+        """
+
+        return await asyncio.to_thread(self.execute_batch, operations, headers, account)
+
+    def _authorize(self, names: list, headers: dict, account: str, execute):
+        """
+        Runs 'execute(headers)' with the access token of 'account' if an operation is 🔐, then once more
+        with a new token if the gateway rejected it (revoked, or expired earlier than announced).
+        """
+
+        if self._tokens is None or not any(self.operation(name).auth for name in names):
+            return execute(headers)
+        for retry in (False, True):
+            access_token = self._tokens.token(account)
+            results = execute({**(headers or {}), "Authorization": f"Bearer {access_token}"})
+            if retry or not any(_unauthenticated(result) for result in (results if isinstance(results, list) else [results])):
+                return results
+            self._tokens.invalidate(account, access_token)
+
+    def _execute_split(self, name: str, variables: dict, headers: dict, split, account: str = None) -> GraphQLResult:
+        """
+        Executes a '$from'/'$size' request as concurrent sub-ranges, then stitches them back in order:
+        'results' are concatenated (up to the first short sub-range), and 'total' is the largest one seen.
+        """
+
+        size = variables["size"]
+        k = self._split_planner.choose(name, size) if split == "auto" else max(1, min(int(split), size))
+        if k == 1:
+            start = time.perf_counter()
+            result = self.execute(name, variables, headers, 1, account)
+            if split == "auto":
+                self._split_planner.observe(name, size, 1, time.perf_counter() - start)
+            return result
+
+        with tracing.span("graphql.split", operation=name, ranges=k):
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="GraphQLClient")
+            start = time.perf_counter()
+            futures = [
+                self._executor.submit(tracing.wrap(self.execute), name, {**variables, "from": offset, "size": length}, headers, 1, account)
+                for offset, length in _ranges(variables["from"], size, k)
+            ]
+            results = [future.result() for future in futures]
+            elapsed = time.perf_counter() - start
+            if split == "auto":
+                self._split_planner.observe(name, size, k, elapsed)
+
+            # Stitch the sub-ranges:
+            data, errors, items, total = None, [], [], None
+            for (offset, length), result in zip(_ranges(variables["from"], size, k), results):
+                errors.extend(result.errors or ())
+                page = find_page(result.data)
+                if page is None:
+                    continue
+                if data is None:
+                    data = result.data
+                if page.get("total") is not None:
+                    total = max(total or 0, page["total"])
+                if len(items) == offset - variables["from"]:
+                    items.extend(page["results"])
+            if data is None:
+                data = results[0].data
+            else:
+                page = find_page(data)
+                page["results"] = items
+                if "total" in page:
+                    page["total"] = total
+
+            status = max(result.status for result in results)
+            timings = {phase: max(result.timings.get(phase, 0.0) for result in results) for phase in results[0].timings}
+            body = transports.encode({"data": data, "errors": errors} if errors else {"data": data})
+            wire_bytes = sum(result.response.wire_bytes for result in results)
+            response = transports.Response(status, results[0].response.headers, body, elapsed, timings, wire_bytes)
+            return GraphQLResult(name, variables, status, data, errors or None, response, timings)
+
+    def _compile(self, operations: list) -> tuple:
+        """
+        Builds the payloads of operations, and encodes them.
+
+        Returns:
+            ➤ tuple: '(payloads, body)'.
+        """
+
+        with tracing.span("graphql.compile") as span:
+            span.set("cached", all(name in self._operations for name, _ in operations))
+            payload = [self.payload(name, variables) for name, variables in operations]
+            body = transports.encode(payload if len(payload) > 1 else payload[0])
+            span.set("bytes_out", len(body))
+        return payload, body
+
+    def _send(self, operations: list, payload, body: bytes, headers: dict) -> tuple:
+        """
+        Sends an encoded payload, recording failed requests.
+
+        Returns:
+            ➤ tuple: '(response, start)', where start is the 'time.perf_counter()' of the request.
+
+        Raises:
+            ➤ CircuitOpenError: If the circuit of an operation is open (nothing is sent).
+        """
+
+        admitted = []
+        for name, _ in operations:
+            try:
+                self._breaker.allow(name)
+            except CircuitOpenError:
+                for admitted_name in admitted:
+                    self._breaker.release(admitted_name)
+                for rejected_name, _ in operations:
+                    self._metrics.reject(rejected_name)
+                raise
+            admitted.append(name)
+
+        start = time.perf_counter()
+        with tracing.span("graphql.send", bytes_out=len(body)) as span:
+            try:
+                response = self._transmit(operations, payload, body, {**self._headers, **(headers or {})}, span)
+            except Exception as exception:
+                elapsed = time.perf_counter() - start
+                for name, variables in operations:
+                    self._breaker.record(name, False)
+                    self._metrics.observe(name, elapsed, bytes_out=len(body) // len(operations), failed=True)
+                    self._slow_requests.capture(name, elapsed, variables or {}, {}, len(body) // len(operations), 0, error=repr(exception))
+                raise
+            span.set("status", response.status)
+        return response, start
+
+    def _transmit(self, operations: list, payload, body: bytes, headers: dict, span: tracing.Span) -> transports.Response:
+        """
+        Sends an encoded payload through the transport, hedging it if 'hedging' applies: when no response arrived
+        after the hedge delay, the same request is sent again, the first response wins and the other is cancelled.
+        """
+
+        name = operations[0][0]
+        delay = self._hedging.delay(name, self._metrics.histogram(name)) if self._hedging is not None and len(operations) == 1 else None
+        if delay is None:
+            return self._transport.send(payload, body, headers)
+
+        with self._lock:
+            if self._hedge_executor is None:
+                # Separate from the sub-range workers, which may wait on hedged requests:
+                self._hedge_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="GraphQLClient-hedge")
+
+        def attempt(cancellation: transports.Cancellation) -> transports.Response:
+            with cancellation:
+                return self._transport.send(payload, body, headers)
+
+        attempts = {}
+        for hedge in (False, True):
+            cancellation = transports.Cancellation()
+            attempts[self._hedge_executor.submit(tracing.wrap(attempt), cancellation)] = (cancellation, hedge)
+            if hedge or wait(attempts, timeout=delay).done or not self._hedging.acquire():
+                break
+        span.set("hedged", len(attempts) > 1)
+
+        pending, error = set(attempts), None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    response = future.result()
+                except Exception as exception:
+                    error = error or exception
+                    continue
+                for loser in pending:
+                    loser.cancel()
+                    attempts[loser][0].cancel()
+                if len(attempts) > 1:
+                    self._metrics.hedge(name, won=attempts[future][1])
+                    span.set("hedge_won", attempts[future][1])
+                return response
+        if len(attempts) > 1:
+            self._metrics.hedge(name, won=False)
+        raise error
+
+    def _observe(self, result: GraphQLResult, elapsed: float, bytes_out: int, bytes_in: int, bytes_wire: int) -> None:
+        # Only server-side failures count against the circuit (not 4xx, nor GraphQL validation errors):
+        self._breaker.record(result.name, result.status < 500)
+        self._metrics.observe(
+            result.name, elapsed, bytes_out=bytes_out, bytes_in=bytes_in, bytes_wire=bytes_wire, items=count_items(result.data),
+            errors=len(result.errors or ()), failed=not 200 <= result.status < 300
+        )
+        self._slow_requests.capture(result.name, elapsed, result.variables, result.timings, bytes_out, bytes_in, result.status)
+
+    def close(self) -> None:
+        """
+        Closes the transport, the sub-range and the hedge workers.
+        """
+
+        for executor in (self._executor, self._hedge_executor):
+            if executor is not None:
+                executor.shutdown()
+        self._transport.close()
+# ═════════════════════════════════════════════════════════════════════════════╝
@@ -0,0 +1,272 @@
+#╔═════════════════════════════════════════════════════════════════════════════╗
+#║══════════════════❯ 💫 AxieAPI | GraphQL | Code Generation 💫
+#╚═════════════════════════════════════════════════════════════════════════════╝
+# Usage:
+#   python codegen.py [--documents DIR] [--output FILE] [--check] [--no-validate]
+#   python codegen.py --refresh-schema [URL]
+# Compiles 'documents/' (one '.graphql' file per operation or fragment) into 'compiled_operations.py'.
+# An operation file may also define fragments: they override the shared ones for this operation only.
+# Every operation is validated against the schema snapshot ('schema.json', cf. 'schema.py') before anything is written.
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📦 Dependencies 📦
+# ╚════════❯ 📦 Built-in Dependencies:
+import argparse
+import hashlib
+import json
+import os
+import pprint
+import sys
+# ╚════════❯ 📦 External Dependencies:
+# ╚════════❯ 📦 Internal Dependencies:
+import cost
+import document
+import schema
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📚 Documents 📚
+DOCUMENTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "documents")
+OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "compiled_operations.py")
+AUTH_MARKER = "🔐"
+
+class Definition:
+    """
+    A class that holds one definition of a '.graphql' file.
+    """
+
+    __slots__ = ("name", "text", "node", "path", "auth")
+
+    def __init__(self, name: str, text: str, node: document.Node, path: str, auth: bool) -> None:
+        """
+        Initializes a 'Definition' instance.
+
+        Args:
+            ➤ name (str): The operation or fragment name.
+            ➤ text (str): The minified definition.
+            ➤ node (Node): The parsed definition.
+            ➤ path (str): The '.graphql' file it comes from.
+            ➤ auth (bool): Whether the file is marked as requiring authentication ('# 🔐').
+        """
+
+        self.name = name
+        self.text = text
+        self.node = node
+        self.path = path
+        self.auth = auth
+
+def load(directory: str = DOCUMENTS) -> tuple:
+    """
+    Loads every '.graphql' file of a directory tree.
+
+    Returns:
+        ➤ tuple: '(fragments, operations, overrides)': the shared fragments by name, the operations by file name,
+                 and the fragments defined in each operation file.
+
+    Raises:
+        ➤ SyntaxError: If a file is not valid GraphQL.
+        ➤ ValueError: If a name is defined twice, or an operation is not named after its file.
+    """
+
+    fragments, operations, overrides = {}, {}, {}
+    for root, folders, files in os.walk(directory):
+        folders.sort()
+        for file in sorted(files):
+            if not file.endswith(".graphql"):
+                continue
+            path = os.path.join(root, file)
+            with open(path, encoding="utf-8") as handle:
+                text = handle.read()
+            auth = any(line.startswith("#") and AUTH_MARKER in line for line in text.splitlines())
+            try:
+                parsed = [(chunk, document.parse(chunk)) for chunk in document.definitions(text)]
+            except SyntaxError as error:
+                raise SyntaxError(f"{path}: {error}") from None
+
+            local, found = {}, []
+            for chunk, node in parsed:
+                if node.operations:
+                    found.append((chunk, node.operations[0]))
+                    continue
+                definition = next(iter(node.fragments.values()))
+                if definition.name in local:
+                    raise ValueError(f"{path}: fragment '{definition.name}' is defined twice.")
+                local[definition.name] = Definition(definition.name, chunk, definition, path, auth)
+            if len(found) > 1:
+                raise ValueError(f"{path}: a file holds at most one operation.")
+            if found:
+                # Operations are named after their file (the name is sent as 'operationName', and must match the document):
+                name = file[:-len(".graphql")]
+                if found[0][1].name != name:
+                    raise ValueError(f"{path}: the operation is named '{found[0][1].name}', but its file is named '{name}'.")
+                if name in operations:
+                    raise ValueError(f"{path}: operation '{name}' is already defined in {operations[name].path}.")
+                operations[name] = Definition(name, found[0][0], found[0][1], path, auth)
+                overrides[name] = local
+            else:
+                for name, definition in local.items():
+                    if name in fragments:
+                        raise ValueError(f"{path}: fragment '{name}' is already defined in {fragments[name].path}.")
+                    fragments[name] = definition
+    return fragments, operations, overrides
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ ⚙️ Compilation ⚙️
+def _spreads(selections: list, found: list) -> list:
+    """
+    Lists the fragment names spread in selections, in order of first use.
+    """
+
+    for selection in selections:
+        if isinstance(selection, document.FragmentSpread):
+            if selection.name not in found:
+                found.append(selection.name)
+        else:
+            _spreads(selection.selections, found)
+    return found
+
+def _variable_type(variable: document.VariableDefinition) -> str:
+    """
+    Formats a variable type as 'GraphQLOperation.variables' does, with its default value (e.g. 'Boolean=false').
+    """
+
+    default = variable.default
+    if default is None:
+        return variable.type
+    if isinstance(default, bool):
+        default = "true" if default else "false"
+    elif isinstance(default, document.Enum):
+        default = default.value
+    elif isinstance(default, str):
+        default = json.dumps(default)
+    return f"{variable.type}={default}"
+
+def resolve(definition: Definition, fragments: dict) -> list:
+    """
+    Lists the fragments a definition uses, transitively and without duplicates (depth-first, in order of first use).
+
+    Raises:
+        ➤ ValueError: If a fragment is not defined.
+    """
+
+    resolved, pending = [], _spreads(definition.node.selections, [])[::-1]
+    while pending:
+        name = pending.pop()
+        if name in resolved:
+            continue
+        if name not in fragments:
+            raise ValueError(f"{definition.path}: fragment '{name}' is not defined.")
+        resolved.append(name)
+        pending.extend(_spreads(fragments[name].node.selections, [])[::-1])
+    return resolved
+
+def compile_documents(directory: str = DOCUMENTS) -> tuple:
+    """
+    Compiles the '.graphql' files of a directory.
+
+    Returns:
+        ➤ tuple: '(fragments, operations)' tables:
+            - fragments: name -> minified fragment, followed by the fragments it uses.
+            - operations: name -> dict of 'kind', 'query' (minified, with its fragments once each), 'fragments',
+              'sha256' (of 'query', e.g. for persisted queries), 'variables' (name -> type), 'auth' and 'cost'
+              ('(depth, nodes, fragments, spreads, fixed, per_item)', cf. 'cost.Cost').
+    """
+
+    fragments, operations, overrides = load(directory)
+
+    compiled_fragments = {}
+    for name, definition in fragments.items():
+        used = resolve(definition, fragments)
+        compiled_fragments[name] = "".join([definition.text, *(fragments[used_name].text for used_name in used)])
+
+    compiled_operations = {}
+    for name, definition in operations.items():
+        scope = {**fragments, **overrides[name]}
+        used = resolve(definition, scope)
+        query = "".join([definition.text, *(scope[used_name].text for used_name in used)])
+        estimate = cost.analyze(query, definition.node.name)
+        compiled_operations[name] = {
+            "kind": definition.node.kind,
+            "query": query,
+            "fragments": tuple(used),
+            "sha256": hashlib.sha256(query.encode("utf-8")).hexdigest(),
+            "variables": {variable.name: _variable_type(variable) for variable in definition.node.variables},
+            "auth": definition.auth or any(scope[used_name].auth for used_name in used),
+            "cost": (estimate.depth, estimate.nodes, estimate.fragments, estimate.spreads, estimate.fixed, estimate.per_item),
+        }
+    return compiled_fragments, compiled_operations
+
+def validate_operations(operations: dict, snapshot: dict) -> list:
+    """
+    Validates compiled operations against a schema snapshot (cf. 'schema.validate'), each under the name
+    it is sent with as 'operationName'.
+
+    Returns:
+        ➤ list: The error messages, prefixed by the operation name.
+    """
+
+    errors = []
+    for name, compiled in operations.items():
+        errors.extend(f"{name}: {error}" for error in schema.validate(compiled["query"], snapshot, name))
+    return errors
+
+def render(fragments: dict, operations: dict) -> str:
+    """
+    Renders the compiled tables as a Python module.
+    """
+
+    return (
+        "#╔═════════════════════════════════════════════════════════════════════════════╗\n"
+        "#║══════════════════❯ 💫 AxieAPI | GraphQL | Compiled Operations 💫\n"
+        "#╚═════════════════════════════════════════════════════════════════════════════╝\n"
+        "# Generated by 'codegen.py' from 'documents/': do not edit, run 'python codegen.py' instead.\n"
+        "\n\n"
+        f"FRAGMENTS = {pprint.pformat(fragments, width=120, sort_dicts=False)}\n"
+        "\n"
+        f"OPERATIONS = {pprint.pformat(operations, width=120, sort_dicts=False)}\n"
+    )
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🚀 Main 🚀
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description="Compiles the '.graphql' documents into 'compiled_operations.py'.")
+    parser.add_argument("--documents", default=DOCUMENTS, help="The directory of '.graphql' files.")
+    parser.add_argument("--output", default=OUTPUT, help="The generated module path.")
+    parser.add_argument("--check", action="store_true", help="Only check that the generated module is up to date.")
+    parser.add_argument("--schema", default=schema.SNAPSHOT, help="The schema snapshot path.")
+    parser.add_argument("--no-validate", action="store_true", help="Skip the validation against the schema snapshot.")
+    parser.add_argument("--refresh-schema", nargs="?", const=schema.URL, metavar="URL", help="Replace the snapshot with the introspection result of an endpoint.")
+    args = parser.parse_args(argv)
+
+    fragments, operations = compile_documents(args.documents)
+    if args.refresh_schema:
+        schema.save(schema.fetch(args.refresh_schema), args.schema)
+    if not args.no_validate and os.path.exists(args.schema):
+        errors = validate_operations(operations, schema.load(args.schema))
+        for error in errors:
+            print(error, file=sys.stderr)
+        if errors:
+            print(f"{len(errors)} error(s): nothing was written.", file=sys.stderr)
+            return 1
+
+    source = render(fragments, operations)
+    try:
+        with open(args.output, encoding="utf-8") as file:
+            current = file.read()
+    except FileNotFoundError:
+        current = None
+    if args.check:
+        if current != source:
+            print(f"{args.output} is out of date: run 'python codegen.py'.", file=sys.stderr)
+            return 1
+        return 0
+    if current != source:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(source)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
+# ═════════════════════════════════════════════════════════════════════════════╝
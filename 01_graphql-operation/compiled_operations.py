@@ -0,0 +1,1180 @@
+#╔═════════════════════════════════════════════════════════════════════════════╗
+#║══════════════════❯ 💫 AxieAPI | GraphQL | Compiled Operations 💫
+#╚═════════════════════════════════════════════════════════════════════════════╝
+# Generated by 'codegen.py' from 'documents/': do not edit, run 'python codegen.py' instead.
+
+
+FRAGMENTS = {'Equipment': 'fragment Equipment on Equipment{alias name equipmentType slot rarity collections total equippedTotal '
+              'minPrice __typename}',
+ 'EquipmentDetail': 'fragment EquipmentDetail on EquipmentInstance{tokenId alias equipmentId equipmentType name slot '
+                    'rarity collections order{...OrderInfo __typename}__typename}fragment OrderInfo on Order{id maker '
+                    'kind assets{...AssetInfo __typename}expiredAt paymentToken startedAt basePrice endedAt endedPrice '
+                    'expectedState nonce marketFeePercentage signature hash duration timeLeft currentPrice '
+                    'suggestedPrice currentPriceUsd __typename}fragment AssetInfo on Asset{erc address id quantity '
+                    'orderId __typename}',
+ 'EquipmentInstance': 'fragment EquipmentInstance on EquipmentInstance{id:tokenId tokenId alias name equipmentId '
+                      'equipmentType slot owner equippedBy rarity collections __typename}',
+ 'EquipmentSettledBrief': 'fragment EquipmentSettledBrief on EquipmentInstance{alias name equipmentId equipmentType '
+                          'slot owner equippedBy rarity collections}',
+ 'AccountAddresses': 'fragment AccountAddresses on NetAddresses{ronin ethereum __typename}',
+ 'AccountReferral': 'fragment AccountReferral on AccountReferral{code address addedAt __typename}',
+ 'Activity': 'fragment Activity on Activity{activityId accountId action timestamp data{...on BuyAxie{...BuyAxie '
+             '__typename}...on ListAxie{...ListAxie __typename}...on UnlistAxie{...UnlistAxie __typename}...on '
+             'GiftAxie{...GiftAxie __typename}...on MakeAxieOffer{...MakeAxieOffer __typename}...on '
+             'CancelAxieOffer{...CancelAxieOffer __typename}...on SyncExp{...SyncExp __typename}...on '
+             'MorphToPetite{...MorphToPetite __typename}...on MorphToAdult{...MorphToAdult __typename}...on '
+             'BreedAxies{...BreedAxies __typename}...on BuyLand{...BuyLand __typename}...on ListLand{...ListLand '
+             '__typename}...on UnlistLand{...UnlistLand __typename}...on GiftLand{...GiftLand __typename}...on '
+             'MakeLandOffer{...MakeLandOffer __typename}...on CancelLandOffer{...CancelLandOffer __typename}...on '
+             'BuyItem{...BuyItem __typename}...on ListItem{...ListItem __typename}...on UnlistItem{...UnlistItem '
+             '__typename}...on GiftItem{...GiftItem __typename}...on MakeItemOffer{...MakeItemOffer __typename}...on '
+             'CancelItemOffer{...CancelItemOffer __typename}...on ListBundle{...ListBundle __typename}...on '
+             'UnlistBundle{...UnlistBundle __typename}...on BuyBundle{...BuyBundle __typename}...on '
+             'MakeBundleOffer{...MakeBundleOffer __typename}...on CancelBundleOffer{...CancelBundleOffer '
+             '__typename}...on AddLoomBalance{...AddLoomBalance __typename}...on WithdrawFromLoom{...WithdrawFromLoom '
+             '__typename}...on AddFundBalance{...AddFundBalance __typename}...on WithdrawFromFund{...WithdrawFromFund '
+             '__typename}...on TopupRoninWeth{...TopupRoninWeth __typename}...on '
+             'WithdrawRoninWeth{...WithdrawRoninWeth __typename}__typename}__typename}fragment BuyAxie on '
+             'BuyAxie{axieId price owner txHash __typename}fragment ListAxie on ListAxie{axieId priceFrom priceTo '
+             'duration txHash __typename}fragment UnlistAxie on UnlistAxie{axieId txHash __typename}fragment GiftAxie '
+             'on GiftAxie{axieId destination txHash __typename}fragment MakeAxieOffer on MakeAxieOffer{axieId price '
+             'txHash __typename}fragment CancelAxieOffer on CancelAxieOffer{axieId txHash __typename}fragment SyncExp '
+             'on SyncExp{axieId exp txHash __typename}fragment MorphToPetite on MorphToPetite{axieId txHash '
+             '__typename}fragment MorphToAdult on MorphToAdult{axieId txHash __typename}fragment BreedAxies on '
+             'BreedAxies{sireId matronId lovePotionAmount txHash __typename}fragment BuyLand on BuyLand{row col price '
+             'owner txHash __typename}fragment ListLand on ListLand{row col priceFrom priceTo duration txHash '
+             '__typename}fragment UnlistLand on UnlistLand{row col txHash __typename}fragment GiftLand on GiftLand{row '
+             'col destination txHash __typename}fragment MakeLandOffer on MakeLandOffer{row col price txHash '
+             '__typename}fragment CancelLandOffer on CancelLandOffer{row col txHash __typename}fragment BuyItem on '
+             'BuyItem{tokenId itemAlias price owner txHash __typename}fragment ListItem on ListItem{tokenId itemAlias '
+             'priceFrom priceTo duration txHash __typename}fragment UnlistItem on UnlistItem{tokenId itemAlias txHash '
+             '__typename}fragment GiftItem on GiftItem{tokenId itemAlias destination txHash __typename}fragment '
+             'MakeItemOffer on MakeItemOffer{tokenId itemAlias price txHash __typename}fragment CancelItemOffer on '
+             'CancelItemOffer{tokenId itemAlias txHash __typename}fragment ListBundle on ListBundle{numberOfItems '
+             'priceFrom priceTo duration txHash __typename}fragment UnlistBundle on UnlistBundle{listingIndex txHash '
+             '__typename}fragment BuyBundle on BuyBundle{listingIndex price owner txHash __typename}fragment '
+             'MakeBundleOffer on MakeBundleOffer{listingIndex price txHash __typename}fragment CancelBundleOffer on '
+             'CancelBundleOffer{listingIndex txHash __typename}fragment AddLoomBalance on AddLoomBalance{amount '
+             'senderAddress receiverAddress txHash __typename}fragment WithdrawFromLoom on WithdrawFromLoom{amount '
+             'senderAddress receiverAddress txHash __typename}fragment AddFundBalance on AddFundBalance{amount '
+             'senderAddress txHash __typename}fragment WithdrawFromFund on WithdrawFromFund{amount receiverAddress '
+             'txHash __typename}fragment TopupRoninWeth on TopupRoninWeth{amount receiverAddress txHash '
+             'receiverAddress __typename}fragment WithdrawRoninWeth on WithdrawRoninWeth{amount receiverAddress txHash '
+             'receiverAddress __typename}',
+ 'PrivateProfile': 'fragment PrivateProfile on AccountProfile{name accountId addresses{...AccountAddresses '
+                   '__typename}activated email settings{unsubscribeNotificationEmail '
+                   '__typename}referral{...AccountReferral __typename}isScholar __typename}fragment AccountAddresses '
+                   'on NetAddresses{ronin ethereum __typename}fragment AccountReferral on AccountReferral{code address '
+                   'addedAt __typename}',
+ 'PublicProfile': 'fragment PublicProfile on PublicProfile{name accountId addresses{...AccountAddresses '
+                  '__typename}__typename}fragment AccountAddresses on NetAddresses{ronin ethereum __typename}',
+ 'AddFundBalance': 'fragment AddFundBalance on AddFundBalance{amount senderAddress txHash __typename}',
+ 'AddLoomBalance': 'fragment AddLoomBalance on AddLoomBalance{amount senderAddress receiverAddress txHash __typename}',
+ 'BreedAxies': 'fragment BreedAxies on BreedAxies{sireId matronId lovePotionAmount txHash __typename}',
+ 'BuyAxie': 'fragment BuyAxie on BuyAxie{axieId price owner txHash __typename}',
+ 'BuyBundle': 'fragment BuyBundle on BuyBundle{listingIndex price owner txHash __typename}',
+ 'BuyItem': 'fragment BuyItem on BuyItem{tokenId itemAlias price owner txHash __typename}',
+ 'BuyLand': 'fragment BuyLand on BuyLand{row col price owner txHash __typename}',
+ 'CancelAxieOffer': 'fragment CancelAxieOffer on CancelAxieOffer{axieId txHash __typename}',
+ 'CancelBundleOffer': 'fragment CancelBundleOffer on CancelBundleOffer{listingIndex txHash __typename}',
+ 'CancelItemOffer': 'fragment CancelItemOffer on CancelItemOffer{tokenId itemAlias txHash __typename}',
+ 'CancelLandOffer': 'fragment CancelLandOffer on CancelLandOffer{row col txHash __typename}',
+ 'GiftAxie': 'fragment GiftAxie on GiftAxie{axieId destination txHash __typename}',
+ 'GiftItem': 'fragment GiftItem on GiftItem{tokenId itemAlias destination txHash __typename}',
+ 'GiftLand': 'fragment GiftLand on GiftLand{row col destination txHash __typename}',
+ 'ListAxie': 'fragment ListAxie on ListAxie{axieId priceFrom priceTo duration txHash __typename}',
+ 'ListBundle': 'fragment ListBundle on ListBundle{numberOfItems priceFrom priceTo duration txHash __typename}',
+ 'ListItem': 'fragment ListItem on ListItem{tokenId itemAlias priceFrom priceTo duration txHash __typename}',
+ 'ListLand': 'fragment ListLand on ListLand{row col priceFrom priceTo duration txHash __typename}',
+ 'MakeAxieOffer': 'fragment MakeAxieOffer on MakeAxieOffer{axieId price txHash __typename}',
+ 'MakeBundleOffer': 'fragment MakeBundleOffer on MakeBundleOffer{listingIndex price txHash __typename}',
+ 'MakeItemOffer': 'fragment MakeItemOffer on MakeItemOffer{tokenId itemAlias price txHash __typename}',
+ 'MakeLandOffer': 'fragment MakeLandOffer on MakeLandOffer{row col price txHash __typename}',
+ 'MorphToAdult': 'fragment MorphToAdult on MorphToAdult{axieId txHash __typename}',
+ 'MorphToPetite': 'fragment MorphToPetite on MorphToPetite{axieId txHash __typename}',
+ 'SyncExp': 'fragment SyncExp on SyncExp{axieId exp txHash __typename}',
+ 'TopupRoninWeth': 'fragment TopupRoninWeth on TopupRoninWeth{amount receiverAddress txHash receiverAddress '
+                   '__typename}',
+ 'UnlistAxie': 'fragment UnlistAxie on UnlistAxie{axieId txHash __typename}',
+ 'UnlistBundle': 'fragment UnlistBundle on UnlistBundle{listingIndex txHash __typename}',
+ 'UnlistItem': 'fragment UnlistItem on UnlistItem{tokenId itemAlias txHash __typename}',
+ 'UnlistLand': 'fragment UnlistLand on UnlistLand{row col txHash __typename}',
+ 'WithdrawFromFund': 'fragment WithdrawFromFund on WithdrawFromFund{amount receiverAddress txHash __typename}',
+ 'WithdrawFromLoom': 'fragment WithdrawFromLoom on WithdrawFromLoom{amount senderAddress receiverAddress txHash '
+                     '__typename}',
+ 'WithdrawRoninWeth': 'fragment WithdrawRoninWeth on WithdrawRoninWeth{amount receiverAddress txHash receiverAddress '
+                      '__typename}',
+ 'AxieBannedStatus': 'fragment AxieBannedStatus on AxieBattleInfo{banned __typename}',
+ 'AxieBattleInfo': 'fragment AxieBattleInfo on AxieBattleInfo{banned banUntil level __typename}',
+ 'AxieBreedingBrief': 'fragment AxieBreedingBrief on Axie{id name image owner ownerProfile{name __typename}class '
+                      'parts{...AxiePart __typename}bodyShape breedCount genes newGenes birthDate stage matronId '
+                      'matronClass sireId sireClass children{id name image owner class breedCount stage '
+                      '__typename}__typename}fragment AxiePart on AxiePart{id name class type specialGenes stage '
+                      '__typename}',
+ 'AxieBrief': 'fragment AxieBrief on Axie{id name image owner ownerProfile{name __typename}class parts{...AxiePart '
+              '__typename}breedCount genes newGenes stage level battleInfo{...AxieBannedStatus '
+              '__typename}order{...OrderInfo __typename}__typename}fragment AxiePart on AxiePart{id name class type '
+              'specialGenes stage __typename}fragment AxieBannedStatus on AxieBattleInfo{banned __typename}fragment '
+              'OrderInfo on Order{id maker kind assets{...AssetInfo __typename}expiredAt paymentToken startedAt '
+              'basePrice endedAt endedPrice expectedState nonce marketFeePercentage signature hash duration timeLeft '
+              'currentPrice suggestedPrice currentPriceUsd __typename}fragment AssetInfo on Asset{erc address id '
+              'quantity orderId __typename}',
+ 'AxieCardAbility': 'fragment AxieCardAbility on AxieCardAbility{id name attack defense energy description '
+                    'backgroundUrl effectIconUrl __typename}',
+ 'AxieDetail': 'fragment AxieDetail on Axie{id name image figure{atlas model image __typename}owner ownerProfile{name '
+               '__typename}class parts{...AxiePartWithAbilities __typename}bodyShape potentialPoints{beast aquatic '
+               'plant bug bird reptile mech dawn dusk __typename}breedCount genes newGenes birthDate title stage '
+               'matronId matronClass sireId sireClass children{id name image owner class breedCount stage '
+               '__typename}level battleInfo{...AxieBattleInfo __typename}order{...OrderInfo '
+               '__typename}__typename}fragment AxiePartWithAbilities on AxiePart{id name class type specialGenes stage '
+               'abilities{...AxieCardAbility __typename}__typename}fragment AxieCardAbility on AxieCardAbility{id name '
+               'attack defense energy description backgroundUrl effectIconUrl __typename}fragment AxieBattleInfo on '
+               'AxieBattleInfo{banned banUntil level __typename}fragment OrderInfo on Order{id maker kind '
+               'assets{...AssetInfo __typename}expiredAt paymentToken startedAt basePrice endedAt endedPrice '
+               'expectedState nonce marketFeePercentage signature hash duration timeLeft currentPrice suggestedPrice '
+               'currentPriceUsd __typename}fragment AssetInfo on Asset{erc address id quantity orderId __typename}',
+ 'AxiePart': 'fragment AxiePart on AxiePart{id name class type specialGenes stage __typename}',
+ 'AxiePartWithAbilities': 'fragment AxiePartWithAbilities on AxiePart{id name class type specialGenes stage '
+                          'abilities{...AxieCardAbility __typename}__typename}fragment AxieCardAbility on '
+                          'AxieCardAbility{id name attack defense energy description backgroundUrl effectIconUrl '
+                          '__typename}',
+ 'AxieSettledBrief': 'fragment AxieSettledBrief on Axie{id name image class parts{...AxiePart __typename}breedCount '
+                     'genes newGenes stage level battleInfo{...AxieBannedStatus __typename}__typename}fragment '
+                     'AxiePart on AxiePart{id name class type specialGenes stage __typename}fragment AxieBannedStatus '
+                     'on AxieBattleInfo{banned __typename}',
+ 'BundleDetail': 'fragment BundleDetail on Bundle{listingIndex name items{...LandBundleBrief...ItemBundleBrief '
+                 '__typename}owner order{...OrderInfo __typename}__typename}fragment LandBundleBrief on LandPlot{col '
+                 'row landType __typename}fragment ItemBundleBrief on LandItem{itemAlias itemId name figureURL '
+                 'landType rarity __typename}fragment OrderInfo on Order{id maker kind assets{...AssetInfo '
+                 '__typename}expiredAt paymentToken startedAt basePrice endedAt endedPrice expectedState nonce '
+                 'marketFeePercentage signature hash duration timeLeft currentPrice suggestedPrice currentPriceUsd '
+                 '__typename}fragment AssetInfo on Asset{erc address id quantity orderId __typename}',
+ 'BundleSettledBrief': 'fragment BundleSettledBrief on Bundle{listingIndex name '
+                       'items{...LandBundleBrief...ItemBundleBrief __typename}__typename}fragment LandBundleBrief on '
+                       'LandPlot{col row landType __typename}fragment ItemBundleBrief on LandItem{itemAlias itemId '
+                       'name figureURL landType rarity __typename}',
+ 'ItemBrief': 'fragment ItemBrief on LandItem{tokenId itemAlias itemId name figureURL landType rarity owner '
+              'ownerProfile{name __typename}order{...OrderInfo __typename}__typename}fragment OrderInfo on Order{id '
+              'maker kind assets{...AssetInfo __typename}expiredAt paymentToken startedAt basePrice endedAt endedPrice '
+              'expectedState nonce marketFeePercentage signature hash duration timeLeft currentPrice suggestedPrice '
+              'currentPriceUsd __typename}fragment AssetInfo on Asset{erc address id quantity orderId __typename}',
+ 'ItemBundleBrief': 'fragment ItemBundleBrief on LandItem{itemAlias itemId name figureURL landType rarity __typename}',
+ 'ItemDetail': 'fragment ItemDetail on LandItem{tokenId itemAlias itemId name figureURL landType rarity effects '
+               'description tokenType owner ownerProfile{name __typename}order{...OrderInfo '
+               '__typename}__typename}fragment OrderInfo on Order{id maker kind assets{...AssetInfo '
+               '__typename}expiredAt paymentToken startedAt basePrice endedAt endedPrice expectedState nonce '
+               'marketFeePercentage signature hash duration timeLeft currentPrice suggestedPrice currentPriceUsd '
+               '__typename}fragment AssetInfo on Asset{erc address id quantity orderId __typename}',
+ 'ItemSettledBrief': 'fragment ItemSettledBrief on LandItem{tokenId itemAlias itemId name figureURL landType rarity '
+                     '__typename}',
+ 'LandBundleBrief': 'fragment LandBundleBrief on LandPlot{col row landType __typename}',
+ 'LandDetail': 'fragment LandDetail on LandPlot{tokenId col row landType owner ownerProfile{name '
+               '__typename}order{...OrderInfo __typename}__typename}fragment OrderInfo on Order{id maker kind '
+               'assets{...AssetInfo __typename}expiredAt paymentToken startedAt basePrice endedAt endedPrice '
+               'expectedState nonce marketFeePercentage signature hash duration timeLeft currentPrice suggestedPrice '
+               'currentPriceUsd __typename}fragment AssetInfo on Asset{erc address id quantity orderId __typename}',
+ 'LandSettledBrief': 'fragment LandSettledBrief on LandPlot{tokenId col row landType __typename}',
+ 'AssetInfo': 'fragment AssetInfo on Asset{erc address id quantity orderId __typename}',
+ 'OrderInfo': 'fragment OrderInfo on Order{id maker kind assets{...AssetInfo __typename}expiredAt paymentToken '
+              'startedAt basePrice endedAt endedPrice expectedState nonce marketFeePercentage signature hash duration '
+              'timeLeft currentPrice suggestedPrice currentPriceUsd __typename}fragment AssetInfo on Asset{erc address '
+              'id quantity orderId __typename}',
+ 'OrdersInfo': 'fragment OrdersInfo on Orders{total quantity data{...OrderInfo __typename}__typename}fragment '
+               'OrderInfo on Order{id maker kind assets{...AssetInfo __typename}expiredAt paymentToken startedAt '
+               'basePrice endedAt endedPrice expectedState nonce marketFeePercentage signature hash duration timeLeft '
+               'currentPrice suggestedPrice currentPriceUsd __typename}fragment AssetInfo on Asset{erc address id '
+               'quantity orderId __typename}',
+ 'SettlementStats': 'fragment SettlementStats on SettlementStats{count axieCount volume volumeUsd __typename}',
+ 'TransferHistoryInSettledAuction': 'fragment TransferHistoryInSettledAuction on TransferRecords{total '
+                                    'results{...TransferRecordInSettledAuction __typename}__typename}fragment '
+                                    'TransferRecordInSettledAuction on TransferRecord{txHash timestamp from to '
+                                    'withPrice withPriceUsd fromProfile{name __typename}toProfile{name '
+                                    '__typename}__typename}',
+ 'TransferRecordInSettledAuction': 'fragment TransferRecordInSettledAuction on TransferRecord{txHash timestamp from to '
+                                   'withPrice withPriceUsd fromProfile{name __typename}toProfile{name '
+                                   '__typename}__typename}',
+ 'TransferRecords': 'fragment TransferRecords on TransferRecords{total results{txHash timestamp from to withPrice '
+                    '__typename}__typename}',
+ 'Erc1155TokenDetail': 'fragment Erc1155TokenDetail on Erc1155Token{id:tokenId tokenId tokenType tokenAddress total '
+                       '__typename}',
+ 'Erc1155TokenSettledBrief': 'fragment Erc1155TokenSettledBrief on Erc1155Token{erc1155TokenId:tokenId id:tokenId '
+                             'tokenType tokenAddress total __typename}'}
+
+OPERATIONS = {'AddActivity': {'kind': 'mutation',
+                 'query': 'mutation AddActivity($action:Action!$data:ActivityDataInput!){createActivity(action:$action '
+                          'data:$data){result __typename}}',
+                 'fragments': (),
+                 'sha256': 'dcaf0e8096223871515d27473f67521ace1a429ffc0fb5d2c302f35ef58e5a78',
+                 'variables': {'action': 'Action!', 'data': 'ActivityDataInput!'},
+                 'auth': True,
+                 'cost': (2, 3, 0, 0, 3.0, 0.0)},
+ 'GetActivityLog': {'kind': 'query',
+                    'query': 'query GetActivityLog($from:Int$size:Int){profile{activities(from:$from '
+                             'size:$size){...Activity __typename}__typename}}fragment Activity on Activity{activityId '
+                             'accountId action timestamp data{...on BuyAxie{...BuyAxie __typename}...on '
+                             'ListAxie{...ListAxie __typename}...on UnlistAxie{...UnlistAxie __typename}...on '
+                             'GiftAxie{...GiftAxie __typename}...on MakeAxieOffer{...MakeAxieOffer __typename}...on '
+                             'CancelAxieOffer{...CancelAxieOffer __typename}...on SyncExp{...SyncExp __typename}...on '
+                             'MorphToPetite{...MorphToPetite __typename}...on MorphToAdult{...MorphToAdult '
+                             '__typename}...on BreedAxies{...BreedAxies __typename}...on BuyLand{...BuyLand '
+                             '__typename}...on ListLand{...ListLand __typename}...on UnlistLand{...UnlistLand '
+                             '__typename}...on GiftLand{...GiftLand __typename}...on MakeLandOffer{...MakeLandOffer '
+                             '__typename}...on CancelLandOffer{...CancelLandOffer __typename}...on BuyItem{...BuyItem '
+                             '__typename}...on ListItem{...ListItem __typename}...on UnlistItem{...UnlistItem '
+                             '__typename}...on GiftItem{...GiftItem __typename}...on MakeItemOffer{...MakeItemOffer '
+                             '__typename}...on CancelItemOffer{...CancelItemOffer __typename}...on '
+                             'ListBundle{...ListBundle __typename}...on UnlistBundle{...UnlistBundle __typename}...on '
+                             'BuyBundle{...BuyBundle __typename}...on MakeBundleOffer{...MakeBundleOffer '
+                             '__typename}...on CancelBundleOffer{...CancelBundleOffer __typename}...on '
+                             'AddLoomBalance{...AddLoomBalance __typename}...on WithdrawFromLoom{...WithdrawFromLoom '
+                             '__typename}...on AddFundBalance{...AddFundBalance __typename}...on '
+                             'WithdrawFromFund{...WithdrawFromFund __typename}...on TopupRoninWeth{...TopupRoninWeth '
+                             '__typename}...on WithdrawRoninWeth{...WithdrawRoninWeth '
+                             '__typename}__typename}__typename}fragment BuyAxie on BuyAxie{axieId price owner txHash '
+                             '__typename}fragment ListAxie on ListAxie{axieId priceFrom priceTo duration txHash '
+                             '__typename}fragment UnlistAxie on UnlistAxie{axieId txHash __typename}fragment GiftAxie '
+                             'on GiftAxie{axieId destination txHash __typename}fragment MakeAxieOffer on '
+                             'MakeAxieOffer{axieId price txHash __typename}fragment CancelAxieOffer on '
+                             'CancelAxieOffer{axieId txHash __typename}fragment SyncExp on SyncExp{axieId exp txHash '
+                             '__typename}fragment MorphToPetite on MorphToPetite{axieId txHash __typename}fragment '
+                             'MorphToAdult on MorphToAdult{axieId txHash __typename}fragment BreedAxies on '
+                             'BreedAxies{sireId matronId lovePotionAmount txHash __typename}fragment BuyLand on '
+                             'BuyLand{row col price owner txHash __typename}fragment ListLand on ListLand{row col '
+                             'priceFrom priceTo duration txHash __typename}fragment UnlistLand on UnlistLand{row col '
+                             'txHash __typename}fragment GiftLand on GiftLand{row col destination txHash '
+                             '__typename}fragment MakeLandOffer on MakeLandOffer{row col price txHash '
+                             '__typename}fragment CancelLandOffer on CancelLandOffer{row col txHash '
+                             '__typename}fragment BuyItem on BuyItem{tokenId itemAlias price owner txHash '
+                             '__typename}fragment ListItem on ListItem{tokenId itemAlias priceFrom priceTo duration '
+                             'txHash __typename}fragment UnlistItem on UnlistItem{tokenId itemAlias txHash '
+                             '__typename}fragment GiftItem on GiftItem{tokenId itemAlias destination txHash '
+                             '__typename}fragment MakeItemOffer on MakeItemOffer{tokenId itemAlias price txHash '
+                             '__typename}fragment CancelItemOffer on CancelItemOffer{tokenId itemAlias txHash '
+                             '__typename}fragment ListBundle on ListBundle{numberOfItems priceFrom priceTo duration '
+                             'txHash __typename}fragment UnlistBundle on UnlistBundle{listingIndex txHash '
+                             '__typename}fragment BuyBundle on BuyBundle{listingIndex price owner txHash '
+                             '__typename}fragment MakeBundleOffer on MakeBundleOffer{listingIndex price txHash '
+                             '__typename}fragment CancelBundleOffer on CancelBundleOffer{listingIndex txHash '
+                             '__typename}fragment AddLoomBalance on AddLoomBalance{amount senderAddress '
+                             'receiverAddress txHash __typename}fragment WithdrawFromLoom on WithdrawFromLoom{amount '
+                             'senderAddress receiverAddress txHash __typename}fragment AddFundBalance on '
+                             'AddFundBalance{amount senderAddress txHash __typename}fragment WithdrawFromFund on '
+                             'WithdrawFromFund{amount receiverAddress txHash __typename}fragment TopupRoninWeth on '
+                             'TopupRoninWeth{amount receiverAddress txHash receiverAddress __typename}fragment '
+                             'WithdrawRoninWeth on WithdrawRoninWeth{amount receiverAddress txHash receiverAddress '
+                             '__typename}',
+                    'fragments': ('Activity',
+                                  'BuyAxie',
+                                  'ListAxie',
+                                  'UnlistAxie',
+                                  'GiftAxie',
+                                  'MakeAxieOffer',
+                                  'CancelAxieOffer',
+                                  'SyncExp',
+                                  'MorphToPetite',
+                                  'MorphToAdult',
+                                  'BreedAxies',
+                                  'BuyLand',
+                                  'ListLand',
+                                  'UnlistLand',
+                                  'GiftLand',
+                                  'MakeLandOffer',
+                                  'CancelLandOffer',
+                                  'BuyItem',
+                                  'ListItem',
+                                  'UnlistItem',
+                                  'GiftItem',
+                                  'MakeItemOffer',
+                                  'CancelItemOffer',
+                                  'ListBundle',
+                                  'UnlistBundle',
+                                  'BuyBundle',
+                                  'MakeBundleOffer',
+                                  'CancelBundleOffer',
+                                  'AddLoomBalance',
+                                  'WithdrawFromLoom',
+                                  'AddFundBalance',
+                                  'WithdrawFromFund',
+                                  'TopupRoninWeth',
+                                  'WithdrawRoninWeth'),
+                    'sha256': '0b8b882841efcb9d02e511afc0e8b8b4031ba7b422929e6f62a927ccd333e3c0',
+                    'variables': {'from': 'Int', 'size': 'Int'},
+                    'auth': True,
+                    'cost': (4, 195, 34, 34, 3.0, 192.0)},
+ 'GetOwnerAccessoryList': {'kind': 'query',
+                           'query': 'query '
+                                    'GetOwnerAccessoryList($owner:String$auctionType:AuctionType$sort:SortBy!$from:Int!$size:Int!$includeInstances:Boolean=false$instancesFrom:Int$instancesSize:Int$includeEquippedTotal:Boolean=false$includeEquippedBy:Boolean=false){equipments(owner:$owner '
+                                    'auctionType:$auctionType from:$from size:$size){total results{...Equipment '
+                                    'instances(size:$instancesSize from:$instancesFrom '
+                                    'sort:$sort)@include(if:$includeInstances){id:tokenId tokenId alias name '
+                                    'equipmentId equipmentType slot rarity collections owner '
+                                    'equippedBy@include(if:$includeEquippedBy)__typename}__typename}__typename}}fragment '
+                                    'Equipment on Equipment{alias name equipmentType slot rarity collections total '
+                                    'equippedTotal@include(if:$includeEquippedTotal)lowestUnequippedTokenId@include(if:$includeEquippedTotal)minPrice '
+                                    '__typename}',
+                           'fragments': ('Equipment',),
+                           'sha256': '6409d60c8c169e86397a81941e2d318e88b31dfeca0bc48e3c0e676958c60a2f',
+                           'variables': {'owner': 'String',
+                                         'auctionType': 'AuctionType',
+                                         'sort': 'SortBy!',
+                                         'from': 'Int!',
+                                         'size': 'Int!',
+                                         'includeInstances': 'Boolean=false',
+                                         'instancesFrom': 'Int',
+                                         'instancesSize': 'Int',
+                                         'includeEquippedTotal': 'Boolean=false',
+                                         'includeEquippedBy': 'Boolean=false'},
+                           'auth': False,
+                           'cost': (4, 29, 1, 1, 4.0, 25.0)},
+ 'GetOwnerAccessoryListV2': {'kind': 'query',
+                             'query': 'query '
+                                      'GetOwnerAccessoryListV2($equipmentType:Int!$owner:String$from:Int!$size:Int!$sort:SortBy!$auctionType:AuctionType$includeOrder:Boolean=false$includeInstances:Boolean=false){equipment(owner:$owner '
+                                      'equipmentType:$equipmentType auctionType:$auctionType){...Equipment '
+                                      'instances(from:$from size:$size '
+                                      'sort:$sort)@include(if:$includeInstances){...EquipmentInstance '
+                                      'order@include(if:$includeOrder){...OrderInfo '
+                                      '__typename}__typename}__typename}}fragment Equipment on Equipment{alias name '
+                                      'equipmentType slot rarity collections total equippedTotal minPrice '
+                                      '__typename}fragment EquipmentInstance on EquipmentInstance{id:tokenId tokenId '
+                                      'alias name equipmentId equipmentType slot owner equippedBy rarity collections '
+                                      '__typename}fragment OrderInfo on Order{id maker kind assets{...AssetInfo '
+                                      '__typename}expiredAt paymentToken startedAt basePrice endedAt endedPrice '
+                                      'expectedState nonce marketFeePercentage signature hash duration timeLeft '
+                                      'currentPrice suggestedPrice currentPriceUsd __typename}fragment AssetInfo on '
+                                      'Asset{erc address id quantity orderId __typename}',
+                             'fragments': ('Equipment', 'EquipmentInstance', 'OrderInfo', 'AssetInfo'),
+                             'sha256': 'cb68081914268b8dd9eaded3474cbd3c06fa2eae23748015a4679d8174c3ffbe',
+                             'variables': {'equipmentType': 'Int!',
+                                           'owner': 'String',
+                                           'from': 'Int!',
+                                           'size': 'Int!',
+                                           'sort': 'SortBy!',
+                                           'auctionType': 'AuctionType',
+                                           'includeOrder': 'Boolean=false',
+                                           'includeInstances': 'Boolean=false'},
+                             'auth': False,
+                             'cost': (5, 56, 4, 4, 13.0, 43.0)},
+ 'GetOwnerAxieBreederList': {'kind': 'query',
+                             'query': 'query '
+                                      'GetOwnerAxieBreederList($owner:String$auctionType:AuctionType$criteria:AxieSearchCriteria$sort:SortBy$from:Int$size:Int){axies(owner:$owner '
+                                      'auctionType:$auctionType criteria:$criteria sort:$sort from:$from '
+                                      'size:$size){total results{...AxieBreedingBrief __typename}__typename}}fragment '
+                                      'AxieBreedingBrief on Axie{id name image owner ownerProfile{name '
+                                      '__typename}class parts{...AxiePart __typename}bodyShape breedCount genes '
+                                      'newGenes birthDate stage matronId matronClass sireId sireClass children{id name '
+                                      'image owner class breedCount stage __typename}__typename}fragment AxiePart on '
+                                      'AxiePart{id name class type specialGenes stage __typename}',
+                             'fragments': ('AxieBreedingBrief', 'AxiePart'),
+                             'sha256': '5ec2b8ca9cc7f8da5d75110d1c18fe18e5feb7c22c3b3bc2c320c1745d79f0f0',
+                             'variables': {'owner': 'String',
+                                           'auctionType': 'AuctionType',
+                                           'criteria': 'AxieSearchCriteria',
+                                           'sort': 'SortBy',
+                                           'from': 'Int',
+                                           'size': 'Int'},
+                             'auth': False,
+                             'cost': (4, 42, 2, 2, 4.0, 86.0)},
+ 'GetOwnerAxieList': {'kind': 'query',
+                      'query': 'query '
+                               'GetOwnerAxieList($owner:String$auctionType:AuctionType$criteria:AxieSearchCriteria$sort:SortBy$from:Int$size:Int){axies(owner:$owner '
+                               'auctionType:$auctionType criteria:$criteria sort:$sort from:$from size:$size){total '
+                               'results{...AxieBrief __typename}__typename}}fragment AxieBrief on Axie{id name image '
+                               'owner ownerProfile{name __typename}class parts{...AxiePart __typename}breedCount genes '
+                               'newGenes stage level battleInfo{...AxieBannedStatus __typename}order{...OrderInfo '
+                               '__typename}__typename}fragment AxiePart on AxiePart{id name class type specialGenes '
+                               'stage __typename}fragment AxieBannedStatus on AxieBattleInfo{banned '
+                               '__typename}fragment OrderInfo on Order{id maker kind assets{...AssetInfo '
+                               '__typename}expiredAt paymentToken startedAt basePrice endedAt endedPrice expectedState '
+                               'nonce marketFeePercentage signature hash duration timeLeft currentPrice suggestedPrice '
+                               'currentPriceUsd __typename}fragment AssetInfo on Asset{erc address id quantity orderId '
+                               '__typename}',
+                      'fragments': ('AxieBrief', 'AxiePart', 'AxieBannedStatus', 'OrderInfo', 'AssetInfo'),
+                      'sha256': 'a3afbbcb2522c5840cb74c53fa7787670b19a72c4004a88f61c7f3c0ce6ae24e',
+                      'variables': {'owner': 'String',
+                                    'auctionType': 'AuctionType',
+                                    'criteria': 'AxieSearchCriteria',
+                                    'sort': 'SortBy',
+                                    'from': 'Int',
+                                    'size': 'Int'},
+                      'auth': False,
+                      'cost': (5, 62, 5, 5, 4.0, 98.0)},
+ 'GetOwnerBundleList': {'kind': 'query',
+                        'query': 'query '
+                                 'GetOwnerBundleList($seller:String$criteria:BundleSearchCriteria$sort:SortBy$from:Int!$size:Int!){bundles(seller:$seller '
+                                 'criteria:$criteria sort:$sort from:$from size:$size){total results{...BundleDetail '
+                                 '__typename}__typename}}fragment BundleDetail on Bundle{listingIndex name '
+                                 'items{...LandBundleBrief...ItemBundleBrief __typename}owner order{...OrderInfo '
+                                 '__typename}__typename}fragment LandBundleBrief on LandPlot{col row landType '
+                                 '__typename}fragment ItemBundleBrief on LandItem{itemAlias itemId name figureURL '
+                                 'landType rarity __typename}fragment OrderInfo on Order{id maker kind '
+                                 'assets{...AssetInfo __typename}expiredAt paymentToken startedAt basePrice endedAt '
+                                 'endedPrice expectedState nonce marketFeePercentage signature hash duration timeLeft '
+                                 'currentPrice suggestedPrice currentPriceUsd __typename}fragment AssetInfo on '
+                                 'Asset{erc address id quantity orderId __typename}',
+                        'fragments': ('BundleDetail', 'LandBundleBrief', 'ItemBundleBrief', 'OrderInfo', 'AssetInfo'),
+                        'sha256': '5fefe783133da3dde31993ecbb3a159922a84d03088a57c689d92052e963fc45',
+                        'variables': {'seller': 'String',
+                                      'criteria': 'BundleSearchCriteria',
+                                      'sort': 'SortBy',
+                                      'from': 'Int!',
+                                      'size': 'Int!'},
+                        'auth': False,
+                        'cost': (5, 52, 5, 5, 4.0, 60.0)},
+ 'GetOwnerErc1155TokenList': {'kind': 'query',
+                              'query': 'query '
+                                       'GetOwnerErc1155TokenList($owner:String!$from:Int!$size:Int!){erc1155Tokens(owner:$owner '
+                                       'from:$from size:$size){total results{...Erc1155TokenDetail '
+                                       '__typename}__typename}}fragment Erc1155TokenDetail on Erc1155Token{id:tokenId '
+                                       'tokenId tokenType tokenAddress total __typename}',
+                              'fragments': ('Erc1155TokenDetail',),
+                              'sha256': 'f2e398e53c001d972481b158ef622627b4f5f355ef73e70cac857a27f9f52d88',
+                              'variables': {'owner': 'String!', 'from': 'Int!', 'size': 'Int!'},
+                              'auth': False,
+                              'cost': (3, 11, 1, 1, 4.0, 7.0)},
+ 'GetOwnerItemList': {'kind': 'query',
+                      'query': 'query '
+                               'GetOwnerItemList($owner:String$auctionType:AuctionType$criteria:ItemSearchCriteria$sort:SortBy$from:Int$size:Int){items(owner:$owner '
+                               'auctionType:$auctionType criteria:$criteria sort:$sort from:$from size:$size){total '
+                               'results{...ItemBrief __typename}__typename}}fragment ItemBrief on LandItem{tokenId '
+                               'itemAlias itemId name figureURL landType rarity owner ownerProfile{name '
+                               '__typename}order{...OrderInfo __typename}__typename}fragment OrderInfo on Order{id '
+                               'maker kind assets{...AssetInfo __typename}expiredAt paymentToken startedAt basePrice '
+                               'endedAt endedPrice expectedState nonce marketFeePercentage signature hash duration '
+                               'timeLeft currentPrice suggestedPrice currentPriceUsd __typename}fragment AssetInfo on '
+                               'Asset{erc address id quantity orderId __typename}',
+                      'fragments': ('ItemBrief', 'OrderInfo', 'AssetInfo'),
+                      'sha256': 'ab54d8dcc7ed452d43a8c170b46a4ce79a9092e9ebe5ddff3d0f443b539d4cd8',
+                      'variables': {'owner': 'String',
+                                    'auctionType': 'AuctionType',
+                                    'criteria': 'ItemSearchCriteria',
+                                    'sort': 'SortBy',
+                                    'from': 'Int',
+                                    'size': 'Int'},
+                      'auth': False,
+                      'cost': (5, 47, 3, 3, 7.0, 86.0)},
+ 'GetOwnerLandList': {'kind': 'query',
+                      'query': 'query '
+                               'GetOwnerLandList($owner:String$auctionType:AuctionType$criteria:LandSearchCriteria$sort:SortBy!$from:Int!$size:Int!){lands(owner:$owner '
+                               'auctionType:$auctionType criteria:$criteria sort:$sort from:$from size:$size){total '
+                               'results{...LandDetail __typename}__typename}}fragment LandDetail on LandPlot{tokenId '
+                               'col row landType owner ownerProfile{name __typename}order{...OrderInfo '
+                               '__typename}__typename}fragment OrderInfo on Order{id maker kind assets{...AssetInfo '
+                               '__typename}expiredAt paymentToken startedAt basePrice endedAt endedPrice expectedState '
+                               'nonce marketFeePercentage signature hash duration timeLeft currentPrice suggestedPrice '
+                               'currentPriceUsd __typename}fragment AssetInfo on Asset{erc address id quantity orderId '
+                               '__typename}',
+                      'fragments': ('LandDetail', 'OrderInfo', 'AssetInfo'),
+                      'sha256': '2ae74969b1eb9bcaeb1b43abf9f4c6fc069a0215fe7d247385b1ce1974bf514e',
+                      'variables': {'owner': 'String',
+                                    'auctionType': 'AuctionType',
+                                    'criteria': 'LandSearchCriteria',
+                                    'sort': 'SortBy!',
+                                    'from': 'Int!',
+                                    'size': 'Int!'},
+                      'auth': False,
+                      'cost': (5, 44, 3, 3, 4.0, 40.0)},
+ 'GetPrivateProfile': {'kind': 'query',
+                       'query': 'query GetPrivateProfile{profile{...PrivateProfile __typename}}fragment PrivateProfile '
+                                'on AccountProfile{name accountId addresses{...AccountAddresses __typename}activated '
+                                'email settings{unsubscribeNotificationEmail __typename}referral{...AccountReferral '
+                                '__typename}isScholar __typename}fragment AccountAddresses on NetAddresses{ronin '
+                                'ethereum __typename}fragment AccountReferral on AccountReferral{code address addedAt '
+                                '__typename}',
+                       'fragments': ('PrivateProfile', 'AccountAddresses', 'AccountReferral'),
+                       'sha256': '533eb280ec21b50a23366c8a9ae4e1f28bae429476fcf07d1e621701b9a992ce',
+                       'variables': {},
+                       'auth': True,
+                       'cost': (3, 22, 3, 3, 22.0, 0.0)},
+ 'GetPublicProfileWithAccountID': {'kind': 'query',
+                                   'query': 'query '
+                                            'GetPublicProfileWithAccountID($accountId:UUID!){publicProfile(id:$accountId){...PublicProfile '
+                                            '__typename}}fragment PublicProfile on PublicProfile{name accountId '
+                                            'addresses{...AccountAddresses __typename}__typename}fragment '
+                                            'AccountAddresses on NetAddresses{ronin ethereum __typename}',
+                                   'fragments': ('PublicProfile', 'AccountAddresses'),
+                                   'sha256': 'c12f29b774cca976affac6977feeb9c7e85b573ba170417c44e8a6506996e28f',
+                                   'variables': {'accountId': 'UUID!'},
+                                   'auth': False,
+                                   'cost': (3, 10, 2, 2, 10.0, 0.0)},
+ 'GetPublicProfileWithRoninAddress': {'kind': 'query',
+                                      'query': 'query '
+                                               'GetPublicProfileWithRoninAddress($roninAddress:String!){publicProfileWithRoninAddress(roninAddress:$roninAddress){...PublicProfile '
+                                               '__typename}}fragment PublicProfile on PublicProfile{name accountId '
+                                               'addresses{...AccountAddresses __typename}__typename}fragment '
+                                               'AccountAddresses on NetAddresses{ronin ethereum __typename}',
+                                      'fragments': ('PublicProfile', 'AccountAddresses'),
+                                      'sha256': '9b3884c0b6c8fe857df36fb63dcfc094a927b8fec26cead67c3ae25977bf8748',
+                                      'variables': {'roninAddress': 'String!'},
+                                      'auth': False,
+                                      'cost': (3, 10, 2, 2, 10.0, 0.0)},
+ 'UpdatePassword': {'kind': 'mutation',
+                    'query': 'mutation '
+                             'UpdatePassword($password:String!$oldPassword:String!){updatePassword(newPassword:$password '
+                             'password:$oldPassword){result __typename}}',
+                    'fragments': (),
+                    'sha256': 'fb2b6f5f1e3e5085319b0207c86ed59426d617dbc5c9304922d0438978f9e032',
+                    'variables': {'password': 'String!', 'oldPassword': 'String!'},
+                    'auth': True,
+                    'cost': (2, 3, 0, 0, 3.0, 0.0)},
+ 'UpdateProfileName': {'kind': 'mutation',
+                       'query': 'mutation '
+                                'UpdateProfileName($name:String!){updateProfileName(name:$name){accountProfile{...PrivateProfile '
+                                '__typename}__typename}}fragment PrivateProfile on AccountProfile{name accountId '
+                                'addresses{...AccountAddresses __typename}activated email '
+                                'settings{unsubscribeNotificationEmail __typename}referral{...AccountReferral '
+                                '__typename}isScholar __typename}fragment AccountAddresses on NetAddresses{ronin '
+                                'ethereum __typename}fragment AccountReferral on AccountReferral{code address addedAt '
+                                '__typename}',
+                       'fragments': ('PrivateProfile', 'AccountAddresses', 'AccountReferral'),
+                       'sha256': 'db19b16ffa13680daf1ad12819a7cf1d3f3a054b20a24417fecefb5fb65592c5',
+                       'variables': {'name': 'String!'},
+                       'auth': True,
+                       'cost': (4, 24, 3, 3, 24.0, 0.0)},
+ 'CreateAccessTokenWithSignature': {'kind': 'mutation',
+                                    'query': 'mutation '
+                                             'CreateAccessTokenWithSignature($input:SignatureInput!){createAccessTokenWithSignature(input:$input){newAccount '
+                                             'result accessToken __typename}}',
+                                    'fragments': (),
+                                    'sha256': '57c8d55e4d714a66dc62b4c69ef9d2af125da012f2378912c5f104df57e6f81e',
+                                    'variables': {'input': 'SignatureInput!'},
+                                    'auth': False,
+                                    'cost': (2, 5, 0, 0, 5.0, 0.0)},
+ 'CreateRandomMessage': {'kind': 'mutation',
+                         'query': 'mutation CreateRandomMessage{createRandomMessage}',
+                         'fragments': (),
+                         'sha256': '82f361abd63c9872300d98d658b8cdd3530b910d235ca0bb65c67ba79658382b',
+                         'variables': {},
+                         'auth': False,
+                         'cost': (1, 1, 0, 0, 1.0, 0.0)},
+ 'GetAxieBreedingBrief': {'kind': 'query',
+                          'query': 'query GetAxieBreedingBrief($axieId:ID!){axie(axieId:$axieId){...AxieBreedingBrief '
+                                   '__typename}}fragment AxieBreedingBrief on Axie{id name image owner '
+                                   'ownerProfile{name __typename}class parts{...AxiePart __typename}bodyShape '
+                                   'breedCount genes newGenes birthDate stage matronId matronClass sireId sireClass '
+                                   'children{id name image owner class breedCount stage __typename}__typename}fragment '
+                                   'AxiePart on AxiePart{id name class type specialGenes stage __typename}',
+                          'fragments': ('AxieBreedingBrief', 'AxiePart'),
+                          'sha256': 'a1b5affa7a9e217c42669b7a8a2792fd76e3b35e2fd18956a9d7101fd58b71cb',
+                          'variables': {'axieId': 'ID!'},
+                          'auth': False,
+                          'cost': (3, 39, 2, 2, 87.0, 0.0)},
+ 'GetAxieBrief': {'kind': 'query',
+                  'query': 'query GetAxieBrief($axieId:ID!){axie(axieId:$axieId){...AxieBrief __typename}}fragment '
+                           'AxieBrief on Axie{id name image owner ownerProfile{name __typename}class parts{...AxiePart '
+                           '__typename}breedCount genes newGenes stage level battleInfo{...AxieBannedStatus '
+                           '__typename}order{...OrderInfo __typename}__typename}fragment AxiePart on AxiePart{id name '
+                           'class type specialGenes stage __typename}fragment AxieBannedStatus on '
+                           'AxieBattleInfo{banned __typename}fragment OrderInfo on Order{id maker kind '
+                           'assets{...AssetInfo __typename}expiredAt paymentToken startedAt basePrice endedAt '
+                           'endedPrice expectedState nonce marketFeePercentage signature hash duration timeLeft '
+                           'currentPrice suggestedPrice currentPriceUsd __typename}fragment AssetInfo on Asset{erc '
+                           'address id quantity orderId __typename}',
+                  'fragments': ('AxieBrief', 'AxiePart', 'AxieBannedStatus', 'OrderInfo', 'AssetInfo'),
+                  'sha256': '7124c0ebb33e6c184f9ec0d7c8e0eaf35d7cb9fa366f90f5637bfcd354e127c7',
+                  'variables': {'axieId': 'ID!'},
+                  'auth': False,
+                  'cost': (4, 59, 5, 5, 99.0, 0.0)},
+ 'GetAxieDetail': {'kind': 'query',
+                   'query': 'query GetAxieDetail($axieId:ID!){axie(axieId:$axieId){...AxieDetail __typename}}fragment '
+                            'AxieDetail on Axie{id name image figure{atlas model image __typename}owner '
+                            'ownerProfile{name __typename}class parts{...AxiePartWithAbilities __typename}bodyShape '
+                            'potentialPoints{beast aquatic plant bug bird reptile mech dawn dusk __typename}breedCount '
+                            'genes newGenes birthDate title stage matronId matronClass sireId sireClass children{id '
+                            'name image owner class breedCount stage __typename}level battleInfo{...AxieBattleInfo '
+                            '__typename}order{...OrderInfo __typename}__typename}fragment AxiePartWithAbilities on '
+                            'AxiePart{id name class type specialGenes stage abilities{...AxieCardAbility '
+                            '__typename}__typename}fragment AxieCardAbility on AxieCardAbility{id name attack defense '
+                            'energy description backgroundUrl effectIconUrl __typename}fragment AxieBattleInfo on '
+                            'AxieBattleInfo{banned banUntil level __typename}fragment OrderInfo on Order{id maker kind '
+                            'assets{...AssetInfo __typename}expiredAt paymentToken startedAt basePrice endedAt '
+                            'endedPrice expectedState nonce marketFeePercentage signature hash duration timeLeft '
+                            'currentPrice suggestedPrice currentPriceUsd __typename}fragment AssetInfo on Asset{erc '
+                            'address id quantity orderId __typename}',
+                   'fragments': ('AxieDetail',
+                                 'AxiePartWithAbilities',
+                                 'AxieCardAbility',
+                                 'AxieBattleInfo',
+                                 'OrderInfo',
+                                 'AssetInfo'),
+                   'sha256': '08a4fad9b8a1ad61dd2cbf08751a93c6b0cc73fe1ef278b9e7dfc3e6063e62f6',
+                   'variables': {'axieId': 'ID!'},
+                   'auth': False,
+                   'cost': (4, 104, 6, 6, 207.0, 0.0)},
+ 'GetParentsBrief': {'kind': 'query',
+                     'query': 'query '
+                              'GetParentsBrief($matronId:ID!$sireId:ID!){matron:axie(axieId:$matronId){...AxieBreedingBrief '
+                              '__typename}sire:axie(axieId:$sireId){...AxieBreedingBrief __typename}}fragment '
+                              'AxieBreedingBrief on Axie{id name image owner ownerProfile{name __typename}class '
+                              'parts{...AxiePart __typename}bodyShape breedCount genes newGenes birthDate stage '
+                              'matronId matronClass sireId sireClass children{id name image owner class breedCount '
+                              'stage __typename}__typename}fragment AxiePart on AxiePart{id name class type '
+                              'specialGenes stage __typename}',
+                     'fragments': ('AxieBreedingBrief', 'AxiePart'),
+                     'sha256': '958eb177b7218732e2908001c425a13c3914a1c417e418db4f9a8d27c880aea3',
+                     'variables': {'matronId': 'ID!', 'sireId': 'ID!'},
+                     'auth': False,
+                     'cost': (3, 78, 2, 4, 174.0, 0.0)},
+ 'MorphAxie': {'kind': 'mutation',
+               'query': 'mutation MorphAxie($axieId:ID!$owner:String!$signature:String!){morphAxie(axieId:$axieId '
+                        'owner:$owner signature:$signature)}',
+               'fragments': (),
+               'sha256': 'b220f3ab538c72260f1abc07566ad5c64ef9f088e54e81fc1d0ed3a28949aac6',
+               'variables': {'axieId': 'ID!', 'owner': 'String!', 'signature': 'String!'},
+               'auth': True,
+               'cost': (1, 1, 0, 0, 1.0, 0.0)},
+ 'RenameAxie': {'kind': 'mutation',
+                'query': 'mutation RenameAxie($axieId:ID!$name:String!){renameAxie(axieId:$axieId name:$name){result '
+                         '__typename}}',
+                'fragments': (),
+                'sha256': '3290ddf79eb2d7089a4fafc54fdbb787aa1a095ad91026eda422342974b3033b',
+                'variables': {'axieId': 'ID!', 'name': 'String!'},
+                'auth': True,
+                'cost': (2, 3, 0, 0, 3.0, 0.0)},
+ 'GetBundleDetail': {'kind': 'query',
+                     'query': 'query '
+                              'GetBundleDetail($listingIndex:Int!){bundle(listingIndex:$listingIndex){...BundleDetail '
+                              '__typename}}fragment BundleDetail on Bundle{listingIndex name '
+                              'items{...LandBundleBrief...ItemBundleBrief __typename}owner order{...OrderInfo '
+                              '__typename}__typename}fragment LandBundleBrief on LandPlot{col row landType '
+                              '__typename}fragment ItemBundleBrief on LandItem{itemAlias itemId name figureURL '
+                              'landType rarity __typename}fragment OrderInfo on Order{id maker kind '
+                              'assets{...AssetInfo __typename}expiredAt paymentToken startedAt basePrice endedAt '
+                              'endedPrice expectedState nonce marketFeePercentage signature hash duration timeLeft '
+                              'currentPrice suggestedPrice currentPriceUsd __typename}fragment AssetInfo on Asset{erc '
+                              'address id quantity orderId __typename}',
+                     'fragments': ('BundleDetail', 'LandBundleBrief', 'ItemBundleBrief', 'OrderInfo', 'AssetInfo'),
+                     'sha256': '8f4ea3992a1a7b5e6666fd88cc36ede22deebcbca60420b52eeeb049979daaca',
+                     'variables': {'listingIndex': 'Int!'},
+                     'auth': False,
+                     'cost': (4, 49, 5, 5, 61.0, 0.0)},
+ 'GetItemBrief': {'kind': 'query',
+                  'query': 'query GetItemBrief($itemAlias:String!$itemId:Int!){item(itemAlias:$itemAlias '
+                           'itemId:$itemId){...ItemBrief __typename}}fragment ItemBrief on LandItem{tokenId itemAlias '
+                           'itemId name figureURL landType rarity owner ownerProfile{name '
+                           '__typename}order{...OrderInfo __typename}__typename}fragment OrderInfo on Order{id maker '
+                           'kind assets{...AssetInfo __typename}expiredAt paymentToken startedAt basePrice endedAt '
+                           'endedPrice expectedState nonce marketFeePercentage signature hash duration timeLeft '
+                           'currentPrice suggestedPrice currentPriceUsd __typename}fragment AssetInfo on Asset{erc '
+                           'address id quantity orderId __typename}',
+                  'fragments': ('ItemBrief', 'OrderInfo', 'AssetInfo'),
+                  'sha256': 'cd99a90c9e49ad3df72bf0212b91489e2dc68bb392d804ba02a87cd9660fcca9',
+                  'variables': {'itemAlias': 'String!', 'itemId': 'Int!'},
+                  'auth': False,
+                  'cost': (4, 44, 3, 3, 44.0, 0.0)},
+ 'GetItemDetail': {'kind': 'query',
+                   'query': 'query GetItemDetail($itemAlias:String!$itemId:Int!){item(itemAlias:$itemAlias '
+                            'itemId:$itemId){...ItemDetail __typename}}fragment ItemDetail on LandItem{tokenId '
+                            'itemAlias itemId name figureURL landType rarity effects description tokenType owner '
+                            'ownerProfile{name __typename}order{...OrderInfo __typename}__typename}fragment OrderInfo '
+                            'on Order{id maker kind assets{...AssetInfo __typename}expiredAt paymentToken startedAt '
+                            'basePrice endedAt endedPrice expectedState nonce marketFeePercentage signature hash '
+                            'duration timeLeft currentPrice suggestedPrice currentPriceUsd __typename}fragment '
+                            'AssetInfo on Asset{erc address id quantity orderId __typename}',
+                   'fragments': ('ItemDetail', 'OrderInfo', 'AssetInfo'),
+                   'sha256': '3c038b9549cc28d2812ea1f26150cf6a934f94b766b331e71747a5e26dcd2e8b',
+                   'variables': {'itemAlias': 'String!', 'itemId': 'Int!'},
+                   'auth': False,
+                   'cost': (4, 47, 3, 3, 47.0, 0.0)},
+ 'GetLandDetail': {'kind': 'query',
+                   'query': 'query GetLandDetail($col:Int!$row:Int!){land(col:$col row:$row){...LandDetail '
+                            '__typename}}fragment LandDetail on LandPlot{tokenId col row landType owner '
+                            'ownerProfile{name __typename}order{...OrderInfo __typename}__typename}fragment OrderInfo '
+                            'on Order{id maker kind assets{...AssetInfo __typename}expiredAt paymentToken startedAt '
+                            'basePrice endedAt endedPrice expectedState nonce marketFeePercentage signature hash '
+                            'duration timeLeft currentPrice suggestedPrice currentPriceUsd __typename}fragment '
+                            'AssetInfo on Asset{erc address id quantity orderId __typename}',
+                   'fragments': ('LandDetail', 'OrderInfo', 'AssetInfo'),
+                   'sha256': '810ad4b99724f71397591c0cf6b99d60ce2a04d9945a9a1922a53fb5efb8206f',
+                   'variables': {'col': 'Int!', 'row': 'Int!'},
+                   'auth': False,
+                   'cost': (4, 41, 3, 3, 41.0, 0.0)},
+ 'GetMinPriceAxie': {'kind': 'query',
+                     'query': 'query GetMinPriceAxie($axieId:ID!){axie(axieId:$axieId){id minPrice __typename}}',
+                     'fragments': (),
+                     'sha256': '349e4cc2b49bb7ececcc48136ad16c11a5a3f35ec28f7504402a686037131b31',
+                     'variables': {'axieId': 'ID!'},
+                     'auth': False,
+                     'cost': (2, 4, 0, 0, 4.0, 0.0)},
+ 'GetMinPriceErc1155Tokens': {'kind': 'query',
+                              'query': 'query GetMinPriceErc1155Tokens($from:Int$size:Int){erc1155Tokens(from:$from '
+                                       'size:$size){results{id:tokenId tokenId tokenType minPrice '
+                                       '__typename}__typename}}',
+                              'fragments': (),
+                              'sha256': '11076da79db6033fc007b6c38946244447a740f2aa8933014a2cca3d6c2aec7e',
+                              'variables': {'from': 'Int', 'size': 'Int'},
+                              'auth': False,
+                              'cost': (3, 8, 0, 0, 3.0, 5.0)},
+ 'CreateOrder': {'kind': 'mutation',
+                 'query': 'mutation CreateOrder($order:InputOrder!$signature:String!){createOrder(order:$order '
+                          'signature:$signature){...OrderInfo __typename}}fragment OrderInfo on Order{id maker kind '
+                          'assets{...AssetInfo __typename}expiredAt paymentToken startedAt basePrice endedAt '
+                          'endedPrice expectedState nonce marketFeePercentage signature hash duration timeLeft '
+                          'currentPrice suggestedPrice currentPriceUsd __typename}fragment AssetInfo on Asset{erc '
+                          'address id quantity orderId __typename}',
+                 'fragments': ('OrderInfo', 'AssetInfo'),
+                 'sha256': '1bb96617b59c7bbcb69327e3810f53402bbe1b82bf0cc9e746d086663e5a5b97',
+                 'variables': {'order': 'InputOrder!', 'signature': 'String!'},
+                 'auth': True,
+                 'cost': (3, 30, 2, 2, 30.0, 0.0)},
+ 'GetAccessoriesMarketplace': {'kind': 'query',
+                               'query': 'query '
+                                        'GetAccessoriesMarketplace($from:Int!$size:Int!$auctionType:AuctionType){equipments(from:$from '
+                                        'size:$size auctionType:$auctionType){total results{id:alias alias name '
+                                        'equipmentType slot rarity collections minPrice __typename}__typename}}',
+                               'fragments': (),
+                               'sha256': '9c1e9d40d1bb7defce3cffe69dcfc40765f632c76e1c77df931684e9987f88e1',
+                               'variables': {'from': 'Int!', 'size': 'Int!', 'auctionType': 'AuctionType'},
+                               'auth': False,
+                               'cost': (3, 13, 0, 0, 4.0, 9.0)},
+ 'GetAccessoryOrders': {'kind': 'query',
+                        'query': 'query '
+                                 'GetAccessoryOrders($equipmentType:Int!$owner:String$from:Int!$size:Int!$sort:SortBy!$auctionType:AuctionType){equipment(owner:$owner '
+                                 'equipmentType:$equipmentType auctionType:$auctionType){total instances(from:$from '
+                                 'size:$size sort:$sort){...EquipmentInstance key:tokenId order{...OrderInfo '
+                                 '__typename}__typename}__typename}}fragment EquipmentInstance on '
+                                 'EquipmentInstance{id:tokenId tokenId alias name equipmentId equipmentType slot owner '
+                                 'equippedBy rarity collections __typename}fragment OrderInfo on Order{id maker kind '
+                                 'assets{...AssetInfo __typename}expiredAt paymentToken startedAt basePrice endedAt '
+                                 'endedPrice expectedState nonce marketFeePercentage signature hash duration timeLeft '
+                                 'currentPrice suggestedPrice currentPriceUsd __typename}fragment AssetInfo on '
+                                 'Asset{erc address id quantity orderId __typename}',
+                        'fragments': ('EquipmentInstance', 'OrderInfo', 'AssetInfo'),
+                        'sha256': '8a107f357950c7325e56b33ba7a27062bbc459aabd808ce19dc56f4fbb683356',
+                        'variables': {'equipmentType': 'Int!',
+                                      'owner': 'String',
+                                      'from': 'Int!',
+                                      'size': 'Int!',
+                                      'sort': 'SortBy!',
+                                      'auctionType': 'AuctionType'},
+                        'auth': False,
+                        'cost': (5, 48, 3, 3, 4.0, 44.0)},
+ 'GetRecentlyListedAccessories': {'kind': 'query',
+                                  'query': 'query '
+                                           'GetRecentlyListedAccessories($auctionType:AuctionType$sort:SortBy$from:Int!$size:Int!){equipmentInstances(auctionType:$auctionType '
+                                           'sort:$sort from:$from size:$size){total results{...EquipmentDetail '
+                                           '__typename}__typename}}fragment EquipmentDetail on '
+                                           'EquipmentInstance{tokenId alias equipmentId equipmentType name slot rarity '
+                                           'collections order{...OrderInfo __typename}__typename}fragment OrderInfo on '
+                                           'Order{id maker kind assets{...AssetInfo __typename}expiredAt paymentToken '
+                                           'startedAt basePrice endedAt endedPrice expectedState nonce '
+                                           'marketFeePercentage signature hash duration timeLeft currentPrice '
+                                           'suggestedPrice currentPriceUsd __typename}fragment AssetInfo on Asset{erc '
+                                           'address id quantity orderId __typename}',
+                                  'fragments': ('EquipmentDetail', 'OrderInfo', 'AssetInfo'),
+                                  'sha256': '74e031f1f44525800a90dd4e23e5292fd3c53303facaa4e19c4118d1eff99ae1',
+                                  'variables': {'auctionType': 'AuctionType',
+                                                'sort': 'SortBy',
+                                                'from': 'Int!',
+                                                'size': 'Int!'},
+                                  'auth': False,
+                                  'cost': (5, 44, 3, 3, 4.0, 40.0)},
+ 'GetRecentlyListedAccessoriesV0': {'kind': 'query',
+                                    'query': 'query '
+                                             'GetRecentlyListedAccessoriesV0($owner:String$auctionType:AuctionType$sort:SortBy$from:Int!$size:Int!){equipmentInstances(auctionType:$auctionType '
+                                             'from:$from sort:$sort size:$size owner:$owner){total '
+                                             'results{...EquipmentSettledBrief __typename}__typename}}fragment '
+                                             'EquipmentSettledBrief on EquipmentInstance{tokenId name rarity alias '
+                                             'collections slot order{id currentPrice currentPriceUsd startedAt '
+                                             '__typename}__typename}',
+                                    'fragments': ('EquipmentSettledBrief',),
+                                    'sha256': '8f18f9697065618c6fbee14e9fdaf01a649bc062364b1b32a3da298207879ef7',
+                                    'variables': {'owner': 'String',
+                                                  'auctionType': 'AuctionType',
+                                                  'sort': 'SortBy',
+                                                  'from': 'Int!',
+                                                  'size': 'Int!'},
+                                    'auth': False,
+                                    'cost': (4, 18, 1, 1, 4.0, 14.0)},
+ 'GetRecentlyListedAxies': {'kind': 'query',
+                            'query': 'query '
+                                     'GetRecentlyListedAxies($auctionType:AuctionType$criteria:AxieSearchCriteria$sort:SortBy$from:Int$size:Int){axies(auctionType:$auctionType '
+                                     'criteria:$criteria sort:$sort from:$from size:$size){total results{...AxieBrief '
+                                     '__typename}__typename}}fragment AxieBrief on Axie{id name image owner '
+                                     'ownerProfile{name __typename}class parts{...AxiePart __typename}breedCount genes '
+                                     'newGenes stage level battleInfo{...AxieBannedStatus '
+                                     '__typename}order{...OrderInfo __typename}__typename}fragment AxiePart on '
+                                     'AxiePart{id name class type specialGenes stage __typename}fragment '
+                                     'AxieBannedStatus on AxieBattleInfo{banned __typename}fragment OrderInfo on '
+                                     'Order{id maker kind assets{...AssetInfo __typename}expiredAt paymentToken '
+                                     'startedAt basePrice endedAt endedPrice expectedState nonce marketFeePercentage '
+                                     'signature hash duration timeLeft currentPrice suggestedPrice currentPriceUsd '
+                                     '__typename}fragment AssetInfo on Asset{erc address id quantity orderId '
+                                     '__typename}',
+                            'fragments': ('AxieBrief', 'AxiePart', 'AxieBannedStatus', 'OrderInfo', 'AssetInfo'),
+                            'sha256': '2d9f226880e7b598c1ab4b34caadaa6c49d4a54a8d7ceed139b5cc726764432d',
+                            'variables': {'auctionType': 'AuctionType',
+                                          'criteria': 'AxieSearchCriteria',
+                                          'sort': 'SortBy',
+                                          'from': 'Int',
+                                          'size': 'Int'},
+                            'auth': False,
+                            'cost': (5, 62, 5, 5, 4.0, 98.0)},
+ 'GetRecentlyListedBundles': {'kind': 'query',
+                              'query': 'query '
+                                       'GetRecentlyListedBundles($criteria:BundleSearchCriteria$sort:SortBy$from:Int!$size:Int!){bundles(criteria:$criteria '
+                                       'sort:$sort from:$from size:$size){total results{...BundleDetail '
+                                       '__typename}__typename}}fragment BundleDetail on Bundle{listingIndex name '
+                                       'items{...LandBundleBrief...ItemBundleBrief __typename}owner order{...OrderInfo '
+                                       '__typename}__typename}fragment LandBundleBrief on LandPlot{col row landType '
+                                       '__typename}fragment ItemBundleBrief on LandItem{itemAlias itemId name '
+                                       'figureURL landType rarity __typename}fragment OrderInfo on Order{id maker kind '
+                                       'assets{...AssetInfo __typename}expiredAt paymentToken startedAt basePrice '
+                                       'endedAt endedPrice expectedState nonce marketFeePercentage signature hash '
+                                       'duration timeLeft currentPrice suggestedPrice currentPriceUsd '
+                                       '__typename}fragment AssetInfo on Asset{erc address id quantity orderId '
+                                       '__typename}',
+                              'fragments': ('BundleDetail',
+                                            'LandBundleBrief',
+                                            'ItemBundleBrief',
+                                            'OrderInfo',
+                                            'AssetInfo'),
+                              'sha256': 'bf0788b261457cda940d6d24c40005b87fd769644dcb055daef19b5d9c272160',
+                              'variables': {'criteria': 'BundleSearchCriteria',
+                                            'sort': 'SortBy',
+                                            'from': 'Int!',
+                                            'size': 'Int!'},
+                              'auth': False,
+                              'cost': (5, 52, 5, 5, 4.0, 60.0)},
+ 'GetRecentlyListedErc1155Tokens': {'kind': 'query',
+                                    'query': 'query '
+                                             'GetRecentlyListedErc1155Tokens($tokenType:Erc1155Type!$from:Int$size:Int){erc1155Token(tokenType:$tokenType){...Erc1155TokenDetail '
+                                             'orders(sort:Latest from:$from size:$size){...OrdersInfo '
+                                             '__typename}__typename}}fragment Erc1155TokenDetail on '
+                                             'Erc1155Token{id:tokenId tokenId tokenType tokenAddress total '
+                                             '__typename}fragment OrdersInfo on Orders{total quantity '
+                                             'data{...OrderInfo __typename}__typename}fragment OrderInfo on Order{id '
+                                             'maker kind assets{...AssetInfo __typename}expiredAt paymentToken '
+                                             'startedAt basePrice endedAt endedPrice expectedState nonce '
+                                             'marketFeePercentage signature hash duration timeLeft currentPrice '
+                                             'suggestedPrice currentPriceUsd __typename}fragment AssetInfo on '
+                                             'Asset{erc address id quantity orderId __typename}',
+                                    'fragments': ('Erc1155TokenDetail', 'OrdersInfo', 'OrderInfo', 'AssetInfo'),
+                                    'sha256': '2f79573826e607f7d6536a5f303ea6e8ae59f715d45ecfc123bf0ae869b95088',
+                                    'variables': {'tokenType': 'Erc1155Type!', 'from': 'Int', 'size': 'Int'},
+                                    'auth': False,
+                                    'cost': (5, 43, 4, 4, 14.0, 29.0)},
+ 'GetRecentlyListedItems': {'kind': 'query',
+                            'query': 'query '
+                                     'GetRecentlyListedItems($auctionType:AuctionType$criteria:ItemSearchCriteria$sort:SortBy$from:Int$size:Int){items(auctionType:$auctionType '
+                                     'criteria:$criteria sort:$sort from:$from size:$size){total results{...ItemBrief '
+                                     '__typename}__typename}}fragment ItemBrief on LandItem{tokenId itemAlias itemId '
+                                     'name figureURL landType rarity owner ownerProfile{name '
+                                     '__typename}order{...OrderInfo __typename}__typename}fragment OrderInfo on '
+                                     'Order{id maker kind assets{...AssetInfo __typename}expiredAt paymentToken '
+                                     'startedAt basePrice endedAt endedPrice expectedState nonce marketFeePercentage '
+                                     'signature hash duration timeLeft currentPrice suggestedPrice currentPriceUsd '
+                                     '__typename}fragment AssetInfo on Asset{erc address id quantity orderId '
+                                     '__typename}',
+                            'fragments': ('ItemBrief', 'OrderInfo', 'AssetInfo'),
+                            'sha256': 'f9b98b60a4f7fab6f6c5448fd6a6ca7a855d6737b3317f7db9f7e78996dffef0',
+                            'variables': {'auctionType': 'AuctionType',
+                                          'criteria': 'ItemSearchCriteria',
+                                          'sort': 'SortBy',
+                                          'from': 'Int',
+                                          'size': 'Int'},
+                            'auth': False,
+                            'cost': (5, 47, 3, 3, 7.0, 86.0)},
+ 'GetRecentlyListedLands': {'kind': 'query',
+                            'query': 'query '
+                                     'GetRecentlyListedLands($auctionType:AuctionType$criteria:LandSearchCriteria$sort:SortBy!$from:Int!$size:Int!){lands(auctionType:$auctionType '
+                                     'criteria:$criteria sort:$sort from:$from size:$size){total results{...LandDetail '
+                                     '__typename}__typename}}fragment LandDetail on LandPlot{tokenId col row landType '
+                                     'owner ownerProfile{name __typename}order{...OrderInfo '
+                                     '__typename}__typename}fragment OrderInfo on Order{id maker kind '
+                                     'assets{...AssetInfo __typename}expiredAt paymentToken startedAt basePrice '
+                                     'endedAt endedPrice expectedState nonce marketFeePercentage signature hash '
+                                     'duration timeLeft currentPrice suggestedPrice currentPriceUsd '
+                                     '__typename}fragment AssetInfo on Asset{erc address id quantity orderId '
+                                     '__typename}',
+                            'fragments': ('LandDetail', 'OrderInfo', 'AssetInfo'),
+                            'sha256': '2a4654a1c9edcf4b091ebcba5ad75a0b5039e3541248af42d908593e69551dcc',
+                            'variables': {'auctionType': 'AuctionType',
+                                          'criteria': 'LandSearchCriteria',
+                                          'sort': 'SortBy!',
+                                          'from': 'Int!',
+                                          'size': 'Int!'},
+                            'auth': False,
+                            'cost': (5, 44, 3, 3, 4.0, 40.0)},
+ 'GetRecentlySoldAccessories': {'kind': 'query',
+                                'query': 'query '
+                                         'GetRecentlySoldAccessories($from:Int!$size:Int!){settledAuctions{equipments(from:$from '
+                                         'size:$size){total results{...EquipmentSettledBrief '
+                                         'transferHistory{...EquipmentTransferRecords '
+                                         '__typename}__typename}__typename}__typename}}fragment EquipmentSettledBrief '
+                                         'on EquipmentInstance{tokenId name rarity alias collections slot order{id '
+                                         'currentPrice currentPriceUsd startedAt __typename}__typename}fragment '
+                                         'EquipmentTransferRecords on TransferRecords{total results{from to txHash '
+                                         'timestamp withPrice withPriceUsd fromProfile{name __typename}toProfile{name '
+                                         '__typename}__typename}__typename}',
+                                'fragments': ('EquipmentSettledBrief', 'EquipmentTransferRecords'),
+                                'sha256': '752ceb5e1c073a95a92c9159d32325b7858e9d161ed489c79e4fb5990edbcd0d',
+                                'variables': {'from': 'Int!', 'size': 'Int!'},
+                                'auth': False,
+                                'cost': (7, 38, 2, 2, 6.0, 32.0)},
+ 'GetRecentlySoldAxies': {'kind': 'query',
+                          'query': 'query GetRecentlySoldAxies($from:Int$size:Int){settledAuctions{axies(from:$from '
+                                   'size:$size){total results{...AxieSettledBrief '
+                                   'transferHistory{...TransferHistoryInSettledAuction '
+                                   '__typename}__typename}__typename}__typename}}fragment AxieSettledBrief on Axie{id '
+                                   'name image class parts{...AxiePart __typename}breedCount genes newGenes stage '
+                                   'level battleInfo{...AxieBannedStatus __typename}__typename}fragment AxiePart on '
+                                   'AxiePart{id name class type specialGenes stage __typename}fragment '
+                                   'AxieBannedStatus on AxieBattleInfo{banned __typename}fragment '
+                                   'TransferHistoryInSettledAuction on TransferRecords{total '
+                                   'results{...TransferRecordInSettledAuction __typename}__typename}fragment '
+                                   'TransferRecordInSettledAuction on TransferRecord{txHash timestamp from to '
+                                   'withPrice withPriceUsd fromProfile{name __typename}toProfile{name '
+                                   '__typename}__typename}',
+                          'fragments': ('AxieSettledBrief',
+                                        'AxiePart',
+                                        'AxieBannedStatus',
+                                        'TransferHistoryInSettledAuction',
+                                        'TransferRecordInSettledAuction'),
+                          'sha256': '7cb29d62434f20ccce125241c3d0556825a03ca15faac7c745efdb2af5405f51',
+                          'variables': {'from': 'Int', 'size': 'Int'},
+                          'auth': False,
+                          'cost': (7, 49, 5, 5, 6.0, 83.0)},
+ 'GetRecentlySoldBundles': {'kind': 'query',
+                            'query': 'query '
+                                     'GetRecentlySoldBundles($from:Int$size:Int){settledAuctions{bundles(from:$from '
+                                     'size:$size){total results{...BundleSettledBrief '
+                                     'transferHistory{...TransferHistoryInSettledAuction '
+                                     '__typename}__typename}__typename}__typename}}fragment BundleSettledBrief on '
+                                     'Bundle{listingIndex name items{...LandBundleBrief...ItemBundleBrief '
+                                     '__typename}__typename}fragment LandBundleBrief on LandPlot{col row landType '
+                                     '__typename}fragment ItemBundleBrief on LandItem{itemAlias itemId name figureURL '
+                                     'landType rarity __typename}fragment TransferHistoryInSettledAuction on '
+                                     'TransferRecords{total results{...TransferRecordInSettledAuction '
+                                     '__typename}__typename}fragment TransferRecordInSettledAuction on '
+                                     'TransferRecord{txHash timestamp from to withPrice withPriceUsd fromProfile{name '
+                                     '__typename}toProfile{name __typename}__typename}',
+                            'fragments': ('BundleSettledBrief',
+                                          'LandBundleBrief',
+                                          'ItemBundleBrief',
+                                          'TransferHistoryInSettledAuction',
+                                          'TransferRecordInSettledAuction'),
+                            'sha256': 'fe234c1eeb6c98691573f820e9f39f2a8ca6e7c75fdc4f27ac7b072a14da1ba7',
+                            'variables': {'from': 'Int', 'size': 'Int'},
+                            'auth': False,
+                            'cost': (7, 42, 5, 5, 6.0, 48.0)},
+ 'GetRecentlySoldErc1155Tokens': {'kind': 'query',
+                                  'query': 'query '
+                                           'GetRecentlySoldErc1155Tokens($tokenType:Erc1155Type!$from:Int$size:Int){settledAuctions{erc1155Tokens(tokenType:$tokenType '
+                                           'from:$from size:$size){total results{...Erc1155TokenSettledBrief '
+                                           'transferHistory{...TransferHistoryInSettledAuction '
+                                           '__typename}__typename}__typename}__typename}}fragment '
+                                           'Erc1155TokenSettledBrief on Erc1155Token{erc1155TokenId:tokenId id:tokenId '
+                                           'tokenType tokenAddress total __typename}fragment '
+                                           'TransferHistoryInSettledAuction on TransferRecords{total '
+                                           'results{...TransferRecordInSettledAuction __typename}__typename}fragment '
+                                           'TransferRecordInSettledAuction on TransferRecord{txHash timestamp from to '
+                                           'withPrice withPriceUsd fromProfile{name __typename}toProfile{name '
+                                           '__typename}__typename}',
+                                  'fragments': ('Erc1155TokenSettledBrief',
+                                                'TransferHistoryInSettledAuction',
+                                                'TransferRecordInSettledAuction'),
+                                  'sha256': '5128b152e3f413a5ecde611cb82314a2915e9da19401e6335654b3e430ded29d',
+                                  'variables': {'tokenType': 'Erc1155Type!', 'from': 'Int', 'size': 'Int'},
+                                  'auth': False,
+                                  'cost': (7, 32, 3, 3, 6.0, 26.0)},
+ 'GetRecentlySoldItems': {'kind': 'query',
+                          'query': 'query GetRecentlySoldItems($from:Int$size:Int){settledAuctions{items(from:$from '
+                                   'size:$size){total results{...ItemSettledBrief '
+                                   'transferHistory{...TransferHistoryInSettledAuction '
+                                   '__typename}__typename}__typename}__typename}}fragment ItemSettledBrief on '
+                                   'LandItem{tokenId itemAlias itemId name figureURL landType rarity '
+                                   '__typename}fragment TransferHistoryInSettledAuction on TransferRecords{total '
+                                   'results{...TransferRecordInSettledAuction __typename}__typename}fragment '
+                                   'TransferRecordInSettledAuction on TransferRecord{txHash timestamp from to '
+                                   'withPrice withPriceUsd fromProfile{name __typename}toProfile{name '
+                                   '__typename}__typename}',
+                          'fragments': ('ItemSettledBrief',
+                                        'TransferHistoryInSettledAuction',
+                                        'TransferRecordInSettledAuction'),
+                          'sha256': '0ab9132200b9dd79f3f988be996b26484ef85d6f59bf7103e027c2c711627fa5',
+                          'variables': {'from': 'Int', 'size': 'Int'},
+                          'auth': False,
+                          'cost': (7, 34, 3, 3, 9.0, 56.0)},
+ 'GetRecentlySoldLands': {'kind': 'query',
+                          'query': 'query GetRecentlySoldLands($from:Int$size:Int){settledAuctions{lands(from:$from '
+                                   'size:$size){total results{...LandSettledBrief '
+                                   'transferHistory{...TransferHistoryInSettledAuction '
+                                   '__typename}__typename}__typename}__typename}}fragment LandSettledBrief on '
+                                   'LandPlot{tokenId col row landType __typename}fragment '
+                                   'TransferHistoryInSettledAuction on TransferRecords{total '
+                                   'results{...TransferRecordInSettledAuction __typename}__typename}fragment '
+                                   'TransferRecordInSettledAuction on TransferRecord{txHash timestamp from to '
+                                   'withPrice withPriceUsd fromProfile{name __typename}toProfile{name '
+                                   '__typename}__typename}',
+                          'fragments': ('LandSettledBrief',
+                                        'TransferHistoryInSettledAuction',
+                                        'TransferRecordInSettledAuction'),
+                          'sha256': 'a29110c5587e12909d02c7cbdd2f9efbf9a4555419a84ebbc49fb90ee9f71d81',
+                          'variables': {'from': 'Int', 'size': 'Int'},
+                          'auth': False,
+                          'cost': (7, 31, 3, 3, 6.0, 25.0)},
+ 'GetExchangeRates': {'kind': 'query',
+                      'query': 'query GetExchangeRates{exchangeRate{eth{usd __typename}slp{usd __typename}ron{usd '
+                               '__typename}axs{usd __typename}usd{usd __typename}__typename}}',
+                      'fragments': (),
+                      'sha256': 'c4a894eee102dbb0a00eccebdca019966012f3ffcc8203674ed8cb882965b845',
+                      'variables': {},
+                      'auth': False,
+                      'cost': (3, 17, 0, 0, 17.0, 0.0)},
+ 'GetOverallStats': {'kind': 'query',
+                     'query': 'query GetOverallStats{overallMarketStats{newAxies{last7D allTime '
+                              '__typename}originBattles{last7D allTime __typename}mkpVolume{last7D allTime '
+                              '__typename}mkpTxs{last7D allTime __typename}__typename}tokensStats{axie{totalSupply '
+                              'holders __typename}__typename}}',
+                     'fragments': (),
+                     'sha256': '93f139c729b3e38e2730f47c695197b4b680202afb53c04cdef2b291c291814a',
+                     'variables': {},
+                     'auth': False,
+                     'cost': (3, 24, 0, 0, 24.0, 0.0)},
+ 'GetSettlementStats': {'kind': 'query',
+                        'query': 'query GetSettlementStats{marketStats{last24Hours{...SettlementStats '
+                                 '__typename}last7Days{...SettlementStats __typename}last30Days{...SettlementStats '
+                                 '__typename}__typename}}fragment SettlementStats on SettlementStats{count axieCount '
+                                 'volume volumeUsd __typename}',
+                        'fragments': ('SettlementStats',),
+                        'sha256': '9865d1f42b6d3f29a926777c310f741a5a0d27d02011d49b718652e61ec9e9e6',
+                        'variables': {},
+                        'auth': False,
+                        'cost': (3, 23, 1, 3, 23.0, 0.0)},
+ 'GetTopAllSales': {'kind': 'query',
+                    'query': 'query '
+                             'GetTopAllSales($item_type:TokenType!$period_type:PeriodType!$size:Int!){topSales(tokenType:$item_type '
+                             'periodType:$period_type size:$size){results{orderId settlePrice settlePriceUsd timestamp '
+                             'tokenAsset{__typename...on Axie{...AxieSettledBrief __typename}...on '
+                             'EquipmentInstance{...EquipmentSettledBrief __typename}...on '
+                             'Erc1155Token{...Erc1155TokenSettledBrief __typename}...on LandPlot{...LandSettledBrief '
+                             '__typename}...on LandItem{...ItemSettledBrief '
+                             '__typename}}__typename}__typename}}fragment AxieSettledBrief on Axie{id name image class '
+                             'parts{...AxiePart __typename}breedCount genes newGenes stage level '
+                             'battleInfo{...AxieBannedStatus __typename}__typename}fragment AxiePart on AxiePart{id '
+                             'name class type specialGenes stage __typename}fragment AxieBannedStatus on '
+                             'AxieBattleInfo{banned __typename}fragment EquipmentSettledBrief on '
+                             'EquipmentInstance{alias name equipmentId equipmentType slot owner equippedBy rarity '
+                             'collections}fragment Erc1155TokenSettledBrief on Erc1155Token{erc1155TokenId:tokenId '
+                             'tokenType tokenAddress total __typename}fragment LandSettledBrief on LandPlot{tokenId '
+                             'col row landType __typename}fragment ItemSettledBrief on LandItem{tokenId itemAlias '
+                             'itemId name figureURL landType rarity __typename}',
+                    'fragments': ('AxieSettledBrief',
+                                  'AxiePart',
+                                  'AxieBannedStatus',
+                                  'EquipmentSettledBrief',
+                                  'Erc1155TokenSettledBrief',
+                                  'LandSettledBrief',
+                                  'ItemSettledBrief'),
+                    'sha256': 'c1c00ae6bf1aee1d3f033caff05467149f49be4525e0a835ebab4b3268623533',
+                    'variables': {'item_type': 'TokenType!', 'period_type': 'PeriodType!', 'size': 'Int!'},
+                    'auth': False,
+                    'cost': (5, 65, 7, 7, 3.0, 102.0)},
+ 'GetTopSales': {'kind': 'query',
+                 'query': 'query '
+                          'GetTopSales($item_type:TokenType!$period_type:PeriodType!$isAxie:Boolean=false$isEquipment:Boolean=false$isErc1155:Boolean=false$isLandPlot:Boolean=false$isLandItem:Boolean=false$size:Int!){topSales(tokenType:$item_type '
+                          'periodType:$period_type size:$size){results{orderId settlePrice settlePriceUsd timestamp '
+                          'axie:tokenAsset@include(if:$isAxie){...on Axie{...AxieSettledBrief '
+                          '__typename}__typename}equipment:tokenAsset@include(if:$isEquipment){...on '
+                          'EquipmentInstance{...EquipmentSettledBrief '
+                          '__typename}__typename}erc1155:tokenAsset@include(if:$isErc1155){...on '
+                          'Erc1155Token{...Erc1155TokenSettledBrief '
+                          '__typename}__typename}landPlot:tokenAsset@include(if:$isLandPlot){...on '
+                          'LandPlot{...LandSettledBrief '
+                          '__typename}__typename}landItem:tokenAsset@include(if:$isLandItem){...on '
+                          'LandItem{...ItemSettledBrief __typename}__typename}__typename}__typename}}fragment '
+                          'AxieSettledBrief on Axie{id name image class parts{...AxiePart __typename}breedCount genes '
+                          'newGenes stage level battleInfo{...AxieBannedStatus __typename}__typename}fragment AxiePart '
+                          'on AxiePart{id name class type specialGenes stage __typename}fragment AxieBannedStatus on '
+                          'AxieBattleInfo{banned __typename}fragment EquipmentSettledBrief on EquipmentInstance{alias '
+                          'name equipmentId equipmentType slot owner equippedBy rarity collections}fragment '
+                          'Erc1155TokenSettledBrief on Erc1155Token{erc1155TokenId:tokenId id:tokenId tokenType '
+                          'tokenAddress total __typename}fragment LandSettledBrief on LandPlot{tokenId col row '
+                          'landType __typename}fragment ItemSettledBrief on LandItem{tokenId itemAlias itemId name '
+                          'figureURL landType rarity __typename}',
+                 'fragments': ('AxieSettledBrief',
+                               'AxiePart',
+                               'AxieBannedStatus',
+                               'EquipmentSettledBrief',
+                               'Erc1155TokenSettledBrief',
+                               'LandSettledBrief',
+                               'ItemSettledBrief'),
+                 'sha256': 'dcbc2ea21ffddb99a2ba222e6c73f193b87f5b32c912fb62b340cb1c43001b83',
+                 'variables': {'item_type': 'TokenType!',
+                               'period_type': 'PeriodType!',
+                               'isAxie': 'Boolean=false',
+                               'isEquipment': 'Boolean=false',
+                               'isErc1155': 'Boolean=false',
+                               'isLandPlot': 'Boolean=false',
+                               'isLandItem': 'Boolean=false',
+                               'size': 'Int!'},
+                 'auth': False,
+                 'cost': (5, 74, 7, 7, 3.0, 111.0)},
+ 'GetErc1155TokenDetail': {'kind': 'query',
+                           'query': 'query '
+                                    'GetErc1155TokenDetail($tokenType:Erc1155Type!$tokenId:String!$owner:String){erc1155Token(tokenType:$tokenType '
+                                    'tokenId:$tokenId owner:$owner){...Erc1155TokenDetail __typename}}fragment '
+                                    'Erc1155TokenDetail on Erc1155Token{id:tokenId tokenId tokenType tokenAddress '
+                                    'total __typename}',
+                           'fragments': ('Erc1155TokenDetail',),
+                           'sha256': 'b2d23b2155b9c08194cbdca15d842e3c6b6f776b8b4a35b4d6c66960d220d293',
+                           'variables': {'tokenType': 'Erc1155Type!', 'tokenId': 'String!', 'owner': 'String'},
+                           'auth': False,
+                           'cost': (2, 8, 1, 1, 8.0, 0.0)},
+ 'GetAxieTransferHistory': {'kind': 'query',
+                            'query': 'query '
+                                     'GetAxieTransferHistory($axieId:ID!$from:Int!$size:Int!){axie(axieId:$axieId){id '
+                                     'transferHistory(from:$from size:$size){...TransferRecords '
+                                     '__typename}ethereumTransferHistory(from:$from size:$size){...TransferRecords '
+                                     '__typename}__typename}}fragment TransferRecords on TransferRecords{total '
+                                     'results{txHash timestamp from to withPrice __typename}__typename}',
+                            'fragments': ('TransferRecords',),
+                            'sha256': 'cc14705e3bbbf1c7f0db839d9f30157eb08589cca6900139e8f8bd933adc1934',
+                            'variables': {'axieId': 'ID!', 'from': 'Int!', 'size': 'Int!'},
+                            'auth': False,
+                            'cost': (4, 25, 1, 2, 13.0, 12.0)},
+ 'GetErc1155TokenOrders': {'kind': 'query',
+                           'query': 'query '
+                                    'GetErc1155TokenOrders($tokenId:String!$tokenType:Erc1155Type!$maker:String$from:Int!$size:Int!$sort:SortBy!$owner:String){erc1155Token(tokenType:$tokenType '
+                                    'tokenId:$tokenId owner:$owner){id:tokenId tokenId orders(maker:$maker from:$from '
+                                    'size:$size sort:$sort){...OrdersInfo __typename}__typename}}fragment OrdersInfo '
+                                    'on Orders{total quantity data{...OrderInfo __typename}__typename}fragment '
+                                    'OrderInfo on Order{id maker kind assets{...AssetInfo __typename}expiredAt '
+                                    'paymentToken startedAt basePrice endedAt endedPrice expectedState nonce '
+                                    'marketFeePercentage signature hash duration timeLeft currentPrice suggestedPrice '
+                                    'currentPriceUsd __typename}fragment AssetInfo on Asset{erc address id quantity '
+                                    'orderId __typename}',
+                           'fragments': ('OrdersInfo', 'OrderInfo', 'AssetInfo'),
+                           'sha256': '31f9ea5a8db3e663e42db00885ab435cdb1dec4470882cbd7e0a2d260e21760f',
+                           'variables': {'tokenId': 'String!',
+                                         'tokenType': 'Erc1155Type!',
+                                         'maker': 'String',
+                                         'from': 'Int!',
+                                         'size': 'Int!',
+                                         'sort': 'SortBy!',
+                                         'owner': 'String'},
+                           'auth': False,
+                           'cost': (5, 39, 3, 3, 10.0, 29.0)},
+ 'GetItemTransferHistory': {'kind': 'query',
+                            'query': 'query '
+                                     'GetItemTransferHistory($itemAlias:String!$itemId:Int!$from:Int!$size:Int!){item(itemAlias:$itemAlias '
+                                     'itemId:$itemId){tokenId transferHistory(from:$from '
+                                     'size:$size){...TransferRecords __typename}__typename}}fragment TransferRecords '
+                                     'on TransferRecords{total results{txHash timestamp from to withPrice '
+                                     '__typename}__typename}',
+                            'fragments': ('TransferRecords',),
+                            'sha256': 'fe636fc335781633c15eecfcede045f79ee6bb43b53ec096f30d96cd49faa2b3',
+                            'variables': {'itemAlias': 'String!', 'itemId': 'Int!', 'from': 'Int!', 'size': 'Int!'},
+                            'auth': False,
+                            'cost': (4, 14, 1, 1, 8.0, 6.0)},
+ 'GetLandTransferHistory': {'kind': 'query',
+                            'query': 'query '
+                                     'GetLandTransferHistory($col:Int!$row:Int!$from:Int!$size:Int!){land(col:$col '
+                                     'row:$row){tokenId transferHistory(from:$from size:$size){...TransferRecords '
+                                     '__typename}__typename}}fragment TransferRecords on TransferRecords{total '
+                                     'results{txHash timestamp from to withPrice __typename}__typename}',
+                            'fragments': ('TransferRecords',),
+                            'sha256': '183c54f1a9260ca858cd3c07b98e83e49087478888990abed155ab283ec5116f',
+                            'variables': {'col': 'Int!', 'row': 'Int!', 'from': 'Int!', 'size': 'Int!'},
+                            'auth': False,
+                            'cost': (4, 14, 1, 1, 8.0, 6.0)}}
@@ -0,0 +1,133 @@
+#╔═════════════════════════════════════════════════════════════════════════════╗
+#║══════════════════❯ 💫 AxieAPI | GraphQL | Query Cost 💫
+#╚═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📦 Dependencies 📦
+# ╚════════❯ 📦 Built-in Dependencies:
+import functools
+# ╚════════❯ 📦 External Dependencies:
+# ╚════════❯ 📦 Internal Dependencies:
+import document
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🧮 Cost 🧮
+# List fields: name -> expected length ('None' for paginated lists, sized by the 'size' argument):
+LIST_FIELDS = {"results": None, "data": None, "instances": None, "activities": None, "parts": 6, "abilities": 1, "children": 2, "assets": 1, "items": 2}
+
+class Cost:
+    """
+    A class that holds the static cost estimate of an operation.
+    """
+
+    __slots__ = ("name", "depth", "nodes", "fragments", "spreads", "fixed", "per_item")
+
+    def __init__(self, name: str, depth: int, nodes: int, fragments: int, spreads: int, fixed: float, per_item: float) -> None:
+        """
+        Initializes a 'Cost' instance.
+
+        Args:
+            ➤ name (str): The operation name.
+            ➤ depth (int): The maximum selection depth.
+            ➤ nodes (int): The number of selected fields, fragments expanded.
+            ➤ fragments (int): The number of distinct fragments used.
+            ➤ spreads (int): The number of fragment spreads expanded (fragment fan-out).
+            ➤ fixed (float): The expected number of response nodes outside paginated lists.
+            ➤ per_item (float): The expected number of response nodes per item of paginated lists.
+        """
+
+        self.name = name
+        self.depth = depth
+        self.nodes = nodes
+        self.fragments = fragments
+        self.spreads = spreads
+        self.fixed = fixed
+        self.per_item = per_item
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{slot}={getattr(self, slot)!r}" for slot in self.__slots__)
+        return f"{self.__class__.__name__}({fields})"
+
+    def response_nodes(self, size: int) -> float:
+        """
+        The expected number of response nodes for a page of 'size' items.
+        """
+
+        return self.fixed + self.per_item * size
+
+def _selection_cost(selections: list, fragments: dict, depth: int, stats: dict, in_page: bool) -> tuple:
+    """
+    Walks selections, expanding fragments (abstract selections count every type).
+
+    Returns:
+        ➤ tuple: '(fixed nodes, nodes per paginated item)' of the selections.
+    """
+
+    fixed = per_item = 0.0
+    for selection in selections:
+        if isinstance(selection, document.FragmentSpread):
+            fragment = fragments.get(selection.name)
+            stats["spreads"] += 1
+            if fragment is None:
+                continue
+            stats["fragments"].add(selection.name)
+            nested = fragment.selections
+        elif isinstance(selection, document.InlineFragment):
+            nested = selection.selections
+        else:
+            stats["nodes"] += 1
+            stats["depth"] = max(stats["depth"], depth)
+            nested_fixed, nested_per_item = _selection_cost(selection.selections, fragments, depth + 1, stats, in_page)
+            length = LIST_FIELDS.get(selection.name, 1) if selection.selections else 1
+            if length is None and not in_page:
+                # A paginated list: its content is counted per item.
+                nested_fixed, nested_per_item = _selection_cost(selection.selections, fragments, depth + 1, _scratch(), True)
+                fixed += 1
+                per_item += nested_fixed + nested_per_item
+                continue
+            length = length or 1
+            fixed += 1 + length * nested_fixed
+            per_item += length * nested_per_item
+            continue
+        nested_fixed, nested_per_item = _selection_cost(nested, fragments, depth, stats, in_page)
+        fixed += nested_fixed
+        per_item += nested_per_item
+    return fixed, per_item
+
+def _scratch() -> dict:
+    return {"nodes": 0, "depth": 0, "spreads": 0, "fragments": set()}
+
+def analyze(query: str, name: str = None) -> Cost:
+    """
+    Estimates the cost of an operation from its parsed document.
+
+    Args:
+        ➤ query (str): The query string.
+        ➤ name (str): The operation name (for documents with several operations).
+
+    Returns:
+        ➤ Cost: The cost estimate.
+    """
+
+    parsed = document.parse(query)
+    definition = parsed.operation(name)
+    stats = _scratch()
+    fixed, per_item = _selection_cost(definition.selections, parsed.fragments, 1, stats, False)
+    return Cost(definition.name, stats["depth"], stats["nodes"], len(stats["fragments"]), stats["spreads"], fixed, per_item)
+
+@functools.lru_cache(maxsize=None)
+def estimate(name: str) -> Cost:
+    """
+    Returns the cost estimate of a 'ValidOperations' operation, precomputed by 'codegen.py'.
+
+    Raises:
+        ➤ ValueError: If 'name' is not a valid operation name.
+    """
+
+    # Imported here: 'codegen.py' analyzes documents with this module to generate 'compiled_operations.py',
+    # which 'operation' imports.
+    import operation
+    operation.GraphQLOperation._check_operation(name)
+    return Cost(name, *operation.OPERATIONS[name]["cost"])
+# ═════════════════════════════════════════════════════════════════════════════╝
@@ -0,0 +1,400 @@
+#╔═════════════════════════════════════════════════════════════════════════════╗
+#║══════════════════❯ 💫 AxieAPI | GraphQL | Document 💫
+#╚═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📦 Dependencies 📦
+# ╚════════❯ 📦 Built-in Dependencies:
+import json
+import re
+# ╚════════❯ 📦 External Dependencies:
+# ╚════════❯ 📦 Internal Dependencies:
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🌳 Nodes 🌳
+class Node:
+    """
+    A base class for the nodes of a parsed GraphQL document.
+    """
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{slot}={getattr(self, slot)!r}" for slot in self.__slots__)
+        return f"{self.__class__.__name__}({fields})"
+
+class Variable(Node):
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+class Enum(Node):
+    __slots__ = ("value",)
+
+    def __init__(self, value: str) -> None:
+        self.value = value
+
+class Directive(Node):
+    __slots__ = ("name", "arguments")
+
+    def __init__(self, name: str, arguments: dict) -> None:
+        self.name = name
+        self.arguments = arguments
+
+class Field(Node):
+    __slots__ = ("alias", "name", "arguments", "directives", "selections")
+
+    def __init__(self, alias: str, name: str, arguments: dict, directives: list, selections: list) -> None:
+        self.alias = alias
+        self.name = name
+        self.arguments = arguments
+        self.directives = directives
+        self.selections = selections
+
+    @property
+    def key(self) -> str:
+        """
+        The response key of the field (its alias, or its name).
+        """
+
+        return self.alias or self.name
+
+class FragmentSpread(Node):
+    __slots__ = ("name", "directives")
+
+    def __init__(self, name: str, directives: list) -> None:
+        self.name = name
+        self.directives = directives
+
+class InlineFragment(Node):
+    __slots__ = ("type_condition", "directives", "selections")
+
+    def __init__(self, type_condition: str, directives: list, selections: list) -> None:
+        self.type_condition = type_condition
+        self.directives = directives
+        self.selections = selections
+
+class VariableDefinition(Node):
+    __slots__ = ("name", "type", "default")
+
+    def __init__(self, name: str, type: str, default) -> None:
+        self.name = name
+        self.type = type
+        self.default = default
+
+class OperationDefinition(Node):
+    __slots__ = ("kind", "name", "variables", "directives", "selections")
+
+    def __init__(self, kind: str, name: str, variables: list, directives: list, selections: list) -> None:
+        self.kind = kind
+        self.name = name
+        self.variables = variables
+        self.directives = directives
+        self.selections = selections
+
+class FragmentDefinition(Node):
+    __slots__ = ("name", "type_condition", "directives", "selections")
+
+    def __init__(self, name: str, type_condition: str, directives: list, selections: list) -> None:
+        self.name = name
+        self.type_condition = type_condition
+        self.directives = directives
+        self.selections = selections
+
+class Document(Node):
+    """
+    A parsed GraphQL document: its operations, and its fragments by name.
+    Fragments defined more than once (cf. concatenated 'ValidFragments') are kept once.
+    """
+
+    __slots__ = ("operations", "fragments")
+
+    def __init__(self, operations: list, fragments: dict) -> None:
+        self.operations = operations
+        self.fragments = fragments
+
+    def operation(self, name: str = None) -> OperationDefinition:
+        """
+        Returns the operation named 'name' (or the first one).
+
+        Raises:
+            ➤ KeyError: If the document has no such operation.
+        """
+
+        for definition in self.operations:
+            if name is None or definition.name == name:
+                return definition
+        raise KeyError(f"Operation '{name}' not found in the document.")
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ ✂️ Lexer ✂️
+_TOKEN = re.compile(r'''
+    (?P<skip>[\s,\ufeff]+|\#[^\n]*)
+  | (?P<spread>\.\.\.)
+  | (?P<punct>[!$&():=@\[\]{|}])
+  | (?P<block>"""(?:\\"""|[^"]|"(?!""))*""")
+  | (?P<string>"(?:\\.|[^"\\\n])*")
+  | (?P<number>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)
+  | (?P<name>[_A-Za-z][_0-9A-Za-z]*)
+''', re.VERBOSE)
+
+def tokenize(text: str) -> list:
+    """
+    Splits a GraphQL document into '(kind, value)' tokens, dropping whitespace, commas and comments.
+
+    Raises:
+        ➤ SyntaxError: If an unexpected character is found.
+    """
+
+    tokens, position = [], 0
+    while position < len(text):
+        match = _TOKEN.match(text, position)
+        if match is None:
+            raise SyntaxError(f"Unexpected character {text[position]!r} at position {position}.")
+        if match.lastgroup != "skip":
+            tokens.append((match.lastgroup, match.group()))
+        position = match.end()
+    return tokens
+
+def untokenize(tokens: list) -> str:
+    """
+    Joins tokens into the shortest equivalent text: a space is only kept between two names or numbers.
+    """
+
+    words = ("name", "number")
+    parts, previous = [], None
+    for kind, value in tokens:
+        if previous in words and kind in words:
+            parts.append(" ")
+        parts.append(value)
+        previous = kind
+    return "".join(parts)
+
+def minify(text: str) -> str:
+    """
+    Minifies a GraphQL document: drops comments, commas and insignificant whitespace.
+    """
+
+    return untokenize(tokenize(text))
+
+def definitions(text: str) -> list:
+    """
+    Splits a GraphQL document into the minified text of each top-level definition, in order.
+    """
+
+    chunks, depth = [], 0
+    for kind, value in tokenize(text):
+        if depth == 0 and (not chunks or chunks[-1][-1][1] == "}") and (value in ("query", "mutation", "subscription", "fragment") or value == "{"):
+            chunks.append([])
+        chunks[-1].append((kind, value))
+        if value in ("{", "("):
+            depth += 1
+        elif value in ("}", ")"):
+            depth -= 1
+    return [untokenize(chunk) for chunk in chunks]
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🌳 Parser 🌳
+class _Parser:
+    """
+    A recursive-descent parser of GraphQL executable documents.
+    """
+
+    def __init__(self, text: str) -> None:
+        self.tokens = tokenize(text)
+        self.position = 0
+
+    def peek(self, value: str = None) -> bool:
+        if self.position >= len(self.tokens):
+            return False
+        return value is None or self.tokens[self.position][1] == value
+
+    def take(self, value: str = None, kind: str = None) -> str:
+        if self.position >= len(self.tokens):
+            raise SyntaxError(f"Unexpected end of document (expected {value or kind!r}).")
+        token_kind, token = self.tokens[self.position]
+        if (value is not None and token != value) or (kind is not None and token_kind != kind):
+            raise SyntaxError(f"Unexpected token {token!r} (expected {value or kind!r}).")
+        self.position += 1
+        return token
+
+    def document(self) -> Document:
+        operations, fragments = [], {}
+        while self.peek():
+            if self.peek("fragment"):
+                fragment = self.fragment_definition()
+                fragments.setdefault(fragment.name, fragment)
+            else:
+                operations.append(self.operation_definition())
+        return Document(operations, fragments)
+
+    def operation_definition(self) -> OperationDefinition:
+        if self.peek("{"):
+            return OperationDefinition("query", None, [], [], self.selection_set())
+        kind = self.take(kind="name")
+        if kind not in ("query", "mutation", "subscription"):
+            raise SyntaxError(f"Unexpected token {kind!r} (expected an operation or a fragment).")
+        name = None
+        if self.peek() and self.tokens[self.position][0] == "name":
+            name = self.take(kind="name")
+        variables = []
+        if self.peek("("):
+            self.take("(")
+            while not self.peek(")"):
+                self.take("$")
+                variable = self.take(kind="name")
+                self.take(":")
+                type = self.type_reference()
+                default = None
+                if self.peek("="):
+                    self.take("=")
+                    default = self.value()
+                self.directives()
+                variables.append(VariableDefinition(variable, type, default))
+            self.take(")")
+        return OperationDefinition(kind, name, variables, self.directives(), self.selection_set())
+
+    def fragment_definition(self) -> FragmentDefinition:
+        self.take("fragment")
+        name = self.take(kind="name")
+        self.take("on")
+        type_condition = self.take(kind="name")
+        return FragmentDefinition(name, type_condition, self.directives(), self.selection_set())
+
+    def type_reference(self) -> str:
+        if self.peek("["):
+            self.take("[")
+            type = f"[{self.type_reference()}]"
+            self.take("]")
+        else:
+            type = self.take(kind="name")
+        if self.peek("!"):
+            type += self.take("!")
+        return type
+
+    def selection_set(self) -> list:
+        self.take("{")
+        selections = []
+        while not self.peek("}"):
+            selections.append(self.selection())
+        self.take("}")
+        return selections
+
+    def selection(self) -> Node:
+        if self.peek("..."):
+            self.take("...")
+            if self.peek("on"):
+                self.take("on")
+                type_condition = self.take(kind="name")
+                return InlineFragment(type_condition, self.directives(), self.selection_set())
+            elif self.peek("@") or self.peek("{"):
+                return InlineFragment(None, self.directives(), self.selection_set())
+            return FragmentSpread(self.take(kind="name"), self.directives())
+
+        alias, name = None, self.take(kind="name")
+        if self.peek(":"):
+            self.take(":")
+            alias, name = name, self.take(kind="name")
+        arguments = self.arguments()
+        directives = self.directives()
+        selections = self.selection_set() if self.peek("{") else []
+        return Field(alias, name, arguments, directives, selections)
+
+    def arguments(self) -> dict:
+        arguments = {}
+        if self.peek("("):
+            self.take("(")
+            while not self.peek(")"):
+                name = self.take(kind="name")
+                self.take(":")
+                arguments[name] = self.value()
+            self.take(")")
+        return arguments
+
+    def directives(self) -> list:
+        directives = []
+        while self.peek("@"):
+            self.take("@")
+            directives.append(Directive(self.take(kind="name"), self.arguments()))
+        return directives
+
+    def value(self):
+        if not self.peek():
+            raise SyntaxError("Unexpected end of document (expected a value).")
+        kind, token = self.tokens[self.position]
+        if token == "$":
+            self.take("$")
+            return Variable(self.take(kind="name"))
+        elif token == "[":
+            self.take("[")
+            values = []
+            while not self.peek("]"):
+                values.append(self.value())
+            self.take("]")
+            return values
+        elif token == "{":
+            self.take("{")
+            values = {}
+            while not self.peek("}"):
+                name = self.take(kind="name")
+                self.take(":")
+                values[name] = self.value()
+            self.take("}")
+            return values
+        self.position += 1
+        if kind == "number":
+            return float(token) if any(char in token for char in ".eE") else int(token)
+        elif kind == "string":
+            return json.loads(token)
+        elif kind == "block":
+            return token[3:-3].replace('\\"""', '"""')
+        elif kind == "name":
+            if token in ("true", "false", "null"):
+                return {"true": True, "false": False, "null": None}[token]
+            return Enum(token)
+        raise SyntaxError(f"Unexpected token {token!r} (expected a value).")
+
+def parse(text: str) -> Document:
+    """
+    Parses a GraphQL executable document (operations and fragments).
+
+    Args:
+        ➤ text (str): The document (e.g. 'GraphQLOperation(name).query').
+
+    Returns:
+        ➤ Document: The parsed document.
+
+    Raises:
+        ➤ SyntaxError: If the document is not valid GraphQL.
+    """
+
+    return _Parser(text).document()
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🧭 Helpers 🧭
+def named_type(type: str) -> str:
+    """
+    Strips list and non-null wrappers from a type reference (e.g. '[Int!]!' -> 'Int').
+    """
+
+    return type.strip("[]!")
+
+def is_included(node: Node, variables: dict) -> bool:
+    """
+    Evaluates the '@include' and '@skip' directives of a selection.
+    """
+
+    for directive in node.directives:
+        if directive.name in ("include", "skip"):
+            condition = directive.arguments.get("if")
+            if isinstance(condition, Variable):
+                condition = variables.get(condition.name)
+            if bool(condition) != (directive.name == "include"):
+                return False
+    return True
+# ═════════════════════════════════════════════════════════════════════════════╝
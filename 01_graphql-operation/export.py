@@ -0,0 +1,391 @@
+#╔═════════════════════════════════════════════════════════════════════════════╗
+#║══════════════════❯ 💫 AxieAPI | GraphQL | Sales Export 💫
+#╚═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📦 Dependencies 📦
+# ╚════════❯ 📦 Built-in Dependencies:
+import collections
+import json
+import math
+import mmap
+import os
+import struct
+import zlib
+from array import array
+# ╚════════❯ 📦 External Dependencies:
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+# ╚════════❯ 📦 Internal Dependencies:
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📐 Format 📐
+# Chunk file layout: MAGIC | header length (uint32) | header (JSON) | column blocks.
+MAGIC = b"AXSALES1"
+INDEX = "index.json"
+
+# Columns: (name, type), where type is 'q' (int64), 'd' (float64) or 's' (utf-8 strings).
+COLUMNS = (
+    ("timestamp", "q"),
+    ("kind", "s"),
+    ("id", "s"),
+    ("order_id", "s"),
+    ("tx_hash", "s"),
+    ("from", "s"),
+    ("to", "s"),
+    ("price", "s"),
+    ("price_usd", "d"),
+)
+
+CODECS = ("zstd", "zlib", "none") if zstandard else ("zlib", "none")
+
+def _compress(codec: str, data: bytes) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=9).compress(data)
+    elif codec == "zlib":
+        return zlib.compress(data, 6)
+    return data
+
+def _decompress(codec: str, data: bytes) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdDecompressor().decompress(data)
+    elif codec == "zlib":
+        return zlib.decompress(data)
+    return data
+
+def _encode(kind: str, values: list) -> bytes:
+    """
+    Encodes a column. Strings are NUL-separated ('None' is stored as an empty string).
+    """
+
+    if kind == "s":
+        return "\0".join("" if value is None else str(value) for value in values).encode()
+    return array(kind, values).tobytes()
+
+def _decode(kind: str, data: bytes, rows: int) -> list:
+    if kind == "s":
+        return data.decode().split("\0") if rows else []
+    values = array(kind)
+    values.frombytes(data)
+    return values
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🔀 Sales Extraction 🔀
+def _int(value) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+def _float(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+def _settled_rows(kind: str, key: str):
+    """
+    Builds an extractor of 'settledAuctions' results (cf. 'GetRecentlySold*'),
+    with one row per priced record of 'TransferHistoryInSettledAuction'.
+    """
+
+    def extract(data: dict):
+        for asset in ((data.get("settledAuctions") or {}).get(kind) or {}).get("results") or ():
+            for record in (asset.get("transferHistory") or {}).get("results") or ():
+                if record.get("withPrice") is None:
+                    continue
+                yield (
+                    _int(record.get("timestamp")), kind, asset.get(key), None, record.get("txHash"),
+                    record.get("from"), record.get("to"), record.get("withPrice"), _float(record.get("withPriceUsd"))
+                )
+    return extract
+
+# Asset '__typename' -> kind (named after the 'settledAuctions' fields):
+KINDS = {
+    "Axie": "axies",
+    "LandPlot": "lands",
+    "LandItem": "items",
+    "Bundle": "bundles",
+    "Erc1155Token": "erc1155Tokens",
+    "EquipmentInstance": "equipments",
+}
+
+def _top_sales_rows(data: dict):
+    """
+    Extracts 'topSales' results (cf. 'GetTopSales', 'GetTopAllSales').
+    """
+
+    for sale in ((data.get("topSales") or {}).get("results")) or ():
+        asset = next(
+            (sale[key] for key in ("tokenAsset", "axie", "equipment", "erc1155", "landPlot", "landItem") if sale.get(key)),
+            {}
+        )
+        token_id = asset.get("id") or asset.get("tokenId") or asset.get("erc1155TokenId") or asset.get("alias")
+        yield (
+            _int(sale.get("timestamp")), KINDS.get(asset.get("__typename"), ""), token_id, sale.get("orderId"), None,
+            None, None, sale.get("settlePrice"), _float(sale.get("settlePriceUsd"))
+        )
+
+# Operation name -> extractor of rows from the response 'data':
+EXTRACTORS = {
+    "GetRecentlySoldAxies": _settled_rows("axies", "id"),
+    "GetRecentlySoldLands": _settled_rows("lands", "tokenId"),
+    "GetRecentlySoldItems": _settled_rows("items", "tokenId"),
+    "GetRecentlySoldBundles": _settled_rows("bundles", "listingIndex"),
+    "GetRecentlySoldErc1155Tokens": _settled_rows("erc1155Tokens", "erc1155TokenId"),
+    "GetTopSales": _top_sales_rows,
+    "GetTopAllSales": _top_sales_rows,
+}
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📤 Sales Exporter 📤
+class SalesExporter:
+    """
+    A class that streams sales results into append-only, compressed, columnar chunk files,
+    indexed by time range and id range (cf. 'SalesArchive').
+    """
+
+    def __init__(self, directory: str, chunk_rows: int = 50_000, codec: str = CODECS[0], dedup_window: int = 100_000) -> None:
+        """
+        Initializes a 'SalesExporter' instance.
+
+        Args:
+            ➤ directory (str): The archive directory (created if missing).
+            ➤ chunk_rows (int): The number of rows buffered before a chunk is written.
+            ➤ codec (str): The column compression codec ('zstd' if installed, 'zlib' or 'none').
+            ➤ dedup_window (int): The number of recent sales remembered to drop duplicates across polls.
+
+        Raises:
+            ➤ ValueError: If 'codec' is not available.
+        """
+
+        # ┗━━━━━➤ 🚦 Perform checks:
+        if codec not in CODECS:
+            raise ValueError(f"Codec '{codec}' is not available. It must be one of: {CODECS}.")
+
+        # ┗━━━━━➤ 📌 Define attributes:
+        self._directory = directory
+        self._chunk_rows = chunk_rows
+        self._codec = codec
+        self._rows = []
+        self._seen = collections.OrderedDict()
+        self._dedup_window = dedup_window
+        os.makedirs(directory, exist_ok=True)
+        self._index = _read_index(directory)
+
+    def __enter__(self) -> "SalesExporter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def add(self, operation: str, data: dict) -> int:
+        """
+        Buffers the sales of one response, and writes a chunk once 'chunk_rows' is reached.
+
+        Args:
+            ➤ operation (str): The operation name (cf. 'EXTRACTORS').
+            ➤ data (dict): The response 'data'.
+
+        Returns:
+            ➤ int: The number of new (non-duplicate) rows.
+
+        Raises:
+            ➤ ValueError: If 'operation' has no sales extractor.
+        """
+
+        if operation not in EXTRACTORS:
+            raise ValueError(f"Operation '{operation}' can't be exported. It must be one of: {list(EXTRACTORS)}.")
+
+        added = 0
+        for row in EXTRACTORS[operation](data or {}):
+            key = (row[1], row[2], row[3], row[4], row[0])
+            if key in self._seen:
+                continue
+            self._seen[key] = None
+            if len(self._seen) > self._dedup_window:
+                self._seen.popitem(last=False)
+            self._rows.append(row)
+            added += 1
+        if len(self._rows) >= self._chunk_rows:
+            self.flush()
+        return added
+
+    def flush(self) -> None:
+        """
+        Writes the buffered rows as a new chunk file, and appends it to the index.
+        """
+
+        if not self._rows:
+            return
+        rows, self._rows = self._rows, []
+        rows.sort(key=lambda row: row[0])
+
+        # Encode & compress each column:
+        blocks, columns, offset = [], [], 0
+        for position, (name, kind) in enumerate(COLUMNS):
+            block = _compress(self._codec, _encode(kind, [row[position] for row in rows]))
+            columns.append({"name": name, "type": kind, "offset": offset, "length": len(block)})
+            blocks.append(block)
+            offset += len(block)
+        header = json.dumps({"codec": self._codec, "rows": len(rows), "columns": columns}).encode()
+
+        # Write the chunk (append-only: a new file per chunk):
+        file = f"chunk-{len(self._index):06d}.col"
+        path = os.path.join(self._directory, file)
+        with open(path + ".tmp", "wb") as chunk:
+            chunk.write(MAGIC + struct.pack("<I", len(header)) + header)
+            for block in blocks:
+                chunk.write(block)
+        os.replace(path + ".tmp", path)
+
+        ids = [_int(row[2]) for row in rows if str(row[2]).isdigit()]
+        self._index.append({
+            "file": file,
+            "rows": len(rows),
+            "min_timestamp": rows[0][0],
+            "max_timestamp": rows[-1][0],
+            "min_id": min(ids) if ids else None,
+            "max_id": max(ids) if ids else None,
+            "kinds": sorted({row[1] for row in rows}),
+        })
+        _write_index(self._directory, self._index)
+
+    def close(self) -> None:
+        """
+        Writes the remaining buffered rows.
+        """
+
+        self.flush()
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📥 Sales Archive 📥
+class SalesArchive:
+    """
+    A class that range-scans the chunks written by a 'SalesExporter',
+    skipping chunks through the index and reading only the requested columns.
+    """
+
+    def __init__(self, directory: str) -> None:
+        """
+        Initializes a 'SalesArchive' instance.
+
+        Args:
+            ➤ directory (str): The archive directory.
+        """
+
+        self._directory = directory
+        self._index = _read_index(directory)
+
+    @property
+    def index(self) -> list:
+        """
+        """
+
+        return self._index
+
+    def chunks(self, start: int = None, end: int = None, min_id: int = None, max_id: int = None, kind: str = None) -> list:
+        """
+        Selects the chunks that may hold rows within the given ranges.
+
+        Args:
+            ➤ start (int): The first timestamp (inclusive).
+            ➤ end (int): The last timestamp (inclusive).
+            ➤ min_id (int): The lowest numeric id (inclusive).
+            ➤ max_id (int): The highest numeric id (inclusive).
+            ➤ kind (str): The asset kind (e.g. 'axies', 'lands', cf. 'KINDS').
+
+        Returns:
+            ➤ list: The matching index entries.
+        """
+
+        selected = []
+        for entry in self._index:
+            if start is not None and entry["max_timestamp"] < start:
+                continue
+            if end is not None and entry["min_timestamp"] > end:
+                continue
+            if min_id is not None and entry["max_id"] is not None and entry["max_id"] < min_id:
+                continue
+            if max_id is not None and entry["min_id"] is not None and entry["min_id"] > max_id:
+                continue
+            if kind is not None and kind not in entry["kinds"]:
+                continue
+            selected.append(entry)
+        return selected
+
+    def scan(self, columns: tuple = None, start: int = None, end: int = None, kind: str = None, **ranges):
+        """
+        Yields the requested columns of each selected chunk, with rows outside '[start, end]' (or of another kind) dropped.
+        'min_id'/'max_id' only skip whole chunks: rows outside the id range are still yielded from the selected ones.
+
+        Args:
+            ➤ columns (tuple): The column names (all columns by default, cf. 'COLUMNS').
+            ➤ start (int): The first timestamp (inclusive).
+            ➤ end (int): The last timestamp (inclusive).
+            ➤ kind (str): The asset kind.
+            ➤ ranges: 'min_id'/'max_id' chunk filters (cf. 'chunks').
+
+        Yields:
+            ➤ dict: A mapping of column name to a list of values, for one chunk.
+        """
+
+        columns = tuple(columns or (name for name, _ in COLUMNS))
+        wanted = set(columns) | {"timestamp"} | ({"kind"} if kind is not None else set())
+        for entry in self.chunks(start=start, end=end, kind=kind, **ranges):
+            data = self._read_chunk(entry["file"], wanted)
+            rows = range(len(data["timestamp"]))
+            if start is not None or end is not None or kind is not None:
+                rows = [
+                    row for row in rows
+                    if (start is None or data["timestamp"][row] >= start)
+                    and (end is None or data["timestamp"][row] <= end)
+                    and (kind is None or data["kind"][row] == kind)
+                ]
+                yield {name: [data[name][row] for row in rows] for name in columns}
+            else:
+                yield {name: list(data[name]) for name in columns}
+
+    def _read_chunk(self, file: str, wanted: set) -> dict:
+        """
+        Maps a chunk file, and decodes the wanted column blocks only.
+        """
+
+        with open(os.path.join(self._directory, file), "rb") as chunk:
+            with mmap.mmap(chunk.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                if view[:len(MAGIC)] != MAGIC:
+                    raise ValueError(f"File '{file}' is not a sales chunk.")
+                (length,) = struct.unpack_from("<I", view, len(MAGIC))
+                base = len(MAGIC) + 4
+                header = json.loads(view[base:base + length])
+                base += length
+                data = {}
+                for column in header["columns"]:
+                    if column["name"] in wanted:
+                        start = base + column["offset"]
+                        block = _decompress(header["codec"], view[start:start + column["length"]])
+                        data[column["name"]] = _decode(column["type"], block, header["rows"])
+        return data
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🗂 Index 🗂
+def _read_index(directory: str) -> list:
+    try:
+        with open(os.path.join(directory, INDEX)) as index:
+            return json.load(index)
+    except FileNotFoundError:
+        return []
+
+def _write_index(directory: str, index: list) -> None:
+    path = os.path.join(directory, INDEX)
+    with open(path + ".tmp", "w") as file:
+        json.dump(index, file)
+    os.replace(path + ".tmp", path)
+# ═════════════════════════════════════════════════════════════════════════════╝
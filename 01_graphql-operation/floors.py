@@ -0,0 +1,238 @@
+#╔═════════════════════════════════════════════════════════════════════════════╗
+#║══════════════════❯ 💫 AxieAPI | GraphQL | Floor Prices 💫
+#╚═════════════════════════════════════════════════════════════════════════════╝
+# Keeps the listings of each segment (axie class, class and part, land type, item alias) sorted by price,
+# updated by listing events instead of rescanning the marketplace:
+#   floors = FloorTracker()
+#   Paginator(client, "GetRecentlyListedAxies", {"auctionType": "Sale"}, sink=floors, fragment="AxieBrief")
+#   floors.floor(("axie", "Aquatic", "mouth-risky-fish")), floors.cheapest(("land", "Savannah"), 10)
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📦 Dependencies 📦
+# ╚════════❯ 📦 Built-in Dependencies:
+import bisect
+import threading
+# ╚════════❯ 📦 External Dependencies:
+# ╚════════❯ 📦 Internal Dependencies:
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🧩 Segments 🧩
+def _axie_segments(axie: dict) -> list:
+    """
+    An axie is in the segment of its class, and of its class with each of its parts.
+    """
+
+    segments = [("axie", axie.get("class"))]
+    segments.extend(("axie", axie.get("class"), part.get("id")) for part in axie.get("parts") or () if part)
+    return segments
+
+def _land_segments(land: dict) -> list:
+    return [("land", land.get("landType"))]
+
+def _item_segments(item: dict) -> list:
+    return [("item", item.get("itemAlias"))]
+
+# The segments of an entity of each kind (replaceable per tracker, cf. 'FloorTracker(segmenters=...)'):
+SEGMENTERS = {"axie": _axie_segments, "land": _land_segments, "item": _item_segments}
+# The kind of the entities of each fragment, and their ID field:
+FRAGMENTS = {
+    "AxieBrief": ("axie", "id"),
+    "AxieDetail": ("axie", "id"),
+    "LandDetail": ("land", "tokenId"),
+    "ItemBrief": ("item", "tokenId"),
+    "ItemDetail": ("item", "tokenId"),
+}
+
+def price(entity: dict) -> float:
+    """
+    The listing price of an entity ('order.currentPriceUsd'), or None if it is not listed.
+    Auction prices move between 'startedAt' and 'endedAt': the price of the last update is kept.
+    """
+
+    order = entity.get("order") or {}
+    value = order.get("currentPriceUsd")
+    return float(value) if value is not None else None
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🏷 Floor Tracker 🏷
+class FloorTracker:
+    """
+    A class that maintains the listings of each segment as a sorted '(price, id)' array, fed by listing events
+    ('listed', 'unlisted', 'sold'), or by listing pages as a sink (cf. 'write'):
+        - the floor is the first entry (O(1)), the 'k' cheapest a slice (O(k)).
+        - the rank of a price (how many listings are cheaper) is a binary search (O(log n)).
+        - an event moves the entity in the arrays of its segments (a binary search, and a memmove).
+    """
+
+    def __init__(self, segmenters: dict = None) -> None:
+        """
+        Initializes a 'FloorTracker' instance.
+
+        Args:
+            ➤ segmenters (dict): The function returning the segments of an entity, per kind ('SEGMENTERS' by default).
+        """
+
+        self._segmenters = {**SEGMENTERS, **(segmenters or {})}
+        self._listings = {}
+        self._books = {}
+        self._sales = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__module__}.{self.__class__.__name__} {len(self._listings)} listings object at {hex(id(self))}>"
+
+    def __len__(self) -> int:
+        return len(self._listings)
+
+    def write(self, fragment: str, entities: list) -> None:
+        """
+        Applies fetched entities (the sink interface, cf. 'Paginator(sink=...)'): listed ones are added or
+        repriced, and the ones without an order are removed.
+
+        Raises:
+            ➤ ValueError: If 'fragment' has no kind mapping (cf. 'FRAGMENTS').
+        """
+
+        if fragment not in FRAGMENTS:
+            raise ValueError(f"Fragment '{fragment}' can't be tracked. It must be one of: {list(FRAGMENTS)}.")
+        kind, field = FRAGMENTS[fragment]
+        for entity in entities:
+            if entity and entity.get(field) is not None:
+                if price(entity) is not None:
+                    self.listed(kind, entity, entity[field])
+                else:
+                    self.unlisted(kind, entity[field])
+
+    def listed(self, kind: str, entity: dict, id=None) -> None:
+        """
+        Records a new listing, or a new price of a listing.
+
+        Args:
+            ➤ kind (str): The entity kind (cf. 'SEGMENTERS').
+            ➤ entity (dict): The listed entity, with its 'order'.
+            ➤ id: The entity ID (its 'id' field if omitted).
+
+        Raises:
+            ➤ KeyError: If 'kind' has no segmenter.
+            ➤ ValueError: If the entity has no 'order.currentPriceUsd'.
+        """
+
+        value = price(entity)
+        if value is None:
+            raise ValueError(f"The {kind} '{id}' is not listed: it has no 'order.currentPriceUsd'.")
+        key = (kind, str(entity["id"] if id is None else id))
+        segments = tuple(self._segmenters[kind](entity))
+        with self._lock:
+            self._remove(key)
+            self._listings[key] = (value, segments)
+            for segment in segments:
+                bisect.insort(self._books.setdefault(segment, []), (value, key[1]))
+
+    def unlisted(self, kind: str, id) -> bool:
+        """
+        Records a cancelled (or expired) listing.
+
+        Returns:
+            ➤ bool: Whether the entity was listed.
+        """
+
+        with self._lock:
+            return self._remove((kind, str(id))) is not None
+
+    def sold(self, kind: str, id, price: float = None) -> bool:
+        """
+        Records a sale: the listing is removed, and the price is kept as the last sale of its segments.
+
+        Args:
+            ➤ price (float): The sale price in USD (the listing price if omitted).
+
+        Returns:
+            ➤ bool: Whether the entity was listed.
+        """
+
+        with self._lock:
+            listing = self._remove((kind, str(id)))
+            if listing is None:
+                return False
+            value, segments = listing
+            for segment in segments:
+                self._sales[segment] = price if price is not None else value
+            return True
+
+    def _remove(self, key: tuple) -> tuple:
+        """
+        Removes a listing from its segments (under the lock).
+
+        Returns:
+            ➤ tuple: The removed '(price, segments)', or None.
+        """
+
+        listing = self._listings.pop(key, None)
+        if listing is None:
+            return None
+        value, segments = listing
+        for segment in segments:
+            book = self._books[segment]
+            position = bisect.bisect_left(book, (value, key[1]))
+            if position < len(book) and book[position] == (value, key[1]):
+                del book[position]
+            if not book:
+                del self._books[segment]
+        return listing
+
+    def floor(self, segment: tuple) -> tuple:
+        """
+        The cheapest listing of a segment.
+
+        Returns:
+            ➤ tuple: '(price, id)', or None if nothing is listed in the segment.
+        """
+
+        book = self._books.get(tuple(segment))
+        try:
+            return book[0] if book else None
+        except IndexError:
+            # Emptied by a concurrent event.
+            return None
+
+    def cheapest(self, segment: tuple, k: int = 10) -> list:
+        """
+        The 'k' cheapest listings of a segment, as '(price, id)' pairs.
+        """
+
+        with self._lock:
+            return self._books.get(tuple(segment), [])[:k]
+
+    def rank(self, segment: tuple, price: float) -> int:
+        """
+        The number of listings of a segment cheaper than a price.
+        """
+
+        with self._lock:
+            return bisect.bisect_left(self._books.get(tuple(segment), []), (price,))
+
+    def count(self, segment: tuple) -> int:
+        """
+        The number of listings of a segment.
+        """
+
+        return len(self._books.get(tuple(segment), ()))
+
+    def last_sale(self, segment: tuple) -> float:
+        """
+        The price of the last sale recorded in a segment (None if there was none).
+        """
+
+        return self._sales.get(tuple(segment))
+
+    def floors(self, prefix: tuple = ()) -> dict:
+        """
+        The floor price of every segment starting with 'prefix' (e.g. '("land",)').
+        """
+
+        prefix = tuple(prefix)
+        with self._lock:
+            return {segment: book[0][0] for segment, book in self._books.items() if segment[:len(prefix)] == prefix}
+# ═════════════════════════════════════════════════════════════════════════════╝
@@ -0,0 +1,115 @@
+#╔═════════════════════════════════════════════════════════════════════════════╗
+#║══════════════════❯ 💫 AxieAPI | GraphQL | Request Hedging 💫
+#╚═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📦 Dependencies 📦
+# ╚════════❯ 📦 Built-in Dependencies:
+import threading
+# ╚════════❯ 📦 External Dependencies:
+# ╚════════❯ 📦 Internal Dependencies:
+from compiled_operations import OPERATIONS
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🪞 Hedging 🪞
+LATENCY_CRITICAL = ("GetAxieBrief", "GetMinPriceAxie", "GetExchangeRates")
+
+class HedgePolicy:
+    """
+    A class that decides when a duplicate ('hedge') of a slow request is sent: if no response arrived
+    after the observed latency percentile of its operation, the same request is sent again, and the
+    first response wins (cf. 'GraphQLClient(hedging=...)').
+
+    Only queries are hedged (never mutations), and the extra load is capped by a budget: every request
+    of a hedged operation earns 'budget' tokens (up to 'burst'), and every hedge spends one.
+    """
+
+    def __init__(self, operations: tuple = LATENCY_CRITICAL, percentile: float = 95.0, min_samples: int = 20, min_delay: float = 0.01, max_delay: float = 2.0, budget: float = 0.05, burst: float = 10.0) -> None:
+        """
+        Initializes a 'HedgePolicy' instance.
+
+        Args:
+            ➤ operations (tuple): The hedged operation names.
+            ➤ percentile (float): The latency percentile of an operation after which a hedge is sent.
+            ➤ min_samples (int): The latencies observed before an operation is hedged.
+            ➤ min_delay (float): The shortest hedge delay, in seconds.
+            ➤ max_delay (float): The longest hedge delay, in seconds.
+            ➤ budget (float): The hedges allowed per request (e.g. 0.05: at most 5% extra requests).
+            ➤ burst (float): The largest number of hedges saved up.
+
+        Raises:
+            ➤ ValueError: If an operation is not a valid query name (mutations are not idempotent), or
+                          if 'percentile' or 'budget' is out of range.
+        """
+
+        # ┗━━━━━➤ 🚦 Perform checks:
+        for name in operations:
+            if name not in OPERATIONS:
+                raise ValueError(f"Operation '{name}' is not valid. It must be a 'ValidOperations' name.")
+            if OPERATIONS[name]["kind"] != "query":
+                raise ValueError(f"Operation '{name}' is a {OPERATIONS[name]['kind']}: only queries can be hedged.")
+        if not 0 < percentile < 100:
+            raise ValueError(f"'percentile' ({percentile}) must be in ]0, 100[.")
+        if not 0 <= budget <= 1:
+            raise ValueError(f"'budget' ({budget}) must be in [0, 1].")
+
+        # ┗━━━━━➤ 📌 Define attributes:
+        self._operations = frozenset(operations)
+        self._percentile = percentile
+        self._min_samples = min_samples
+        self._min_delay = min_delay
+        self._max_delay = max_delay
+        self._budget = budget
+        self._burst = burst
+        self._tokens = burst
+        self._lock = threading.Lock()
+
+    @property
+    def operations(self) -> frozenset:
+        """
+        """
+
+        return self._operations
+
+    @property
+    def tokens(self) -> float:
+        """
+        """
+
+        return self._tokens
+
+    def delay(self, name: str, histogram) -> float:
+        """
+        The delay after which a request of an operation is hedged, and earns its budget share.
+
+        Args:
+            ➤ name (str): The operation name.
+            ➤ histogram (Histogram): The observed latencies of the operation (cf. 'Metrics.histogram').
+
+        Returns:
+            ➤ float: The delay in seconds, or None if the operation is not hedged (yet).
+        """
+
+        if name not in self._operations:
+            return None
+        with self._lock:
+            self._tokens = min(self._burst, self._tokens + self._budget)
+        if histogram.count < self._min_samples:
+            return None
+        return max(self._min_delay, min(self._max_delay, histogram.percentile(self._percentile)))
+
+    def acquire(self) -> bool:
+        """
+        Spends the budget of one hedge.
+
+        Returns:
+            ➤ bool: Whether the budget allows it.
+        """
+
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+# ═════════════════════════════════════════════════════════════════════════════╝
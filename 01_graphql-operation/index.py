@@ -0,0 +1,330 @@
+#╔═════════════════════════════════════════════════════════════════════════════╗
+#║══════════════════❯ 💫 AxieAPI | GraphQL | Axie Index 💫
+#╚═════════════════════════════════════════════════════════════════════════════╝
+# Answers 'AxieSearchCriteria' locally, over axies fetched with 'AxieBrief'/'AxieDetail':
+#   index = AxieIndex()
+#   Paginator(client, "GetRecentlyListedAxies", {"auctionType": "Sale"}, sink=index, fragment="AxieBrief")
+#   index.search({"classes": ["Aquatic"], "parts": ["mouth-risky-fish"], "breedCount": [0, 2]}, sort="PriceAsc")
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📦 Dependencies 📦
+# ╚════════❯ 📦 Built-in Dependencies:
+import bisect
+import math
+import re
+import threading
+# ╚════════❯ 📦 External Dependencies:
+# ╚════════❯ 📦 Internal Dependencies:
+import tracing
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🔎 Axie Index 🔎
+FRAGMENTS = ("AxieBrief", "AxieDetail")
+SORTS = ("PriceAsc", "PriceDesc", "IdAsc", "IdDesc", "Latest")
+# The criteria evaluated locally (others, e.g. 'numMystic' or 'hp', need the gateway):
+CRITERIA = ("classes", "parts", "stages", "breedCount", "pureness")
+MAX_BREED_COUNT = 7
+
+def _price(axie: dict) -> float:
+    order = axie.get("order") or {}
+    price = order.get("currentPriceUsd")
+    return float(price) if price is not None else math.inf
+
+def _id(axie: dict) -> int:
+    return int(axie["id"]) if str(axie["id"]).isdigit() else 0
+
+def _listed_at(axie: dict) -> int:
+    return (axie.get("order") or {}).get("startedAt") or 0
+
+# The sort key of an axie in each sorted array ('Latest' first: the most recently listed):
+_SORT_KEYS = (
+    lambda axie: (_price(axie), _id(axie)),
+    lambda axie: (_id(axie),),
+    lambda axie: (-_listed_at(axie), -_id(axie)),
+)
+
+_NONZERO = re.compile(rb"[^\x00]")
+
+def _members(data: bytes) -> list:
+    """
+    The set bits of a little-endian bitmap (its zero bytes are skipped by the regex engine).
+    """
+
+    return [
+        match.start() * 8 + bit for match in _NONZERO.finditer(data)
+        for bit in range(8) if data[match.start()] >> bit & 1
+    ]
+
+def _bitmap(slots) -> int:
+    data = bytearray()
+    for slot in slots:
+        if slot >> 3 >= len(data):
+            data.extend(bytes((slot >> 3) - len(data) + 1))
+        data[slot >> 3] |= 1 << (slot & 7)
+    return int.from_bytes(data, "little")
+
+def _keys(axie: dict) -> list:
+    """
+    The posting keys of an axie: its class, part IDs, stage, breed count, pureness
+    (the number of its parts of its own class) and whether it has a price.
+    """
+
+    parts = [part for part in axie.get("parts") or () if part]
+    keys = [
+        ("class", axie.get("class")), ("stage", axie.get("stage")), ("breedCount", axie.get("breedCount")),
+        ("listed", _price(axie) < math.inf),
+    ]
+    keys.extend(("part", part.get("id")) for part in parts)
+    keys.append(("pureness", sum(part.get("class") == axie.get("class") for part in parts)))
+    return keys
+
+class AxieIndex:
+    """
+    A class that indexes axies in memory, to evaluate search criteria without a gateway round trip:
+        - each axie gets a slot, and each class, part ID, stage, breed count and pureness a bitmap
+          of slots (a Python int), so criteria are a few bitwise operations.
+        - slots are kept sorted by 'order.currentPriceUsd', ID and listing time, to page through
+          the matching axies in the requested order.
+    It is a sink (cf. 'write'), so a 'Paginator' polling listings keeps it up to date.
+    """
+
+    def __init__(self) -> None:
+        self._axies = []
+        self._slots = {}
+        self._free = []
+        self._keys = []
+        self._postings = {}
+        self._all = 0
+        # The '(*sort key, slot)' entries sorted by price, ID and listing time (cf. '_SORT_KEYS'):
+        self._sorted = ([], [], [])
+        self._lock = threading.RLock()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__module__}.{self.__class__.__name__} {len(self)} axies object at {hex(id(self))}>"
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, id) -> bool:
+        return str(id) in self._slots
+
+    def get(self, id) -> dict:
+        """
+        Returns an indexed axie (None if it's not indexed).
+        """
+
+        slot = self._slots.get(str(id))
+        return self._axies[slot] if slot is not None else None
+
+    def write(self, fragment: str, entities: list) -> None:
+        """
+        Indexes fetched axies (the sink interface, cf. 'Paginator(sink=...)').
+
+        Raises:
+            ➤ ValueError: If 'fragment' is not an axie fragment.
+        """
+
+        if fragment not in FRAGMENTS:
+            raise ValueError(f"Fragment '{fragment}' can't be indexed. It must be one of: {FRAGMENTS}.")
+        self.update(entities)
+
+    def update(self, axies: list) -> int:
+        """
+        Adds or replaces axies (e.g. a new page of listings): an axie whose order is gone is kept unlisted.
+
+        Returns:
+            ➤ int: The number of new axies.
+        """
+
+        # An axie may appear twice in a batch (e.g. pages shifting while fetched): its last copy wins.
+        batch = {str(axie["id"]): axie for axie in axies if axie and axie.get("id") is not None}
+        added, postings, slots = 0, {}, []
+        with tracing.span("index.update") as span, self._lock:
+            for id, axie in batch.items():
+                if id in self._slots:
+                    self._unindex(self._slots[id])
+                else:
+                    added += 1
+                slot = self._index(id, axie)
+                slots.append(slot)
+                for key in self._keys[slot]:
+                    postings.setdefault(key, []).append(slot)
+
+            # Set the bits of each posting at once (an OR copies the whole int):
+            for key, posting in postings.items():
+                self._postings[key] = self._postings.get(key, 0) | _bitmap(posting)
+            self._all |= _bitmap(slots)
+            for array, key in zip(self._sorted, _SORT_KEYS):
+                entries = [(*key(self._axies[slot]), slot) for slot in slots]
+                if len(entries) > len(array) // 16:
+                    array.extend(entries)
+                    array.sort()
+                else:
+                    for entry in entries:
+                        bisect.insort(array, entry)
+            span.set("axies", len(axies))
+            span.set("added", added)
+        return added
+
+    def remove(self, ids: list) -> int:
+        """
+        Drops axies (e.g. sold or delisted ones).
+
+        Returns:
+            ➤ int: The number of removed axies.
+        """
+
+        removed = 0
+        with self._lock:
+            for id in ids:
+                slot = self._slots.pop(str(id), None)
+                if slot is not None:
+                    self._unindex(slot)
+                    self._axies[slot] = None
+                    self._free.append(slot)
+                    removed += 1
+        return removed
+
+    def _index(self, id: str, axie: dict) -> int:
+        """
+        Assigns a slot to an axie (under the lock), its previous slot if it had one; its bits and sorted
+        entries are then added by 'update'.
+        """
+
+        slot = self._slots.get(id)
+        if slot is None:
+            slot = self._free.pop() if self._free else len(self._axies)
+            if slot == len(self._axies):
+                self._axies.append(None)
+                self._keys.append(())
+            self._slots[id] = slot
+        self._axies[slot] = axie
+        self._keys[slot] = tuple(_keys(axie))
+        return slot
+
+    def _unindex(self, slot: int) -> None:
+        """
+        Clears the bits and sorted entries of a slot (under the lock).
+        """
+
+        axie, mask = self._axies[slot], ~(1 << slot)
+        for key in self._keys[slot]:
+            posting = self._postings[key] & mask
+            if posting:
+                self._postings[key] = posting
+            else:
+                del self._postings[key]
+        self._keys[slot] = ()
+        self._all &= mask
+        for array, key in zip(self._sorted, _SORT_KEYS):
+            entry = (*key(axie), slot)
+            position = bisect.bisect_left(array, entry)
+            if position < len(array) and array[position] == entry:
+                del array[position]
+
+    def _any(self, kind: str, values) -> int:
+        bitmap = 0
+        for value in values:
+            bitmap |= self._postings.get((kind, value), 0)
+        return bitmap
+
+    def match(self, criteria: dict = None) -> int:
+        """
+        Evaluates criteria into the bitmap of the matching slots:
+            - 'classes', 'stages', 'pureness': any of the values.
+            - 'parts': any of the parts of a same type ('mouth-...'), and all of the types;
+              '!<part ID>' excludes a part.
+            - 'breedCount': a '[min, max]' range.
+
+        Raises:
+            ➤ ValueError: If a criterion can't be evaluated locally (cf. 'CRITERIA').
+        """
+
+        criteria = {key: value for key, value in (criteria or {}).items() if value not in (None, [])}
+        unsupported = sorted(set(criteria) - set(CRITERIA))
+        if unsupported:
+            raise ValueError(f"Criteria {unsupported} can't be evaluated locally. They must be among: {CRITERIA}.")
+
+        with self._lock:
+            bitmap = self._all
+            if "classes" in criteria:
+                bitmap &= self._any("class", criteria["classes"])
+            if "stages" in criteria:
+                bitmap &= self._any("stage", criteria["stages"])
+            if "pureness" in criteria:
+                bitmap &= self._any("pureness", criteria["pureness"])
+            if "breedCount" in criteria:
+                low, high = min(criteria["breedCount"]), max(criteria["breedCount"])
+                bitmap &= self._any("breedCount", range(max(0, low), min(high, MAX_BREED_COUNT) + 1))
+            if "parts" in criteria:
+                groups = {}
+                for part in criteria["parts"]:
+                    if part.startswith("!"):
+                        bitmap &= ~self._postings.get(("part", part[1:]), 0)
+                    else:
+                        groups.setdefault(part.split("-", 1)[0], []).append(part)
+                for parts in groups.values():
+                    bitmap &= self._any("part", parts)
+            return bitmap
+
+    def search(self, criteria: dict = None, sort: str = "PriceAsc", from_: int = 0, size: int = 100, min_price: float = None, max_price: float = None) -> dict:
+        """
+        Searches the indexed axies, like the 'axies(criteria, sort, from, size)' field.
+
+        Args:
+            ➤ criteria (dict): The 'AxieSearchCriteria' (cf. 'match').
+            ➤ sort (str): The order of the results (cf. 'SORTS').
+            ➤ from_ (int): The offset of the first result.
+            ➤ size (int): The maximum number of results.
+            ➤ min_price (float): The lowest 'order.currentPriceUsd'.
+            ➤ max_price (float): The highest 'order.currentPriceUsd'.
+
+        Returns:
+            ➤ dict: '{"total": int, "results": [axie dicts]}'.
+
+        Raises:
+            ➤ ValueError: If 'sort' or a criterion is not supported.
+        """
+
+        if sort not in SORTS:
+            raise ValueError(f"Sort '{sort}' is not supported. It must be one of: {SORTS}.")
+
+        with tracing.span("index.search", sort=sort) as span, self._lock:
+            bitmap = self.match(criteria)
+            if sort.startswith("Price"):
+                # Only listed axies have a price to sort on:
+                bitmap &= self._postings.get(("listed", True), 0)
+            by_price, by_id, by_listing = self._sorted
+            # The price window (unlisted axies, priced 'inf', are last):
+            start = 0 if min_price is None else bisect.bisect_left(by_price, (min_price,))
+            end = bisect.bisect_left(by_price, (math.inf,)) if max_price is None else bisect.bisect_right(by_price, (max_price, math.inf))
+            if min_price is not None or max_price is not None:
+                # The window narrows the price scan, and the matches (the total, and the few matches sorted below):
+                bitmap &= _bitmap(by_price[index][-1] for index in range(start, end))
+            sorted_by = {"Price": (by_price, 0, start, end), "Id": (by_id, 1, 0, len(by_id)), "Latest": (by_listing, 2, 0, len(by_listing))}
+            entries, key, start, end = sorted_by[sort.replace("Asc", "").replace("Desc", "")]
+            descending = sort.endswith("Desc")
+
+            total, results = bitmap.bit_count(), []
+            if from_ < total:
+                data = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little")
+                if (from_ + size) * (end - start) / total > 4 * total:
+                    # Few matches: sorting them beats scanning the sorted array until the page is filled.
+                    slots = sorted(_members(data), key=lambda slot: (*_SORT_KEYS[key](self._axies[slot]), slot), reverse=descending)
+                    slots = slots[from_:from_ + size]
+                else:
+                    slots, skipped, length = [], 0, len(data)
+                    for index in range(end - 1, start - 1, -1) if descending else range(start, end):
+                        slot = entries[index][-1]
+                        if slot >> 3 < length and data[slot >> 3] >> (slot & 7) & 1:
+                            if skipped < from_:
+                                skipped += 1
+                                continue
+                            slots.append(slot)
+                            if len(slots) >= size:
+                                break
+                results = [self._axies[slot] for slot in slots]
+            span.set("total", total)
+        return {"total": total, "results": results}
+# ═════════════════════════════════════════════════════════════════════════════╝
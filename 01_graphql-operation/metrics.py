@@ -0,0 +1,446 @@
+#╔═════════════════════════════════════════════════════════════════════════════╗
+#║══════════════════❯ 💫 AxieAPI | GraphQL | Metrics 💫
+#╚═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📦 Dependencies 📦
+# ╚════════❯ 📦 Built-in Dependencies:
+import heapq
+import itertools
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+# ╚════════❯ 📦 External Dependencies:
+# ╚════════❯ 📦 Internal Dependencies:
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📊 Histogram 📊
+# Log-linear buckets (HDR-style): exact below 128µs, then 64 sub-buckets per power of two (≤1.6% error).
+_SUB_BITS = 6
+_LINEAR = 1 << (_SUB_BITS + 1)
+
+def _bucket(value: int) -> int:
+    if value < _LINEAR:
+        return value
+    shift = value.bit_length() - _SUB_BITS - 1
+    return (shift << _SUB_BITS) + (value >> shift)
+
+def _lower_bound(bucket: int) -> int:
+    if bucket < _LINEAR:
+        return bucket
+    shift = (bucket >> _SUB_BITS) - 1
+    return (bucket - (shift << _SUB_BITS)) << shift
+
+class Histogram:
+    """
+    A class that records latencies in log-linear buckets of microseconds,
+    with constant-time recording and bounded memory.
+    """
+
+    __slots__ = ("counts", "count", "total", "minimum", "maximum")
+
+    def __init__(self) -> None:
+        self.counts = {}
+        self.count = 0
+        self.total = 0.0
+        self.minimum = None
+        self.maximum = None
+
+    def record(self, seconds: float) -> None:
+        """
+        Records a latency, in seconds.
+        """
+
+        bucket = _bucket(max(0, int(seconds * 1_000_000)))
+        self.counts[bucket] = self.counts.get(bucket, 0) + 1
+        self.count += 1
+        self.total += seconds
+        if self.minimum is None or seconds < self.minimum:
+            self.minimum = seconds
+        if self.maximum is None or seconds > self.maximum:
+            self.maximum = seconds
+
+    def percentile(self, percent: float) -> float:
+        """
+        Returns the latency below which 'percent' % of the recorded latencies fall, in seconds.
+        """
+
+        if not self.count:
+            return 0.0
+        rank, seen = max(1, round(self.count * percent / 100)), 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= rank:
+                return min(_lower_bound(bucket + 1) / 1_000_000, self.maximum)
+        return self.maximum
+
+    def cumulative(self, bounds: tuple) -> list:
+        """
+        Counts the latencies below each bound (in seconds), for Prometheus 'le' buckets.
+        """
+
+        counts, seen, buckets = [], 0, sorted(self.counts.items())
+        position = 0
+        for bound in bounds:
+            while position < len(buckets) and _lower_bound(buckets[position][0]) / 1_000_000 <= bound:
+                seen += buckets[position][1]
+                position += 1
+            counts.append(seen)
+        return counts
+
+    def merge(self, other: "Histogram") -> None:
+        """
+        Adds the latencies of another histogram.
+        """
+
+        for bucket, count in other.counts.items():
+            self.counts[bucket] = self.counts.get(bucket, 0) + count
+        self.count += other.count
+        self.total += other.total
+        for value in (other.minimum, other.maximum):
+            if value is not None:
+                self.minimum = value if self.minimum is None else min(self.minimum, value)
+                self.maximum = value if self.maximum is None else max(self.maximum, value)
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📈 Metrics 📈
+PERCENTILES = (50, 90, 95, 99, 99.9)
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+def count_items(data, depth: int = 3) -> int:
+    """
+    Counts the decoded items of a response 'data': the length of its 'results'/'data' lists,
+    searched a few levels deep, or 1 for a single non-null entity.
+    """
+
+    if not isinstance(data, dict):
+        return 0
+    items, found = 0, False
+    for key, value in data.items():
+        if isinstance(value, list) and key in ("results", "data"):
+            items, found = items + len(value), True
+        elif isinstance(value, dict) and depth > 1:
+            nested = count_items(value, depth - 1)
+            if nested:
+                items, found = items + nested, True
+    return items if found else int(any(value is not None for value in data.values()))
+
+class OperationMetrics:
+    """
+    A class that holds the metrics of one operation name.
+    """
+
+    __slots__ = ("latency", "requests", "failures", "errors", "bytes_out", "bytes_in", "bytes_wire", "items", "rejected", "circuit", "transitions", "hedged", "hedge_wins", "lock")
+
+    def __init__(self) -> None:
+        self.latency = Histogram()
+        self.requests = 0
+        self.failures = 0
+        self.errors = 0
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.bytes_wire = 0
+        self.items = 0
+        self.rejected = 0
+        self.circuit = "closed"
+        self.transitions = {}
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.lock = threading.Lock()
+
+class Metrics:
+    """
+    A class that collects per-operation metrics: latency histograms, request and response bytes,
+    decoded item counts, GraphQL 'errors' counts and failed requests.
+    """
+
+    def __init__(self, namespace: str = "axie_graphql") -> None:
+        """
+        Initializes a 'Metrics' instance.
+
+        Args:
+            ➤ namespace (str): The prefix of exported Prometheus metric names.
+        """
+
+        self._namespace = namespace
+        self._operations = {}
+        self._lock = threading.Lock()
+        self._server = None
+
+    def _operation(self, name: str) -> OperationMetrics:
+        metrics = self._operations.get(name)
+        if metrics is None:
+            with self._lock:
+                metrics = self._operations.setdefault(name, OperationMetrics())
+        return metrics
+
+    def observe(self, name: str, latency: float, bytes_out: int = 0, bytes_in: int = 0, items: int = 0, errors: int = 0, failed: bool = False, bytes_wire: int = None) -> None:
+        """
+        Records one executed operation.
+
+        Args:
+            ➤ name (str): The operation name.
+            ➤ latency (float): The round-trip time, in seconds.
+            ➤ bytes_out (int): The request body size.
+            ➤ bytes_in (int): The response body size (decompressed).
+            ➤ items (int): The number of decoded items (cf. 'count_items').
+            ➤ errors (int): The number of GraphQL 'errors'.
+            ➤ failed (bool): Whether the request failed (network error or non-2xx status).
+            ➤ bytes_wire (int): The response body size as received, if compressed ('bytes_in' by default).
+        """
+
+        metrics = self._operation(name)
+        with metrics.lock:
+            metrics.latency.record(latency)
+            metrics.requests += 1
+            metrics.failures += failed
+            metrics.errors += errors
+            metrics.bytes_out += bytes_out
+            metrics.bytes_in += bytes_in
+            metrics.bytes_wire += bytes_in if bytes_wire is None else bytes_wire
+            metrics.items += items
+
+    def reject(self, name: str) -> None:
+        """
+        Records a request failed fast by an open circuit (cf. 'breaker.CircuitBreaker').
+        """
+
+        metrics = self._operation(name)
+        with metrics.lock:
+            metrics.rejected += 1
+
+    def transition(self, name: str, old: str, new: str) -> None:
+        """
+        Records a circuit state transition of an operation (a 'CircuitBreaker' listener).
+        """
+
+        metrics = self._operation(name)
+        with metrics.lock:
+            metrics.circuit = new
+            metrics.transitions[new] = metrics.transitions.get(new, 0) + 1
+
+    def hedge(self, name: str, won: bool) -> None:
+        """
+        Records a hedged request of an operation, and whether the hedge answered first (cf. 'hedging.HedgePolicy').
+        """
+
+        metrics = self._operation(name)
+        with metrics.lock:
+            metrics.hedged += 1
+            metrics.hedge_wins += won
+
+    def histogram(self, name: str) -> Histogram:
+        """
+        Returns a copy of the latency histogram of an operation.
+        """
+
+        histogram = Histogram()
+        metrics = self._operations.get(name)
+        if metrics is not None:
+            with metrics.lock:
+                histogram.merge(metrics.latency)
+        return histogram
+
+    def snapshot(self) -> dict:
+        """
+        Returns the current metrics, per operation name.
+
+        Returns:
+            ➤ dict: '{name: {requests, failures, errors, bytes_out, bytes_in, bytes_wire, compression_ratio, items,
+                     latency: {count, mean, min, max, p50, p90, p95, p99, p99.9}}}' (latencies in seconds).
+        """
+
+        snapshot = {}
+        for name, metrics in sorted(self._operations.items()):
+            with metrics.lock:
+                histogram = metrics.latency
+                snapshot[name] = {
+                    "requests": metrics.requests,
+                    "failures": metrics.failures,
+                    "errors": metrics.errors,
+                    "bytes_out": metrics.bytes_out,
+                    "bytes_in": metrics.bytes_in,
+                    "bytes_wire": metrics.bytes_wire,
+                    "compression_ratio": metrics.bytes_in / metrics.bytes_wire if metrics.bytes_wire else 1.0,
+                    "items": metrics.items,
+                    "rejected": metrics.rejected,
+                    "hedged": metrics.hedged,
+                    "hedge_wins": metrics.hedge_wins,
+                    "circuit": {"state": metrics.circuit, "transitions": dict(metrics.transitions)},
+                    "latency": {
+                        "count": histogram.count,
+                        "mean": histogram.total / histogram.count if histogram.count else 0.0,
+                        "min": histogram.minimum or 0.0,
+                        "max": histogram.maximum or 0.0,
+                        **{f"p{percent:g}": histogram.percentile(percent) for percent in PERCENTILES},
+                    },
+                }
+        return snapshot
+
+    def prometheus(self) -> str:
+        """
+        Exports the metrics in the Prometheus text format.
+        """
+
+        prefix = self._namespace
+        counters = (
+            ("requests_total", "requests", "Executed operations."),
+            ("failures_total", "failures", "Failed requests (network errors or non-2xx statuses)."),
+            ("errors_total", "errors", "GraphQL errors returned."),
+            ("request_bytes_total", "bytes_out", "Request body bytes sent."),
+            ("response_bytes_total", "bytes_in", "Response body bytes received (decompressed)."),
+            ("response_wire_bytes_total", "bytes_wire", "Response body bytes received on the wire (compressed)."),
+            ("items_total", "items", "Decoded items."),
+            ("rejected_total", "rejected", "Requests failed fast by an open circuit."),
+            ("hedged_total", "hedged", "Requests sent again after the hedge delay."),
+            ("hedge_wins_total", "hedge_wins", "Hedged requests answered first by the hedge."),
+        )
+        operations = sorted(self._operations.items())
+        lines = []
+        for metric, attribute, description in counters:
+            lines.append(f"# HELP {prefix}_{metric} {description}")
+            lines.append(f"# TYPE {prefix}_{metric} counter")
+            for name, metrics in operations:
+                lines.append(f'{prefix}_{metric}{{operation="{name}"}} {getattr(metrics, attribute)}')
+
+        metric = f"{prefix}_circuit_state"
+        lines.append(f"# HELP {metric} Circuit state (0: closed, 1: half-open, 2: open).")
+        lines.append(f"# TYPE {metric} gauge")
+        for name, metrics in operations:
+            lines.append(f'{metric}{{operation="{name}"}} {("closed", "half_open", "open").index(metrics.circuit)}')
+        metric = f"{prefix}_circuit_transitions_total"
+        lines.append(f"# HELP {metric} Circuit state transitions, by new state.")
+        lines.append(f"# TYPE {metric} counter")
+        for name, metrics in operations:
+            for state, count in sorted(metrics.transitions.items()):
+                lines.append(f'{metric}{{operation="{name}",state="{state}"}} {count}')
+
+        metric = f"{prefix}_request_duration_seconds"
+        lines.append(f"# HELP {metric} Operation round-trip time.")
+        lines.append(f"# TYPE {metric} histogram")
+        for name, metrics in operations:
+            with metrics.lock:
+                histogram = metrics.latency
+                for bound, count in zip(BUCKETS, histogram.cumulative(BUCKETS)):
+                    lines.append(f'{metric}_bucket{{operation="{name}",le="{bound:g}"}} {count}')
+                lines.append(f'{metric}_bucket{{operation="{name}",le="+Inf"}} {histogram.count}')
+                lines.append(f'{metric}_sum{{operation="{name}"}} {histogram.total:.6f}')
+                lines.append(f'{metric}_count{{operation="{name}"}} {histogram.count}')
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str) -> None:
+        """
+        Writes the Prometheus export to a file (atomically, e.g. for the node exporter textfile collector).
+        """
+
+        with open(path + ".tmp", "w") as file:
+            file.write(self.prometheus())
+        os.replace(path + ".tmp", path)
+
+    def serve(self, port: int = 9108, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """
+        Serves the Prometheus export on 'http://<host>:<port>/metrics', from a background thread.
+
+        Returns:
+            ➤ ThreadingHTTPServer: The server (call 'shutdown' to stop it).
+        """
+
+        metrics = self
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = metrics.prometheus().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name="Metrics", daemon=True).start()
+        return self._server
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🐢 Slow Requests 🐢
+class SlowRequestLog:
+    """
+    A class that retains the full breakdown of the slowest requests of each operation,
+    to diagnose tail latency after the fact (bounded to 'size' requests per operation).
+    """
+
+    def __init__(self, size: int = 10) -> None:
+        """
+        Initializes a 'SlowRequestLog' instance.
+
+        Args:
+            ➤ size (int): The number of requests retained per operation.
+        """
+
+        self._size = size
+        self._requests = {}
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+
+    def capture(self, name: str, elapsed: float, variables: dict, timings: dict, bytes_out: int, bytes_in: int, status: int = None, error: str = None) -> None:
+        """
+        Retains a request if it is among the slowest of its operation.
+
+        Args:
+            ➤ name (str): The operation name.
+            ➤ elapsed (float): The total time, in seconds.
+            ➤ variables (dict): The operation variables.
+            ➤ timings (dict): The time spent per phase, in seconds.
+            ➤ bytes_out (int): The request body size.
+            ➤ bytes_in (int): The response body size.
+            ➤ status (int): The HTTP status code (None if the request failed).
+            ➤ error (str): The exception raised, if any.
+        """
+
+        with self._lock:
+            heap = self._requests.setdefault(name, [])
+            if len(heap) >= self._size and elapsed <= heap[0][0]:
+                return
+            record = {
+                "operation": name,
+                "elapsed": elapsed,
+                "timings": dict(timings),
+                "variables": variables,
+                "bytes_out": bytes_out,
+                "bytes_in": bytes_in,
+                "status": status,
+                "error": error,
+                "timestamp": time.time(),
+            }
+            entry = (elapsed, next(self._sequence), record)
+            if len(heap) >= self._size:
+                heapq.heapreplace(heap, entry)
+            else:
+                heapq.heappush(heap, entry)
+
+    def slowest(self, name: str = None) -> list:
+        """
+        Returns the retained requests, slowest first.
+
+        Args:
+            ➤ name (str): The operation name (all operations if omitted).
+        """
+
+        with self._lock:
+            heaps = [self._requests.get(name, [])] if name else list(self._requests.values())
+            entries = [entry for heap in heaps for entry in heap]
+        return [record for _, _, record in sorted(entries, key=lambda entry: entry[0], reverse=True)]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._requests.clear()
+# ═════════════════════════════════════════════════════════════════════════════╝
@@ -0,0 +1,784 @@
+#╔═════════════════════════════════════════════════════════════════════════════╗
+#║══════════════════❯ 💫 AxieAPI | GraphQL | Mock Gateway 💫
+#╚═════════════════════════════════════════════════════════════════════════════╝
+# A local stand-in for 'graphql-gateway.axieinfinity.com', for offline load tests:
+#   python mock_gateway.py --port 8080 --latency lognormal:-3,0.5 --throttle-rate 0.01
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📦 Dependencies 📦
+# ╚════════❯ 📦 Built-in Dependencies:
+import argparse
+import base64
+import collections
+import hashlib
+import json
+import os
+import random
+import secrets
+import socket
+import socketserver
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+# ╚════════❯ 📦 External Dependencies:
+try:
+    import h2.config
+    import h2.connection
+    import h2.events
+    import h2.exceptions
+    import h2.settings
+except ImportError:
+    h2 = None
+# ╚════════❯ 📦 Internal Dependencies:
+import document
+import operation
+import transport as transports
+from cost import LIST_FIELDS
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🎲 Response Generator 🎲
+# Field name heuristics for generated values: the schema snapshot ('schema.json') has types, not realistic values
+# (addresses, hashes, wei prices, timestamps), and responses only follow the shape of the query:
+INT_FIELDS = {
+    "total", "count", "axieCount", "quantity", "breedCount", "stage", "level", "col", "row", "timestamp",
+    "startedAt", "endedAt", "expiredAt", "duration", "timeLeft", "nonce", "marketFeePercentage", "attack",
+    "defense", "energy", "itemId", "listingIndex", "equipmentType", "last7D", "allTime", "totalSupply",
+    "holders", "birthDate", "addedAt", "banUntil", "equippedTotal", "beast", "aquatic", "plant", "bug",
+    "bird", "reptile", "mech", "dawn", "dusk", "bodyShape",
+}
+FLOAT_FIELDS = {"usd", "volume", "minPrice"}
+BOOL_FIELDS = {"banned", "newAccount", "result", "activated", "isScholar", "unsubscribeNotificationEmail"}
+ID_FIELDS = {"id", "axieId", "tokenId", "matronId", "sireId", "orderId", "erc1155TokenId", "equipmentId", "accountId", "activityId"}
+ADDRESS_FIELDS = {"owner", "maker", "from", "to", "address", "ronin", "ethereum", "destination", "tokenAddress", "receiverAddress", "paymentToken", "equippedBy"}
+HASH_FIELDS = {"txHash", "hash", "signature", "genes", "newGenes"}
+
+class ResponseGenerator:
+    """
+    A class that generates deterministic responses matching the shape of an operation's selections.
+    """
+
+    def __init__(self, total: int = 1000, seed: int = 0) -> None:
+        """
+        Initializes a 'ResponseGenerator' instance.
+
+        Args:
+            ➤ total (int): The 'total' reported by paginated fields.
+            ➤ seed (int): The seed of generated values.
+        """
+
+        self._total = total
+        self._seed = seed
+        self._documents = {}
+
+    def parse(self, query: str) -> document.Document:
+        """
+        Parses a query (memoized per query string).
+        """
+
+        parsed = self._documents.get(query)
+        if parsed is None:
+            parsed = self._documents[query] = document.parse(query)
+        return parsed
+
+    def generate(self, query: str, variables: dict = None, name: str = None) -> dict:
+        """
+        Generates the 'data' of a response.
+
+        Args:
+            ➤ query (str): The query string.
+            ➤ variables (dict): The request variables.
+            ➤ name (str): The operation name (for documents with several operations).
+
+        Returns:
+            ➤ dict: The generated 'data'.
+        """
+
+        parsed = self.parse(query)
+        definition = parsed.operation(name)
+        variables = {
+            **{var.name: var.default for var in definition.variables if var.default is not None},
+            **(variables or {}),
+        }
+        key = f"{definition.name}:{json.dumps(variables, sort_keys=True, default=str)}"
+        rng = random.Random(zlib.crc32(key.encode()) ^ self._seed)
+        context = (parsed.fragments, variables, rng)
+        return self._object(definition.selections, "Query" if definition.kind == "query" else "Mutation", context, (0, 10), 0)
+
+    def _collect(self, selections: list, type_name: str, abstract: bool, context: tuple) -> collections.OrderedDict:
+        """
+        Flattens fragments into the fields selected on 'type_name', grouped by response key.
+        """
+
+        fragments, variables, _ = context
+        fields = collections.OrderedDict()
+        for selection in selections:
+            if not document.is_included(selection, variables):
+                continue
+            if isinstance(selection, document.Field):
+                fields.setdefault(selection.key, []).append(selection)
+                continue
+            if isinstance(selection, document.FragmentSpread):
+                fragment = fragments.get(selection.name)
+                if fragment is None:
+                    continue
+                type_condition, nested = fragment.type_condition, fragment.selections
+            else:
+                type_condition, nested = selection.type_condition, selection.selections
+            if type_condition in (None, type_name) or not abstract:
+                for key, nested_fields in self._collect(nested, type_name, abstract, context).items():
+                    fields.setdefault(key, []).extend(nested_fields)
+        return fields
+
+    def _object(self, selections: list, type_name: str, context: tuple, page: tuple, index: int) -> dict:
+        fragments, variables, rng = context
+        # Pick a concrete type for abstract selections (e.g. 'tokenAsset', 'Activity.data', 'Bundle.items'):
+        candidates = []
+        for selection in selections:
+            if isinstance(selection, document.InlineFragment):
+                type_condition = selection.type_condition
+            elif isinstance(selection, document.FragmentSpread) and selection.name in fragments:
+                type_condition = fragments[selection.name].type_condition
+            else:
+                continue
+            if type_condition and type_condition not in candidates and document.is_included(selection, variables):
+                candidates.append(type_condition)
+        abstract = len(candidates) > 1
+        if abstract and type_name not in candidates:
+            type_name = rng.choice(candidates)
+        elif candidates:
+            type_name = candidates[0]
+
+        result = {}
+        for key, fields in self._collect(selections, type_name, abstract, context).items():
+            nested = [selection for field in fields for selection in field.selections]
+            result[key] = self._value(fields[0], nested, type_name, context, page, index)
+        return result
+
+    def _value(self, field: document.Field, selections: list, type_name: str, context: tuple, page: tuple, index: int):
+        _, variables, rng = context
+        name = field.name
+        if name == "__typename":
+            return type_name
+
+        # Pagination arguments apply to the nested 'results'/'total':
+        arguments = {
+            key: variables.get(value.name) if isinstance(value, document.Variable) else value
+            for key, value in field.arguments.items()
+        }
+        if "size" in arguments or "from" in arguments:
+            page = (arguments.get("from") or 0, arguments.get("size") if arguments.get("size") is not None else 10)
+
+        if not selections:
+            return self._scalar(name, rng, page, index)
+        child_type = name[:1].upper() + name[1:]
+        if name in LIST_FIELDS:
+            start, size = page
+            length = LIST_FIELDS[name]
+            if length is None:
+                length = max(0, min(size, self._total - start))
+            return [
+                self._object(selections, child_type, context, page, start + position if LIST_FIELDS[name] is None else position)
+                for position in range(length)
+            ]
+        return self._object(selections, child_type, context, page, index)
+
+    def _scalar(self, name: str, rng: random.Random, page: tuple, index: int):
+        if name == "total":
+            return self._total
+        elif name in ID_FIELDS:
+            return str(index + 1) if name in ("id", "tokenId") else str(rng.randrange(1, 12_000_000))
+        elif name in INT_FIELDS or name.endswith("Count"):
+            return rng.randrange(0, 1_700_000_000 if name.endswith("At") or name in ("timestamp", "birthDate") else 100)
+        elif name in FLOAT_FIELDS or name.endswith("Usd"):
+            return round(rng.uniform(1, 500), 2)
+        elif name in BOOL_FIELDS:
+            return rng.random() < 0.5
+        elif name in ADDRESS_FIELDS:
+            return "0x" + "%040x" % rng.getrandbits(160)
+        elif name in HASH_FIELDS:
+            return "0x" + "%064x" % rng.getrandbits(256)
+        elif "rice" in name:
+            return str(rng.randrange(10**15, 10**18))
+        elif name in ("collections", "effects"):
+            return [f"{name}-{rng.randrange(100)}"]
+        return f"{name}-{rng.randrange(1000)}"
+
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ ⏳ Latency ⏳
+def latency_sampler(spec):
+    """
+    Builds a latency sampler from a spec.
+
+    Args:
+        ➤ spec: 'None' (no latency), a number of seconds, a callable 'f(rng) -> seconds',
+                a tuple '(distribution, *parameters)' or its string form 'distribution:p1,p2', where
+                distribution is one of 'constant', 'uniform', 'normal', 'lognormal', 'exponential'.
+
+    Returns:
+        ➤ callable: A function 'f(rng) -> seconds'.
+
+    Raises:
+        ➤ ValueError: If the distribution is unknown.
+    """
+
+    if spec is None:
+        return lambda rng: 0.0
+    elif callable(spec):
+        return spec
+    elif isinstance(spec, (int, float)):
+        return lambda rng: float(spec)
+    if isinstance(spec, str):
+        distribution, _, parameters = spec.partition(":")
+        spec = (distribution, *(float(parameter) for parameter in parameters.split(",") if parameter))
+    distribution, *parameters = spec
+    distributions = {
+        "constant": lambda rng: parameters[0],
+        "uniform": lambda rng: rng.uniform(*parameters),
+        "normal": lambda rng: max(0.0, rng.gauss(*parameters)),
+        "lognormal": lambda rng: rng.lognormvariate(*parameters),
+        "exponential": lambda rng: rng.expovariate(1 / parameters[0]),
+    }
+    if distribution not in distributions:
+        raise ValueError(f"Distribution '{distribution}' is not valid. It must be one of: {list(distributions)}.")
+    return distributions[distribution]
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🛰 Mock Gateway 🛰
+# Smaller responses are sent uncompressed (the coding overhead would outweigh the savings):
+COMPRESSION_MIN_SIZE = 256
+
+class _H2Session:
+    """
+    The server side of one cleartext HTTP/2 connection: each request stream is answered from its own thread,
+    so slow responses don't hold back the other streams of the connection.
+    """
+
+    def __init__(self, sock, handle, max_streams: int) -> None:
+        self._sock = sock
+        self._handle = handle
+        self._h2 = h2.connection.H2Connection(h2.config.H2Configuration(client_side=False, header_encoding="utf-8"))
+        self._h2.local_settings = h2.settings.Settings(client=False, initial_values={
+            h2.settings.SettingCodes.MAX_CONCURRENT_STREAMS: max_streams,
+            h2.settings.SettingCodes.INITIAL_WINDOW_SIZE: 1 << 20,
+        })
+        self._bodies = {}
+        self._accept = {}
+        self._outgoing = {}
+        self._lock = threading.Lock()
+
+    def serve(self) -> None:
+        with self._lock:
+            self._h2.initiate_connection()
+            self._flush()
+        try:
+            while True:
+                data = self._sock.recv(65536)
+                if not data:
+                    break
+                with self._lock:
+                    for event in self._h2.receive_data(data):
+                        if isinstance(event, h2.events.RequestReceived):
+                            self._bodies[event.stream_id] = []
+                            headers = dict(event.headers)
+                            self._accept[event.stream_id] = (headers.get("accept-encoding"), headers.get("authorization"))
+                        elif isinstance(event, h2.events.DataReceived):
+                            self._bodies.get(event.stream_id, []).append(event.data)
+                            self._h2.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                        elif isinstance(event, h2.events.StreamEnded) and event.stream_id in self._bodies:
+                            body = b"".join(self._bodies.pop(event.stream_id))
+                            accept_encoding, authorization = self._accept.pop(event.stream_id, (None, None))
+                            threading.Thread(target=self._respond, args=(event.stream_id, body, accept_encoding, authorization), daemon=True).start()
+                        elif isinstance(event, h2.events.StreamReset):
+                            self._bodies.pop(event.stream_id, None)
+                            self._accept.pop(event.stream_id, None)
+                            self._outgoing.pop(event.stream_id, None)
+                        elif isinstance(event, h2.events.WindowUpdated):
+                            for stream_id in list(self._outgoing):
+                                self._send(stream_id)
+                        elif isinstance(event, h2.events.ConnectionTerminated):
+                            return
+                    self._flush()
+        except (OSError, h2.exceptions.ProtocolError):
+            pass
+
+    def _respond(self, stream_id: int, body: bytes, accept_encoding: str, authorization: str) -> None:
+        status, headers, payload = self._handle(body, accept_encoding, authorization)
+        with self._lock:
+            try:
+                self._h2.send_headers(stream_id, [
+                    (":status", str(status)), ("content-type", "application/json"), ("content-length", str(len(payload))),
+                    *((name.lower(), value) for name, value in headers.items()),
+                ])
+            except h2.exceptions.ProtocolError:
+                # The client reset the stream (e.g. the cancelled loser of a hedge).
+                return
+            self._outgoing[stream_id] = payload
+            self._send(stream_id)
+            try:
+                self._flush()
+            except OSError:
+                pass
+
+    def _send(self, stream_id: int) -> None:
+        """
+        Sends as much of a response body as the flow-control windows allow (under the lock).
+        """
+
+        payload = self._outgoing[stream_id]
+        try:
+            while True:
+                size = min(self._h2.local_flow_control_window(stream_id), self._h2.max_outbound_frame_size, len(payload))
+                if size <= 0 and payload:
+                    break
+                self._h2.send_data(stream_id, payload[:size], end_stream=size == len(payload))
+                payload = payload[size:]
+                if not payload:
+                    del self._outgoing[stream_id]
+                    return
+        except h2.exceptions.StreamClosedError:
+            del self._outgoing[stream_id]
+            return
+        self._outgoing[stream_id] = payload
+
+    def _flush(self) -> None:
+        data = self._h2.data_to_send()
+        if data:
+            self._sock.sendall(data)
+
+class MockGateway:
+    """
+    A class that serves a local GraphQL endpoint understanding the 'ValidOperations' operation names,
+    with canned or generated responses, latency, error and 429 injection, batching and persisted queries.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency=None,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        server_error_rate: float = 0.0,
+        rate_limit: float = None,
+        responses=None,
+        total: int = 1000,
+        seed: int = 0,
+        batching: bool = True,
+        persisted_queries: bool = True,
+        http2: bool = False,
+        max_streams: int = 100,
+        compression=True,
+        auth: bool = False,
+        token_ttl: float = 3600.0,
+    ) -> None:
+        """
+        Initializes a 'MockGateway' instance (call 'start' or use it as a context manager).
+
+        Args:
+            ➤ host (str): The bound host.
+            ➤ port (int): The bound port ('0' picks a free port, cf. 'url').
+            ➤ latency: A latency spec (cf. 'latency_sampler'), or a dict of specs per operation name ('*' as default).
+            ➤ error_rate (float): The probability of answering an operation with GraphQL 'errors'.
+            ➤ throttle_rate (float): The probability of answering a request with HTTP 429.
+            ➤ server_error_rate (float): The probability of answering a request with HTTP 503.
+            ➤ rate_limit (float): The maximum requests per second before HTTP 429 (token bucket, burst of 1s).
+            ➤ responses: Canned responses, as a dict of operation name -> response, or a directory of '<name>.json'.
+            ➤ total (int): The 'total' reported by generated paginated fields.
+            ➤ seed (int): The seed of injected faults, latencies and generated values.
+            ➤ batching (bool): Whether a JSON list of operations is accepted in one request.
+            ➤ persisted_queries (bool): Whether automatic persisted queries ('extensions.persistedQuery') are supported.
+            ➤ http2 (bool): Whether to serve cleartext HTTP/2 with prior knowledge ('h2c', requires the 'h2' package)
+                            instead of HTTP/1.1.
+            ➤ max_streams (int): The 'SETTINGS_MAX_CONCURRENT_STREAMS' advertised over HTTP/2.
+            ➤ compression: Whether responses are compressed when the client accepts it ('True' for every coding of
+                           'transport.ENCODINGS', or a tuple of codings in order of preference).
+            ➤ auth (bool): Whether 🔐 operations require a 'Bearer' access token, obtained through the
+                           'CreateRandomMessage' → 'CreateAccessTokenWithSignature' flow (any signature is accepted).
+            ➤ token_ttl (float): The lifetime of the issued access tokens, in seconds.
+
+        Raises:
+            ➤ ImportError: If 'http2' is set without the 'h2' package.
+        """
+
+        # ┗━━━━━➤ 🚦 Perform checks:
+        if http2 and h2 is None:
+            raise ImportError("Serving HTTP/2 requires the 'h2' package ('pip install h2').")
+
+        # ┗━━━━━➤ 📌 Define attributes:
+        latency = latency if isinstance(latency, dict) else {"*": latency}
+        self._latency = {name: latency_sampler(spec) for name, spec in latency.items()}
+        self._error_rate = error_rate
+        self._throttle_rate = throttle_rate
+        self._server_error_rate = server_error_rate
+        self._rate_limit = rate_limit
+        self._tokens = rate_limit or 0.0
+        self._refilled_at = time.monotonic()
+        self._responses = responses or {}
+        self._generator = ResponseGenerator(total=total, seed=seed)
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._batching = batching
+        self._compression = transports.ENCODINGS if compression is True else tuple(compression or ())
+        self._persisted_queries = persisted_queries
+        self._persisted = {}
+        self._operations = {
+            name for name, value in vars(operation.GraphQLOperation.ValidOperations).items()
+            if not name.startswith("__") and not isinstance(value, type)
+        }
+        self._auth = auth
+        self._auth_operations = {name for name in self._operations if operation.GraphQLOperation(name).auth}
+        self._token_ttl = token_ttl
+        self._messages = set()
+        self._access_tokens = {}
+        self.stats = collections.Counter()
+
+        gateway = self
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are separate writes: without this, Nagle's algorithm holds the body back
+            # until the client's delayed ACK (~40 ms per request on keep-alive connections).
+            disable_nagle_algorithm = True
+
+            def setup(self) -> None:
+                super().setup()
+                with gateway._lock:
+                    gateway.stats["connections"] += 1
+
+            def do_POST(self) -> None:
+                body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                status, headers, payload = gateway.handle(body, self.headers.get("Accept-Encoding"), self.headers.get("Authorization"))
+                self.send_response(status)
+                for header, value in headers.items():
+                    self.send_header(header, value)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                try:
+                    self.wfile.write(payload)
+                except (BrokenPipeError, ConnectionResetError):
+                    # The client gave up on the request (e.g. the cancelled loser of a hedge).
+                    self.close_connection = True
+
+            def log_message(self, *args) -> None:
+                pass
+
+        class H2Handler(socketserver.BaseRequestHandler):
+            def handle(self) -> None:
+                with gateway._lock:
+                    gateway.stats["connections"] += 1
+                self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                _H2Session(self.request, gateway.handle, max_streams).serve()
+
+        server = socketserver.ThreadingTCPServer if http2 else ThreadingHTTPServer
+        self._server = server((host, port), H2Handler if http2 else Handler, bind_and_activate=False)
+        self._server.daemon_threads = True
+        # Load tests open hundreds of connections at once: the default listen backlog (5) would reset them.
+        self._server.request_queue_size = 1024
+        self._server.allow_reuse_address = True
+        try:
+            self._server.server_bind()
+            self._server.server_activate()
+        except OSError:
+            self._server.server_close()
+            raise
+        self._thread = None
+
+    def __enter__(self) -> "MockGateway":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        """
+        """
+
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/graphql"
+
+    def start(self) -> "MockGateway":
+        """
+        Serves requests from a background thread.
+        """
+
+        self._thread = threading.Thread(target=self._server.serve_forever, name="MockGateway", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stops serving, and closes the socket.
+        """
+
+        self._server.shutdown()
+        self._server.server_close()
+
+    def serve_forever(self) -> None:
+        """
+        Serves requests from the calling thread.
+        """
+
+        self._server.serve_forever()
+
+    def handle(self, body: bytes, accept_encoding: str = None, authorization: str = None) -> tuple:
+        """
+        Answers one HTTP request body, compressed with the preferred coding the client accepts (cf. 'compression').
+
+        Args:
+            ➤ body (bytes): The request body.
+            ➤ accept_encoding (str): The 'Accept-Encoding' request header.
+            ➤ authorization (str): The 'Authorization' request header.
+
+        Returns:
+            ➤ tuple: '(status, headers, payload bytes)'.
+        """
+
+        status, headers, payload = self._answer(body, authorization)
+        encoding = self._negotiate(accept_encoding) if len(payload) >= COMPRESSION_MIN_SIZE else None
+        if encoding is not None:
+            compressed = transports.compress(payload, encoding)
+            with self._lock:
+                self.stats["raw_bytes"] += len(payload)
+                self.stats["wire_bytes"] += len(compressed)
+            return status, {**headers, "Content-Encoding": encoding, "Vary": "Accept-Encoding"}, compressed
+        return status, headers, payload
+
+    def _negotiate(self, accept_encoding: str) -> str:
+        """
+        Picks the content coding of a response: the first of 'compression' the client accepts (None for identity).
+        """
+
+        if not self._compression or not accept_encoding:
+            return None
+        accepted = set()
+        for item in accept_encoding.split(","):
+            coding, _, parameters = item.strip().lower().partition(";")
+            if parameters.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+                accepted.add(coding.strip())
+        return next((coding for coding in self._compression if coding in accepted or "*" in accepted), None)
+
+    def _answer(self, body: bytes, authorization: str = None) -> tuple:
+        """
+        Answers one HTTP request body, uncompressed (cf. 'handle').
+        """
+
+        with self._lock:
+            self.stats["requests"] += 1
+            throttled = not self._take_token() or self._rng.random() < self._throttle_rate
+            failed = self._rng.random() < self._server_error_rate
+            if throttled:
+                self.stats["throttled"] += 1
+            elif failed:
+                self.stats["server_errors"] += 1
+        if throttled:
+            return 429, {"Retry-After": "1"}, json.dumps({"errors": [{"message": "Too Many Requests"}]}).encode()
+        if failed:
+            return 503, {}, json.dumps({"errors": [{"message": "Service Unavailable"}]}).encode()
+
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return 400, {}, json.dumps({"errors": [{"message": "Request body is not valid JSON."}]}).encode()
+        if isinstance(payload, list):
+            if not self._batching:
+                return 400, {}, json.dumps({"errors": [{"message": "Batching is not supported."}]}).encode()
+            with self._lock:
+                self.stats["batches"] += 1
+            results = [self._execute(item, authorization) for item in payload]
+            delay = max((seconds for seconds, _ in results), default=0.0)
+            response = [result for _, result in results]
+        else:
+            delay, response = self._execute(payload, authorization)
+        if delay > 0:
+            time.sleep(delay)
+        return 200, {}, json.dumps(response).encode()
+
+    def _take_token(self) -> bool:
+        """
+        Consumes a token of the rate limit bucket (always succeeds without 'rate_limit').
+        """
+
+        if not self._rate_limit:
+            return True
+        now = time.monotonic()
+        self._tokens = min(self._rate_limit, self._tokens + (now - self._refilled_at) * self._rate_limit)
+        self._refilled_at = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def _execute(self, payload: dict, authorization: str = None) -> tuple:
+        """
+        Answers one operation.
+
+        Returns:
+            ➤ tuple: '(latency in seconds, response dict)'.
+        """
+
+        def error(message: str, code: str = None) -> tuple:
+            with self._lock:
+                self.stats["errors"] += 1
+            return 0.0, {"errors": [{"message": message, **({"extensions": {"code": code}} if code else {})}], "data": None}
+
+        if not isinstance(payload, dict):
+            return error("Operation must be a JSON object.")
+        query = payload.get("query")
+        variables = payload.get("variables") or {}
+
+        # Automatic persisted queries:
+        persisted = (payload.get("extensions") or {}).get("persistedQuery")
+        if persisted:
+            if not self._persisted_queries:
+                return error("PersistedQueryNotSupported", "PERSISTED_QUERY_NOT_SUPPORTED")
+            sha256 = persisted.get("sha256Hash")
+            if query is None:
+                query = self._persisted.get(sha256)
+                if query is None:
+                    return error("PersistedQueryNotFound", "PERSISTED_QUERY_NOT_FOUND")
+            elif hashlib.sha256(query.encode()).hexdigest() != sha256:
+                return error("provided sha does not match query", "BAD_USER_INPUT")
+            else:
+                self._persisted[sha256] = query
+        if not query:
+            return error("Must provide query string.", "BAD_USER_INPUT")
+
+        try:
+            definition = self._generator.parse(query).operation(payload.get("operationName"))
+        except (SyntaxError, KeyError) as exception:
+            return error(str(exception), "GRAPHQL_PARSE_FAILED")
+        name = definition.name
+        if name not in self._operations:
+            return error(f"Unknown operation '{name}'.", "GRAPHQL_VALIDATION_FAILED")
+
+        with self._lock:
+            self.stats[name] += 1
+            sampler = self._latency.get(name, self._latency.get("*"))
+            delay = sampler(self._rng) if sampler else 0.0
+            injected = self._rng.random() < self._error_rate
+        if injected:
+            return delay, error("Injected error", "INTERNAL_SERVER_ERROR")[1]
+        if self._auth:
+            if name == "CreateRandomMessage":
+                return delay, {"data": {"createRandomMessage": self._message()}}
+            if name == "CreateAccessTokenWithSignature":
+                signature = variables.get("input") or {}
+                with self._lock:
+                    issued = signature.get("message") in self._messages
+                    self._messages.discard(signature.get("message"))
+                if not issued or not signature.get("owner") or not signature.get("signature"):
+                    return delay, error("Invalid signature.", "UNAUTHENTICATED")[1]
+                access_token = self._access_token(signature["owner"])
+                return delay, {"data": {"createAccessTokenWithSignature": {
+                    "newAccount": False, "result": True, "accessToken": access_token, "__typename": "CreateAccessTokenWithSignatureResult",
+                }}}
+            if name in self._auth_operations and not self._authorized(authorization):
+                return delay, error("Unauthorized: a valid access token is required.", "UNAUTHENTICATED")[1]
+        return delay, self._canned(name) or {"data": self._generator.generate(query, variables, name)}
+
+    def _message(self) -> str:
+        """
+        Issues a one-time random message to sign.
+        """
+
+        message = f"Welcome to Axie Infinity!\n\nNonce: {secrets.token_hex(16)}"
+        with self._lock:
+            self._messages.add(message)
+        return message
+
+    def _access_token(self, owner: str) -> str:
+        """
+        Issues a JWT-shaped access token (unsigned: only this gateway checks it, by lookup).
+        """
+
+        def encode(claims: dict) -> str:
+            return base64.urlsafe_b64encode(json.dumps(claims, separators=(",", ":")).encode()).rstrip(b"=").decode()
+
+        now = time.time()
+        access_token = ".".join((
+            encode({"alg": "none", "typ": "JWT"}),
+            encode({"sub": owner.lower(), "iat": int(now), "exp": int(now + self._token_ttl), "jti": secrets.token_hex(8)}),
+            secrets.token_hex(16),
+        ))
+        with self._lock:
+            self._access_tokens[access_token] = now + self._token_ttl
+            self.stats["access_tokens"] += 1
+        return access_token
+
+    def _authorized(self, authorization: str) -> bool:
+        """
+        Whether an 'Authorization' header holds an issued, unexpired and unrevoked access token.
+        """
+
+        scheme, _, access_token = (authorization or "").partition(" ")
+        with self._lock:
+            expires_at = self._access_tokens.get(access_token.strip())
+        return scheme.lower() == "bearer" and expires_at is not None and time.time() < expires_at
+
+    def revoke(self, access_token: str = None) -> None:
+        """
+        Revokes an issued access token (or all of them).
+        """
+
+        with self._lock:
+            if access_token is None:
+                self._access_tokens.clear()
+            else:
+                self._access_tokens.pop(access_token, None)
+
+    def _canned(self, name: str):
+        """
+        Looks up a canned response (from the 'responses' dict or directory).
+        """
+
+        if isinstance(self._responses, dict):
+            return self._responses.get(name)
+        path = os.path.join(self._responses, f"{name}.json")
+        if os.path.exists(path):
+            with open(path) as file:
+                return json.load(file)
+        return None
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🚀 Main 🚀
+def main(argv: list = None) -> None:
+    parser = argparse.ArgumentParser(description="Serves a local mock of the Axie GraphQL gateway.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", help="A latency spec, e.g. 'constant:0.05', 'uniform:0.01,0.2', 'lognormal:-3,0.5'.")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--server-error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit", type=float, help="The maximum requests per second before HTTP 429.")
+    parser.add_argument("--responses", help="A directory of canned responses ('<operation>.json').")
+    parser.add_argument("--total", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-batching", action="store_true")
+    parser.add_argument("--no-persisted-queries", action="store_true")
+    parser.add_argument("--http2", action="store_true", help="Serve cleartext HTTP/2 ('h2c') instead of HTTP/1.1.")
+    parser.add_argument("--auth", action="store_true", help="Require access tokens for 🔐 operations.")
+    parser.add_argument("--token-ttl", type=float, default=3600.0, help="The lifetime of the issued access tokens, in seconds.")
+    parser.add_argument("--compression", help="The content codings offered, in order of preference (e.g. 'gzip,deflate'; 'none' to disable).")
+    args = parser.parse_args(argv)
+
+    gateway = MockGateway(
+        host=args.host, port=args.port, latency=args.latency, error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate, server_error_rate=args.server_error_rate, rate_limit=args.rate_limit,
+        responses=args.responses, total=args.total, seed=args.seed,
+        batching=not args.no_batching, persisted_queries=not args.no_persisted_queries, http2=args.http2,
+        compression=True if args.compression is None else tuple(coding for coding in args.compression.split(",") if coding != "none"),
+        auth=args.auth, token_ttl=args.token_ttl,
+    )
+    print(f"🛰 Mock gateway listening on {gateway.url}")
+    gateway.serve_forever()
+
+if __name__ == "__main__":
+    main()
+# ═════════════════════════════════════════════════════════════════════════════╝
@@ -0,0 +1,307 @@
+#╔═════════════════════════════════════════════════════════════════════════════╗
+#║══════════════════❯ 💫 AxieAPI | GraphQL | Order Pipeline 💫
+#╚═════════════════════════════════════════════════════════════════════════════╝
+# Lists many assets at once: 'InputOrder' objects are built from a template, signed in a process pool,
+# then sent as 'CreateOrder' mutations with bounded concurrency (signing and sending overlap).
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📦 Dependencies 📦
+# ╚════════❯ 📦 Built-in Dependencies:
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+# ╚════════❯ 📦 External Dependencies:
+# ╚════════❯ 📦 Internal Dependencies:
+from auth import AuthenticationError, Signer
+from breaker import CircuitOpenError
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🧾 Orders 🧾
+AXIE_CONTRACT = "0x32950db2a7164ae833121501c797d79e7b79d74c"
+WETH_CONTRACT = "0xc99a6a985ed2cac1ef41640596c5a5f9f4e19ef5"
+MARKET_FEE_PERCENTAGE = 425
+
+TEMPLATE = {
+    "kind": "Sell",
+    "paymentToken": WETH_CONTRACT,
+    "basePrice": None,
+    "endedPrice": None,
+    "duration": 7 * 24 * 3600,
+    "expectedState": "",
+    "marketFeePercentage": MARKET_FEE_PERCENTAGE,
+}
+
+def asset(id, erc: str = "Erc721", address: str = AXIE_CONTRACT, quantity: str = "0") -> dict:
+    """
+    Builds an 'InputOrder' asset (an axie by default).
+    """
+
+    return {"erc": erc, "address": address, "id": str(id), "quantity": str(quantity)}
+
+def build_orders(maker: str, assets: list, template=None, nonce: int = 0, now: int = None) -> list:
+    """
+    Builds one 'InputOrder' per asset from a template.
+
+    Args:
+        ➤ maker (str): The address of the account listing the assets.
+        ➤ assets (list): The assets (cf. 'asset'), or axie IDs.
+        ➤ template: The order fields over 'TEMPLATE' (e.g. '{"basePrice": "1000000000000000"}'), or a callable
+                    returning them for an asset (e.g. a price per asset). 'duration' is in seconds; 'endedPrice'
+                    defaults to 'basePrice' (a fixed price).
+        ➤ nonce (int): The nonce of the first order (incremented per order).
+        ➤ now (int): The 'startedAt' Unix time (now if omitted).
+
+    Returns:
+        ➤ list: The 'InputOrder' dicts.
+
+    Raises:
+        ➤ ValueError: If an order has no 'basePrice'.
+    """
+
+    now = int(time.time()) if now is None else now
+    orders = []
+    for index, item in enumerate(assets):
+        item = item if isinstance(item, dict) else asset(item)
+        fields = {**TEMPLATE, **((template(item) if callable(template) else template) or {})}
+        if fields["basePrice"] is None:
+            raise ValueError(f"The order of asset '{item['id']}' has no 'basePrice'.")
+        duration = int(fields.pop("duration"))
+        started_at = int(fields.pop("startedAt", now))
+        orders.append({
+            "maker": maker.lower(),
+            "kind": fields["kind"],
+            "assets": [item],
+            "expiredAt": started_at + duration,
+            "paymentToken": fields["paymentToken"],
+            "startedAt": started_at,
+            "basePrice": str(fields["basePrice"]),
+            "endedAt": started_at + duration if fields["endedPrice"] is not None else 0,
+            "endedPrice": str(fields["endedPrice"] if fields["endedPrice"] is not None else fields["basePrice"]),
+            "expectedState": fields["expectedState"],
+            "nonce": nonce + index,
+            "marketFeePercentage": fields["marketFeePercentage"],
+        })
+    return orders
+
+def digest(order: dict) -> str:
+    """
+    The message signed for an order: the SHA-256 of its canonical JSON (a 'Signer' can hash the
+    order its own way, e.g. as EIP-712 typed data, by overriding 'Signer.sign').
+    """
+
+    return "0x" + hashlib.sha256(json.dumps(order, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+
+def _sign_chunk(signer: Signer, orders: list) -> list:
+    """
+    Signs orders (in a worker process).
+
+    Returns:
+        ➤ list: The signature of each order, or the exception raised signing it.
+    """
+
+    signatures = []
+    for order in orders:
+        try:
+            signatures.append(signer.sign(digest(order)))
+        except Exception as exception:
+            signatures.append(exception)
+    return signatures
+
+def _transient(result) -> bool:
+    """
+    Whether a failed 'GraphQLResult' may succeed if sent again (throttled, or a server error).
+    """
+
+    return result.status == 429 or result.status >= 500 or any(
+        isinstance(error, dict) and (error.get("extensions") or {}).get("code") == "INTERNAL_SERVER_ERROR"
+        for error in result.errors or ()
+    )
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🏭 Order Pipeline 🏭
+logger = logging.getLogger("axie.graphql.orders")
+
+class OrderResult:
+    """
+    A class that holds the outcome of one order.
+    """
+
+    __slots__ = ("index", "order", "signature", "result", "error", "attempts")
+
+    def __init__(self, index: int, order: dict) -> None:
+        self.index = index
+        self.order = order
+        self.signature = None
+        self.result = None
+        self.error = None
+        self.attempts = 0
+
+    def __repr__(self) -> str:
+        state = "ok" if self.ok else repr(self.error)
+        return f"<{self.__class__.__module__}.{self.__class__.__name__} #{self.index} {state} object at {hex(id(self))}>"
+
+    @property
+    def ok(self) -> bool:
+        """
+        """
+
+        return self.result is not None and self.result.ok
+
+    @property
+    def created(self) -> dict:
+        """
+        The created 'Order' (None if the order failed).
+        """
+
+        return (self.result.data or {}).get("createOrder") if self.ok else None
+
+    @property
+    def retryable(self) -> bool:
+        """
+        Whether the failure may be transient: network errors, open circuits, throttling and server errors,
+        also while logging in (not signing failures, nor orders the gateway rejected).
+        """
+
+        if self.ok or self.signature is None:
+            return False
+        if self.result is None:
+            if isinstance(self.error, AuthenticationError):
+                return self.error.result is not None and _transient(self.error.result)
+            return isinstance(self.error, (OSError, CircuitOpenError))
+        return _transient(self.result)
+
+class OrderPipeline:
+    """
+    A class that signs orders in a process pool (signatures are CPU-bound, cf. 'EthAccountSigner'),
+    and sends them as 'CreateOrder' mutations from a bounded thread pool as soon as their chunk is signed.
+    Only the failed orders are sent again (up to 'retries' times), with the same signature.
+    """
+
+    def __init__(self, client, signer: Signer, concurrency: int = 8, processes: int = None, chunk_size: int = 32, retries: int = 2, backoff: float = 0.5) -> None:
+        """
+        Initializes an 'OrderPipeline' instance.
+
+        Args:
+            ➤ client (GraphQLClient): The client sending the mutations (with a 'TokenManager' holding the signer's account).
+            ➤ signer (Signer): The signer of the maker account (picklable, sent to the worker processes).
+            ➤ concurrency (int): The largest number of mutations in flight.
+            ➤ processes (int): The signing processes ('os.cpu_count()' if omitted, 0 signs in the calling thread).
+            ➤ chunk_size (int): The orders signed per task (fewer round trips to the processes).
+            ➤ retries (int): The rounds of retries of the retryable failures (cf. 'OrderResult.retryable').
+            ➤ backoff (float): The delay before the first round of retries, doubled at each round, in seconds.
+
+        Raises:
+            ➤ ValueError: If 'concurrency' or 'chunk_size' is not positive.
+        """
+
+        # ┗━━━━━➤ 🚦 Perform checks:
+        if concurrency < 1 or chunk_size < 1:
+            raise ValueError("'concurrency' and 'chunk_size' must be positive integers.")
+
+        # ┗━━━━━➤ 📌 Define attributes:
+        self._client = client
+        self._signer = signer
+        self._concurrency = concurrency
+        self._processes = (os.cpu_count() or 1) if processes is None else processes
+        self._chunk_size = chunk_size
+        self._retries = retries
+        self._backoff = backoff
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__module__}.{self.__class__.__name__} {self._signer.address} object at {hex(id(self))}>"
+
+    def run(self, orders: list) -> list:
+        """
+        Signs and sends orders, then retries the retryable failures (cf. 'retry').
+
+        Args:
+            ➤ orders (list): The 'InputOrder' dicts (cf. 'build_orders').
+
+        Returns:
+            ➤ list: The 'OrderResult' of each order, in order.
+        """
+
+        results = [OrderResult(index, order) for index, order in enumerate(orders)]
+        chunks = [results[start:start + self._chunk_size] for start in range(0, len(results), self._chunk_size)]
+        with ThreadPoolExecutor(max_workers=self._concurrency, thread_name_prefix="OrderPipeline") as senders:
+            if not self._processes:
+                for chunk in chunks:
+                    self._signed(chunk, _sign_chunk(self._signer, [result.order for result in chunk]), senders)
+            else:
+                # Spawned (not forked) workers: the sender threads and the client's connections are live here.
+                context = multiprocessing.get_context("spawn")
+                with ProcessPoolExecutor(max_workers=min(self._processes, len(chunks) or 1), mp_context=context) as signers:
+                    pending = {signers.submit(_sign_chunk, self._signer, [result.order for result in chunk]): chunk for chunk in chunks}
+                    while pending:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            chunk = pending.pop(future)
+                            try:
+                                signatures = future.result()
+                            except Exception as exception:
+                                signatures = [exception] * len(chunk)
+                            self._signed(chunk, signatures, senders)
+        return self.retry(results, self._retries)
+
+    def retry(self, results: list, rounds: int = 1) -> list:
+        """
+        Sends the retryable failures of 'results' again (in place), for up to 'rounds' rounds.
+
+        Returns:
+            ➤ list: The same 'OrderResult' list.
+        """
+
+        delay = self._backoff
+        for _ in range(rounds):
+            failed = [result for result in results if result.retryable]
+            if not failed:
+                break
+            logger.info("Retrying %d failed orders in %.1fs.", len(failed), delay)
+            time.sleep(delay)
+            delay *= 2
+            with ThreadPoolExecutor(max_workers=self._concurrency, thread_name_prefix="OrderPipeline") as senders:
+                list(senders.map(self._send, failed))
+        return results
+
+    @staticmethod
+    def summary(results: list) -> dict:
+        """
+        Counts the created, failed and retried orders.
+        """
+
+        return {
+            "orders": len(results),
+            "created": sum(result.ok for result in results),
+            "failed": sum(not result.ok for result in results),
+            "retryable": sum(result.retryable for result in results),
+            "retried": sum(result.attempts > 1 for result in results),
+        }
+
+    def _signed(self, chunk: list, signatures: list, senders: ThreadPoolExecutor) -> None:
+        """
+        Records the signatures of a chunk, and queues its signed orders.
+        """
+
+        for result, signature in zip(chunk, signatures):
+            if isinstance(signature, Exception):
+                result.error = signature
+            else:
+                result.signature = signature
+                senders.submit(self._send, result)
+
+    def _send(self, result: OrderResult) -> None:
+        result.attempts += 1
+        try:
+            result.result = self._client.execute(
+                "CreateOrder", {"order": result.order, "signature": result.signature}, account=result.order["maker"]
+            )
+            result.error = None if result.result.ok else (result.result.errors or result.result.status)
+        except Exception as exception:
+            result.result, result.error = None, exception
+# ═════════════════════════════════════════════════════════════════════════════╝
@@ -0,0 +1,240 @@
+#╔═════════════════════════════════════════════════════════════════════════════╗
+#║══════════════════❯ 💫 AxieAPI | GraphQL | Paginator 💫
+#╚═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📦 Dependencies 📦
+# ╚════════❯ 📦 Built-in Dependencies:
+import threading
+import time
+# ╚════════❯ 📦 External Dependencies:
+# ╚════════❯ 📦 Internal Dependencies:
+import cost
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🎚 Page Size Tuner 🎚
+class PageSizeTuner:
+    """
+    A class that tunes the '$size' of paginated operations, to maximize items per second
+    while keeping pages under a latency target (below the gateway timeouts).
+
+    Each operation starts from its static cost estimate (cf. 'cost.estimate'), then follows a
+    latency model 'latency = overhead + per_item × size', fitted on observed pages with decay.
+    """
+
+    def __init__(self, min_size: int = 5, max_size: int = 100, target_latency: float = 2.0, node_budget: int = 5000, max_bytes: int = 4_000_000, decay: float = 0.8) -> None:
+        """
+        Initializes a 'PageSizeTuner' instance.
+
+        Args:
+            ➤ min_size (int): The smallest page size.
+            ➤ max_size (int): The largest page size (the gateway limit).
+            ➤ target_latency (float): The latency a page should stay under, in seconds.
+            ➤ node_budget (int): The expected response nodes of a first page (cf. 'Cost.response_nodes').
+            ➤ max_bytes (int): The response size a page should stay under.
+            ➤ decay (float): The weight kept by past observations at each new one.
+        """
+
+        self._min_size = min_size
+        self._max_size = max_size
+        self._target_latency = target_latency
+        self._node_budget = node_budget
+        self._max_bytes = max_bytes
+        self._decay = decay
+        self._models = {}
+        self._lock = threading.Lock()
+
+    def initial_size(self, name: str) -> int:
+        """
+        The first page size of an operation, from its static cost: heavy items get smaller pages.
+        """
+
+        estimate = cost.estimate(name)
+        if estimate.per_item <= 0:
+            return self._max_size
+        size = int((self._node_budget - estimate.fixed) / estimate.per_item)
+        return max(self._min_size, min(self._max_size, size))
+
+    def size(self, name: str) -> int:
+        """
+        The page size to use next for an operation.
+        """
+
+        with self._lock:
+            model = self._models.get(name)
+            return model["size"] if model else self.initial_size(name)
+
+    def observe(self, name: str, size: int, latency: float, bytes_in: int, items: int, failed: bool = False) -> int:
+        """
+        Updates the model of an operation with an observed page.
+
+        Args:
+            ➤ name (str): The operation name.
+            ➤ size (int): The requested page size.
+            ➤ latency (float): The page latency, in seconds.
+            ➤ bytes_in (int): The response size.
+            ➤ items (int): The number of items received.
+            ➤ failed (bool): Whether the page failed (timeout, 5xx, GraphQL errors).
+
+        Returns:
+            ➤ int: The next page size.
+        """
+
+        with self._lock:
+            model = self._models.setdefault(name, {"size": self.initial_size(name), "n": 0.0, "x": 0.0, "y": 0.0, "xx": 0.0, "xy": 0.0, "bytes": 0.0})
+            if failed:
+                # Multiplicative decrease, then let the model grow back.
+                model["size"] = max(self._min_size, size // 2)
+                return model["size"]
+            if items <= 0:
+                return model["size"]
+
+            # Decayed least squares of 'latency = overhead + per_item × items':
+            for key in ("n", "x", "y", "xx", "xy"):
+                model[key] *= self._decay
+            model["n"] += 1
+            model["x"] += items
+            model["y"] += latency
+            model["xx"] += items * items
+            model["xy"] += items * latency
+            model["bytes"] = bytes_in / items if not model["bytes"] else 0.7 * model["bytes"] + 0.3 * bytes_in / items
+
+            variance = model["n"] * model["xx"] - model["x"] ** 2
+            if variance > 1e-9:
+                per_item = max(1e-6, (model["n"] * model["xy"] - model["x"] * model["y"]) / variance)
+                overhead = max(0.0, (model["y"] - per_item * model["x"]) / model["n"])
+            else:
+                # A single page size seen so far: attribute the whole latency to the items.
+                per_item, overhead = max(1e-6, latency / items), 0.0
+
+            # Throughput 'size / (overhead + per_item × size)' grows with size: take the largest
+            # size within the latency target and the response size limit, growing at most ×2 per page.
+            size_limit = int((self._target_latency - overhead) / per_item)
+            bytes_limit = int(self._max_bytes / model["bytes"]) if model["bytes"] else self._max_size
+            model["size"] = max(self._min_size, min(self._max_size, size_limit, bytes_limit, max(size, self._min_size) * 2))
+            return model["size"]
+
+TUNER = PageSizeTuner()
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📖 Paginator 📖
+class PaginationError(Exception):
+    """
+    An exception raised when a page fails; 'result' holds the failed 'GraphQLResult'.
+    """
+
+    def __init__(self, message: str, result=None) -> None:
+        super().__init__(message)
+        self.result = result
+
+def find_page(data) -> dict:
+    """
+    Finds the paginated object of a response 'data': the first dict holding a 'results' list.
+    """
+
+    if isinstance(data, dict):
+        if isinstance(data.get("results"), list):
+            return data
+        for value in data.values():
+            page = find_page(value)
+            if page is not None:
+                return page
+    return None
+
+class Paginator:
+    """
+    A class that iterates the pages of a paginated operation ('$from'/'$size' variables),
+    with page sizes tuned per operation (cf. 'PageSizeTuner').
+    """
+
+    def __init__(self, client, name: str, variables: dict = None, page_size: int = None, max_items: int = None, tuner: PageSizeTuner = None, sink=None, fragment: str = None) -> None:
+        """
+        Initializes a 'Paginator' instance.
+
+        Args:
+            ➤ client (GraphQLClient): The client executing the pages.
+            ➤ name (str): The operation name (e.g. 'GetRecentlyListedAxies').
+            ➤ variables (dict): The other operation variables.
+            ➤ page_size (int): A fixed page size (tuned automatically if omitted).
+            ➤ max_items (int): The maximum number of items to fetch.
+            ➤ tuner (PageSizeTuner): The page size tuner (the shared 'TUNER' by default).
+            ➤ sink (SQLiteSink): A sink every page is written to.
+            ➤ fragment (str): The fragment name of the items, for the sink (e.g. 'AxieBrief').
+
+        Raises:
+            ➤ ValueError: If the operation has no '$from'/'$size' variables, or if 'sink' is given without 'fragment'.
+        """
+
+        # ┗━━━━━➤ 🚦 Perform checks:
+        declared = client.operation(name).variables
+        if "from" not in declared or "size" not in declared:
+            raise ValueError(f"Operation '{name}' is not paginated. It must declare '$from' and '$size' variables.")
+        if sink is not None and fragment is None:
+            raise ValueError("A 'fragment' name is required to write pages to a sink.")
+
+        # ┗━━━━━➤ 📌 Define attributes:
+        self._client = client
+        self._name = name
+        self._variables = dict(variables or {})
+        self._page_size = page_size
+        self._max_items = max_items
+        self._tuner = tuner or TUNER
+        self._sink = sink
+        self._fragment = fragment
+        self.total = None
+
+    def __iter__(self):
+        return self.items()
+
+    def pages(self, start: int = 0):
+        """
+        Yields the items of each page, until 'total' or 'max_items' is reached.
+
+        Args:
+            ➤ start (int): The offset of the first item.
+
+        Yields:
+            ➤ list: The items of a page.
+
+        Raises:
+            ➤ PaginationError: If a page fails.
+        """
+
+        offset, fetched = start, 0
+        while self._max_items is None or fetched < self._max_items:
+            size = self._page_size or self._tuner.size(self._name)
+            if self._max_items is not None:
+                size = min(size, self._max_items - fetched)
+            began = time.perf_counter()
+            try:
+                result = self._client.execute(self._name, {**self._variables, "from": offset, "size": size})
+            except OSError:
+                self._tuner.observe(self._name, size, time.perf_counter() - began, 0, 0, failed=True)
+                raise
+            page = find_page(result.data)
+            if not result.ok or page is None:
+                self._tuner.observe(self._name, size, time.perf_counter() - began, len(result.response.body), 0, failed=True)
+                raise PaginationError(f"Page {offset}-{offset + size} of '{self._name}' failed: {result.errors or result.status}.", result)
+
+            items = page["results"]
+            self._tuner.observe(self._name, size, time.perf_counter() - began, len(result.response.body), len(items))
+            self.total = page.get("total", self.total)
+            if self._sink is not None and items:
+                self._sink.write(self._fragment, items)
+            if items:
+                yield items
+            offset += len(items)
+            fetched += len(items)
+            if len(items) < size or (self.total is not None and offset >= self.total):
+                break
+
+    def items(self, start: int = 0):
+        """
+        Yields every item, page after page (cf. 'pages').
+        """
+
+        for items in self.pages(start):
+            yield from items
+# ═════════════════════════════════════════════════════════════════════════════╝
@@ -0,0 +1,468 @@
+#╔═════════════════════════════════════════════════════════════════════════════╗
+#║══════════════════❯ 💫 AxieAPI | GraphQL | Pedigree Crawler 💫
+#╚═════════════════════════════════════════════════════════════════════════════╝
+# Crawls the lineage of axies ('matronId'/'sireId' up, 'children' down) into a compact local graph:
+#   pedigree = PedigreeCrawler(client).crawl(["11467", "2124"], ancestors=5, descendants=1)
+#   pedigree.ancestors("11467", depth=3), pedigree.common_ancestors("11467", "2124"), pedigree.inbreeding("11467")
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📦 Dependencies 📦
+# ╚════════❯ 📦 Built-in Dependencies:
+import collections
+import logging
+import threading
+from array import array
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+# ╚════════❯ 📦 External Dependencies:
+# ╚════════❯ 📦 Internal Dependencies:
+import tracing
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🌳 Pedigree 🌳
+NONE = -1
+
+def _axie_id(value) -> int:
+    """
+    An axie ID as an int (None for missing parents: genesis axies have a '0' matron and sire).
+    """
+
+    if value is None or not str(value).isdigit() or int(value) == 0:
+        return None
+    return int(value)
+
+class Pedigree:
+    """
+    A class that holds a lineage graph in parallel int arrays, one slot per known axie:
+        - 'ids' (the axie ID of each slot), 'matrons' and 'sires' (the slot of each parent, or -1).
+        - the children are a CSR structure (offsets into one array of slots), rebuilt lazily after updates
+          from the parents arrays and the 'children' lists of the fetched axies (kept per slot, cf. 'record').
+    Generations follow axie IDs (an axie is always younger than its parents), which orders the
+    kinship recursion of 'inbreeding'.
+    """
+
+    def __init__(self) -> None:
+        self._slots = {}
+        self._ids = array("q")
+        self._matrons = array("l")
+        self._sires = array("l")
+        self._fetched = bytearray()
+        # The slots of the declared children of each fetched slot:
+        self._declared = {}
+        self._offsets = None
+        self._children = None
+        self._kinships = {}
+        self._lock = threading.RLock()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__module__}.{self.__class__.__name__} {len(self._ids)} axies object at {hex(id(self))}>"
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, id) -> bool:
+        return _axie_id(id) in self._slots
+
+    def fetched(self, id) -> bool:
+        """
+        Whether the record of an axie was added (its parents and children are known).
+        """
+
+        slot = self._slots.get(_axie_id(id))
+        return slot is not None and bool(self._fetched[slot])
+
+    def _slot(self, id: int) -> int:
+        slot = self._slots.get(id)
+        if slot is None:
+            slot = self._slots[id] = len(self._ids)
+            self._ids.append(id)
+            self._matrons.append(NONE)
+            self._sires.append(NONE)
+            self._fetched.append(0)
+        return slot
+
+    def add(self, axie: dict) -> int:
+        """
+        Adds an axie record ('AxieBreedingBrief'): its parents, and its children.
+
+        Returns:
+            ➤ int: The slot of the axie.
+
+        Raises:
+            ➤ ValueError: If the axie has no numeric 'id'.
+        """
+
+        id = _axie_id(axie.get("id"))
+        if id is None:
+            raise ValueError(f"The axie {axie.get('id')!r} has no numeric 'id'.")
+        with self._lock:
+            slot = self._slot(id)
+            matron, sire = _axie_id(axie.get("matronId")), _axie_id(axie.get("sireId"))
+            self._matrons[slot] = self._slot(matron) if matron is not None else NONE
+            self._sires[slot] = self._slot(sire) if sire is not None else NONE
+            children = (_axie_id((child or {}).get("id")) for child in axie.get("children") or ())
+            self._declared[slot] = array("l", (self._slot(child) for child in children if child is not None))
+            self._fetched[slot] = 1
+            self._offsets = None
+            self._kinships.clear()
+            return slot
+
+    def record(self, id) -> dict:
+        """
+        The lineage of a fetched axie, as 'add' takes it ('id', 'matronId', 'sireId' and its declared 'children').
+
+        Returns:
+            ➤ dict: The record, or None if the axie was not fetched.
+        """
+
+        with self._lock:
+            slot = self._slots.get(_axie_id(id))
+            if slot is None or not self._fetched[slot]:
+                return None
+            matron, sire = self._matrons[slot], self._sires[slot]
+            return {
+                "id": str(self._ids[slot]),
+                "matronId": str(self._ids[matron]) if matron != NONE else None,
+                "sireId": str(self._ids[sire]) if sire != NONE else None,
+                "children": [{"id": str(self._ids[child])} for child in self._declared[slot]],
+            }
+
+    def parents(self, id) -> tuple:
+        """
+        The '(matron, sire)' IDs of an axie (None where unknown).
+
+        Raises:
+            ➤ KeyError: If the axie is not in the graph.
+        """
+
+        slot = self._slots[_axie_id(id)]
+        return tuple(str(self._ids[parent]) if parent != NONE else None for parent in (self._matrons[slot], self._sires[slot]))
+
+    def children(self, id) -> list:
+        """
+        The IDs of the known children of an axie.
+
+        Raises:
+            ➤ KeyError: If the axie is not in the graph.
+        """
+
+        slot = self._slots[_axie_id(id)]
+        offsets, children = self._csr()
+        return [str(self._ids[child]) for child in children[offsets[slot]:offsets[slot + 1]]]
+
+    def _csr(self) -> tuple:
+        """
+        Builds the children CSR structure if the graph changed (the parent links, plus the declared children).
+        """
+
+        with self._lock:
+            if self._offsets is not None:
+                return self._offsets, self._children
+            edges = {(parent, child) for parent, children in self._declared.items() for child in children}
+            for parents in (self._matrons, self._sires):
+                edges.update((parent, child) for child, parent in enumerate(parents) if parent != NONE)
+            edges = sorted(edges)
+            offsets = array("l", bytes(array("l").itemsize * (len(self._ids) + 1)))
+            for parent, _ in edges:
+                offsets[parent + 1] += 1
+            for slot in range(len(self._ids)):
+                offsets[slot + 1] += offsets[slot]
+            self._offsets, self._children = offsets, array("l", (child for _, child in edges))
+            return self._offsets, self._children
+
+    def _walk(self, slot: int, depth: int, step) -> dict:
+        """
+        Walks the graph breadth-first from a slot.
+
+        Returns:
+            ➤ dict: The generation (1 for parents or children) of each reached slot.
+        """
+
+        generations, frontier = {}, [slot]
+        for generation in range(1, (depth if depth is not None else len(self._ids)) + 1):
+            reached = []
+            for current in frontier:
+                for other in step(current):
+                    if other not in generations:
+                        generations[other] = generation
+                        reached.append(other)
+            if not reached:
+                break
+            frontier = reached
+        return generations
+
+    def _up(self, slot: int) -> tuple:
+        return tuple(parent for parent in (self._matrons[slot], self._sires[slot]) if parent != NONE)
+
+    def ancestors(self, id, depth: int = None) -> dict:
+        """
+        The known ancestors of an axie, up to 'depth' generations (all if omitted).
+
+        Returns:
+            ➤ dict: The generation of each ancestor ID (1 for parents, 2 for grandparents, ...).
+
+        Raises:
+            ➤ KeyError: If the axie is not in the graph.
+        """
+
+        slot = self._slots[_axie_id(id)]
+        return {str(self._ids[other]): generation for other, generation in self._walk(slot, depth, self._up).items()}
+
+    def descendants(self, id, depth: int = None) -> dict:
+        """
+        The known descendants of an axie, up to 'depth' generations (all if omitted).
+
+        Returns:
+            ➤ dict: The generation of each descendant ID (1 for children, 2 for grandchildren, ...).
+
+        Raises:
+            ➤ KeyError: If the axie is not in the graph.
+        """
+
+        slot = self._slots[_axie_id(id)]
+        offsets, children = self._csr()
+        step = lambda current: children[offsets[current]:offsets[current + 1]]
+        return {str(self._ids[other]): generation for other, generation in self._walk(slot, depth, step).items()}
+
+    def common_ancestors(self, a, b, depth: int = None) -> dict:
+        """
+        The ancestors shared by two axies (including either axie itself, if it is an ancestor of the other).
+
+        Returns:
+            ➤ dict: The '(generation from a, generation from b)' of each shared ancestor ID.
+        """
+
+        ancestors_a = {**self.ancestors(a, depth), str(_axie_id(a)): 0}
+        ancestors_b = {**self.ancestors(b, depth), str(_axie_id(b)): 0}
+        return {
+            id: (ancestors_a[id], ancestors_b[id])
+            for id in ancestors_a.keys() & ancestors_b.keys() if ancestors_a[id] or ancestors_b[id]
+        }
+
+    def related(self, a, b, depth: int = 2) -> bool:
+        """
+        Whether two axies share an ancestor within 'depth' generations, or one descends from the other
+        (depth 1 covers the parent/child and sibling pairs the game refuses to breed).
+        """
+
+        return bool(self.common_ancestors(a, b, depth))
+
+    def kinship(self, a, b, depth: int = 16) -> float:
+        """
+        The coefficient of kinship of two axies: the probability that a gene drawn from each is inherited
+        from the same ancestor (0.5 for an axie with itself). Unknown parents count as unrelated founders,
+        and the recursion stops 'depth' generations up.
+
+        Raises:
+            ➤ KeyError: If an axie is not in the graph.
+        """
+
+        with self._lock:
+            return self._kinship(self._slots[_axie_id(a)], self._slots[_axie_id(b)], depth)
+
+    def inbreeding(self, id, depth: int = 16) -> float:
+        """
+        The coefficient of inbreeding of an axie: the kinship of its parents (0 if one is unknown).
+
+        Raises:
+            ➤ KeyError: If the axie is not in the graph.
+        """
+
+        with self._lock:
+            slot = self._slots[_axie_id(id)]
+            return self._inbreeding(slot, depth)
+
+    def _inbreeding(self, slot: int, depth: int) -> float:
+        matron, sire = self._matrons[slot], self._sires[slot]
+        if matron == NONE or sire == NONE or depth <= 0:
+            return 0.0
+        return self._kinship(matron, sire, depth - 1)
+
+    def _kinship(self, a: int, b: int, depth: int) -> float:
+        """
+        Kinship by recursion on the younger axie (the larger ID, never an ancestor of the other), memoized.
+        """
+
+        if depth < 0:
+            return 0.0
+        if self._ids[a] < self._ids[b]:
+            a, b = b, a
+        key = (a, b, depth)
+        kinship = self._kinships.get(key)
+        if kinship is None:
+            if a == b:
+                kinship = (1.0 + self._inbreeding(a, depth)) / 2
+            else:
+                kinship = sum(self._kinship(parent, b, depth - 1) for parent in self._up(a)) / 2
+            self._kinships[key] = kinship
+        return kinship
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🕸 Pedigree Crawler 🕸
+logger = logging.getLogger("axie.graphql.pedigree")
+
+class PedigreeCrawler:
+    """
+    A class that crawls lineages breadth-first into a 'Pedigree': the frontier of unvisited axie IDs is fetched
+    two per 'GetParentsBrief' request (its 'matron' and 'sire' aliases take any two IDs), 'batch_size' of them
+    per HTTP request (cf. 'GraphQLClient.execute_batch'), with up to 'concurrency' requests in flight.
+    """
+
+    def __init__(self, client, pedigree: Pedigree = None, concurrency: int = 8, batch_size: int = 16, sink=None) -> None:
+        """
+        Initializes a 'PedigreeCrawler' instance.
+
+        Args:
+            ➤ client (GraphQLClient): The client fetching the axies.
+            ➤ pedigree (Pedigree): The graph to extend (a new one by default).
+            ➤ concurrency (int): The largest number of requests in flight.
+            ➤ batch_size (int): The 'GetParentsBrief' operations per request (two axies each).
+            ➤ sink: Receives the fetched axies, with 'sink.write("AxieBreedingBrief", axies)' (e.g. a 'SQLiteSink').
+
+        Raises:
+            ➤ ValueError: If 'concurrency' or 'batch_size' is not positive.
+        """
+
+        # ┗━━━━━➤ 🚦 Perform checks:
+        if concurrency < 1 or batch_size < 1:
+            raise ValueError("'concurrency' and 'batch_size' must be positive integers.")
+
+        # ┗━━━━━➤ 📌 Define attributes:
+        self._client = client
+        self._pedigree = pedigree if pedigree is not None else Pedigree()
+        self._concurrency = concurrency
+        self._batch_size = batch_size
+        self._sink = sink
+        self.failed = set()
+        self.missing = set()
+        self.stats = {"requests": 0, "axies": 0, "failed": 0, "missing": 0}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__module__}.{self.__class__.__name__} {self._pedigree!r} object at {hex(id(self))}>"
+
+    @property
+    def pedigree(self) -> Pedigree:
+        """
+        The pedigree the crawled axies are added to.
+        """
+
+        return self._pedigree
+
+    def crawl(self, roots: list, ancestors: int = 4, descendants: int = 0, max_axies: int = None) -> Pedigree:
+        """
+        Crawls the lineage of axies: their ancestors up to 'ancestors' generations, and their descendants
+        down to 'descendants' generations. Axies already fetched in the pedigree are expanded without a request
+        (cf. 'Pedigree.record'); the IDs that failed in a previous crawl are retried.
+
+        Args:
+            ➤ roots (list): The axie IDs to start from.
+            ➤ ancestors (int): The generations crawled up ('matronId'/'sireId').
+            ➤ descendants (int): The generations crawled down ('children').
+            ➤ max_axies (int): The largest number of axies fetched (unbounded if omitted).
+
+        Returns:
+            ➤ Pedigree: The pedigree, also kept by the crawler (cf. 'pedigree').
+        """
+
+        # The largest '(up, down)' generations left each axie was reached with, and the axies to expand:
+        budgets, frontier = {}, collections.deque()
+        def reach(id, up: int, down: int) -> None:
+            id = _axie_id(id)
+            if id is None:
+                return
+            best = budgets.get(id)
+            if best is not None and best[0] >= up and best[1] >= down:
+                return
+            budgets[id] = (max(up, best[0]), max(down, best[1])) if best else (up, down)
+            frontier.append(id)
+
+        def expand(axie: dict) -> None:
+            up, down = budgets.get(_axie_id(axie.get("id")), (0, 0))
+            if up > 0:
+                reach(axie.get("matronId"), up - 1, 0)
+                reach(axie.get("sireId"), up - 1, 0)
+            if down > 0:
+                for child in axie.get("children") or ():
+                    reach((child or {}).get("id"), 0, down - 1)
+
+        for root in roots:
+            reach(root, ancestors, descendants)
+        with self._lock:
+            self.failed.clear()
+        inflight, fetched, added = set(), 0, 0
+        with tracing.span("pedigree.crawl", roots=len(roots)) as span, \
+                ThreadPoolExecutor(max_workers=self._concurrency, thread_name_prefix="PedigreeCrawler") as executor:
+            pending = {}
+            while frontier or pending:
+                # Expand the fetched axies, and batch the others (an axie in flight is expanded on arrival):
+                batch = []
+                while frontier and len(batch) < 2 * self._batch_size:
+                    id = frontier.popleft()
+                    record = self._pedigree.record(id)
+                    if record is not None:
+                        expand(record)
+                    elif id not in inflight and id not in self.missing and id not in self.failed and (max_axies is None or fetched < max_axies):
+                        batch.append(id)
+                        inflight.add(id)
+                        fetched += 1
+                # Send full batches, or partial ones while requests are idle:
+                if batch and (len(batch) == 2 * self._batch_size or len(pending) < self._concurrency):
+                    pending[executor.submit(tracing.wrap(self._fetch), batch)] = batch
+                elif batch:
+                    frontier.extendleft(reversed(batch))
+                    inflight.difference_update(batch)
+                    fetched -= len(batch)
+                if not pending or (frontier and len(pending) < self._concurrency):
+                    continue
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    inflight.difference_update(pending.pop(future))
+                    axies = future.result()
+                    for axie in axies:
+                        self._pedigree.add(axie)
+                        expand(axie)
+                    added += len(axies)
+                    if axies and self._sink is not None:
+                        self._sink.write("AxieBreedingBrief", axies)
+            span.set("axies", added)
+            span.set("failed", len(self.failed))
+        return self._pedigree
+
+    def _fetch(self, ids: list) -> list:
+        """
+        Fetches axies two per 'GetParentsBrief' operation ('GetAxieBreedingBrief' for an odd one), in one request.
+
+        Returns:
+            ➤ list: The fetched axies (the failed and missing IDs are recorded, cf. 'failed' and 'missing').
+        """
+
+        operations = [("GetParentsBrief", {"matronId": str(a), "sireId": str(b)}) for a, b in zip(ids[::2], ids[1::2])]
+        if len(ids) % 2:
+            operations.append(("GetAxieBreedingBrief", {"axieId": str(ids[-1])}))
+        try:
+            results = self._client.execute_batch(operations)
+        except Exception as exception:
+            logger.warning("Fetching %d axies failed: %r.", len(ids), exception)
+            results = None
+
+        axies, missing, failed = [], [], []
+        for index, (name, variables) in enumerate(operations):
+            result = results[index] if results is not None else None
+            fields = ("matron", "sire") if name == "GetParentsBrief" else ("axie",)
+            for field, id in zip(fields, variables.values()):
+                axie = ((result.data if result is not None else None) or {}).get(field)
+                if axie and _axie_id(axie.get("id")) is not None:
+                    axies.append(axie)
+                else:
+                    (missing if result is not None and result.ok else failed).append(int(id))
+        with self._lock:
+            self.missing.update(missing)
+            self.failed.update(failed)
+            self.stats["requests"] += 1
+            self.stats["axies"] += len(axies)
+            self.stats["missing"] += len(missing)
+            self.stats["failed"] += len(failed)
+        return axies
+# ═════════════════════════════════════════════════════════════════════════════╝
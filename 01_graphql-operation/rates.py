@@ -0,0 +1,216 @@
+#╔═════════════════════════════════════════════════════════════════════════════╗
+#║══════════════════❯ 💫 AxieAPI | GraphQL | Exchange Rates 💫
+#╚═════════════════════════════════════════════════════════════════════════════╝
+# Converts the wei price strings of a whole page at once:
+#   converter = PriceConverter(RateProvider(client, ttl=60))
+#   columns = converter.columns(result.data)    # {"currentPrice": [...], "currentPriceUsd": [...], ...}
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📦 Dependencies 📦
+# ╚════════❯ 📦 Built-in Dependencies:
+import logging
+import math
+import threading
+import time
+from array import array
+from decimal import Decimal
+# ╚════════❯ 📦 External Dependencies:
+try:
+    import numpy
+except ImportError:
+    numpy = None
+# ╚════════❯ 📦 Internal Dependencies:
+from paginator import find_page
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 💱 Rate Provider 💱
+# Payment token (Ronin) -> (symbol, decimals):
+TOKENS = {
+    "0xc99a6a985ed2cac1ef41640596c5a5f9f4e19ef5": ("eth", 18),
+    "0xe514d9deb7966c8be0ca922de8a064264ea6bcd4": ("ron", 18),
+    "0x97a9107c1793bc407d6f527b77e7fff4d812bece": ("axs", 18),
+    "0xa8754b9fa15fc18bb59458815510e40a12cd2014": ("slp", 0),
+    "0x0b7007c13325c48911f73a2dad5fa5dcbf808adc": ("usdc", 6),
+}
+DECIMALS = {symbol: decimals for symbol, decimals in TOKENS.values()}
+
+logger = logging.getLogger("axie.graphql.rates")
+
+class RateProvider:
+    """
+    A class that caches the USD rates of 'GetExchangeRates' for 'ttl' seconds (one refresh at a time;
+    the last rates are kept, and served, if a refresh fails, which is retried after 'retry_delay' seconds).
+    USDC is priced as 'usd'.
+    """
+
+    def __init__(self, client, ttl: float = 60.0, retry_delay: float = 5.0, clock=time.monotonic) -> None:
+        """
+        Initializes a 'RateProvider' instance.
+
+        Args:
+            ➤ client (GraphQLClient): The client fetching the rates.
+            ➤ ttl (float): How long rates are served before being refreshed, in seconds.
+            ➤ retry_delay (float): How long the last rates are served after a failed refresh, in seconds.
+            ➤ clock (callable): The monotonic clock (e.g. a fake one in tests).
+        """
+
+        self._client = client
+        self._ttl = ttl
+        self._retry_delay = retry_delay
+        self._clock = clock
+        self._rates = None
+        self._fetched_at = None
+        self._expires_at = None
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__module__}.{self.__class__.__name__} {self._rates} object at {hex(id(self))}>"
+
+    def rates(self) -> dict:
+        """
+        Returns the USD rate of each symbol ('eth', 'ron', 'axs', 'slp', 'usd', 'usdc').
+
+        Raises:
+            ➤ LookupError: If no rates could ever be fetched.
+        """
+
+        rates, expires_at = self._rates, self._expires_at
+        if rates is not None and self._clock() < expires_at:
+            return rates
+        with self._lock:
+            if self._rates is not None and self._clock() < self._expires_at:
+                return self._rates
+            try:
+                self._rates, self._fetched_at = self._fetch(), self._clock()
+                self._expires_at = self._fetched_at + self._ttl
+            except (OSError, LookupError) as exception:
+                if self._rates is None:
+                    raise
+                self._expires_at = self._clock() + self._retry_delay
+                logger.warning("Refreshing exchange rates failed (serving rates %.0fs old): %r.", self._clock() - self._fetched_at, exception)
+            return self._rates
+
+    def rate(self, symbol: str) -> float:
+        """
+        Returns the USD rate of a symbol.
+
+        Raises:
+            ➤ KeyError: If the symbol has no rate.
+        """
+
+        return self.rates()[symbol.lower()]
+
+    def _fetch(self) -> dict:
+        result = self._client.execute("GetExchangeRates")
+        rates = (result.data or {}).get("exchangeRate") if result.ok else None
+        if not rates:
+            raise LookupError(f"'GetExchangeRates' failed: {result.errors or result.status}.")
+        rates = {symbol: float(value["usd"]) for symbol, value in rates.items() if isinstance(value, dict) and value.get("usd") is not None}
+        rates.setdefault("usdc", rates.get("usd", 1.0))
+        return rates
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🧮 Price Converter 🧮
+# Result type -> (price fields, where rows are taken from):
+LISTING_FIELDS = ("currentPrice", "basePrice", "endedPrice")
+SALE_FIELDS = ("withPrice",)
+TOP_SALE_FIELDS = ("settlePrice",)
+
+def _rows(data) -> tuple:
+    """
+    Finds the priced rows of a page: the orders of listed entities, the priced transfer records of
+    settled auctions (several per entity), or the top sales.
+
+    Returns:
+        ➤ tuple: '(rows, fields, default symbol)'.
+    """
+
+    page = find_page(data) if not isinstance(data, list) else {"results": data}
+    results = (page or {}).get("results") or []
+    sample = next((result for result in results if result), {})
+    if "transferHistory" in sample:
+        rows = [
+            record for result in results for record in ((result or {}).get("transferHistory") or {}).get("results") or ()
+            if record.get("withPrice") is not None
+        ]
+        return rows, SALE_FIELDS, "eth"
+    if "settlePrice" in sample:
+        return results, TOP_SALE_FIELDS, "eth"
+    return [(result or {}).get("order") or {} for result in results], LISTING_FIELDS, None
+
+class PriceConverter:
+    """
+    A class that converts the price columns of a page (wei strings) into token amounts and USD values,
+    a column at a time: each column is gathered with one comprehension, then scaled in bulk
+    (with 'numpy' when installed, else into 'array("d")' columns).
+    """
+
+    def __init__(self, rates: RateProvider) -> None:
+        self._rates = rates
+
+    def columns(self, data, decimal: bool = False) -> dict:
+        """
+        Converts the price columns of a page (listings, settled auctions or top sales, cf. '_rows').
+
+        Args:
+            ➤ data: The response 'data' (or a list of results).
+            ➤ decimal (bool): Whether amounts are exact 'Decimal's (one per value) instead of floats.
+
+        Returns:
+            ➤ dict: Per price field, the amounts ('<field>') and USD values ('<field>Usd'), aligned with the rows
+                    (NaN or None where a row has no price), and the 'symbol' of each row.
+        """
+
+        rows, fields, default = _rows(data)
+        rates = self._rates.rates()
+        if default is None:
+            symbols = [TOKENS.get((row.get("paymentToken") or "").lower(), ("eth", 18))[0] for row in rows]
+        else:
+            symbols = [default] * len(rows)
+        if len(set(symbols)) <= 1:
+            symbol = symbols[0] if symbols else default or "eth"
+            scale, rate = 10.0 ** -DECIMALS.get(symbol, 18), rates.get(symbol, math.nan)
+        else:
+            scale = [10.0 ** -DECIMALS.get(symbol, 18) for symbol in symbols]
+            rate = [rates.get(symbol, math.nan) for symbol in symbols]
+
+        columns = {"symbol": symbols}
+        for field in fields:
+            wei = [row.get(field) for row in rows]
+            if decimal:
+                columns[field], columns[f"{field}Usd"] = self._decimals(wei, symbols, rates)
+            else:
+                columns[field], columns[f"{field}Usd"] = self._floats(wei, scale, rate)
+        return columns
+
+    @staticmethod
+    def _floats(wei: list, scale, rate) -> tuple:
+        """
+        Scales a column of wei strings into amounts and USD values ('scale' and 'rate' are per column or per row).
+        """
+
+        if numpy is not None:
+            amounts = numpy.array([value if value is not None else "nan" for value in wei], dtype=float)
+            amounts *= numpy.asarray(scale)
+            return amounts, amounts * numpy.asarray(rate)
+        raw = array("d", map(float, (value if value is not None else "nan" for value in wei)))
+        if isinstance(scale, list):
+            amounts = array("d", map(float.__mul__, raw, scale))
+            return amounts, array("d", map(float.__mul__, amounts, rate))
+        amounts = array("d", (value * scale for value in raw))
+        return amounts, array("d", (value * rate for value in amounts))
+
+    @staticmethod
+    def _decimals(wei: list, symbols: list, rates: dict) -> tuple:
+        amounts = [
+            Decimal(value).scaleb(-DECIMALS.get(symbol, 18)) if value is not None else None
+            for value, symbol in zip(wei, symbols)
+        ]
+        usd = [
+            amount * Decimal(repr(rates[symbol])) if amount is not None and symbol in rates else None
+            for amount, symbol in zip(amounts, symbols)
+        ]
+        return amounts, usd
+# ═════════════════════════════════════════════════════════════════════════════╝
@@ -0,0 +1,349 @@
+#╔═════════════════════════════════════════════════════════════════════════════╗
+#║══════════════════❯ 💫 AxieAPI | GraphQL | Schema 💫
+#╚═════════════════════════════════════════════════════════════════════════════╝
+# The checked-in snapshot ('schema.json') is used by 'codegen.py' to validate every operation at build time:
+#   python codegen.py --refresh-schema [URL]  Replaces the snapshot with the gateway's introspection result.
+# The gateway disables introspection: the snapshot is maintained by hand ('"source": "hand-checked"'), independently
+# from the documents it validates. Edit it when the gateway changes, and refresh it whenever introspection is allowed.
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📦 Dependencies 📦
+# ╚════════❯ 📦 Built-in Dependencies:
+import json
+import os
+import urllib.request
+# ╚════════❯ 📦 External Dependencies:
+# ╚════════❯ 📦 Internal Dependencies:
+import document
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🗺 Snapshot 🗺
+# The snapshot: {"source": ..., "query": "Query", "mutation": "Mutation", "types": {name: type}}, where a type is
+# {"kind": "OBJECT" | "INTERFACE" | "UNION" | "ENUM" | "INPUT_OBJECT" | "SCALAR", "fields": {name: {"type": "[Axie!]!",
+# "args": {name: type}}}, "possibleTypes": [...], "enumValues": [...]} (only the keys relevant to its kind).
+SNAPSHOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "schema.json")
+URL = "https://graphql-gateway.axieinfinity.com/graphql"
+COMPOSITE = ("OBJECT", "INTERFACE", "UNION")
+INPUT = ("SCALAR", "ENUM", "INPUT_OBJECT")
+BUILTIN_SCALARS = ("Int", "Float", "String", "Boolean", "ID")
+
+def load(path: str = SNAPSHOT) -> dict:
+    """
+    Loads a schema snapshot.
+    """
+
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+def save(schema: dict, path: str = SNAPSHOT) -> None:
+    """
+    Writes a schema snapshot (sorted, so that refreshes diff cleanly).
+    """
+
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(schema, file, indent=1, sort_keys=True, ensure_ascii=False)
+        file.write("\n")
+
+INTROSPECTION = """
+query IntrospectionQuery {
+    __schema {
+        queryType { name }
+        mutationType { name }
+        types {
+            kind
+            name
+            fields(includeDeprecated: true) { name args { name type { ...TypeRef } defaultValue } type { ...TypeRef } }
+            inputFields { name type { ...TypeRef } }
+            possibleTypes { name }
+            enumValues(includeDeprecated: true) { name }
+        }
+    }
+}
+fragment TypeRef on __Type {
+    kind name ofType { kind name ofType { kind name ofType { kind name ofType { kind name } } } }
+}
+"""
+
+def _type_reference(reference: dict) -> str:
+    """
+    Formats an introspection type reference (e.g. '[Axie!]!').
+    """
+
+    if reference["kind"] == "NON_NULL":
+        return _type_reference(reference["ofType"]) + "!"
+    if reference["kind"] == "LIST":
+        return f"[{_type_reference(reference['ofType'])}]"
+    return reference["name"]
+
+def from_introspection(result: dict, source: str = None) -> dict:
+    """
+    Converts an introspection result ('data' of 'INTROSPECTION') to a snapshot.
+    """
+
+    introspected = result["__schema"]
+    types = {}
+    for entry in introspected["types"]:
+        if entry["name"].startswith("__"):
+            continue
+        converted = {"kind": entry["kind"]}
+        if entry.get("fields") is not None:
+            converted["fields"] = {
+                field["name"]: {
+                    "type": _type_reference(field["type"]),
+                    "args": {arg["name"]: _type_reference(arg["type"]) + ("=" if arg.get("defaultValue") is not None else "") for arg in field["args"]},
+                }
+                for field in entry["fields"]
+            }
+        if entry.get("inputFields") is not None:
+            converted["fields"] = {field["name"]: {"type": _type_reference(field["type"]), "args": {}} for field in entry["inputFields"]}
+        if entry.get("possibleTypes") is not None:
+            converted["possibleTypes"] = sorted(possible["name"] for possible in entry["possibleTypes"])
+        if entry.get("enumValues") is not None:
+            converted["enumValues"] = sorted(value["name"] for value in entry["enumValues"])
+        types[entry["name"]] = converted
+    return {
+        "source": source or "introspection",
+        "query": (introspected.get("queryType") or {}).get("name", "Query"),
+        "mutation": (introspected.get("mutationType") or {}).get("name", "Mutation"),
+        "types": types,
+    }
+
+def fetch(url: str = URL, timeout: float = 30.0) -> dict:
+    """
+    Fetches the schema of a GraphQL endpoint through introspection.
+
+    Raises:
+        ➤ OSError: If the request fails.
+        ➤ ValueError: If the endpoint doesn't allow introspection.
+    """
+
+    request = urllib.request.Request(
+        url, data=json.dumps({"query": INTROSPECTION}).encode("utf-8"),
+        headers={"Content-Type": "application/json"}, method="POST"
+    )
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        body = json.loads(response.read())
+    if not body.get("data"):
+        raise ValueError(f"Introspection failed: {body.get('errors')}.")
+    return from_introspection(body["data"], url)
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ ✅ Validation ✅
+def _possible_types(schema: dict, name: str) -> set:
+    entry = schema["types"].get(name) or {}
+    if entry.get("kind") in ("UNION", "INTERFACE"):
+        return set(entry.get("possibleTypes", ()))
+    return {name}
+
+def _compatible(variable_type: str, argument_type: str, has_default: bool) -> bool:
+    """
+    Whether a variable of 'variable_type' can be used where 'argument_type' is expected.
+    """
+
+    if argument_type.endswith("!"):
+        if not variable_type.endswith("!"):
+            return has_default and _compatible(variable_type, argument_type[:-1], False)
+        return _compatible(variable_type[:-1], argument_type[:-1], False)
+    if variable_type.endswith("!"):
+        return _compatible(variable_type[:-1], argument_type, False)
+    if argument_type.startswith("["):
+        return variable_type.startswith("[") and _compatible(variable_type[1:-1], argument_type[1:-1], False)
+    return variable_type == argument_type
+
+def _literal_errors(schema: dict, value, type: str, where: str) -> list:
+    """
+    Checks a literal argument value against its type (scalars and enums, other types are not checked).
+    """
+
+    if value is None:
+        return [f"{where}: null given for non-null type '{type}'."] if type.endswith("!") else []
+    named = document.named_type(type)
+    checks = {
+        "Int": lambda value: isinstance(value, int) and not isinstance(value, bool),
+        "Float": lambda value: isinstance(value, (int, float)) and not isinstance(value, bool),
+        "String": lambda value: isinstance(value, str),
+        "ID": lambda value: isinstance(value, (str, int)) and not isinstance(value, bool),
+        "Boolean": lambda value: isinstance(value, bool),
+    }
+    if type.startswith("["):
+        return []
+    if named in checks and not checks[named](value):
+        return [f"{where}: {value!r} is not a valid '{type}'."]
+    entry = schema["types"].get(named) or {}
+    if entry.get("kind") == "ENUM" and not (isinstance(value, document.Enum) and value.value in entry.get("enumValues", ())):
+        return [f"{where}: {value!r} is not a value of enum '{named}'."]
+    return []
+
+def _collect(schema: dict, selections: list, parent: str, fragments: dict, collected: dict, seen: tuple = ()) -> dict:
+    """
+    Groups the fields of selections (fragments expanded) by response key: key -> [(parent type, field)].
+    """
+
+    for selection in selections:
+        if isinstance(selection, document.Field):
+            collected.setdefault(selection.key, []).append((parent, selection))
+        elif isinstance(selection, document.InlineFragment):
+            _collect(schema, selection.selections, selection.type_condition or parent, fragments, collected, seen)
+        elif selection.name in fragments and selection.name not in seen:
+            fragment = fragments[selection.name]
+            _collect(schema, fragment.selections, fragment.type_condition, fragments, collected, seen + (selection.name,))
+    return collected
+
+def _field_type(schema: dict, parent: str, field: document.Field) -> str:
+    if field.name == "__typename":
+        return "String!"
+    definition = ((schema["types"].get(parent) or {}).get("fields") or {}).get(field.name)
+    return definition["type"] if definition else None
+
+def _merge_errors(schema: dict, collected: dict, fragments: dict, exclusive: bool, where: str) -> list:
+    """
+    Checks that fields sharing a response key can be merged (cf. 'OverlappingFieldsCanBeMerged' in the GraphQL spec):
+    on a same type, they must be the same field with the same arguments; on exclusive object types,
+    they may differ but must return the same type.
+    """
+
+    errors = []
+    for key, fields in collected.items():
+        all_disjoint = len(fields) > 1
+        for index, (parent_a, field_a) in enumerate(fields):
+            for parent_b, field_b in fields[index + 1:]:
+                disjoint = exclusive or (
+                    parent_a != parent_b
+                    and (schema["types"].get(parent_a) or {}).get("kind") == "OBJECT"
+                    and (schema["types"].get(parent_b) or {}).get("kind") == "OBJECT"
+                )
+                all_disjoint = all_disjoint and disjoint
+                if not disjoint and (field_a.name != field_b.name or repr(field_a.arguments) != repr(field_b.arguments)):
+                    errors.append(f"{where}: '{key}' selects different fields or arguments ('{parent_a}.{field_a.name}', '{parent_b}.{field_b.name}').")
+                    continue
+                type_a, type_b = _field_type(schema, parent_a, field_a), _field_type(schema, parent_b, field_b)
+                if type_a is None or type_b is None:
+                    continue
+                named_a, named_b = document.named_type(type_a), document.named_type(type_b)
+                leaf_a = (schema["types"].get(named_a) or {}).get("kind") not in COMPOSITE
+                leaf_b = (schema["types"].get(named_b) or {}).get("kind") not in COMPOSITE
+                shape_a, shape_b = type_a.replace(named_a, ""), type_b.replace(named_b, "")
+                if shape_a != shape_b or leaf_a != leaf_b or (leaf_a and named_a != named_b):
+                    errors.append(f"{where}: '{key}' returns conflicting types '{type_a}' ('{parent_a}.{field_a.name}') and '{type_b}' ('{parent_b}.{field_b.name}').")
+
+        # The sub-selections of every field sharing the key are merged too:
+        nested = {}
+        for parent, field in fields:
+            type = _field_type(schema, parent, field)
+            if field.selections and type is not None:
+                _collect(schema, field.selections, document.named_type(type), fragments, nested)
+        errors.extend(_merge_errors(schema, nested, fragments, exclusive or all_disjoint, f"{where}.{key}"))
+    return errors
+
+def validate(query: str, schema: dict, name: str = None) -> list:
+    """
+    Validates the operations of a GraphQL document against a schema snapshot: fields, arguments and
+    variable types, fragment type conditions and spreads, leaf/composite selections, and field merging.
+
+    Args:
+        ➤ query (str): The GraphQL document (e.g. 'GraphQLOperation(name).query').
+        ➤ schema (dict): The snapshot (cf. 'load').
+        ➤ name (str): The 'operationName' sent with the document: only this operation is validated,
+                      and the document must define it.
+
+    Returns:
+        ➤ list: The error messages (empty if the document is valid).
+    """
+
+    parsed = document.parse(query)
+    types = schema["types"]
+    errors = []
+
+    for fragment in parsed.fragments.values():
+        if (types.get(fragment.type_condition) or {}).get("kind") not in COMPOSITE:
+            errors.append(f"fragment {fragment.name}: unknown or non-composite type condition '{fragment.type_condition}'.")
+
+    if name is not None and name not in (definition.name for definition in parsed.operations):
+        defined = [definition.name for definition in parsed.operations]
+        errors.append(f"{name}: the document defines no operation named '{name}' (it defines {defined}).")
+
+    for definition in parsed.operations:
+        if name is not None and definition.name != name:
+            continue
+        root = schema.get(definition.kind)
+        if root not in types:
+            errors.append(f"{definition.name}: the schema has no {definition.kind} type.")
+            continue
+        variables = {variable.name: variable for variable in definition.variables}
+        for variable in variables.values():
+            named = document.named_type(variable.type)
+            if named not in BUILTIN_SCALARS and (types.get(named) or {}).get("kind") not in INPUT:
+                errors.append(f"{definition.name}: variable '${variable.name}' has unknown or non-input type '{variable.type}'.")
+        used = set()
+
+        def check(selections: list, parent: str, where: str, seen: tuple) -> None:
+            fields = (types.get(parent) or {}).get("fields") or {}
+            for selection in selections:
+                if isinstance(selection, document.FragmentSpread):
+                    fragment = parsed.fragments.get(selection.name)
+                    if fragment is None:
+                        errors.append(f"{where}: unknown fragment '{selection.name}'.")
+                    elif not _possible_types(schema, fragment.type_condition) & _possible_types(schema, parent):
+                        errors.append(f"{where}: fragment '{selection.name}' on '{fragment.type_condition}' can never apply to '{parent}'.")
+                    elif selection.name not in seen:
+                        check(fragment.selections, fragment.type_condition, f"{where}(...{selection.name})", seen + (selection.name,))
+                    continue
+                if isinstance(selection, document.InlineFragment):
+                    condition = selection.type_condition or parent
+                    if (types.get(condition) or {}).get("kind") not in COMPOSITE:
+                        errors.append(f"{where}: unknown or non-composite type condition '{condition}'.")
+                    elif not _possible_types(schema, condition) & _possible_types(schema, parent):
+                        errors.append(f"{where}: '... on {condition}' can never apply to '{parent}'.")
+                    else:
+                        check(selection.selections, condition, f"{where}(... on {condition})", seen)
+                    continue
+                path = f"{where}.{selection.key}"
+                for directive in selection.directives:
+                    for value in directive.arguments.values():
+                        if isinstance(value, document.Variable):
+                            used.add(value.name)
+                if selection.name == "__typename":
+                    if selection.selections:
+                        errors.append(f"{path}: '__typename' has no fields.")
+                    continue
+                field = fields.get(selection.name)
+                if field is None:
+                    errors.append(f"{path}: type '{parent}' has no field '{selection.name}'.")
+                    continue
+                for argument, value in selection.arguments.items():
+                    expected = field["args"].get(argument)
+                    if expected is None:
+                        errors.append(f"{path}: field '{parent}.{selection.name}' has no argument '{argument}'.")
+                        continue
+                    expected = expected.rstrip("=")
+                    if isinstance(value, document.Variable):
+                        used.add(value.name)
+                        variable = variables.get(value.name)
+                        if variable is None:
+                            errors.append(f"{path}: variable '${value.name}' is not defined.")
+                        elif not _compatible(variable.type, expected, variable.default is not None):
+                            errors.append(f"{path}: variable '${value.name}' of type '{variable.type}' can't be used as '{argument}: {expected}'.")
+                    else:
+                        errors.extend(_literal_errors(schema, value, expected, f"{path}({argument})"))
+                for argument, expected in field["args"].items():
+                    if expected.endswith("!") and argument not in selection.arguments:
+                        errors.append(f"{path}: required argument '{argument}: {expected}' is missing.")
+                named = document.named_type(field["type"])
+                composite = (types.get(named) or {}).get("kind") in COMPOSITE
+                if composite and not selection.selections:
+                    errors.append(f"{path}: '{named}' is a composite type, it needs a selection.")
+                elif not composite and selection.selections:
+                    errors.append(f"{path}: '{named}' is a leaf type, it can't have a selection.")
+                elif composite:
+                    check(selection.selections, named, path, seen)
+
+        check(definition.selections, root, definition.name or definition.kind, ())
+        collected = _collect(schema, definition.selections, root, parsed.fragments, {})
+        errors.extend(_merge_errors(schema, collected, parsed.fragments, False, definition.name or definition.kind))
+        for variable in variables:
+            if variable not in used:
+                errors.append(f"{definition.name}: variable '${variable}' is never used.")
+    return errors
+# ═════════════════════════════════════════════════════════════════════════════╝
@@ -0,0 +1,346 @@
+#╔═════════════════════════════════════════════════════════════════════════════╗
+#║══════════════════❯ 💫 AxieAPI | GraphQL | Session Pool 💫
+#╚═════════════════════════════════════════════════════════════════════════════╝
+# Runs 🔐 operations for many accounts through one client: each account has its own token (cf. 'auth'),
+# concurrency cap and rate limit, and the accounts with pending work are served in turn.
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📦 Dependencies 📦
+# ╚════════❯ 📦 Built-in Dependencies:
+import collections
+import threading
+import time
+from concurrent.futures import Future
+# ╚════════❯ 📦 External Dependencies:
+# ╚════════❯ 📦 Internal Dependencies:
+from paginator import TUNER, PaginationError, find_page
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🪣 Rate Limiter 🪣
+class RateLimiter:
+    """
+    A token bucket: 'rate' requests per second, with bursts of up to 'burst' requests.
+    """
+
+    def __init__(self, rate: float, burst: float = None, clock=time.monotonic) -> None:
+        """
+        Initializes a 'RateLimiter' instance.
+
+        Raises:
+            ➤ ValueError: If 'rate' is not positive.
+        """
+
+        if rate <= 0:
+            raise ValueError(f"'rate' ({rate}) must be positive.")
+        self._rate = rate
+        self._burst = max(1.0, burst if burst is not None else rate)
+        self._clock = clock
+        self._tokens = self._burst
+        self._refilled_at = clock()
+
+    def delay(self) -> float:
+        """
+        The time until a request can be sent, in seconds (0 if it can be sent now).
+        """
+
+        now = self._clock()
+        self._tokens = min(self._burst, self._tokens + (now - self._refilled_at) * self._rate)
+        self._refilled_at = now
+        return 0.0 if self._tokens >= 1 else (1 - self._tokens) / self._rate
+
+    def take(self) -> None:
+        """
+        Spends a token (after 'delay' returned 0).
+        """
+
+        self._tokens -= 1
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 👥 Session Pool 👥
+def _page(data) -> tuple:
+    """
+    Finds the items of a page: the 'results' of a paginated object (cf. 'find_page'),
+    or the first list of the response (e.g. 'profile.activities').
+
+    Returns:
+        ➤ tuple: '(items, total)', or '(None, None)' if there is no page.
+    """
+
+    page = find_page(data)
+    if page is not None:
+        return page["results"], page.get("total")
+    if isinstance(data, list):
+        return data, None
+    if isinstance(data, dict):
+        for value in data.values():
+            items, total = _page(value)
+            if items is not None:
+                return items, total
+    return None, None
+
+class Session:
+    """
+    A class that holds the scheduling state of one account: its queue, requests in flight and rate limiter.
+    It also acts as a client bound to the account ('operation', 'execute'), e.g. for a 'Paginator'.
+    """
+
+    def __init__(self, pool: "SessionPool", account: str, concurrency: int, limiter: RateLimiter) -> None:
+        self.pool = pool
+        self.account = account
+        self.concurrency = concurrency
+        self.limiter = limiter
+        self.queue = collections.deque()
+        self.inflight = 0
+        self.stats = collections.Counter()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__module__}.{self.__class__.__name__} '{self.account}' object at {hex(id(self))}>"
+
+    def operation(self, name: str):
+        return self.pool.client.operation(name)
+
+    def execute(self, name: str, variables: dict = None, headers: dict = None, split=None):
+        """
+        Executes one operation as this account, waiting for its turn (cf. 'SessionPool.submit').
+        """
+
+        return self.pool.submit(self.account, name, variables, headers, split).result()
+
+class SessionPool:
+    """
+    A class that runs operations of many accounts through one 'GraphQLClient' (one connection pool),
+    authorized with the token of each account (the client 'tokens' needs a signer per account):
+        - an account has at most 'concurrency' requests in flight, and sends at most 'rate' per second.
+        - the accounts with pending work are served round-robin, so an account with a long backlog
+          (e.g. a deep activity log) doesn't hold back the others.
+    """
+
+    def __init__(self, client, concurrency: int = 2, rate: float = None, burst: float = None, workers: int = 32) -> None:
+        """
+        Initializes a 'SessionPool' instance.
+
+        Args:
+            ➤ client (GraphQLClient): The client sending every request (with a 'TokenManager').
+            ➤ concurrency (int): The largest number of requests in flight per account.
+            ➤ rate (float): The largest number of requests per second per account (unlimited if omitted).
+            ➤ burst (float): The requests an idle account may send at once ('rate' by default).
+            ➤ workers (int): The number of threads sending requests (the overall concurrency).
+
+        Raises:
+            ➤ ValueError: If the client has no 'tokens', or if 'concurrency' or 'workers' is not positive.
+        """
+
+        # ┗━━━━━➤ 🚦 Perform checks:
+        if client.tokens is None:
+            raise ValueError("The client must authorize operations: pass a 'TokenManager' as 'GraphQLClient(tokens=...)'.")
+        if concurrency < 1 or workers < 1:
+            raise ValueError("'concurrency' and 'workers' must be positive integers.")
+
+        # ┗━━━━━➤ 📌 Define attributes:
+        self.client = client
+        self._concurrency = concurrency
+        self._rate = rate
+        self._burst = burst
+        self._sessions = {}
+        self._ready = collections.deque()
+        self._inflight = 0
+        self._condition = threading.Condition()
+        self._closed = False
+        self._threads = [
+            threading.Thread(target=self._work, name=f"SessionPool-{index}", daemon=True) for index in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__module__}.{self.__class__.__name__} {len(self._sessions)} accounts object at {hex(id(self))}>"
+
+    def __enter__(self) -> "SessionPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def session(self, account: str = None) -> Session:
+        """
+        Returns the session of an account (the default account of the client 'tokens' if omitted).
+        """
+
+        account = (account or self.client.tokens.accounts[0]).lower()
+        with self._condition:
+            session = self._sessions.get(account)
+            if session is None:
+                limiter = RateLimiter(self._rate, self._burst) if self._rate else None
+                session = self._sessions[account] = Session(self, account, self._concurrency, limiter)
+        return session
+
+    def submit(self, account: str, name: str, variables: dict = None, headers: dict = None, split=None) -> Future:
+        """
+        Queues one operation of an account.
+
+        Returns:
+            ➤ Future: The future 'GraphQLResult'.
+
+        Raises:
+            ➤ RuntimeError: If the pool is closed.
+        """
+
+        future = Future()
+        self._enqueue(self.session(account), future, lambda session: self.client.execute(name, variables, headers, split, session.account))
+        return future
+
+    def map(self, name: str, accounts: list, variables: dict = None) -> dict:
+        """
+        Executes one operation for every account (e.g. 'GetPrivateProfile').
+
+        Returns:
+            ➤ dict: The 'GraphQLResult' (or the raised exception) of each account.
+        """
+
+        futures = {account: self.submit(account, name, variables) for account in accounts}
+        return {account: future.exception() or future.result() for account, future in futures.items()}
+
+    def collect(self, account: str, name: str, variables: dict = None, page_size: int = None, max_items: int = None) -> Future:
+        """
+        Fetches every item of a paginated operation for one account (e.g. 'GetActivityLog'): each page is queued
+        once the previous one arrived, so the pages of all accounts interleave.
+
+        Returns:
+            ➤ Future: The future list of items (a 'PaginationError' if a page fails).
+        """
+
+        session, future, items = self.session(account), Future(), []
+
+        def page(session: Session, offset: int) -> None:
+            size = page_size or TUNER.size(name)
+            if max_items is not None:
+                size = min(size, max_items - len(items))
+            began = time.perf_counter()
+            try:
+                result = self.client.execute(name, {**(variables or {}), "from": offset, "size": size}, account=session.account)
+            except OSError:
+                TUNER.observe(name, size, time.perf_counter() - began, 0, 0, failed=True)
+                raise
+            found, total = _page(result.data)
+            if not result.ok or found is None:
+                TUNER.observe(name, size, time.perf_counter() - began, len(result.response.body), 0, failed=True)
+                raise PaginationError(f"Page {offset}-{offset + size} of '{name}' failed for '{session.account}': {result.errors or result.status}.", result)
+            TUNER.observe(name, size, time.perf_counter() - began, len(result.response.body), len(found))
+            items.extend(found)
+            offset += len(found)
+            if len(found) < size or (total is not None and offset >= total) or (max_items is not None and len(items) >= max_items):
+                future.set_result(items)
+            else:
+                self._enqueue(session, None, lambda session: page(session, offset), future, chained=True)
+
+        self._enqueue(session, None, lambda session: page(session, 0), future)
+        return future
+
+    def sync(self, name: str, accounts: list, variables: dict = None, page_size: int = None, max_items: int = None) -> dict:
+        """
+        Fetches every item of a paginated operation for every account, in parallel (cf. 'collect').
+
+        Returns:
+            ➤ dict: The list of items (or the raised exception) of each account.
+        """
+
+        futures = {account: self.collect(account, name, variables, page_size, max_items) for account in accounts}
+        return {account: future.exception() or future.result() for account, future in futures.items()}
+
+    def stats(self) -> dict:
+        """
+        The requests, failures, queued and in flight tasks of each account.
+        """
+
+        with self._condition:
+            return {
+                account: {**session.stats, "queued": len(session.queue), "inflight": session.inflight}
+                for account, session in self._sessions.items()
+            }
+
+    def _enqueue(self, session: Session, future: Future, task, failure: Future = None, chained: bool = False) -> None:
+        """
+        Queues a task of a session: 'task(session)' sets 'future' to its return value; if it raises,
+        the exception is set on 'future' (or 'failure', the future of a chain of tasks, still accepted once closed).
+        """
+
+        with self._condition:
+            if self._closed and not chained:
+                raise RuntimeError("The session pool is closed.")
+            if not session.queue:
+                # A session is in the line while it has queued tasks:
+                self._ready.append(session)
+            session.queue.append((future, task, failure))
+            self._condition.notify()
+
+    def _next(self) -> tuple:
+        """
+        Picks the next task (under the lock): the first account in turn with a task, room for one more request
+        in flight and a rate limit token; the account then goes to the back of the line.
+
+        Returns:
+            ➤ tuple: '(session, task)', or '(None, delay)' where delay is the time until a rate limited account
+                     can send (None if no account can send before a request completes).
+        """
+
+        delay = None
+        for _ in range(len(self._ready)):
+            session = self._ready.popleft()
+            if session.inflight < session.concurrency:
+                wait = session.limiter.delay() if session.limiter is not None else 0.0
+                if wait <= 0:
+                    if session.limiter is not None:
+                        session.limiter.take()
+                    session.inflight += 1
+                    self._inflight += 1
+                    task = session.queue.popleft()
+                    if session.queue:
+                        self._ready.append(session)
+                    return session, task
+                delay = wait if delay is None else min(delay, wait)
+            self._ready.append(session)
+        return None, delay
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                while True:
+                    session, task = self._next()
+                    if session is not None:
+                        break
+                    if self._closed and not self._ready and not self._inflight:
+                        return
+                    self._condition.wait(task)
+
+            future, function, failure = task
+            if future is None or future.set_running_or_notify_cancel():
+                try:
+                    value = function(session)
+                except BaseException as exception:
+                    with self._condition:
+                        session.stats["failures"] += 1
+                    target = future or failure
+                    if not target.done():
+                        target.set_exception(exception)
+                else:
+                    if future is not None:
+                        future.set_result(value)
+            with self._condition:
+                session.stats["requests"] += 1
+                session.inflight -= 1
+                self._inflight -= 1
+                self._condition.notify_all()
+
+    def close(self) -> None:
+        """
+        Stops accepting tasks, and waits for the queued ones.
+        """
+
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        for thread in self._threads:
+            thread.join()
+# ═════════════════════════════════════════════════════════════════════════════╝
@@ -0,0 +1,344 @@
+#╔═════════════════════════════════════════════════════════════════════════════╗
+#║══════════════════❯ 💫 AxieAPI | GraphQL | SQLite Sink 💫
+#╚═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📦 Dependencies 📦
+# ╚════════❯ 📦 Built-in Dependencies:
+import json
+import queue
+import sqlite3
+import threading
+# ╚════════❯ 📦 External Dependencies:
+# ╚════════❯ 📦 Internal Dependencies:
+import tracing
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🗄 Tables 🗄
+# Each table: (primary key columns, all columns).
+TABLES = {
+    "axies": (
+        ("id",),
+        ("id", "name", "image", "owner", "owner_name", "class", "breed_count", "genes", "new_genes",
+         "stage", "level", "body_shape", "birth_date", "title", "matron_id", "matron_class",
+         "sire_id", "sire_class", "order_id")
+    ),
+    "parts": (
+        ("axie_id", "part_id"),
+        ("axie_id", "part_id", "name", "class", "type", "stage", "special_genes")
+    ),
+    "orders": (
+        ("id",),
+        ("id", "maker", "kind", "expired_at", "payment_token", "started_at", "base_price", "ended_at",
+         "ended_price", "expected_state", "nonce", "market_fee_percentage", "signature", "hash",
+         "duration", "time_left", "current_price", "suggested_price", "current_price_usd")
+    ),
+    "assets": (
+        ("order_id", "address", "asset_id"),
+        ("order_id", "address", "asset_id", "erc", "quantity")
+    ),
+    "lands": (
+        ("token_id",),
+        ("token_id", "col", "row", "land_type", "owner", "owner_name", "order_id")
+    ),
+    "items": (
+        ("token_id",),
+        ("token_id", "item_alias", "item_id", "name", "figure_url", "land_type", "rarity", "effects",
+         "description", "token_type", "owner", "owner_name", "order_id")
+    ),
+}
+
+def _create_table(name: str) -> str:
+    """
+    Builds the 'CREATE TABLE' statement of a table.
+    """
+
+    keys, columns = TABLES[name]
+    return f"CREATE TABLE IF NOT EXISTS {name} ({', '.join(columns)}, PRIMARY KEY ({', '.join(keys)}))"
+
+def _upsert(name: str, selected: tuple = None) -> str:
+    """
+    Builds the 'INSERT ... ON CONFLICT DO UPDATE' statement of a table.
+
+    Only the 'selected' columns are updated: the fields a partial fragment leaves out (e.g. 'owner' in
+    'AxieSettledBrief') keep their stored value, while the selected ones are overwritten, NULLs included
+    (e.g. the 'order_id' of a delisted axie).
+    """
+
+    keys, columns = TABLES[name]
+    selected = columns if selected is None else selected
+    updates = ", ".join(f"{col} = excluded.{col}" for col in selected if col not in keys)
+    return (
+        f"INSERT INTO {name} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))}) "
+        f"ON CONFLICT ({', '.join(keys)}) DO " + (f"UPDATE SET {updates}" if updates else "NOTHING")
+    )
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🔀 Row Mappers 🔀
+# The value of a field the fragment doesn't select (unlike None, a selected field that is null):
+MISSING = type("Missing", (), {"__repr__": lambda self: "MISSING"})()
+
+def _get(entity: dict, field: str):
+    return entity.get(field, MISSING)
+
+def _owner_name(entity: dict):
+    if "ownerProfile" not in entity:
+        return MISSING
+    return (entity["ownerProfile"] or {}).get("name")
+
+def _order_id(entity: dict):
+    if "order" not in entity:
+        return MISSING
+    return (entity["order"] or {}).get("id")
+
+def _order_rows(order: dict) -> list:
+    """
+    Maps an 'OrderInfo' dict to its 'orders' and 'assets' rows.
+    """
+
+    rows = [("orders", (
+        _get(order, "id"), _get(order, "maker"), _get(order, "kind"), _get(order, "expiredAt"),
+        _get(order, "paymentToken"), _get(order, "startedAt"), _get(order, "basePrice"), _get(order, "endedAt"),
+        _get(order, "endedPrice"), _get(order, "expectedState"), _get(order, "nonce"),
+        _get(order, "marketFeePercentage"), _get(order, "signature"), _get(order, "hash"),
+        _get(order, "duration"), _get(order, "timeLeft"), _get(order, "currentPrice"),
+        _get(order, "suggestedPrice"), _get(order, "currentPriceUsd")
+    ))]
+    for asset in order.get("assets") or ():
+        rows.append(("assets", (
+            _get(order, "id"), _get(asset, "address"), _get(asset, "id"), _get(asset, "erc"), _get(asset, "quantity")
+        )))
+    return rows
+
+def _axie_rows(axie: dict) -> list:
+    """
+    Maps an 'Axie*' fragment dict to its 'axies', 'parts', 'orders' and 'assets' rows.
+    """
+
+    order = axie.get("order") or {}
+    rows = [("axies", (
+        _get(axie, "id"), _get(axie, "name"), _get(axie, "image"), _get(axie, "owner"), _owner_name(axie),
+        _get(axie, "class"), _get(axie, "breedCount"), _get(axie, "genes"), _get(axie, "newGenes"),
+        _get(axie, "stage"), _get(axie, "level"), _get(axie, "bodyShape"), _get(axie, "birthDate"),
+        _get(axie, "title"), _get(axie, "matronId"), _get(axie, "matronClass"), _get(axie, "sireId"),
+        _get(axie, "sireClass"), _order_id(axie)
+    ))]
+    for part in axie.get("parts") or ():
+        rows.append(("parts", (
+            _get(axie, "id"), _get(part, "id"), _get(part, "name"), _get(part, "class"), _get(part, "type"),
+            _get(part, "stage"), _get(part, "specialGenes")
+        )))
+    if order:
+        rows.extend(_order_rows(order))
+    return rows
+
+def _land_rows(land: dict) -> list:
+    """
+    Maps a 'Land*' fragment dict to its 'lands', 'orders' and 'assets' rows.
+    """
+
+    order = land.get("order") or {}
+    rows = [("lands", (
+        _get(land, "tokenId"), _get(land, "col"), _get(land, "row"), _get(land, "landType"),
+        _get(land, "owner"), _owner_name(land), _order_id(land)
+    ))]
+    if order:
+        rows.extend(_order_rows(order))
+    return rows
+
+def _item_rows(item: dict) -> list:
+    """
+    Maps an 'Item*' fragment dict to its 'items', 'orders' and 'assets' rows.
+    """
+
+    order = item.get("order") or {}
+    effects = _get(item, "effects")
+    rows = [("items", (
+        _get(item, "tokenId"), _get(item, "itemAlias"), _get(item, "itemId"), _get(item, "name"),
+        _get(item, "figureURL"), _get(item, "landType"), _get(item, "rarity"),
+        json.dumps(effects) if effects not in (None, MISSING) else effects,
+        _get(item, "description"), _get(item, "tokenType"), _get(item, "owner"), _owner_name(item),
+        _order_id(item)
+    ))]
+    if order:
+        rows.extend(_order_rows(order))
+    return rows
+
+# Fragment name (cf. 'GraphQLOperation.ValidOperations.ValidFragments') -> row mapper:
+MAPPERS = {
+    "AxieDetail": _axie_rows,
+    "AxieBrief": _axie_rows,
+    "AxieSettledBrief": _axie_rows,
+    "AxieBreedingBrief": _axie_rows,
+    "LandDetail": _land_rows,
+    "LandSettledBrief": _land_rows,
+    "ItemDetail": _item_rows,
+    "ItemBrief": _item_rows,
+    "ItemSettledBrief": _item_rows,
+    "OrderInfo": _order_rows,
+}
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🗄 SQLite Sink 🗄
+class SQLiteSink:
+    """
+    A class that persists fetched GraphQL entities into a local SQLite database,
+    through a bounded write-behind queue drained by a single writer thread.
+    """
+
+    def __init__(self, path: str, batch_size: int = 1000, max_queue: int = 10_000) -> None:
+        """
+        Initializes a 'SQLiteSink' instance, and starts its writer thread.
+
+        Args:
+            ➤ path (str): The SQLite database path.
+            ➤ batch_size (int): The maximum number of entities written per transaction.
+            ➤ max_queue (int): The maximum number of pending entities before 'write' blocks.
+
+        Raises:
+            ➤ ValueError: If 'batch_size' or 'max_queue' is not a positive integer.
+        """
+
+        # ┗━━━━━➤ 🚦 Perform checks:
+        if batch_size < 1 or max_queue < 1:
+            raise ValueError(f"'batch_size' ({batch_size}) and 'max_queue' ({max_queue}) must be positive integers.")
+
+        # ┗━━━━━➤ 📌 Define attributes:
+        self._path = path
+        self._batch_size = batch_size
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._error = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=f"SQLiteSink({path})", daemon=True)
+        self._ready = threading.Event()
+        self._thread.start()
+        self._ready.wait()
+        self._raise_error()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__module__}.{self.__class__.__name__} '{self._path}' object at {hex(id(self))}>"
+
+    def __enter__(self) -> "SQLiteSink":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def write(self, fragment: str, entities: list) -> None:
+        """
+        Queues entities for writing. Blocks while the queue is full.
+
+        Args:
+            ➤ fragment (str): The fragment name the entities were fetched with (e.g. 'AxieBrief').
+            ➤ entities (list): The entity dicts (e.g. 'data["axies"]["results"]').
+
+        Raises:
+            ➤ ValueError: If 'fragment' has no table mapping, or if the sink is closed.
+        """
+
+        if fragment not in MAPPERS:
+            raise ValueError(f"Fragment '{fragment}' can't be stored. It must be one of: {list(MAPPERS)}.")
+        if self._closed:
+            raise ValueError(f"{self!r} is closed.")
+        self._raise_error()
+        mapper = MAPPERS[fragment]
+        with tracing.span("sink.write", fragment=fragment) as span:
+            count = 0
+            for entity in entities:
+                if entity:
+                    self._queue.put(mapper(entity))
+                    count += 1
+            span.set("entities", count)
+
+    def flush(self) -> None:
+        """
+        Blocks until every queued entity has been committed.
+
+        Raises:
+            ➤ sqlite3.Error: If the writer thread failed.
+        """
+
+        self._queue.join()
+        self._raise_error()
+
+    def close(self) -> None:
+        """
+        Flushes the queue, then stops the writer thread and closes the database.
+
+        Raises:
+            ➤ sqlite3.Error: If the writer thread failed.
+        """
+
+        if not self._closed:
+            self._closed = True
+            self._queue.put(None)
+            self._thread.join()
+        self._raise_error()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    def _run(self) -> None:
+        """
+        Drains the queue in batches: each batch is grouped per table (and selected columns, cf. '_upsert'),
+        then written with one 'executemany' per group inside a single transaction.
+        """
+
+        try:
+            connection = sqlite3.connect(self._path)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            with connection:
+                for name in TABLES:
+                    connection.execute(_create_table(name))
+        except sqlite3.Error as error:
+            self._error = error
+            self._closed = True
+            self._ready.set()
+            return
+        self._ready.set()
+
+        # One statement per table and set of selected columns:
+        statements = {}
+        stop = False
+        while not stop:
+            batch = [self._queue.get()]
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            # Group rows per table, in runs of the same selected columns (in order, so the last write wins):
+            runs = {name: [] for name in TABLES}
+            for entity_rows in batch:
+                if entity_rows is None:
+                    stop = True
+                    continue
+                for table, row in entity_rows:
+                    selected = tuple(column for column, value in zip(TABLES[table][1], row) if value is not MISSING)
+                    if not runs[table] or runs[table][-1][0] != selected:
+                        runs[table].append((selected, []))
+                    runs[table][-1][1].append(tuple(None if value is MISSING else value for value in row))
+
+            # Write the batch in one transaction:
+            if self._error is None:
+                try:
+                    with connection:
+                        for table, table_runs in runs.items():
+                            for selected, table_rows in table_runs:
+                                statement = statements.get((table, selected))
+                                if statement is None:
+                                    statement = statements[table, selected] = _upsert(table, selected)
+                                connection.executemany(statement, table_rows)
+                except sqlite3.Error as error:
+                    self._error = error
+            for _ in batch:
+                self._queue.task_done()
+
+        connection.close()
+# ═════════════════════════════════════════════════════════════════════════════╝
@@ -0,0 +1,13 @@
+#╔═════════════════════════════════════════════════════════════════════════════╗
+#║══════════════════❯ 💫 AxieAPI | GraphQL | Tests 💫
+#╚═════════════════════════════════════════════════════════════════════════════╝
+# The modules are flat files next to this folder: make them importable from any working directory.
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📦 Dependencies 📦
+# ╚════════❯ 📦 Built-in Dependencies:
+import os
+import sys
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
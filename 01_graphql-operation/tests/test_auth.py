@@ -0,0 +1,78 @@
+#╔═════════════════════════════════════════════════════════════════════════════╗
+#║══════════════════❯ 💫 AxieAPI | GraphQL | Token Manager Tests 💫
+#╚═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📦 Dependencies 📦
+# ╚════════❯ 📦 Built-in Dependencies:
+import time
+from concurrent.futures import ThreadPoolExecutor
+# ╚════════❯ 📦 Internal Dependencies:
+from auth import LocalSigner, TokenManager
+from client import GraphQLClient
+from mock_gateway import MockGateway
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🧪 Token Manager 🧪
+ACCOUNT = "0x" + "ab" * 20
+
+class Clock:
+    """
+    A fake Unix time clock, starting now (the gateway stamps its tokens with the real time).
+    """
+
+    def __init__(self) -> None:
+        self.now = time.time()
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float, tokens: TokenManager) -> None:
+        # The refresh thread sleeps on the real clock: wake it up to read the fake one.
+        self.now += seconds
+        with tokens._lock:
+            tokens._lock.notify_all()
+
+def _until(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+def test_concurrent_callers_share_one_login():
+    with MockGateway(auth=True, latency=0.05) as gateway:
+        with TokenManager(LocalSigner(ACCOUNT), clock=Clock()) as tokens, GraphQLClient(gateway.url, tokens=tokens):
+            with ThreadPoolExecutor(max_workers=16) as executor:
+                access_tokens = set(executor.map(lambda _: tokens.token(), range(64)))
+            assert len(access_tokens) == 1
+            assert tokens.stats["logins"] == 1
+            assert gateway.stats["access_tokens"] == 1
+
+def test_token_is_refreshed_in_background_before_expiry():
+    clock = Clock()
+    with MockGateway(auth=True, token_ttl=3600) as gateway:
+        with TokenManager(LocalSigner(ACCOUNT), refresh_margin=0.2, clock=clock) as tokens, GraphQLClient(gateway.url, tokens=tokens):
+            first = tokens.token()
+            clock.advance(2000, tokens)
+            assert tokens.token() == first
+            assert tokens.stats["background_refreshes"] == 0
+            # Within the last 20% of its lifetime: refreshed by the scheduled refresh, without a caller waiting.
+            clock.advance(1000, tokens)
+            assert _until(lambda: tokens.stats["background_refreshes"] == 1 and tokens.token() != first)
+            assert tokens.stats["logins"] == 2
+            assert gateway.stats["access_tokens"] == 2
+
+def test_revoked_token_is_replaced_and_request_retried():
+    with MockGateway(auth=True) as gateway:
+        with TokenManager(LocalSigner(ACCOUNT), clock=Clock()) as tokens, GraphQLClient(gateway.url, tokens=tokens) as client:
+            assert client.execute("GetPrivateProfile").ok
+            first = tokens.token()
+            gateway.revoke()
+            result = client.execute("GetPrivateProfile")
+            assert result.ok and not result.errors
+            assert tokens.token() != first
+            assert tokens.stats["logins"] == 2
+# ═════════════════════════════════════════════════════════════════════════════╝
@@ -0,0 +1,36 @@
+#╔═════════════════════════════════════════════════════════════════════════════╗
+#║══════════════════❯ 💫 AxieAPI | GraphQL | Code Generation Tests 💫
+#╚═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📦 Dependencies 📦
+# ╚════════❯ 📦 Built-in Dependencies:
+import os
+import shutil
+import subprocess
+import sys
+# ╚════════❯ 📦 External Dependencies:
+import pytest
+# ╚════════❯ 📦 Internal Dependencies:
+import codegen
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🧪 Bootstrap 🧪
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def test_generates_without_its_own_output(tmp_path):
+    # Only the generator and its inputs: no 'compiled_operations.py', 'operation.py' or 'mock_gateway.py'.
+    for file in ("codegen.py", "cost.py", "document.py", "schema.py", "schema.json"):
+        shutil.copy(os.path.join(ROOT, file), tmp_path)
+    shutil.copytree(os.path.join(ROOT, "documents"), tmp_path / "documents")
+    completed = subprocess.run([sys.executable, "codegen.py"], cwd=tmp_path, capture_output=True, text=True)
+    assert completed.returncode == 0, completed.stderr
+    with open(os.path.join(ROOT, "compiled_operations.py"), encoding="utf-8") as file:
+        assert (tmp_path / "compiled_operations.py").read_text(encoding="utf-8") == file.read()
+
+def test_operations_are_named_after_their_file(tmp_path):
+    (tmp_path / "GetAxie.graphql").write_text("query GetAxieDetail($axieId:ID!){axie(axieId:$axieId){id}}")
+    with pytest.raises(ValueError, match="named 'GetAxieDetail'"):
+        codegen.load(str(tmp_path))
+# ═════════════════════════════════════════════════════════════════════════════╝
@@ -0,0 +1,29 @@
+#╔═════════════════════════════════════════════════════════════════════════════╗
+#║══════════════════❯ 💫 AxieAPI | GraphQL | Sales Export Tests 💫
+#╚═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📦 Dependencies 📦
+# ╚════════❯ 📦 Internal Dependencies:
+from export import SalesArchive, SalesExporter
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🧪 Archive Scans 🧪
+def _sales(ids: range) -> dict:
+    return {"topSales": {"results": [
+        {"orderId": id, "timestamp": 1000 + id, "settlePrice": str(id), "settlePriceUsd": str(id / 10), "tokenAsset": {"__typename": "Axie", "id": str(id)}}
+        for id in ids
+    ]}}
+
+def test_scan_yields_lists_on_every_path(tmp_path):
+    with SalesExporter(str(tmp_path)) as exporter:
+        assert exporter.add("GetTopAllSales", _sales(range(1, 11))) == 10
+    archive = SalesArchive(str(tmp_path))
+    columns = ("timestamp", "id", "price_usd")
+    (unfiltered,) = archive.scan(columns)
+    (filtered,) = archive.scan(columns, start=1003, end=1005, kind="axies")
+    assert all(type(values) is list for values in (*unfiltered.values(), *filtered.values()))
+    assert unfiltered["timestamp"] == list(range(1001, 1011))
+    assert filtered == {"timestamp": [1003, 1004, 1005], "id": ["3", "4", "5"], "price_usd": [0.3, 0.4, 0.5]}
+# ═════════════════════════════════════════════════════════════════════════════╝
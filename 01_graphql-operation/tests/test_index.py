@@ -0,0 +1,71 @@
+#╔═════════════════════════════════════════════════════════════════════════════╗
+#║══════════════════❯ 💫 AxieAPI | GraphQL | Axie Index Tests 💫
+#╚═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📦 Dependencies 📦
+# ╚════════❯ 📦 Internal Dependencies:
+from index import AxieIndex
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🧪 Updates 🧪
+def _axie(id: str, cls: str = "Beast", price: str = None, started: int = 0) -> dict:
+    order = {"currentPriceUsd": price, "startedAt": started} if price is not None else None
+    return {"id": id, "class": cls, "stage": 4, "breedCount": 0, "parts": [], "order": order}
+
+def _consistent(index: AxieIndex) -> None:
+    # One entry per indexed axie in each sorted array:
+    for array in index._sorted:
+        assert sorted(entry[-1] for entry in array) == sorted(index._slots.values())
+
+def test_readd_replaces_previous_entries():
+    index = AxieIndex()
+    assert index.update([_axie("1", price="10"), _axie("2", price="20")]) == 2
+    assert index.update([_axie("1", cls="Aquatic", price="30")]) == 0
+    _consistent(index)
+    assert index.search({"classes": ["Beast"]})["total"] == 1
+    assert [axie["id"] for axie in index.search(sort="PriceAsc")["results"]] == ["2", "1"]
+
+def test_readd_after_remove_reuses_slot():
+    index = AxieIndex()
+    index.update([_axie("1", price="10"), _axie("2", price="20")])
+    assert index.remove(["1"]) == 1
+    assert index.update([_axie("1", price="5")]) == 1
+    _consistent(index)
+    assert [axie["id"] for axie in index.search(sort="PriceAsc")["results"]] == ["1", "2"]
+
+def test_duplicate_in_batch_last_copy_wins():
+    index = AxieIndex()
+    assert index.update([_axie("1", price="10"), _axie("2", price="20"), _axie("1", cls="Aquatic", price="30")]) == 2
+    _consistent(index)
+    assert len(index) == 2
+    assert index.get("1")["class"] == "Aquatic"
+    assert index.search({"classes": ["Beast"]})["total"] == 1
+    # Re-adding an indexed axie twice in one batch:
+    assert index.update([_axie("2", price="40"), _axie("2", price="1")]) == 0
+    _consistent(index)
+    assert [axie["id"] for axie in index.search(sort="PriceAsc")["results"]] == ["2", "1"]
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🧪 Price Windows 🧪
+def test_price_window_under_price_sort_scan():
+    index = AxieIndex()
+    index.update([_axie(str(id), cls="Aquatic", price=str(id)) for id in range(1, 200)])
+    # A small page over many matches: the sorted array is scanned.
+    for sort in ("PriceAsc", "PriceDesc"):
+        found = index.search({"classes": ["Aquatic"]}, sort=sort, size=20, min_price=50, max_price=60)
+        assert found["total"] == 11
+        ids = [int(axie["id"]) for axie in found["results"]]
+        assert ids == (list(range(50, 61)) if sort == "PriceAsc" else list(range(60, 49, -1)))
+
+def test_price_window_under_price_sort_few_matches():
+    index = AxieIndex()
+    # 19 Aquatic axies among many Beasts, so the matches are sorted rather than scanned:
+    index.update([_axie(str(id), price=str(id)) for id in range(1000, 3000)])
+    index.update([_axie(str(id), cls="Aquatic", price=str(id * 50)) for id in range(1, 20)])
+    found = index.search({"classes": ["Aquatic"]}, sort="PriceAsc", min_price=100, max_price=300)
+    assert found["total"] == 5
+    assert [axie["id"] for axie in found["results"]] == ["2", "3", "4", "5", "6"]
+# ═════════════════════════════════════════════════════════════════════════════╝
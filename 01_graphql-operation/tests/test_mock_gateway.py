@@ -0,0 +1,41 @@
+#╔═════════════════════════════════════════════════════════════════════════════╗
+#║══════════════════❯ 💫 AxieAPI | GraphQL | Mock Gateway Tests 💫
+#╚═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📦 Dependencies 📦
+# ╚════════❯ 📦 Built-in Dependencies:
+import collections
+import json
+from concurrent.futures import ThreadPoolExecutor
+# ╚════════❯ 📦 Internal Dependencies:
+import compiled_operations
+from mock_gateway import MockGateway
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🧪 Gateway 🧪
+def _body(name: str) -> bytes:
+    return json.dumps({"operationName": name, "query": compiled_operations.OPERATIONS[name]["query"], "variables": {}}).encode()
+
+def test_every_operation_is_answered():
+    gateway = MockGateway()
+    for name in compiled_operations.OPERATIONS:
+        status, _, payload = gateway.handle(_body(name))
+        response = json.loads(payload)
+        assert status == 200 and not response.get("errors"), (name, response.get("errors"))
+
+def test_stats_are_counted_under_concurrency():
+    gateway = MockGateway(error_rate=0.2, throttle_rate=0.2, server_error_rate=0.2, seed=1)
+    def request(_) -> tuple:
+        status, _, payload = gateway.handle(_body("GetAxieBrief"))
+        return status, status == 200 and bool(json.loads(payload).get("errors"))
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        outcomes = list(executor.map(request, range(4000)))
+    statuses = collections.Counter(status for status, _ in outcomes)
+    assert gateway.stats["requests"] == 4000
+    assert gateway.stats["throttled"] == statuses[429]
+    assert gateway.stats["server_errors"] == statuses[503]
+    assert gateway.stats["errors"] == sum(errored for _, errored in outcomes)
+    assert gateway.stats["GetAxieBrief"] == statuses[200]
+# ═════════════════════════════════════════════════════════════════════════════╝
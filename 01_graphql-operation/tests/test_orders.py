@@ -0,0 +1,89 @@
+#╔═════════════════════════════════════════════════════════════════════════════╗
+#║══════════════════❯ 💫 AxieAPI | GraphQL | Order Pipeline Tests 💫
+#╚═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📦 Dependencies 📦
+# ╚════════❯ 📦 Built-in Dependencies:
+import collections
+import threading
+# ╚════════❯ 📦 Internal Dependencies:
+from auth import LocalSigner, TokenManager
+from breaker import CircuitBreaker
+from client import GraphQLClient
+from mock_gateway import MockGateway
+from orders import OrderPipeline, build_orders, digest
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🧪 Order Pipeline 🧪
+ACCOUNT = "0x" + "cd" * 20
+PRICE = {"basePrice": "1000000000000000"}
+
+class Recorder:
+    """
+    A client recording the signature of every 'CreateOrder' sent, per order nonce.
+    """
+
+    def __init__(self, client: GraphQLClient) -> None:
+        self._client = client
+        self.sent = collections.defaultdict(list)
+        self._lock = threading.Lock()
+
+    def execute(self, name: str, variables: dict = None, headers: dict = None, split=None, account: str = None):
+        if name == "CreateOrder":
+            with self._lock:
+                self.sent[variables["order"]["nonce"]].append(variables["signature"])
+        return self._client.execute(name, variables, headers, split, account)
+
+class FailingSigner(LocalSigner):
+    """
+    A signer failing on the digests of some orders.
+    """
+
+    def __init__(self, address: str, failing: set) -> None:
+        super().__init__(address)
+        self.failing = failing
+
+    def sign(self, message: str) -> str:
+        if message in self.failing:
+            raise ValueError("The wallet refused to sign.")
+        return super().sign(message)
+
+def _pipeline(gateway: MockGateway, signer: LocalSigner, retries: int) -> tuple:
+    # A breaker that never opens: every failure comes from the injected faults.
+    breaker = CircuitBreaker(failure_threshold=10_000, min_calls=10_000)
+    client = GraphQLClient(gateway.url, tokens=TokenManager(signer, background=False), breaker=breaker)
+    recorder = Recorder(client)
+    return client, recorder, OrderPipeline(recorder, signer, concurrency=4, processes=0, chunk_size=8, retries=retries, backoff=0.0)
+
+def test_transient_failures_are_resent_with_same_signature():
+    signer = LocalSigner(ACCOUNT)
+    orders = build_orders(signer.address, list(range(1, 41)), PRICE)
+    with MockGateway(auth=True, server_error_rate=0.2, seed=3) as gateway:
+        client, recorder, pipeline = _pipeline(gateway, signer, retries=10)
+        with client:
+            results = pipeline.run(orders)
+    summary = OrderPipeline.summary(results)
+    assert summary["created"] == summary["orders"] == 40
+    assert summary["failed"] == summary["retryable"] == 0
+    assert summary["retried"] == sum(result.attempts > 1 for result in results) > 0
+    for result in results:
+        sent = recorder.sent[result.order["nonce"]]
+        assert len(sent) == result.attempts
+        assert set(sent) == {result.signature}
+
+def test_rejected_and_unsigned_orders_are_not_resent():
+    orders = build_orders(ACCOUNT, list(range(1, 21)), PRICE)
+    signer = FailingSigner(ACCOUNT, {digest(order) for order in orders[:5]})
+    rejected = {"errors": [{"message": "Invalid order.", "extensions": {"code": "GRAPHQL_VALIDATION_FAILED"}}]}
+    with MockGateway(auth=True, responses={"CreateOrder": rejected}) as gateway:
+        client, recorder, pipeline = _pipeline(gateway, signer, retries=3)
+        with client:
+            results = pipeline.run(orders)
+    assert OrderPipeline.summary(results) == {"orders": 20, "created": 0, "failed": 20, "retryable": 0, "retried": 0}
+    unsigned, signed = results[:5], results[5:]
+    assert all(result.signature is None and result.attempts == 0 and isinstance(result.error, ValueError) for result in unsigned)
+    assert not any(recorder.sent[result.order["nonce"]] for result in unsigned)
+    assert all(result.attempts == 1 and len(recorder.sent[result.order["nonce"]]) == 1 for result in signed)
+# ═════════════════════════════════════════════════════════════════════════════╝
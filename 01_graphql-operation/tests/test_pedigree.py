@@ -0,0 +1,65 @@
+#╔═════════════════════════════════════════════════════════════════════════════╗
+#║══════════════════❯ 💫 AxieAPI | GraphQL | Pedigree Crawler Tests 💫
+#╚═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📦 Dependencies 📦
+# ╚════════❯ 📦 Built-in Dependencies:
+from types import SimpleNamespace
+# ╚════════❯ 📦 Internal Dependencies:
+from pedigree import PedigreeCrawler
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🧪 Crawls 🧪
+# Axie ID -> (matron, sire): 5 and 6 are the children of 3 and 4, the children of 1 and 2.
+LINEAGE = {1: (0, 0), 2: (0, 0), 3: (1, 2), 4: (1, 2), 5: (3, 4), 6: (3, 4)}
+
+class Client:
+    """
+    Answers 'GetParentsBrief' and 'GetAxieBreedingBrief' from 'LINEAGE', counting the requested axies.
+    """
+
+    def __init__(self, down: set = ()) -> None:
+        self.requested = []
+        self.down = set(down)
+
+    def _axie(self, id: str) -> dict:
+        matron, sire = LINEAGE[int(id)]
+        children = [{"id": str(child)} for child, parents in LINEAGE.items() if int(id) in parents]
+        return {"id": id, "matronId": str(matron), "sireId": str(sire), "children": children}
+
+    def execute_batch(self, operations: list) -> list:
+        results = []
+        for _, variables in operations:
+            ids = list(variables.values())
+            self.requested.extend(ids)
+            if self.down & set(ids):
+                results.append(SimpleNamespace(ok=False, data=None))
+            else:
+                fields = ("matron", "sire") if len(ids) == 2 else ("axie",)
+                results.append(SimpleNamespace(ok=True, data={field: self._axie(id) for field, id in zip(fields, ids)}))
+        return results
+
+def test_second_crawl_sends_no_request():
+    client = Client()
+    crawler = PedigreeCrawler(client)
+    pedigree = crawler.crawl(["5"], ancestors=2, descendants=1)
+    assert sorted(pedigree.ancestors("5")) == ["1", "2", "3", "4"]
+    assert sorted(client.requested, key=int) == ["1", "2", "3", "4", "5"]
+    client.requested.clear()
+    crawler.crawl(["5"], ancestors=2, descendants=1)
+    assert client.requested == []
+    # The declared children of fetched axies are expanded from the pedigree:
+    crawler.crawl(["3"], ancestors=0, descendants=1)
+    assert sorted(client.requested, key=int) == ["6"]
+
+def test_failed_ids_are_retried_by_next_crawl():
+    client = Client(down={"3"})
+    crawler = PedigreeCrawler(client, batch_size=1)
+    crawler.crawl(["5"], ancestors=1)
+    assert 3 in crawler.failed and not crawler.pedigree.fetched("3")
+    client.down.clear()
+    crawler.crawl(["5"], ancestors=1)
+    assert not crawler.failed and crawler.pedigree.fetched("3")
+# ═════════════════════════════════════════════════════════════════════════════╝
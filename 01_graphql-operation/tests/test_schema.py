@@ -0,0 +1,41 @@
+#╔═════════════════════════════════════════════════════════════════════════════╗
+#║══════════════════❯ 💫 AxieAPI | GraphQL | Schema Tests 💫
+#╚═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📦 Dependencies 📦
+# ╚════════❯ 📦 Internal Dependencies:
+import compiled_operations
+import schema
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🧪 Validation 🧪
+SNAPSHOT = schema.load()
+
+def test_every_operation_validates_under_its_name():
+    for name, compiled in compiled_operations.OPERATIONS.items():
+        assert schema.validate(compiled["query"], SNAPSHOT, name) == [], name
+
+def test_operation_name_must_match_the_document():
+    query = compiled_operations.OPERATIONS["GetOwnerAccessoryList"]["query"]
+    errors = schema.validate(query, SNAPSHOT, "GetOwnerAccessoryListV2")
+    assert errors and "no operation named 'GetOwnerAccessoryListV2'" in errors[0]
+
+def test_list_fields_need_a_selection():
+    errors = schema.validate("query Q{axies{total results}}", SNAPSHOT)
+    assert errors == ["Q.axies.results: 'Axie' is a composite type, it needs a selection."]
+
+def test_list_shapes_conflict_when_merged():
+    errors = schema.validate("query Q($id:ID!){axie(axieId:$id){parts{id} ...on Axie{parts:children{id}}}}", SNAPSHOT)
+    assert any("selects different fields" in error for error in errors)
+
+def test_required_arguments_and_variable_types():
+    assert any("required argument 'axieId: ID!'" in error for error in schema.validate("query Q{axie{id}}", SNAPSHOT))
+    errors = schema.validate("query Q($sort:Sorting){axies(sort:$sort){total}}", SNAPSHOT)
+    assert any("unknown or non-input type 'Sorting'" in error for error in errors)
+    assert schema.validate("query Q($id:String!){axie(axieId:$id){id}}", SNAPSHOT)
+
+def test_snapshot_is_not_inferred():
+    assert SNAPSHOT["source"] != "inferred"
+# ═════════════════════════════════════════════════════════════════════════════╝
@@ -0,0 +1,48 @@
+#╔═════════════════════════════════════════════════════════════════════════════╗
+#║══════════════════❯ 💫 AxieAPI | GraphQL | SQLite Sink Tests 💫
+#╚═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📦 Dependencies 📦
+# ╚════════❯ 📦 Built-in Dependencies:
+import sqlite3
+# ╚════════❯ 📦 Internal Dependencies:
+from sink import SQLiteSink
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🧪 Upserts 🧪
+def _axie(path: str, id: str) -> tuple:
+    with sqlite3.connect(path) as connection:
+        return connection.execute("SELECT owner, owner_name, class, order_id FROM axies WHERE id = ?", (id,)).fetchone()
+
+def test_selected_null_clears_stored_value(tmp_path):
+    path = str(tmp_path / "axies.db")
+    with SQLiteSink(path) as sink:
+        sink.write("AxieBrief", [{"id": "1", "owner": "0xa", "ownerProfile": {"name": "A"}, "class": "Beast", "order": {"id": 7}}])
+        sink.flush()
+        assert _axie(path, "1") == ("0xa", "A", "Beast", 7)
+        # Delisted, and transferred to an account without a profile:
+        sink.write("AxieBrief", [{"id": "1", "owner": "0xb", "ownerProfile": None, "class": "Beast", "order": None}])
+        sink.flush()
+        assert _axie(path, "1") == ("0xb", None, "Beast", None)
+
+def test_unselected_field_keeps_stored_value(tmp_path):
+    path = str(tmp_path / "axies.db")
+    with SQLiteSink(path) as sink:
+        sink.write("AxieBrief", [{"id": "1", "owner": "0xa", "ownerProfile": {"name": "A"}, "class": "Beast", "order": {"id": 7}}])
+        # A partial fragment ('owner', 'ownerProfile' and 'order' not selected):
+        sink.write("AxieSettledBrief", [{"id": "1", "class": "Aquatic"}])
+        sink.flush()
+        assert _axie(path, "1") == ("0xa", "A", "Aquatic", 7)
+
+def test_last_write_of_a_batch_wins(tmp_path):
+    path = str(tmp_path / "axies.db")
+    with SQLiteSink(path, batch_size=100) as sink:
+        sink.write("AxieBrief", [
+            {"id": "1", "owner": "0xa", "class": "Beast", "order": {"id": 7}},
+            {"id": "1", "class": "Plant"},
+            {"id": "1", "owner": "0xc", "class": "Bird", "order": None},
+        ])
+    assert _axie(path, "1") == ("0xc", None, "Bird", None)
+# ═════════════════════════════════════════════════════════════════════════════╝
@@ -0,0 +1,55 @@
+#╔═════════════════════════════════════════════════════════════════════════════╗
+#║══════════════════❯ 💫 AxieAPI | GraphQL | Price Time Series Tests 💫
+#╚═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📦 Dependencies 📦
+# ╚════════❯ 📦 Internal Dependencies:
+from timeseries import DAY, TimeSeriesStore
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🧪 Quantiles 🧪
+NOW = 1_700_000_000
+
+def test_quantile_is_exact_while_ring_is_not_full():
+    store = TimeSeriesStore(clock=lambda: NOW)
+    # The window starts before the first sale (the ring doesn't cover it, but holds every sale):
+    for offset, price in enumerate((1.0, 2.0, 3.0, 100.0)):
+        store.add(("axies",), NOW - 3600 + offset, price)
+    assert store.median(("axies",), window=7 * DAY) == 2.5
+    assert store.quantile(("axies",), 0.0, window=7 * DAY) == 1.0
+    assert store.quantile(("axies",), 1.0, window=7 * DAY) == 100.0
+
+def test_quantile_reads_histograms_once_ring_is_full():
+    store = TimeSeriesStore(capacity=4, clock=lambda: NOW)
+    for offset, price in enumerate((1.0, 2.0, 3.0, 100.0, 4.0)):
+        store.add(("axies",), NOW - 3600 + offset, price)
+    # The first sale was overwritten: approximate (≤1.6% error), over all 5 sales:
+    assert abs(store.median(("axies",), window=7 * DAY) - 3.0) < 0.05
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🧪 Dedup 🧪
+SETTLED = {"settledAuctions": {"axies": {"results": [{
+    "id": "42", "class": "Aquatic", "breedCount": 0,
+    "transferHistory": {"results": [{"txHash": "0xabc", "timestamp": NOW - 60, "withPrice": "5000000000000000", "withPriceUsd": "12.5"}]},
+}]}}}
+TOP_SALES = {"topSales": {"results": [{
+    "orderId": 7, "timestamp": NOW - 60, "settlePrice": "5000000000000000", "settlePriceUsd": "12.5",
+    "tokenAsset": {"__typename": "Axie", "id": "42", "class": "Aquatic", "breedCount": 0},
+}]}}
+
+def test_sale_seen_through_both_sources_counts_once():
+    store = TimeSeriesStore(clock=lambda: NOW)
+    assert store.write("GetRecentlySoldAxies", SETTLED) == 1
+    assert store.write("GetTopAllSales", TOP_SALES) == 0
+    assert store.write("GetRecentlySoldAxies", SETTLED) == 0
+    assert store.summary(("axies", "Aquatic", 0))["count"] == 1
+
+def test_distinct_sales_are_kept():
+    store = TimeSeriesStore(clock=lambda: NOW)
+    store.write("GetRecentlySoldAxies", SETTLED)
+    resold = {"topSales": {"results": [{**TOP_SALES["topSales"]["results"][0], "orderId": 8, "timestamp": NOW - 30}]}}
+    assert store.write("GetTopAllSales", resold) == 1
+# ═════════════════════════════════════════════════════════════════════════════╝
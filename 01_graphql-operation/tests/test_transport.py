@@ -0,0 +1,60 @@
+#╔═════════════════════════════════════════════════════════════════════════════╗
+#║══════════════════❯ 💫 AxieAPI | GraphQL | Transport Tests 💫
+#╚═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📦 Dependencies 📦
+# ╚════════❯ 📦 Built-in Dependencies:
+import socket
+# ╚════════❯ 📦 External Dependencies:
+import pytest
+# ╚════════❯ 📦 Internal Dependencies:
+from transport import Cancellation, _H2Connection
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🧪 HTTP/2 Streams 🧪
+pytest.importorskip("h2")
+
+class FailingSocket:
+    """
+    A socket whose writes fail once 'fail' is set (the peer never answers).
+    """
+
+    def __init__(self, sock: socket.socket) -> None:
+        self._sock = sock
+        self.fail = False
+
+    def sendall(self, data: bytes) -> None:
+        if self.fail:
+            raise ConnectionResetError("The peer reset the connection.")
+        self._sock.sendall(data)
+
+    def recv(self, size: int) -> bytes:
+        return self._sock.recv(size)
+
+    def shutdown(self, how: int) -> None:
+        self._sock.shutdown(how)
+
+    def close(self) -> None:
+        self._sock.close()
+
+def test_failed_send_frees_stream_slot():
+    ours, peer = socket.socketpair()
+    sock = FailingSocket(ours)
+    connection = _H2Connection(sock, max_streams=1, window=65535)
+    headers = [(":method", "POST"), (":scheme", "https"), (":authority", "localhost"), (":path", "/graphql")]
+    try:
+        sock.fail = True
+        with pytest.raises(ConnectionResetError):
+            connection.request(headers, b"{}", 1.0, Cancellation())
+        assert connection.active == 0
+        # The only slot is free again: the next request is sent, and waits for its response.
+        sock.fail = False
+        with pytest.raises(TimeoutError, match="response timed out"):
+            connection.request(headers, b"{}", 0.2, Cancellation())
+        assert connection.active == 0
+    finally:
+        connection.close()
+        peer.close()
+# ═════════════════════════════════════════════════════════════════════════════╝
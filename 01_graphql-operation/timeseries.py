@@ -0,0 +1,419 @@
+#╔═════════════════════════════════════════════════════════════════════════════╗
+#║══════════════════❯ 💫 AxieAPI | GraphQL | Price Time Series 💫
+#╚═════════════════════════════════════════════════════════════════════════════╝
+# Keeps settlement prices per segment (e.g. '("axies", "Aquatic", 0)': Aquatic axies bred 0 times),
+# in bounded memory, rolled up into minute, hour and day buckets:
+#   store = TimeSeriesStore()
+#   store.write("GetRecentlySoldAxies", result.data)
+#   store.median(("axies", "Aquatic", 0), window=7 * DAY), store.ohlc(("axies", "Aquatic"), "hour")
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📦 Dependencies 📦
+# ╚════════❯ 📦 Built-in Dependencies:
+import collections
+import math
+import threading
+import time
+from array import array
+# ╚════════❯ 📦 External Dependencies:
+# ╚════════❯ 📦 Internal Dependencies:
+from export import KINDS
+from metrics import _bucket, _lower_bound
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🕯 Rollups 🕯
+MINUTE, HOUR, DAY = 60, 3600, 86400
+# Resolution name -> (bucket seconds, buckets kept):
+RESOLUTIONS = {"minute": (MINUTE, 24 * 60), "hour": (HOUR, 90 * 24), "day": (DAY, 2 * 365)}
+
+def _cents(price: float) -> int:
+    return max(0, int(price * 100))
+
+class Rollup:
+    """
+    A class that holds the OHLC, volume, count and price histogram of fixed-width time buckets,
+    in a ring of parallel arrays (the oldest bucket is overwritten by the newest).
+    """
+
+    __slots__ = ("seconds", "capacity", "starts", "open", "high", "low", "close", "opened_at", "closed_at", "volume", "count", "histograms")
+
+    def __init__(self, seconds: int, capacity: int) -> None:
+        self.seconds = seconds
+        self.capacity = capacity
+        self.starts = array("q", [-1]) * capacity
+        self.open = array("d", [0.0]) * capacity
+        self.high = array("d", [0.0]) * capacity
+        self.low = array("d", [0.0]) * capacity
+        self.close = array("d", [0.0]) * capacity
+        self.opened_at = array("q", [0]) * capacity
+        self.closed_at = array("q", [0]) * capacity
+        self.volume = array("d", [0.0]) * capacity
+        self.count = array("q", [0]) * capacity
+        # Sparse log-linear histograms of prices in cents (cf. 'metrics.Histogram', ≤1.6% error):
+        self.histograms = [None] * capacity
+
+    def add(self, timestamp: int, price: float) -> bool:
+        """
+        Adds a sale to its bucket.
+
+        Returns:
+            ➤ bool: False if the bucket is older than the ring (the sale is dropped).
+        """
+
+        start = timestamp - timestamp % self.seconds
+        slot = (start // self.seconds) % self.capacity
+        if self.starts[slot] != start:
+            if self.starts[slot] > start:
+                return False
+            self.starts[slot] = start
+            self.open[slot] = self.high[slot] = self.low[slot] = self.close[slot] = price
+            self.opened_at[slot] = self.closed_at[slot] = timestamp
+            self.volume[slot] = 0.0
+            self.count[slot] = 0
+            self.histograms[slot] = {}
+        if price > self.high[slot]:
+            self.high[slot] = price
+        if price < self.low[slot]:
+            self.low[slot] = price
+        if timestamp < self.opened_at[slot]:
+            self.open[slot], self.opened_at[slot] = price, timestamp
+        if timestamp >= self.closed_at[slot]:
+            self.close[slot], self.closed_at[slot] = price, timestamp
+        self.volume[slot] += price
+        self.count[slot] += 1
+        histogram, bucket = self.histograms[slot], _bucket(_cents(price))
+        histogram[bucket] = histogram.get(bucket, 0) + 1
+        return True
+
+    def slots(self, start: int, end: int):
+        """
+        Yields the ring slots of the buckets within '[start, end)', oldest first (at most 'capacity' of them).
+        """
+
+        first = max(start, end - self.capacity * self.seconds)
+        first -= first % self.seconds
+        for bucket_start in range(first, end, self.seconds):
+            slot = (bucket_start // self.seconds) % self.capacity
+            if self.starts[slot] == bucket_start:
+                yield slot
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📈 Series 📈
+class Series:
+    """
+    A class that holds the prices of one segment: the latest 'capacity' sales in a ring buffer
+    (for exact statistics over recent windows), and their rollups.
+    """
+
+    def __init__(self, capacity: int = 4096, resolutions: dict = None) -> None:
+        self.capacity = capacity
+        self.timestamps = array("q", [0]) * capacity
+        self.prices = array("d", [0.0]) * capacity
+        self.size = 0
+        self.head = 0
+        self.version = 0
+        self.rollups = {name: Rollup(seconds, buckets) for name, (seconds, buckets) in (resolutions or RESOLUTIONS).items()}
+
+    def add(self, timestamp: int, price: float) -> None:
+        self.timestamps[self.head] = timestamp
+        self.prices[self.head] = price
+        self.head = (self.head + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+        self.version += 1
+        for rollup in self.rollups.values():
+            rollup.add(timestamp, price)
+
+    def oldest(self) -> int:
+        """
+        The timestamp of the oldest sale in the ring buffer (sales may arrive out of order: a lower bound).
+        """
+
+        if self.size < self.capacity:
+            return min(self.timestamps[:self.size]) if self.size else None
+        return self.timestamps[self.head]
+
+    def recent(self, start: int, end: int) -> list:
+        """
+        The prices of the ring buffer within '[start, end)'.
+        """
+
+        timestamps, prices = self.timestamps[:self.size], self.prices[:self.size]
+        return [price for timestamp, price in zip(timestamps, prices) if start <= timestamp < end]
+
+class TimeSeriesStore:
+    """
+    A class that stores settlement prices (USD) per segment, with bounded memory: each segment keeps its latest
+    sales (cf. 'Series') and minute/hour/day OHLC and volume buckets (cf. 'RESOLUTIONS').
+
+    Quantiles over a window are exact while the ring buffer of recent sales holds every sale of the segment or
+    covers the window, else read from the histograms of the coarsest buckets covering it. They are cached until the segment gets a new sale
+    (windows ending now are aligned on the minute, so repeated queries hit the cache).
+    """
+
+    def __init__(self, capacity: int = 4096, resolutions: dict = None, dedup_window: int = 100_000, clock=time.time) -> None:
+        """
+        Initializes a 'TimeSeriesStore' instance.
+
+        Args:
+            ➤ capacity (int): The recent sales kept per segment.
+            ➤ resolutions (dict): The rollups, as name -> (bucket seconds, buckets kept) ('RESOLUTIONS' by default).
+            ➤ dedup_window (int): The number of recent sales remembered to drop duplicates across polls.
+            ➤ clock (callable): The Unix time clock (the default end of query windows).
+        """
+
+        self._capacity = capacity
+        self._resolutions = dict(resolutions or RESOLUTIONS)
+        self._series = {}
+        self._seen = collections.OrderedDict()
+        self._dedup_window = dedup_window
+        self._clock = clock
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__module__}.{self.__class__.__name__} {len(self._series)} segments object at {hex(id(self))}>"
+
+    def segments(self, prefix: tuple = ()) -> list:
+        """
+        The segments starting with 'prefix' (e.g. '("axies",)').
+        """
+
+        prefix = tuple(prefix)
+        return [segment for segment in list(self._series) if segment[:len(prefix)] == prefix]
+
+    def add(self, segment: tuple, timestamp: int, price: float) -> None:
+        """
+        Records a price of a segment.
+        """
+
+        if price is None or math.isnan(price):
+            return
+        with self._lock:
+            series = self._series.get(segment)
+            if series is None:
+                series = self._series[segment] = Series(self._capacity, self._resolutions)
+            series.add(int(timestamp), float(price))
+
+    def write(self, operation: str, data: dict) -> int:
+        """
+        Records the sales of a response (cf. 'segments_of'), dropping the ones already recorded.
+
+        Args:
+            ➤ operation (str): The operation name ('GetRecentlySold*', 'GetTopSales', 'GetTopAllSales'
+                               or 'GetSettlementStats').
+            ➤ data (dict): The response 'data'.
+
+        Returns:
+            ➤ int: The number of new sales.
+        """
+
+        if operation == "GetSettlementStats":
+            return self._write_stats(data or {})
+        added = 0
+        for kind, asset, key, timestamp, price in _sales(data or {}):
+            with self._lock:
+                if key in self._seen:
+                    continue
+                self._seen[key] = None
+                if len(self._seen) > self._dedup_window:
+                    self._seen.popitem(last=False)
+            for segment in segments_of(kind, asset):
+                self.add(segment, timestamp, price)
+            added += 1
+        return added
+
+    def _write_stats(self, data: dict) -> int:
+        """
+        Records the 'GetSettlementStats' figures as '("settlement", period, field)' segments, timestamped now.
+        """
+
+        now, added = int(self._clock()), 0
+        for period, stats in ((data.get("marketStats") or {}).items()):
+            if not isinstance(stats, dict):
+                continue
+            for field in ("count", "axieCount", "volume", "volumeUsd"):
+                if stats.get(field) is not None:
+                    self.add(("settlement", period, field), now, float(stats[field]))
+                    added += 1
+        return added
+
+    def ohlc(self, segment: tuple, resolution: str = "hour", start: int = None, end: int = None) -> list:
+        """
+        The buckets of a segment within '[start, end)' (the whole ring of the resolution by default).
+
+        Returns:
+            ➤ list: Dicts of 'start', 'open', 'high', 'low', 'close', 'volume' and 'count', oldest first.
+
+        Raises:
+            ➤ KeyError: If 'resolution' is unknown.
+        """
+
+        series = self._series.get(tuple(segment))
+        if series is None:
+            return []
+        rollup = series.rollups[resolution]
+        end = int(self._clock()) + 1 if end is None else end
+        start = end - rollup.capacity * rollup.seconds if start is None else start
+        with self._lock:
+            return [
+                {
+                    "start": rollup.starts[slot], "open": rollup.open[slot], "high": rollup.high[slot], "low": rollup.low[slot],
+                    "close": rollup.close[slot], "volume": rollup.volume[slot], "count": rollup.count[slot],
+                }
+                for slot in rollup.slots(start, end)
+            ]
+
+    def _rollup(self, series: Series, window: int) -> Rollup:
+        """
+        The rollup a window is read from: the coarsest one covering it with buckets of at most 1/24th of it
+        (fewer buckets to merge), else the finest one covering it, else the one spanning the longest.
+        """
+
+        rollups = series.rollups.values()
+        covering = [rollup for rollup in rollups if rollup.seconds * rollup.capacity >= window]
+        if not covering:
+            return max(rollups, key=lambda rollup: rollup.seconds * rollup.capacity)
+        precise = [rollup for rollup in covering if rollup.seconds * 24 <= window]
+        return max(precise, key=lambda rollup: rollup.seconds) if precise else min(covering, key=lambda rollup: rollup.seconds)
+
+    def quantile(self, segment: tuple, q: float, window: int = 7 * DAY, end: int = None) -> float:
+        """
+        A price quantile of a segment over the last 'window' seconds before 'end' (now by default).
+
+        Returns:
+            ➤ float: The quantile, or None if the segment has no sale in the window.
+
+        Raises:
+            ➤ ValueError: If 'q' is not in [0, 1].
+        """
+
+        if not 0 <= q <= 1:
+            raise ValueError(f"'q' ({q}) must be in [0, 1].")
+        series = self._series.get(tuple(segment))
+        if series is None:
+            return None
+        if end is None:
+            end = int(self._clock()) + 1
+            end += -end % MINUTE
+        key = (tuple(segment), q, window, end)
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] == series.version:
+            return cached[1]
+        value = self._quantile(series, q, end - window, end)
+        if len(self._cache) >= 10_000:
+            self._cache.clear()
+        self._cache[key] = (series.version, value)
+        return value
+
+    def _quantile(self, series: Series, q: float, start: int, end: int) -> float:
+        with self._lock:
+            oldest = series.oldest()
+            if series.size < series.capacity or (oldest is not None and oldest <= start):
+                # The ring buffer holds every sale of the segment, or covers the window: exact.
+                prices = sorted(series.recent(start, end))
+                if not prices:
+                    return None
+                position = q * (len(prices) - 1)
+                low = int(position)
+                return prices[low] + (prices[min(low + 1, len(prices) - 1)] - prices[low]) * (position - low)
+
+            rollup, counts = self._rollup(series, end - start), {}
+            for slot in rollup.slots(start, end):
+                for bucket, count in rollup.histograms[slot].items():
+                    counts[bucket] = counts.get(bucket, 0) + count
+        total = sum(counts.values())
+        if not total:
+            return None
+        rank, seen = max(1, math.ceil(total * q)), 0
+        for bucket in sorted(counts):
+            seen += counts[bucket]
+            if seen >= rank:
+                return (_lower_bound(bucket) + _lower_bound(bucket + 1)) / 200
+        return None
+
+    def median(self, segment: tuple, window: int = 7 * DAY, end: int = None) -> float:
+        """
+        The median price of a segment over a window (cf. 'quantile').
+        """
+
+        return self.quantile(segment, 0.5, window, end)
+
+    def summary(self, segment: tuple, window: int = DAY, end: int = None) -> dict:
+        """
+        The count, volume, low, high and mean price of a segment over a window, from its rollup buckets.
+        """
+
+        series = self._series.get(tuple(segment))
+        summary = {"count": 0, "volume": 0.0, "low": None, "high": None, "mean": None}
+        if series is None:
+            return summary
+        end = int(self._clock()) + 1 if end is None else end
+        with self._lock:
+            rollup = self._rollup(series, window)
+            for slot in rollup.slots(end - window, end):
+                summary["count"] += rollup.count[slot]
+                summary["volume"] += rollup.volume[slot]
+                summary["low"] = rollup.low[slot] if summary["low"] is None else min(summary["low"], rollup.low[slot])
+                summary["high"] = rollup.high[slot] if summary["high"] is None else max(summary["high"], rollup.high[slot])
+        if summary["count"]:
+            summary["mean"] = summary["volume"] / summary["count"]
+        return summary
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🔀 Sales Extraction 🔀
+def segments_of(kind: str, asset: dict) -> list:
+    """
+    The segments of a sold asset: its kind, then axies by class and by class and breed count,
+    lands by type, and items by alias.
+    """
+
+    segments = [(kind,)]
+    if kind == "axies" and asset.get("class"):
+        segments.append((kind, asset["class"]))
+        if asset.get("breedCount") is not None:
+            segments.append((kind, asset["class"], asset["breedCount"]))
+    elif kind == "lands" and asset.get("landType"):
+        segments.append((kind, asset["landType"]))
+    elif kind == "items" and asset.get("itemAlias"):
+        segments.append((kind, asset["itemAlias"]))
+    return segments
+
+def _asset_id(asset: dict):
+    return asset.get("id") or asset.get("tokenId") or asset.get("listingIndex") or asset.get("erc1155TokenId")
+
+def _sale_key(kind: str, asset: dict, timestamp, wei) -> tuple:
+    """
+    The dedup key of a sale, from the fields both sources select: 'settledAuctions' records have a 'txHash'
+    and 'topSales' an 'orderId', but not the other, so a sale polled through both would otherwise count twice.
+    The wei price tells apart same-second sales of a fungible (ERC-1155) token.
+    """
+
+    return kind, _asset_id(asset), int(timestamp or 0), wei
+
+def _sales(data: dict):
+    """
+    Yields the priced sales of a response, as '(kind, asset, dedup key, timestamp, price USD)'
+    ('settledAuctions' transfer records, or 'topSales').
+    """
+
+    for kind, page in (data.get("settledAuctions") or {}).items():
+        if not isinstance(page, dict):
+            continue
+        for asset in page.get("results") or ():
+            for record in (asset.get("transferHistory") or {}).get("results") or ():
+                if record.get("withPriceUsd") is not None:
+                    key = _sale_key(kind, asset, record.get("timestamp"), record.get("withPrice"))
+                    yield kind, asset, key, int(record.get("timestamp") or 0), float(record["withPriceUsd"])
+    for sale in ((data.get("topSales") or {}).get("results")) or ():
+        asset = next(
+            (sale[key] for key in ("tokenAsset", "axie", "equipment", "erc1155", "landPlot", "landItem") if sale.get(key)),
+            {}
+        )
+        if sale.get("settlePriceUsd") is not None:
+            kind = KINDS.get(asset.get("__typename"), "")
+            key = _sale_key(kind, asset, sale.get("timestamp"), sale.get("settlePrice"))
+            yield kind, asset, key, int(sale.get("timestamp") or 0), float(sale["settlePriceUsd"])
+# ═════════════════════════════════════════════════════════════════════════════╝
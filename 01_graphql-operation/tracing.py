@@ -0,0 +1,249 @@
+#╔═════════════════════════════════════════════════════════════════════════════╗
+#║══════════════════❯ 💫 AxieAPI | GraphQL | Tracing 💫
+#╚═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📦 Dependencies 📦
+# ╚════════❯ 📦 Built-in Dependencies:
+import contextvars
+import functools
+import json
+import logging
+import os
+import threading
+import time
+# ╚════════❯ 📦 External Dependencies:
+# ╚════════❯ 📦 Internal Dependencies:
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🧵 Span 🧵
+_current = contextvars.ContextVar("span", default=None)
+_exporters = []
+_lock = threading.Lock()
+
+def _new_id(bits: int) -> str:
+    return f"{int.from_bytes(os.urandom(bits // 8), 'big'):0{bits // 4}x}"
+
+class Span:
+    """
+    A class that represents one timed step of an operation (compile, send, decode, ...).
+    Spans of a same logical call share their 'trace_id', and point to their parent through 'parent_id'.
+    """
+
+    __slots__ = ("name", "trace_id", "span_id", "parent_id", "attributes", "links", "start", "end", "error", "_token")
+
+    def __init__(self, name: str, parent: "Span" = None, attributes: dict = None, links: list = None) -> None:
+        """
+        Initializes a 'Span' instance.
+
+        Args:
+            ➤ name (str): The span name (e.g. 'graphql.send').
+            ➤ parent (Span): The parent span (None for a new trace).
+            ➤ attributes (dict): The span attributes.
+            ➤ links (list): Spans of other traces this span relates to (e.g. the calls merged into a batch).
+        """
+
+        self.name = name
+        self.trace_id = parent.trace_id if parent else _new_id(128)
+        self.span_id = _new_id(64)
+        self.parent_id = parent.span_id if parent else None
+        self.attributes = attributes or {}
+        self.links = [(link.trace_id, link.span_id) for link in links or ()]
+        self.start = None
+        self.end = None
+        self.error = None
+        self._token = None
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__module__}.{self.__class__.__name__} '{self.name}' {self.trace_id}/{self.span_id} object at {hex(id(self))}>"
+
+    def __enter__(self) -> "Span":
+        self.start = time.perf_counter()
+        self._token = _current.set(self)
+        for exporter in _exporters:
+            exporter.on_start(self)
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.end = time.perf_counter()
+        if exc is not None:
+            self.error = repr(exc)
+        _current.reset(self._token)
+        for exporter in _exporters:
+            exporter.on_end(self)
+
+    @property
+    def duration(self) -> float:
+        """
+        The span duration, in seconds.
+        """
+
+        return (self.end or time.perf_counter()) - self.start
+
+    def set(self, key: str, value) -> None:
+        """
+        Sets an attribute.
+        """
+
+        self.attributes[key] = value
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "attributes": self.attributes,
+            "links": self.links,
+            "duration": self.duration,
+            "error": self.error,
+        }
+
+class _NoopSpan:
+    """
+    The span returned while tracing is disabled: entering, exiting and setting attributes do nothing.
+    """
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+    def set(self, key: str, value) -> None:
+        pass
+
+_NOOP = _NoopSpan()
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🪝 Hooks 🪝
+def span(name: str, links: list = None, **attributes):
+    """
+    Opens a span, child of the current one (use as a context manager).
+    Returns a shared no-op span while no exporter is registered.
+
+    Args:
+        ➤ name (str): The span name.
+        ➤ links (list): Spans of other traces this span relates to.
+        ➤ attributes: The span attributes.
+    """
+
+    if not _exporters:
+        return _NOOP
+    return Span(name, _current.get(), attributes, links)
+
+def current():
+    """
+    Returns the current span (None outside of any span, or while tracing is disabled).
+    """
+
+    return _current.get()
+
+def enabled() -> bool:
+    """
+    Whether at least one exporter is registered.
+    """
+
+    return bool(_exporters)
+
+def add_exporter(exporter) -> None:
+    """
+    Registers an exporter: an object with 'on_start(span)' and 'on_end(span)' methods.
+    """
+
+    global _exporters
+    with _lock:
+        _exporters = [*_exporters, exporter]
+
+def remove_exporter(exporter) -> None:
+    global _exporters
+    with _lock:
+        _exporters = [registered for registered in _exporters if registered is not exporter]
+
+def wrap(function):
+    """
+    Binds a function to the current context, so spans opened by it in another thread
+    (e.g. submitted to a 'ThreadPoolExecutor') stay children of the current span.
+    """
+
+    context = contextvars.copy_context()
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        return context.copy().run(function, *args, **kwargs)
+    return wrapper
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📤 Exporters 📤
+class Exporter:
+    """
+    A base class for exporters: both callbacks are no-ops.
+    """
+
+    def on_start(self, span: Span) -> None:
+        pass
+
+    def on_end(self, span: Span) -> None:
+        pass
+
+class InMemoryExporter(Exporter):
+    """
+    An exporter that keeps the last 'size' finished spans (e.g. for tests and notebooks).
+    """
+
+    def __init__(self, size: int = 10_000) -> None:
+        self._size = size
+        self.spans = []
+
+    def on_end(self, span: Span) -> None:
+        self.spans.append(span)
+        if len(self.spans) > self._size:
+            del self.spans[:len(self.spans) - self._size]
+
+    def trace(self, trace_id: str) -> list:
+        """
+        Returns the finished spans of a trace, and of the spans linked to it.
+        """
+
+        return [
+            span for span in self.spans
+            if span.trace_id == trace_id or any(link[0] == trace_id for link in span.links)
+        ]
+
+class LoggingExporter(Exporter):
+    """
+    An exporter that logs every finished span.
+    """
+
+    def __init__(self, logger: logging.Logger = None, level: int = logging.DEBUG) -> None:
+        self._logger = logger or logging.getLogger("axie.graphql.tracing")
+        self._level = level
+
+    def on_end(self, span: Span) -> None:
+        self._logger.log(
+            self._level, "%s %.3fms trace=%s span=%s parent=%s %s",
+            span.name, span.duration * 1000, span.trace_id, span.span_id, span.parent_id, span.attributes
+        )
+
+class JSONLinesExporter(Exporter):
+    """
+    An exporter that appends every finished span to a JSON lines file.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._file = open(path, "a")
+        self._lock = threading.Lock()
+
+    def on_end(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+# ═════════════════════════════════════════════════════════════════════════════╝
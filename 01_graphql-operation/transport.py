@@ -0,0 +1,1063 @@
+#╔═════════════════════════════════════════════════════════════════════════════╗
+#║══════════════════❯ 💫 AxieAPI | GraphQL | Transport 💫
+#╚═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📦 Dependencies 📦
+# ╚════════❯ 📦 Built-in Dependencies:
+import base64
+import collections
+import contextvars
+import functools
+import gzip
+import http.client
+import json
+import queue
+import socket
+import ssl
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+# ╚════════❯ 📦 External Dependencies:
+try:
+    import h2.config
+    import h2.connection
+    import h2.errors
+    import h2.events
+    import h2.exceptions
+    import h2.settings
+except ImportError:
+    h2 = None
+try:
+    import brotli
+except ImportError:
+    brotli = None
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+# ╚════════❯ 📦 Internal Dependencies:
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📨 Response 📨
+class Response:
+    """
+    A class that represents a raw HTTP response of the gateway.
+    """
+
+    __slots__ = ("status", "headers", "body", "elapsed", "timings", "wire_bytes")
+
+    def __init__(self, status: int, headers: dict, body: bytes, elapsed: float, timings: dict = None, wire_bytes: int = None) -> None:
+        """
+        Initializes a 'Response' instance.
+
+        Args:
+            ➤ status (int): The HTTP status code.
+            ➤ headers (dict): The response headers (lower-case names, as received).
+            ➤ body (bytes): The response body (decompressed, cf. 'Decoder').
+            ➤ elapsed (float): The round-trip time, in seconds.
+            ➤ timings (dict): The time spent per phase, in seconds (cf. 'PHASES').
+            ➤ wire_bytes (int): The body size as received, before decompression ('len(body)' by default).
+        """
+
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.elapsed = elapsed
+        self.timings = timings or {}
+        self.wire_bytes = len(body) if wire_bytes is None else wire_bytes
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__module__}.{self.__class__.__name__} {self.status} ({len(self.body)} bytes) object at {hex(id(self))}>"
+
+# Request phases timed by 'HTTPTransport' ('dns', 'connect' and 'tls' are 0 on reused connections):
+PHASES = ("dns", "connect", "tls", "send", "ttfb", "download")
+CHUNK_SIZE = 64 * 1024
+
+def encode(payload) -> bytes:
+    """
+    Encodes a payload (an operation dict, or a list of them for a batch) as compact JSON.
+    """
+
+    return json.dumps(payload, separators=(",", ":")).encode()
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🗜 Compression 🗜
+# The supported content codings, in order of preference ('br' and 'zstd' need the optional 'brotli' and 'zstandard' packages):
+ENCODINGS = tuple(encoding for encoding, available in (("zstd", zstandard), ("br", brotli), ("gzip", True), ("deflate", True)) if available)
+ACCEPT_ENCODING = ", ".join(ENCODINGS)
+
+def compress(data: bytes, encoding: str, level: int = None) -> bytes:
+    """
+    Compresses data with a content coding (e.g. for the mock gateway, or to benchmark decoding).
+
+    Raises:
+        ➤ ValueError: If the encoding is not supported.
+    """
+
+    if encoding == "gzip":
+        return gzip.compress(data, 6 if level is None else level, mtime=0)
+    elif encoding == "deflate":
+        # 'deflate' is the zlib format (RFC 9110), not raw deflate.
+        return zlib.compress(data, 6 if level is None else level)
+    elif encoding == "br" and brotli is not None:
+        return brotli.compress(data, quality=5 if level is None else level)
+    elif encoding == "zstd" and zstandard is not None:
+        return zstandard.ZstdCompressor(level=3 if level is None else level).compress(data)
+    elif encoding in ("identity", ""):
+        return data
+    raise ValueError(f"Content coding '{encoding}' is not supported (supported: {', '.join(ENCODINGS)}).")
+
+class Decoder:
+    """
+    A class that decompresses a response body incrementally, as its chunks arrive.
+    """
+
+    __slots__ = ("encoding", "wire_bytes", "_decompress", "_flush")
+
+    def __init__(self, encoding: str = None) -> None:
+        """
+        Initializes a 'Decoder' instance.
+
+        Args:
+            ➤ encoding (str): The 'Content-Encoding' of the response (None or 'identity' for none).
+
+        Raises:
+            ➤ ValueError: If the encoding is not supported.
+        """
+
+        encoding = (encoding or "identity").strip().lower()
+        self.encoding = encoding
+        self.wire_bytes = 0
+        if encoding == "identity":
+            self._decompress, self._flush = bytes, bytes
+        elif encoding in ("gzip", "x-gzip", "deflate"):
+            # 'deflate' may come as raw deflate from non-compliant servers: 'wbits=47' detects zlib and gzip
+            # headers, and raw deflate is retried on the first chunk (cf. 'feed').
+            decompressor = zlib.decompressobj(47)
+            self._decompress, self._flush = decompressor.decompress, decompressor.flush
+        elif encoding == "br" and brotli is not None:
+            decompressor = brotli.Decompressor()
+            self._decompress, self._flush = decompressor.process, bytes
+        elif encoding == "zstd" and zstandard is not None:
+            decompressor = zstandard.ZstdDecompressor().decompressobj()
+            self._decompress, self._flush = decompressor.decompress, decompressor.flush
+        else:
+            raise ValueError(f"Content coding '{encoding}' is not supported (supported: {', '.join(ENCODINGS)}).")
+
+    def feed(self, chunk: bytes) -> bytes:
+        """
+        Decompresses the next chunk of the body.
+
+        Returns:
+            ➤ bytes: The decompressed bytes available so far (possibly empty).
+
+        Raises:
+            ➤ zlib.error: If the body is not valid for its encoding.
+        """
+
+        first = not self.wire_bytes
+        self.wire_bytes += len(chunk)
+        try:
+            return self._decompress(chunk)
+        except zlib.error:
+            if not (first and self.encoding == "deflate"):
+                raise
+            decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+            self._decompress, self._flush = decompressor.decompress, decompressor.flush
+            return self._decompress(chunk)
+
+    def flush(self) -> bytes:
+        """
+        Returns the remaining decompressed bytes, once the whole body was fed.
+        """
+
+        return self._flush()
+
+def decode(encoding: str, chunks) -> tuple:
+    """
+    Decompresses a body from its chunks (cf. 'Decoder').
+
+    Returns:
+        ➤ tuple: '(body, wire bytes)'.
+    """
+
+    decoder = Decoder(encoding)
+    body = b"".join([*map(decoder.feed, chunks), decoder.flush()])
+    return body, decoder.wire_bytes
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ ✋ Cancellation ✋
+_cancellation = contextvars.ContextVar("cancellation", default=None)
+
+class CancelledRequestError(ConnectionAbortedError):
+    """
+    An exception raised by a 'send' aborted through its 'Cancellation'.
+    """
+
+class Cancellation:
+    """
+    A class that aborts the request sent under it (e.g. the losing request of a hedge):
+
+        with Cancellation() as cancellation:
+            transport.send(payload)  # 'cancellation.cancel()' from another thread aborts it.
+
+    'HTTPTransport' shuts its connection down, 'HTTP2Transport' resets its stream; other transports are not
+    interrupted (the caller discards their response).
+    """
+
+    def __init__(self) -> None:
+        self.cancelled = False
+        self._abort = None
+        self._token = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "Cancellation":
+        self._token = _cancellation.set(self)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        _cancellation.reset(self._token)
+
+    def cancel(self) -> None:
+        """
+        Aborts the request: its 'send' raises 'CancelledRequestError'.
+        """
+
+        with self._lock:
+            self.cancelled = True
+            abort, self._abort = self._abort, None
+        if abort is not None:
+            abort()
+
+    def check(self) -> None:
+        """
+        Raises:
+            ➤ CancelledRequestError: If the request was cancelled.
+        """
+
+        if self.cancelled:
+            raise CancelledRequestError("The request was cancelled.")
+
+    def _bind(self, abort) -> None:
+        """
+        Sets the callback 'cancel' aborts the in-flight request with.
+
+        Raises:
+            ➤ CancelledRequestError: If the request was already cancelled.
+        """
+
+        with self._lock:
+            self.check()
+            self._abort = abort
+
+    def _unbind(self) -> bool:
+        """
+        Forgets the abort callback once the request is done.
+
+        Returns:
+            ➤ bool: Whether the request was cancelled (its connection may be shut down).
+        """
+
+        with self._lock:
+            self._abort = None
+            return self.cancelled
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🚚 Transports 🚚
+class Transport:
+    """
+    A base class for transports: they send an encoded payload, and return a 'Response'.
+    """
+
+    def send(self, payload, body: bytes = None, headers: dict = None) -> Response:
+        """
+        Sends a payload.
+
+        Args:
+            ➤ payload: The operation dict (or list of operation dicts).
+            ➤ body (bytes): The already encoded payload (cf. 'encode').
+            ➤ headers (dict): Extra headers for this request.
+
+        Returns:
+            ➤ Response: The raw response.
+        """
+
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """
+        Releases the transport resources.
+        """
+
+    def __enter__(self) -> "Transport":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+class _TimedHTTPConnection(http.client.HTTPConnection):
+    """
+    An HTTP connection that times its DNS resolution and TCP connection.
+    """
+
+    def connect(self) -> None:
+        self.phases = {"dns": 0.0, "connect": 0.0, "tls": 0.0}
+        start = time.perf_counter()
+        addresses = socket.getaddrinfo(self.host, self.port, 0, socket.SOCK_STREAM)
+        resolved = time.perf_counter()
+        self.phases["dns"] = resolved - start
+        error = None
+        for family, kind, protocol, _, address in addresses:
+            sock = socket.socket(family, kind, protocol)
+            sock.settimeout(self.timeout)
+            try:
+                sock.connect(address)
+            except OSError as exception:
+                sock.close()
+                error = exception
+                continue
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.sock = sock
+            self.phases["connect"] = time.perf_counter() - resolved
+            return
+        raise error or OSError(f"Can't resolve '{self.host}'.")
+
+class _TimedHTTPSConnection(http.client.HTTPSConnection):
+    """
+    An HTTPS connection that times its DNS resolution, TCP connection and TLS handshake.
+    """
+
+    def connect(self) -> None:
+        _TimedHTTPConnection.connect(self)
+        start = time.perf_counter()
+        self.sock = self._context.wrap_socket(self.sock, server_hostname=self.host)
+        self.phases["tls"] = time.perf_counter() - start
+
+def _shutdown(connection: http.client.HTTPConnection) -> None:
+    """
+    Shuts a connection socket down from another thread, so its blocked read returns.
+    """
+
+    if connection.sock is not None:
+        try:
+            connection.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+class HTTPTransport(Transport):
+    """
+    A transport that POSTs payloads over HTTP/1.1, with a pool of keep-alive connections.
+    """
+
+    def __init__(self, url: str, headers: dict = None, timeout: float = 30.0, pool_size: int = 10, compression: bool = True) -> None:
+        """
+        Initializes a 'HTTPTransport' instance.
+
+        Args:
+            ➤ url (str): The GraphQL endpoint.
+            ➤ headers (dict): Extra request headers.
+            ➤ timeout (float): The socket timeout, in seconds.
+            ➤ pool_size (int): The maximum number of idle connections kept open.
+            ➤ compression (bool): Whether to accept compressed responses (cf. 'ENCODINGS'), decompressed as they arrive.
+
+        Raises:
+            ➤ ValueError: If 'url' is not an 'http' or 'https' URL.
+        """
+
+        # ┗━━━━━➤ 🚦 Perform checks:
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"URL '{url}' is not valid. It must be an 'http' or 'https' URL.")
+
+        # ┗━━━━━➤ 📌 Define attributes:
+        self._url = url
+        self._scheme = parts.scheme
+        self._host = parts.hostname
+        self._port = parts.port
+        self._path = parts.path or "/"
+        self._headers = {
+            "Content-Type": "application/json", "Accept": "application/json",
+            **({"Accept-Encoding": ACCEPT_ENCODING} if compression else {}), **(headers or {})
+        }
+        self._timeout = timeout
+        self._pool = queue.LifoQueue(maxsize=pool_size)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__module__}.{self.__class__.__name__} '{self._url}' object at {hex(id(self))}>"
+
+    def _connect(self) -> http.client.HTTPConnection:
+        connection = _TimedHTTPSConnection if self._scheme == "https" else _TimedHTTPConnection
+        return connection(self._host, self._port, timeout=self._timeout)
+
+    def _acquire(self) -> tuple:
+        """
+        Takes an idle connection from the pool, or opens a new one.
+
+        Returns:
+            ➤ tuple: '(connection, reused)'.
+        """
+
+        try:
+            return self._pool.get_nowait(), True
+        except queue.Empty:
+            return self._connect(), False
+
+    def _release(self, connection: http.client.HTTPConnection) -> None:
+        try:
+            self._pool.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+    def _exchange(self, connection: http.client.HTTPConnection, body: bytes, headers: dict, timings: dict) -> tuple:
+        """
+        Sends a request on a connection (opening it if needed), timing each phase.
+        The body is decompressed chunk by chunk while it downloads.
+
+        Returns:
+            ➤ tuple: '(response, data, wire bytes)'.
+        """
+
+        if connection.sock is None:
+            connection.connect()
+            timings.update(connection.phases)
+        start = time.perf_counter()
+        connection.request("POST", self._path, body=body, headers=headers)
+        sent = time.perf_counter()
+        response = connection.getresponse()
+        first_byte = time.perf_counter()
+        decoder = Decoder(response.getheader("Content-Encoding"))
+        parts = []
+        while True:
+            chunk = response.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            parts.append(decoder.feed(chunk))
+        parts.append(decoder.flush())
+        data = b"".join(parts)
+        timings["send"] = sent - start
+        timings["ttfb"] = first_byte - sent
+        timings["download"] = time.perf_counter() - first_byte
+        return response, data, decoder.wire_bytes
+
+    def send(self, payload, body: bytes = None, headers: dict = None) -> Response:
+        body = encode(payload) if body is None else body
+        headers = {**self._headers, **(headers or {})}
+        cancellation = _cancellation.get() or Cancellation()
+        cancellation.check()
+        connection, reused = self._acquire()
+        timings = dict.fromkeys(PHASES, 0.0)
+        start = time.perf_counter()
+        try:
+            cancellation._bind(functools.partial(_shutdown, connection))
+            response, data, wire_bytes = self._exchange(connection, body, headers, timings)
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            connection.close()
+            cancellation.check()
+            if not reused:
+                raise
+            # The server closed an idle keep-alive connection: retry once on a new one.
+            connection = self._connect()
+            timings = dict.fromkeys(PHASES, 0.0)
+            start = time.perf_counter()
+            try:
+                cancellation._bind(functools.partial(_shutdown, connection))
+                response, data, wire_bytes = self._exchange(connection, body, headers, timings)
+            except BaseException:
+                connection.close()
+                cancellation.check()
+                raise
+        except BaseException:
+            connection.close()
+            cancellation.check()
+            raise
+        finally:
+            cancelled = cancellation._unbind()
+        elapsed = time.perf_counter() - start
+        response_headers = {name.lower(): value for name, value in response.getheaders()}
+        if response.will_close or cancelled:
+            connection.close()
+        else:
+            self._release(connection)
+        return Response(response.status, response_headers, data, elapsed, timings, wire_bytes)
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 🔀 HTTP/2 🔀
+class _H2Stream:
+    """
+    The state of one in-flight HTTP/2 request, filled in by the connection reader.
+    """
+
+    __slots__ = ("done", "status", "headers", "data", "error", "first_byte")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.status = None
+        self.headers = {}
+        self.data = []
+        self.error = None
+        self.first_byte = None
+
+class _H2Connection:
+    """
+    An HTTP/2 connection multiplexing concurrent requests: callers write their streams under a lock,
+    and a reader thread dispatches the response frames to them.
+    """
+
+    def __init__(self, sock: socket.socket, max_streams: int, window: int) -> None:
+        """
+        Initializes a '_H2Connection' instance, and sends the connection preface.
+
+        Args:
+            ➤ sock (socket): The connected socket.
+            ➤ max_streams (int): The maximum number of concurrent streams opened by this side.
+            ➤ window (int): The flow-control window advertised per stream and for the connection, in bytes.
+        """
+
+        self._sock = sock
+        self._max_streams = max_streams
+        self._h2 = h2.connection.H2Connection(h2.config.H2Configuration(client_side=True, header_encoding="utf-8"))
+        self._h2.local_settings = h2.settings.Settings(client=True, initial_values={
+            h2.settings.SettingCodes.INITIAL_WINDOW_SIZE: window,
+            h2.settings.SettingCodes.ENABLE_PUSH: 0,
+        })
+        self._h2.initiate_connection()
+        if window > 65535:
+            self._h2.increment_flow_control_window(window - 65535)
+        self._streams = {}
+        self._condition = threading.Condition()
+        self.active = 0
+        self.closed = False
+        self._flush()
+        self._reader = threading.Thread(target=self._read, name="HTTP2Transport-reader", daemon=True)
+        self._reader.start()
+
+    @property
+    def capacity(self) -> int:
+        """
+        The number of concurrent streams, as limited by both sides.
+        """
+
+        return min(self._max_streams, self._h2.remote_settings.max_concurrent_streams)
+
+    def _flush(self) -> None:
+        data = self._h2.data_to_send()
+        if data:
+            self._sock.sendall(data)
+
+    def request(self, headers: list, body: bytes, timeout: float, cancellation: Cancellation) -> tuple:
+        """
+        Sends a request on a new stream, waiting for a free stream slot and for flow-control credit.
+
+        Returns:
+            ➤ tuple: '(stream, sent)', where sent is the 'time.perf_counter()' the request was fully sent.
+
+        Raises:
+            ➤ ConnectionError: If the connection is closed.
+            ➤ TimeoutError: If no response arrived within 'timeout'.
+        """
+
+        deadline = time.monotonic() + timeout
+        stream, stream_id = _H2Stream(), None
+        # Every failure once the stream is registered (e.g. 'sendall' or h2 raising) frees its slot:
+        try:
+            with self._condition:
+                while not self.closed and self.active >= self.capacity:
+                    if not self._condition.wait(deadline - time.monotonic()):
+                        raise TimeoutError("No HTTP/2 stream became available.")
+                if self.closed:
+                    raise ConnectionError("The HTTP/2 connection is closed.")
+                try:
+                    stream_id = self._h2.get_next_available_stream_id()
+                except h2.exceptions.NoAvailableStreamIDError:
+                    # Stream ids are exhausted: new requests go to a new connection.
+                    self.closed = True
+                    raise ConnectionError("The HTTP/2 connection has no stream ids left.") from None
+                self.active += 1
+                self._streams[stream_id] = stream
+                self._h2.send_headers(stream_id, headers, end_stream=not body)
+                # Most payloads fit in the window and one frame: send them with the headers, in one write.
+                offset = 0
+                if body and len(body) <= min(self._h2.local_flow_control_window(stream_id), self._h2.max_outbound_frame_size):
+                    self._h2.send_data(stream_id, body, end_stream=True)
+                    offset = len(body)
+                self._flush()
+            cancellation._bind(functools.partial(self.reset, stream_id))
+            while offset < len(body):
+                with self._condition:
+                    while not self.closed and not stream.done.is_set() and self._h2.local_flow_control_window(stream_id) <= 0:
+                        if not self._condition.wait(deadline - time.monotonic()):
+                            raise TimeoutError("The HTTP/2 flow-control window stayed closed.")
+                    if self.closed or stream.done.is_set():
+                        break
+                    size = min(self._h2.local_flow_control_window(stream_id), self._h2.max_outbound_frame_size, len(body) - offset)
+                    self._h2.send_data(stream_id, body[offset:offset + size], end_stream=offset + size == len(body))
+                    self._flush()
+                    offset += size
+            sent = time.perf_counter()
+            if not stream.done.wait(max(0.0, deadline - time.monotonic())):
+                self.reset(stream_id)
+                raise TimeoutError("The HTTP/2 response timed out.")
+        except BaseException:
+            if stream_id is not None:
+                self._forget(stream_id)
+            raise
+        self._forget(stream_id)
+        if stream.error is not None:
+            raise stream.error
+        return stream, sent
+
+    def reset(self, stream_id: int) -> None:
+        """
+        Cancels a stream (RST_STREAM), failing its pending request.
+        """
+
+        with self._condition:
+            stream = self._streams.get(stream_id)
+            if stream is None or stream.done.is_set():
+                return
+            stream.error = CancelledRequestError("The request was cancelled.")
+            stream.done.set()
+            try:
+                self._h2.reset_stream(stream_id, h2.errors.ErrorCodes.CANCEL)
+                self._flush()
+            except (h2.exceptions.ProtocolError, OSError):
+                pass
+            self._condition.notify_all()
+
+    def _forget(self, stream_id: int) -> None:
+        with self._condition:
+            if self._streams.pop(stream_id, None) is not None:
+                self.active -= 1
+                self._condition.notify_all()
+
+    def _read(self) -> None:
+        """
+        Reads frames until the connection closes, completing the streams.
+        """
+
+        error = None
+        try:
+            while not self.closed:
+                data = self._sock.recv(65536)
+                if not data:
+                    break
+                received = time.perf_counter()
+                with self._condition:
+                    for event in self._h2.receive_data(data):
+                        stream = self._streams.get(getattr(event, "stream_id", None))
+                        if isinstance(event, h2.events.ResponseReceived) and stream is not None:
+                            stream.headers = {name.lower(): value for name, value in event.headers if not name.startswith(":")}
+                            stream.status = int(dict(event.headers)[":status"])
+                            stream.first_byte = received
+                        elif isinstance(event, h2.events.DataReceived):
+                            if stream is not None:
+                                stream.data.append(event.data)
+                            # Give the credit back at once: responses are buffered whole anyway.
+                            try:
+                                self._h2.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                            except h2.exceptions.StreamClosedError:
+                                pass
+                        elif isinstance(event, h2.events.StreamEnded) and stream is not None:
+                            stream.done.set()
+                        elif isinstance(event, h2.events.StreamReset) and stream is not None and not stream.done.is_set():
+                            stream.error = ConnectionResetError(f"The HTTP/2 stream was reset ({event.error_code!r}).")
+                            stream.done.set()
+                        elif isinstance(event, h2.events.ConnectionTerminated):
+                            self.closed = True
+                    self._flush()
+                    self._condition.notify_all()
+        except (OSError, h2.exceptions.ProtocolError) as exception:
+            error = exception
+        with self._condition:
+            self.closed = True
+            for stream in self._streams.values():
+                if not stream.done.is_set():
+                    stream.error = ConnectionError(f"The HTTP/2 connection was closed ({error!r}).")
+                    stream.done.set()
+            self._condition.notify_all()
+        self.close()
+
+    def close(self) -> None:
+        with self._condition:
+            if not self.closed:
+                try:
+                    self._h2.close_connection()
+                    self._flush()
+                except (h2.exceptions.ProtocolError, OSError):
+                    pass
+            self.closed = True
+        try:
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._sock.close()
+
+class HTTP2Transport(Transport):
+    """
+    A transport that POSTs payloads over HTTP/2 (requires the optional 'h2' package), multiplexing concurrent
+    requests as streams of a few connections instead of one socket per in-flight request.
+    'https' URLs negotiate 'h2' with ALPN, 'http' URLs use cleartext HTTP/2 with prior knowledge ('h2c').
+    """
+
+    def __init__(self, url: str, headers: dict = None, timeout: float = 30.0, connections: int = 1, max_streams: int = 100, window: int = 1 << 20, compression: bool = True) -> None:
+        """
+        Initializes a 'HTTP2Transport' instance.
+
+        Args:
+            ➤ url (str): The GraphQL endpoint.
+            ➤ headers (dict): Extra request headers.
+            ➤ timeout (float): The request timeout, in seconds.
+            ➤ connections (int): The maximum number of connections (a new one opens when all streams are busy).
+            ➤ max_streams (int): The maximum number of concurrent streams per connection
+                                 (lowered to the server 'SETTINGS_MAX_CONCURRENT_STREAMS').
+            ➤ window (int): The flow-control window of each stream and connection, in bytes.
+            ➤ compression (bool): Whether to accept compressed responses (cf. 'ENCODINGS').
+
+        Raises:
+            ➤ ImportError: If the 'h2' package is not installed.
+            ➤ ValueError: If 'url' is not an 'http' or 'https' URL, or if a limit is out of range.
+        """
+
+        # ┗━━━━━➤ 🚦 Perform checks:
+        if h2 is None:
+            raise ImportError("'HTTP2Transport' requires the 'h2' package ('pip install h2').")
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"URL '{url}' is not valid. It must be an 'http' or 'https' URL.")
+        if connections < 1 or max_streams < 1:
+            raise ValueError("'connections' and 'max_streams' must be positive integers.")
+        if not 65535 <= window <= 2 ** 31 - 1:
+            raise ValueError(f"'window' ({window}) must be in [65535, 2^31 - 1].")
+
+        # ┗━━━━━➤ 📌 Define attributes:
+        self._url = url
+        self._scheme = parts.scheme
+        self._host = parts.hostname
+        self._port = parts.port or (443 if parts.scheme == "https" else 80)
+        self._path = parts.path or "/"
+        self._authority = parts.netloc
+        self._headers = {
+            "content-type": "application/json", "accept": "application/json",
+            **({"accept-encoding": ACCEPT_ENCODING} if compression else {}),
+            **{name.lower(): value for name, value in (headers or {}).items()}
+        }
+        self._timeout = timeout
+        self._connections_limit = connections
+        self._max_streams = max_streams
+        self._window = window
+        self._connections = []
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__module__}.{self.__class__.__name__} '{self._url}' object at {hex(id(self))}>"
+
+    @property
+    def connections(self) -> int:
+        """
+        The number of open connections.
+        """
+
+        return sum(not connection.closed for connection in self._connections)
+
+    def _connect(self, timings: dict) -> _H2Connection:
+        """
+        Opens a connection, timing its DNS resolution, TCP connection and TLS handshake.
+        """
+
+        connection = _TimedHTTPConnection(self._host, self._port, timeout=self._timeout)
+        connection.connect()
+        sock = connection.sock
+        if self._scheme == "https":
+            start = time.perf_counter()
+            context = ssl.create_default_context()
+            context.set_alpn_protocols(["h2"])
+            sock = context.wrap_socket(sock, server_hostname=self._host)
+            connection.phases["tls"] = time.perf_counter() - start
+            if sock.selected_alpn_protocol() != "h2":
+                sock.close()
+                raise ConnectionError(f"'{self._host}' does not support HTTP/2 (ALPN: {sock.selected_alpn_protocol()!r}).")
+        sock.settimeout(None)
+        timings.update(connection.phases)
+        return _H2Connection(sock, self._max_streams, self._window)
+
+    def _acquire(self, timings: dict) -> _H2Connection:
+        """
+        Picks the least busy open connection, opening a new one if every stream is busy (up to 'connections').
+        """
+
+        with self._lock:
+            self._connections = [connection for connection in self._connections if not connection.closed]
+            connection = min(self._connections, key=lambda connection: connection.active, default=None)
+            if connection is None or (connection.active >= connection.capacity and len(self._connections) < self._connections_limit):
+                connection = self._connect(timings)
+                self._connections.append(connection)
+            return connection
+
+    def send(self, payload, body: bytes = None, headers: dict = None) -> Response:
+        body = encode(payload) if body is None else body
+        cancellation = _cancellation.get() or Cancellation()
+        cancellation.check()
+        request_headers = [
+            (":method", "POST"), (":scheme", self._scheme), (":authority", self._authority), (":path", self._path),
+            *{**self._headers, **{name.lower(): value for name, value in (headers or {}).items()}}.items(),
+            ("content-length", str(len(body))),
+        ]
+        timings = dict.fromkeys(PHASES, 0.0)
+        connection = self._acquire(timings)
+        start = time.perf_counter()
+        try:
+            stream, sent = connection.request(request_headers, body, self._timeout, cancellation)
+        finally:
+            cancellation._unbind()
+        cancellation.check()
+        # Frames are buffered by the reader thread (shared by every stream): they are decompressed here.
+        data, wire_bytes = decode(stream.headers.get("content-encoding"), stream.data)
+        done = time.perf_counter()
+        first_byte = stream.first_byte or done
+        timings["send"] = sent - start
+        timings["ttfb"] = max(0.0, first_byte - sent)
+        timings["download"] = max(0.0, done - first_byte)
+        return Response(stream.status, stream.headers, data, done - start, timings, wire_bytes)
+
+    def close(self) -> None:
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+# ═════════════════════════════════════════════════════════════════════════════╝
+
+
+# ═════════════════════════════════════════════════════════════════════════════❯ 📼 Record & Replay 📼
+def request_key(payload) -> str:
+    """
+    Builds the cassette key of a payload: its operation name and canonical variables
+    (batches join the keys of their operations).
+    """
+
+    if isinstance(payload, list):
+        return "|".join(request_key(item) for item in payload)
+    variables = json.dumps(payload.get("variables") or {}, sort_keys=True, separators=(",", ":"))
+    return f"{payload.get('operationName')}:{variables}"
+
+class Cassette:
+    """
+    A class that holds recorded request/response pairs, stored as gzipped JSON lines.
+    Each entry: 'k' (key), 'n' (operation name(s)), 'v' (variables), 't' (offset since the
+    first request, in seconds), 'e' (elapsed), 's' (status), 'h' (headers), 'b' (body).
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Initializes a 'Cassette' instance, loading its entries if the file exists.
+
+        Args:
+            ➤ path (str): The cassette path (e.g. 'traffic.cassette.gz').
+        """
+
+        self._path = path
+        self._lock = threading.Lock()
+        self._file = None
+        self._started = None
+        self.entries = []
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as file:
+                self.entries = [json.loads(line) for line in file if line.strip()]
+        except FileNotFoundError:
+            pass
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__module__}.{self.__class__.__name__} '{self._path}' ({len(self.entries)} entries) object at {hex(id(self))}>"
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def record(self, payload, response: Response, sent_at: float) -> None:
+        """
+        Appends an entry, and writes it to the cassette file.
+
+        Args:
+            ➤ payload: The sent payload.
+            ➤ response (Response): The received response.
+            ➤ sent_at (float): The 'time.monotonic()' of the request.
+        """
+
+        try:
+            body, encoding = response.body.decode("utf-8"), None
+        except UnicodeDecodeError:
+            body, encoding = base64.b64encode(response.body).decode(), "base64"
+        items = payload if isinstance(payload, list) else [payload]
+        with self._lock:
+            if self._started is None:
+                self._started = sent_at - (self.entries[-1]["t"] if self.entries else 0.0)
+            entry = {
+                "k": request_key(payload),
+                "n": [item.get("operationName") for item in items],
+                "v": [item.get("variables") or {} for item in items],
+                "t": round(sent_at - self._started, 6),
+                "e": round(response.elapsed, 6),
+                "s": response.status,
+                "h": response.headers,
+                "b": body,
+                **({"x": encoding} if encoding else {}),
+                **({"w": response.wire_bytes} if response.wire_bytes != len(response.body) else {}),
+            }
+            self.entries.append(entry)
+            if self._file is None:
+                self._file = gzip.open(self._path, "at", encoding="utf-8")
+            self._file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+def _response(entry: dict, elapsed: float) -> Response:
+    body = base64.b64decode(entry["b"]) if entry.get("x") == "base64" else entry["b"].encode("utf-8")
+    return Response(entry["s"], entry["h"], body, elapsed, {"replay": elapsed}, entry.get("w"))
+
+class RecordingTransport(Transport):
+    """
+    A transport that forwards payloads to another transport, and records every exchange in a cassette.
+    """
+
+    def __init__(self, transport: Transport, cassette: Cassette) -> None:
+        """
+        Initializes a 'RecordingTransport' instance.
+
+        Args:
+            ➤ transport (Transport): The transport that actually sends the payloads.
+            ➤ cassette (Cassette): The cassette recorded into.
+        """
+
+        self._transport = transport
+        self._cassette = cassette
+
+    def send(self, payload, body: bytes = None, headers: dict = None) -> Response:
+        sent_at = time.monotonic()
+        response = self._transport.send(payload, body, headers)
+        self._cassette.record(payload, response, sent_at)
+        return response
+
+    def close(self) -> None:
+        self._cassette.close()
+        self._transport.close()
+
+class ReplayTransport(Transport):
+    """
+    A transport that answers payloads from a cassette, without any network.
+    Repeated keys are answered in recorded order, then cycle.
+    """
+
+    TIMINGS = ("original", "scaled", "none")
+
+    def __init__(self, cassette: Cassette, timing: str = "original", scale: float = 1.0) -> None:
+        """
+        Initializes a 'ReplayTransport' instance.
+
+        Args:
+            ➤ cassette (Cassette): The recorded cassette.
+            ➤ timing (str): 'original' (recorded latency), 'scaled' (recorded latency × 'scale') or 'none'.
+            ➤ scale (float): The latency factor of the 'scaled' timing.
+
+        Raises:
+            ➤ ValueError: If 'timing' is not valid.
+        """
+
+        # ┗━━━━━➤ 🚦 Perform checks:
+        if timing not in self.TIMINGS:
+            raise ValueError(f"Timing '{timing}' is not valid. It must be one of: {self.TIMINGS}.")
+
+        # ┗━━━━━➤ 📌 Define attributes:
+        self._factor = {"original": 1.0, "scaled": scale, "none": 0.0}[timing]
+        self._entries = collections.defaultdict(collections.deque)
+        for entry in cassette.entries:
+            self._entries[entry["k"]].append(entry)
+        self._lock = threading.Lock()
+
+    def send(self, payload, body: bytes = None, headers: dict = None) -> Response:
+        """
+        Answers a payload from the cassette.
+
+        Raises:
+            ➤ KeyError: If the payload was never recorded.
+        """
+
+        key = request_key(payload)
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                raise KeyError(f"Request '{key}' was not recorded in the cassette.")
+            entry = entries[0]
+            entries.rotate(-1)
+        delay = entry["e"] * self._factor
+        if delay > 0:
+            time.sleep(delay)
+        return _response(entry, delay)
+
+def replay_traffic(cassette: Cassette, client, speed: float = 1.0, max_workers: int = 32) -> dict:
+    """
+    Re-issues the recorded requests with their original arrival pattern, to compare a client's
+    throughput and latency against the recording.
+
+    Args:
+        ➤ cassette (Cassette): The recorded traffic.
+        ➤ client: The client under test (cf. 'GraphQLClient.execute' and 'GraphQLClient.execute_batch').
+        ➤ speed (float): The arrival rate factor ('2.0' replays twice as fast, '0' as fast as possible).
+        ➤ max_workers (int): The maximum number of concurrent requests.
+
+    Returns:
+        ➤ dict: 'requests', 'failures', 'duration' (s), 'throughput' (req/s),
+                'latencies' (s, sorted) and 'recorded_latencies' (s, sorted).
+    """
+
+    def issue(entry: dict) -> float:
+        start = time.perf_counter()
+        if len(entry["n"]) == 1:
+            client.execute(entry["n"][0], entry["v"][0])
+        else:
+            client.execute_batch(list(zip(entry["n"], entry["v"])))
+        return time.perf_counter() - start
+
+    futures, recorded = [], []
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for entry in cassette.entries:
+            if speed > 0:
+                delay = entry["t"] / speed - (time.monotonic() - start)
+                if delay > 0:
+                    time.sleep(delay)
+            futures.append(executor.submit(issue, entry))
+            recorded.append(entry["e"])
+    latencies, failures = [], 0
+    for future in futures:
+        try:
+            latencies.append(future.result())
+        except Exception:
+            failures += 1
+    duration = time.monotonic() - start
+    return {
+        "requests": len(futures),
+        "failures": failures,
+        "duration": duration,
+        "throughput": len(futures) / duration if duration else 0.0,
+        "latencies": sorted(latencies),
+        "recorded_latencies": sorted(recorded),
+    }
+# ═════════════════════════════════════════════════════════════════════════════╝